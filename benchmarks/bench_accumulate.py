@@ -0,0 +1,127 @@
+"""
+Streaming accumulation regression benchmark.
+
+Replays a synthetic 32k-token OpenAI-style stream through:
+
+- the accumulation pattern GROQ/OPENAI used before (``message_load +=
+  delta`` and the running text written back into every event), and
+- ``GROQ.ask(stream=True)`` as it is now (true deltas, full text joined once),
+  with its HTTP session replaced by a canned response.
+
+The accumulation step is also timed on its own at half, one and two times
+``--tokens``. The old pattern grows quadratically with the stream length; the
+current one should stay linear, so doubling the tokens should roughly double
+its time.
+
+    python benchmarks/bench_accumulate.py
+    python benchmarks/bench_accumulate.py --tokens 64000
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from webscout.AIutel import StreamAccumulator  # noqa: E402
+from webscout.Provider.Groq import GROQ  # noqa: E402
+
+
+def synth_body(tokens: int) -> bytes:
+    events = [
+        "data: " + json.dumps({"choices": [{"index": 0, "delta": {"content": f"token{i} "}}]}) + "\n\n"
+        for i in range(tokens)
+    ]
+    events.append("data: [DONE]\n\n")
+    return "".join(events).encode()
+
+
+def canned_response(body: bytes) -> requests.Response:
+    response = requests.models.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.headers["Content-Type"] = "text/event-stream"
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def legacy(body: bytes) -> str:
+    """The pre-accumulator loop: the running text is copied into every event."""
+    last_response = {}
+    message_load = ""
+    for value in canned_response(body).iter_lines(decode_unicode=True, delimiter="data:", chunk_size=64):
+        try:
+            resp = json.loads(value)
+            delta = resp["choices"][0]["delta"]["content"]
+            if delta:
+                message_load += delta
+                resp["choices"][0]["delta"]["content"] = message_load
+                last_response.update(resp)
+        except (json.JSONDecodeError, KeyError, IndexError):
+            pass
+    return last_response["choices"][0]["delta"]["content"]
+
+
+def current(body: bytes) -> str:
+    provider = GROQ(api_key="bench", is_conversation=False)
+    provider.session.post = lambda *args, **kwargs: canned_response(body)
+    for _ in provider.ask("bench", stream=True):
+        pass
+    return provider.get_message(provider.last_response)
+
+
+def accumulate_legacy(deltas: list) -> str:
+    """Accumulation alone, as the providers did it: running text stored in every event."""
+    last_response, message_load = {}, ""
+    for delta in deltas:
+        message_load += delta
+        last_response.update({"choices": [{"delta": {"content": message_load}}]})
+    return message_load
+
+
+def accumulate_current(deltas: list) -> str:
+    """Accumulation alone with StreamAccumulator: events carry the delta only."""
+    last_response, message = {}, StreamAccumulator()
+    for delta in deltas:
+        message.append(delta)
+        last_response.update({"choices": [{"delta": {"content": delta}}]})
+    return message.text
+
+
+def measure(fn, arg):
+    tracemalloc.start()
+    start = time.perf_counter()
+    text = fn(arg)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=32000)
+    args = parser.parse_args()
+
+    print(f"{'tokens':>8} {'implementation':<20} {'seconds':>9} {'peak MiB':>9} {'chars':>9}")
+    for tokens in (args.tokens // 2, args.tokens, args.tokens * 2):
+        deltas = [f"token{i} " for i in range(tokens)]
+        for name, fn in (("accumulate legacy", accumulate_legacy), ("accumulate current", accumulate_current)):
+            seconds, peak, chars = measure(fn, deltas)
+            print(f"{tokens:>8} {name:<20} {seconds:>9.3f} {peak / 2**20:>9.1f} {chars:>9}")
+
+    for tokens in (args.tokens // 2, args.tokens):
+        body = synth_body(tokens)
+        for name, fn in (("legacy", legacy), ("GROQ.ask", current)):
+            seconds, peak, chars = measure(fn, body)
+            print(f"{tokens:>8} {name:<20} {seconds:>9.3f} {peak / 2**20:>9.1f} {chars:>9}")
+
+
+if __name__ == "__main__":
+    main()
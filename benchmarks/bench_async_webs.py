@@ -0,0 +1,186 @@
+"""
+WEBS vs AsyncWEBS against a local stub server.
+
+Starts an ``http.server`` stub that answers the DuckDuckGo endpoints with
+synthetic pages after a fixed latency, points both clients at it through a
+URL-rewriting httpx transport, and times ``text`` (html backend) and
+``images`` searches, one at a time and with several queries in flight. Host
+limiters are opened up so the numbers show the engines, not the politeness.
+
+    python benchmarks/bench_async_webs.py
+    python benchmarks/bench_async_webs.py --latency 100 --max-results 500 --queries 8
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from webscout import ratelimit  # noqa: E402
+from webscout.webscout_search import WEBS  # noqa: E402
+from webscout.webscout_search_async import AsyncWEBS  # noqa: E402
+
+HOSTS = ("duckduckgo.com", "html.duckduckgo.com", "lite.duckduckgo.com")
+
+
+def html_page(offset: int, size: int) -> bytes:
+    items = "".join(
+        f'<div class="result"><h2><a href="https://example.com/{offset + i}">Result {offset + i}</a></h2>'
+        f'<a class="snippet" href="https://example.com/{offset + i}">Snippet &amp; body of result {offset + i}</a></div>'
+        for i in range(size)
+    )
+    return f"<html><body>{items}</body></html>".encode()
+
+
+def images_page(offset: int, size: int) -> bytes:
+    rows = [
+        {
+            "title": f"Image {offset + i}",
+            "image": f"https://example.com/{offset + i}.jpg",
+            "thumbnail": f"https://example.com/{offset + i}_t.jpg",
+            "url": f"https://example.com/{offset + i}",
+            "height": 600,
+            "width": 800,
+            "source": "Bing",
+        }
+        for i in range(size)
+    ]
+    return json.dumps({"results": rows}).encode()
+
+
+def make_handler(latency: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def _reply(self, query: dict) -> None:
+            time.sleep(latency)
+            offset = int(query.get("s", ["0"])[0])
+            path = urlsplit(self.path).path
+            if path == "/i.js":
+                body, kind = images_page(offset, 100), "application/json"
+            elif path == "/html":
+                body, kind = html_page(offset, 50 if offset else 23), "text/html"
+            else:
+                body, kind = b'<html><script>vqd="4-bench"</script></html>', "text/html"
+            self.send_response(200)
+            self.send_header("Content-Type", kind)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            self._reply(parse_qs(urlsplit(self.path).query))
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            self._reply(parse_qs(self.rfile.read(length).decode()))
+
+    return Handler
+
+
+def rewrite(request: httpx.Request, port: int) -> None:
+    request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=port)
+    request.headers["Host"] = f"127.0.0.1:{port}"
+
+
+class StubTransport(httpx.HTTPTransport):
+    def __init__(self, port: int):
+        super().__init__()
+        self.port = port
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        rewrite(request, self.port)
+        return super().handle_request(request)
+
+
+class AsyncStubTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, port: int):
+        super().__init__()
+        self.port = port
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        rewrite(request, self.port)
+        return await super().handle_async_request(request)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=50, help="Stub response latency in ms")
+    parser.add_argument("--max-results", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=8, help="Queries in flight for the throughput run")
+    parser.add_argument("--concurrency", type=int, default=8, help="AsyncWEBS requests in flight per host")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(args.latency / 1000))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    for host in HOSTS:
+        ratelimit.configure_host(host, rate=1e6, burst=1e6, concurrency=args.concurrency)
+
+    webs = WEBS(result_cache=None)
+    webs.client = httpx.Client(transport=StubTransport(port), headers=webs.headers)
+    awebs = AsyncWEBS(result_cache=None)
+    awebs.client = httpx.AsyncClient(transport=AsyncStubTransport(port), headers=awebs.headers)
+
+    n = args.max_results
+    print(f"stub latency {args.latency:.0f} ms, max_results {n}, {args.queries} queries in flight")
+    print(f"{'search':<34} {'results':>8} {'WEBS s':>9} {'AsyncWEBS s':>12}")
+
+    async def run_async():
+        rows = []
+        for name, sync_call, async_call in (
+            ("text html", lambda q: webs.text(q, backend="html", max_results=n),
+             lambda q: awebs.atext(q, backend="html", max_results=n)),
+            ("images", lambda q: webs.images(q, max_results=n), lambda q: awebs.aimages(q, max_results=n)),
+        ):
+            sync_seconds, results = timed(lambda: sync_call(f"{name} warm"))
+            start = time.perf_counter()
+            async_results = await async_call(f"{name} warm")
+            async_seconds = time.perf_counter() - start
+            assert len(results) == len(async_results), (len(results), len(async_results))
+            rows.append((f"{name}, 1 query", len(results), sync_seconds, async_seconds))
+
+            queries = [f"{name} {i}" for i in range(args.queries)]
+            with ThreadPoolExecutor(args.queries) as pool:
+                sync_seconds, _ = timed(lambda: list(pool.map(sync_call, queries)))
+            start = time.perf_counter()
+            await asyncio.gather(*(async_call(q) for q in queries))
+            rows.append((f"{name}, {args.queries} queries", len(results) * args.queries,
+                         sync_seconds, time.perf_counter() - start))
+
+        start = time.perf_counter()
+        async for _ in awebs.aiter_text("first result async", backend="html", max_results=n):
+            break
+        first_async = time.perf_counter() - start
+        first_sync, _ = timed(lambda: next(webs.iter_text("first result sync", backend="html", max_results=n)))
+        rows.append(("text html, first result (iter_*)", 1, first_sync, first_async))
+        await awebs.client.aclose()
+        return rows
+
+    for name, count, sync_seconds, async_seconds in asyncio.run(run_async()):
+        print(f"{name:<34} {count:>8} {sync_seconds:>9.3f} {async_seconds:>12.3f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
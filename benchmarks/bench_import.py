@@ -0,0 +1,66 @@
+"""
+Import-time benchmark.
+
+Every statement runs in a fresh interpreter (a cold worker start), so module
+caches from a previous run can't hide the cost.
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --runs 10 "from webscout import GROQ"
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STATEMENTS = [
+    "import webscout",
+    "from webscout import WEBS",
+    "from webscout.AIauto import AUTO",
+    "from webscout.Provider import GROQ",
+    "from webscout import model; model.llm.list()",
+]
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+exec({stmt!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": len(sys.modules)}}))
+"""
+
+
+def measure(stmt: str, runs: int) -> dict:
+    """Run ``stmt`` in ``runs`` fresh interpreters and summarise the timings."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    seconds, modules = [], 0
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", PROBE.format(stmt=stmt)],
+            capture_output=True, text=True, env=env, check=True,
+        )
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        seconds.append(result["seconds"])
+        modules = result["modules"]
+    return {"median_ms": statistics.median(seconds) * 1000, "min_ms": min(seconds) * 1000, "modules": modules}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("statements", nargs="*", default=STATEMENTS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'statement':<48} {'median ms':>10} {'min ms':>10} {'modules':>8}")
+    for stmt in args.statements:
+        r = measure(stmt, args.runs)
+        print(f"{stmt:<48} {r['median_ms']:>10.1f} {r['min_ms']:>10.1f} {r['modules']:>8}")
+
+
+if __name__ == "__main__":
+    main()
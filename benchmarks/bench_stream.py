@@ -0,0 +1,118 @@
+"""
+Stream decoding micro-benchmark.
+
+Replays an SSE body through the per-line loop providers used to hand-roll
+(``iter_lines`` + strip ``data:`` + ``json.loads``) and through
+``webscout.AIutel.iter_stream``. No network is involved; the body is either
+synthesised (OpenAI-style chat deltas) or read from a recorded file.
+
+    python benchmarks/bench_stream.py
+    python benchmarks/bench_stream.py --tokens 32000 --chunk 64
+    python benchmarks/bench_stream.py --file recorded_stream.txt --path choices.0.delta.content
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from webscout import AIutel  # noqa: E402
+
+
+def synth_body(tokens: int) -> bytes:
+    events = []
+    for i in range(tokens):
+        event = {
+            "id": "chatcmpl-bench",
+            "object": "chat.completion.chunk",
+            "created": 1700000000,
+            "model": "bench-model",
+            "choices": [{"index": 0, "delta": {"content": f" tok{i}é"}, "finish_reason": None}],
+        }
+        events.append(f"data: {json.dumps(event, ensure_ascii=False)}\n\n")
+    events.append("data: [DONE]\n\n")
+    return "".join(events).encode("utf-8")
+
+
+def make_response(body: bytes) -> requests.Response:
+    response = requests.models.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def legacy(body: bytes, chunk: int, path) -> int:
+    """The loop most providers used before the shared decoder."""
+    count = 0
+    for line in make_response(body).iter_lines(chunk_size=chunk, decode_unicode=True):
+        if line:
+            line = line.strip()
+            if line.startswith("data: "):
+                json_str = line[6:]
+                if json_str == "[DONE]":
+                    break
+                try:
+                    value = AIutel._walk(json.loads(json_str), path)
+                    if value is not None:
+                        count += 1
+                except json.JSONDecodeError:
+                    continue
+    return count
+
+
+def decoder(body: bytes, chunk: int, path) -> int:
+    count = 0
+    for _ in AIutel.iter_stream(make_response(body).iter_content(chunk_size=chunk), path=path):
+        count += 1
+    return count
+
+
+def decoder_stdlib_json(body: bytes, chunk: int, path) -> int:
+    loads = AIutel._json_loads
+    AIutel._json_loads = lambda data: json.loads(data.decode("utf-8"))
+    try:
+        return decoder(body, chunk, path)
+    finally:
+        AIutel._json_loads = loads
+
+
+def bench(fn, body: bytes, chunk: int, path, runs: int):
+    best, count = float("inf"), 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        count = fn(body, chunk, path)
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="Recorded raw SSE body to replay")
+    parser.add_argument("--path", default="choices.0.delta.content", help="JSON path of the delta text")
+    parser.add_argument("--tokens", type=int, default=10000, help="Events in the synthetic body")
+    parser.add_argument("--chunk", type=int, default=512, help="Bytes per network read")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    body = Path(args.file).read_bytes() if args.file else synth_body(args.tokens)
+    path = AIutel._compile_path(args.path)
+    print(f"body: {len(body) / 1024:.0f} KiB, read size {args.chunk} B, orjson: {AIutel._json_loads is not json.loads}")
+    print(f"{'decoder':<28} {'events':>8} {'best ms':>10} {'us/event':>10}")
+    for name, fn in (
+        ("iter_lines + json.loads", legacy),
+        ("iter_stream (json)", decoder_stdlib_json),
+        ("iter_stream", decoder),
+    ):
+        seconds, count = bench(fn, body, args.chunk, path, args.runs)
+        print(f"{name:<28} {count:>8} {seconds * 1000:>10.1f} {seconds / max(count, 1) * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Scout incremental parsing benchmark: iterparse with early exit vs full parse.
+
+Feeds large saved pages (see ``bench_memory.py``) as a stream of byte chunks,
+the way a ``requests`` response with ``stream=True`` delivers them, and for
+jobs that only need the top of a page times, in turns:
+
+- ``Scout.iterparse`` stopping as soon as the job has its answer
+- reading every chunk, then ``Scout(markup)`` and a ``select`` on the tree
+
+Both must give the same answer. The share of the page each one had to read
+is reported next to the timings.
+
+    python benchmarks/scout/bench_iterparse.py
+    python benchmarks/scout/bench_iterparse.py --chunk-kib 4 --runs 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from bench_memory import DEFAULT_PAGES, enlarge  # noqa: E402
+from webscout.scout import Scout  # noqa: E402
+
+
+class Stream:
+    """Byte chunks of a page, counting how many were read."""
+
+    def __init__(self, data: bytes, chunk_size: int):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.consumed = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for start in range(0, len(self.data), self.chunk_size):
+            self.consumed = min(len(self.data), start + self.chunk_size)
+            yield self.data[start:start + self.chunk_size]
+
+
+def stream_title(stream: Stream) -> str:
+    for _, tag in Scout.iterparse(stream, select="title"):
+        return tag.get_text()
+    return ""
+
+
+def stream_links(stream: Stream) -> List[str]:
+    links = []
+    for _, tag in Scout.iterparse(stream, select="a[href]"):
+        links.append(tag.get("href"))
+        if len(links) == 10:
+            break
+    return links
+
+
+def stream_meta(stream: Stream) -> List[Tuple[str, str]]:
+    meta = []
+    for _, tag in Scout.iterparse(stream, select="head, head meta"):
+        if tag.name == "head":
+            break
+        meta.append((tag.get("name") or tag.get("property") or tag.get("charset") or "", tag.get("content") or ""))
+    return meta
+
+
+def full(stream: Stream) -> Scout:
+    return Scout(b"".join(stream))
+
+
+# Job -> (iterparse with early exit, the same answer from a full parse)
+JOBS: Dict[str, Tuple[Callable[[Stream], object], Callable[[Scout], object]]] = {
+    "title": (stream_title, lambda s: s.select_one("title").get_text()),
+    "first 10 links": (stream_links, lambda s: [a.get("href") for a in s.select("a[href]")[:10]]),
+    "head meta": (stream_meta, lambda s: [
+        (m.get("name") or m.get("property") or m.get("charset") or "", m.get("content") or "")
+        for m in s.select("head meta")
+    ]),
+}
+
+
+def median_ms(fns: List[Callable[[], object]], runs: int) -> List[float]:
+    """Median milliseconds of each function, run in turns so machine noise hits them alike."""
+    times = [[] for _ in fns]
+    for fn in fns:
+        fn()
+    for _ in range(runs):
+        for fn, samples in zip(fns, times):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+    return [statistics.median(samples) * 1e3 for samples in times]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", type=Path, help="Saved HTML pages (defaults to the search fixtures)")
+    parser.add_argument("--target-kib", type=int, default=2048, help="Grow every page to this size; 0 keeps it")
+    parser.add_argument("--chunk-kib", type=int, default=16, help="Size of each streamed chunk")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per job")
+    args = parser.parse_args()
+
+    for path in args.pages or DEFAULT_PAGES:
+        data = enlarge(path.read_text(encoding="utf-8", errors="replace"), args.target_kib * 1024).encode("utf-8")
+        chunk_size = args.chunk_kib * 1024
+        print(f"\n{path.name} ({len(data) / 1024:.0f} KiB in {args.chunk_kib} KiB chunks)")
+        print(f"{'job':<16} {'iterparse ms':>13} {'read':>7} {'full parse ms':>14} {'speedup':>8}")
+        for name, (streamed, parsed) in JOBS.items():
+            stream = Stream(data, chunk_size)
+            expected = parsed(full(Stream(data, chunk_size)))
+            assert streamed(stream) == expected, f"{path.name} {name}: iterparse and full parse disagree"
+            fast, slow = median_ms(
+                [lambda: streamed(Stream(data, chunk_size)), lambda: parsed(full(Stream(data, chunk_size)))],
+                args.runs,
+            )
+            print(
+                f"{name:<16} {fast:>13.1f} {stream.consumed / len(data):>6.1%} {slow:>14.1f} "
+                f"{slow / max(1e-9, fast):>7.0f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Scout lazy lxml benchmark: views over the lxml tree vs a converted copy.
+
+Parses large saved pages (see ``bench_memory.py``) with the ``lxml`` backend,
+which copies lxml's tree into Scout tags, and with ``lxml-lazy``, which keeps
+lxml's tree and wraps elements in Scout tags only when they are reached.
+Checks both give the same answers, then times, in turns:
+
+- parsing
+- ``find_all``/``find`` by tag name, class and attribute
+- ``select`` with the selectors scraping code uses
+- ``get_text`` on the document root (``Scout.get_text`` adds sentence
+  splitting, which costs the same on both)
+- a scraping job: parse, pick the results, read their links and text
+
+The lazy tree lives in libxml2's memory, which tracemalloc does not see, so
+memory is left to ``bench_memory.py``'s numbers for the converted backends.
+
+    python benchmarks/scout/bench_lazy.py
+    python benchmarks/scout/bench_lazy.py --target-kib 4096 --runs 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from bench_memory import DEFAULT_PAGES, enlarge  # noqa: E402
+from webscout.scout import Scout  # noqa: E402
+
+OPERATIONS: Dict[str, Callable[[Scout], object]] = {
+    "find_all('a')": lambda s: s.find_all("a"),
+    "find_all(class_)": lambda s: s.find_all("a", class_="result__a"),
+    "find_all(href=True)": lambda s: s.find_all("a", href=True),
+    "find('title')": lambda s: s.find("title"),
+    "select('a.result__a')": lambda s: s.select("a.result__a"),
+    "select('div.g a[href]')": lambda s: s.select("div.g a[href]"),
+    "select('tr:nth-child(odd)')": lambda s: s.select("tr:nth-child(odd)"),
+    "root.get_text()": lambda s: s._soup.get_text(),
+    "root.get_text(strip=True)": lambda s: s._soup.get_text(strip=True),
+}
+
+
+def scrape(markup: str, features: str) -> list:
+    """What a search backend does with a page: parse it and read every result link."""
+    scout = Scout(markup, features=features)
+    return [(a.get("href"), a.get_text(strip=True)) for a in scout.select("a[href]")]
+
+
+def median_ms(fns: List[Callable[[], object]], runs: int) -> List[float]:
+    """Median milliseconds of each function, run in turns so machine noise hits them alike."""
+    times = [[] for _ in fns]
+    for fn in fns:
+        fn()
+    for _ in range(runs):
+        for fn, samples in zip(fns, times):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+    return [statistics.median(samples) * 1e3 for samples in times]
+
+
+def answer(result: object) -> object:
+    """Comparable form of an operation's result: tags by name and attributes, text as is."""
+    if hasattr(result, "_results"):
+        result = result._results
+    if isinstance(result, list):
+        return [answer(item) for item in result]
+    if isinstance(result, tuple):
+        return tuple(answer(item) for item in result)
+    if hasattr(result, "attrs") and hasattr(result, "name"):
+        return result.name, dict(result.attrs)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", type=Path, help="Saved HTML pages (defaults to the search fixtures)")
+    parser.add_argument("--target-kib", type=int, default=2048, help="Grow every page to this size; 0 keeps it")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per operation")
+    args = parser.parse_args()
+
+    for path in args.pages or DEFAULT_PAGES:
+        markup = enlarge(path.read_text(encoding="utf-8", errors="replace"), args.target_kib * 1024)
+        converted, lazy = Scout(markup, features="lxml"), Scout(markup, features="lxml-lazy")
+        parse_converted, parse_lazy = median_ms(
+            [lambda: Scout(markup, features="lxml"), lambda: Scout(markup, features="lxml-lazy")],
+            max(1, args.runs // 2),
+        )
+        print(
+            f"\n{path.name} ({len(markup) / 1024:.0f} KiB): "
+            f"parse {parse_converted:.0f} ms converted, {parse_lazy:.0f} ms lazy "
+            f"({parse_converted / max(1e-9, parse_lazy):.1f}x)"
+        )
+        print(f"{'operation':<28} {'results':>8} {'lxml ms':>9} {'lazy ms':>9} {'speedup':>8}")
+        for name, operation in OPERATIONS.items():
+            expected = operation(converted)
+            assert answer(operation(lazy)) == answer(expected), f"{path.name} {name}: lxml and lxml-lazy disagree"
+            slow, fast = median_ms([lambda: operation(converted), lambda: operation(lazy)], args.runs)
+            expected = getattr(expected, "_results", expected)
+            count = len(expected) if isinstance(expected, list) else 1
+            print(f"{name:<28} {count:>8} {slow:>9.2f} {fast:>9.2f} {slow / max(1e-9, fast):>7.1f}x")
+        assert answer(scrape(markup, "lxml-lazy")) == answer(scrape(markup, "lxml")), f"{path.name}: scrape disagrees"
+        slow, fast = median_ms(
+            [lambda: scrape(markup, "lxml"), lambda: scrape(markup, "lxml-lazy")], max(1, args.runs // 2)
+        )
+        print(f"{'parse + scrape links':<28} {'':>8} {slow:>9.0f} {fast:>9.0f} {slow / max(1e-9, fast):>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
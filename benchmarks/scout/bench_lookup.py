@@ -0,0 +1,113 @@
+"""
+Scout lookup benchmark: document index vs tree walk.
+
+Parses large saved pages (see ``bench_memory.py``) once with and once without
+the document index, checks both return the same tags, then times, in turns:
+
+- the cost of building the index during parsing, and the memory it keeps
+- single ``find_all``/``find``/``select`` lookups by tag name, class and id
+- the helpers that issue a dozen lookups each: ``extract_metadata``,
+  ``extract_semantic_info`` and ``analyze_page_structure``
+
+    python benchmarks/scout/bench_lookup.py
+    python benchmarks/scout/bench_lookup.py --parser lxml --runs 50
+"""
+
+import argparse
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from bench_memory import DEFAULT_PAGES, enlarge  # noqa: E402
+from webscout.scout import Scout  # noqa: E402
+
+LOOKUPS: Dict[str, Callable[[Scout], object]] = {
+    "find_all('a')": lambda s: s.find_all("a"),
+    "find_all(class_)": lambda s: s.find_all("a", class_="result__a"),
+    "find('title')": lambda s: s.find("title"),
+    "find(id=)": lambda s: s.find(attrs={"id": "links"}),
+    "select('.result')": lambda s: s.select(".result"),
+    "extract_metadata": lambda s: s.extract_metadata(),
+    "extract_semantic_info": lambda s: s.extract_semantic_info(),
+    "analyze_page_structure": lambda s: s.analyze_page_structure(),
+}
+
+
+def median_us(fns: List[Callable[[], object]], runs: int) -> List[float]:
+    """Median microseconds of each function, run in turns so machine noise hits them alike."""
+    times = [[] for _ in fns]
+    for fn in fns:
+        fn()
+    for _ in range(runs):
+        for fn, samples in zip(fns, times):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+    return [statistics.median(samples) * 1e6 for samples in times]
+
+
+def retained_kib(make: Callable[[], Scout]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        scout = make()
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del scout
+    return retained / 1024
+
+
+def same(a: object, b: object) -> bool:
+    if hasattr(a, "_results"):
+        a, b = a._results, b._results
+    if isinstance(a, list):
+        return len(a) == len(b) and all(x is y or same(x, y) for x, y in zip(a, b))
+    if hasattr(a, "attrs") and hasattr(a, "name"):
+        return a.name == b.name and a.attrs == b.attrs
+    return repr(a) == repr(b)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", type=Path, help="Saved HTML pages (defaults to the search fixtures)")
+    parser.add_argument("--parser", default="html.parser", help="Scout parser backend")
+    parser.add_argument("--target-kib", type=int, default=2048, help="Grow every page to this size; 0 keeps it")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per lookup")
+    args = parser.parse_args()
+
+    for path in args.pages or DEFAULT_PAGES:
+        markup = enlarge(path.read_text(encoding="utf-8", errors="replace"), args.target_kib * 1024)
+        indexed = Scout(markup, features=args.parser, index=True)
+        walked = Scout(markup, features=args.parser, index=False)
+        parse_indexed, parse_walked = median_us(
+            [lambda: Scout(markup, features=args.parser, index=True),
+             lambda: Scout(markup, features=args.parser, index=False)],
+            max(1, args.runs // 10),
+        )
+        memory = retained_kib(lambda: Scout(markup, features=args.parser, index=True)) - retained_kib(
+            lambda: Scout(markup, features=args.parser, index=False)
+        )
+        print(
+            f"\n{path.name} ({len(markup) / 1024:.0f} KiB, {len(walked.find_all())} tags, {args.parser}): "
+            f"parse {parse_walked / 1000:.0f} -> {parse_indexed / 1000:.0f} ms with the index, "
+            f"index keeps {memory:.0f} KiB"
+        )
+        print(f"{'lookup':<24} {'results':>8} {'walk us':>10} {'index us':>10} {'speedup':>8}")
+        for name, lookup in LOOKUPS.items():
+            expected = lookup(walked)
+            assert same(lookup(indexed), expected), f"{path.name} {name}: index and walk disagree"
+            walk, index = median_us([lambda: lookup(walked), lambda: lookup(indexed)], args.runs)
+            count = len(expected) if hasattr(expected, "__len__") else 1
+            print(f"{name:<24} {count:>8} {walk:>10.0f} {index:>10.0f} {walk / max(1e-9, index):>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Scout memory benchmark: resident size of a parsed document.
+
+Parses large saved pages with each Scout parser backend and reports what the
+tree keeps alive once parsing is done (tracemalloc, with only the root held),
+the peak during parsing, the number of nodes and the bytes each one costs.
+The recorded search result pages in ``benchmarks/search/fixtures`` are the
+default input; their ``<body>`` is repeated until each page reaches
+``--target-kib``, so the numbers reflect the multi-megabyte pages we parse in
+production rather than a few KiB of markup.
+
+Save a run with ``--json`` and compare a later one against it with
+``--baseline``.
+
+    python benchmarks/scout/bench_memory.py
+    python benchmarks/scout/bench_memory.py --target-kib 4096 --parsers lxml
+    python benchmarks/scout/bench_memory.py page1.html page2.html --json before.json
+    python benchmarks/scout/bench_memory.py --baseline before.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from webscout.scout import NavigableString, Tag  # noqa: E402
+from webscout.scout.parsers import ParserRegistry  # noqa: E402
+
+FIXTURES = ROOT / "benchmarks" / "search" / "fixtures"
+DEFAULT_PAGES = [FIXTURES / "google.html", FIXTURES / "html.html", FIXTURES / "lite.html"]
+
+# Benchmark name -> (parser name, parser options)
+VARIANTS = {
+    "html.parser": ("html.parser", {}),
+    "html.parser lean": ("html.parser", {"special_nodes": False}),
+    "lxml": ("lxml", {}),
+    "html5lib": ("html5lib", {}),
+}
+
+
+def enlarge(markup: str, target: int) -> str:
+    """The page with its ``<body>`` content repeated until it is ``target`` characters long."""
+    match = re.search(r"(<body[^>]*>)(.*)(</body>)", markup, flags=re.IGNORECASE | re.DOTALL)
+    if not match or len(markup) >= target:
+        return markup
+    body = match.group(2)
+    copies = max(1, (target - len(markup)) // max(1, len(body)) + 1)
+    return markup[: match.start(2)] + body * (copies + 1) + markup[match.end(2) :]
+
+
+def count_nodes(root: Any) -> Dict[str, int]:
+    tags = strings = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Tag):
+            tags += 1
+            stack.extend(node.contents)
+        elif isinstance(node, NavigableString):
+            strings += 1
+    return {"tags": tags, "strings": strings}
+
+
+def parse(name: str, markup: str) -> Any:
+    parser_name, options = VARIANTS[name]
+    return ParserRegistry.get_parser(parser_name, **options).parse(markup)
+
+
+def bench(name: str, markup: str, runs: int) -> Dict[str, float]:
+    parse(name, markup)  # warm-up
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        parse(name, markup)
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        root = parse(name, markup)
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    nodes = count_nodes(root)
+    total = nodes["tags"] + nodes["strings"]
+    return {
+        **nodes,
+        "ms": statistics.median(times) * 1000,
+        "retained_kib": retained / 1024,
+        "peak_kib": peak / 1024,
+        "bytes_per_node": retained / max(1, total),
+    }
+
+
+def delta(new: float, old: Optional[float]) -> str:
+    if not old:
+        return ""
+    return f"{(new - old) / old * 100:+.0f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", type=Path, help="Saved HTML pages (defaults to the search fixtures)")
+    parser.add_argument("--target-kib", type=int, default=2048, help="Grow every page to this size; 0 keeps it")
+    parser.add_argument("--parsers", default=",".join(VARIANTS), help="Comma-separated benchmarks to run")
+    parser.add_argument("--runs", type=int, default=3, help="Parses timed per page and parser")
+    parser.add_argument("--json", type=Path, help="Save the results to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare with results saved by an earlier --json run")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else {"pages": {}}
+    report: Dict[str, Any] = {"python": platform.python_version(), "target_kib": args.target_kib, "pages": {}}
+    names: List[str] = [name.strip() for name in args.parsers.split(",") if name.strip()]
+    unknown = sorted(set(names) - set(VARIANTS))
+    if unknown:
+        parser.error(f"unknown parsers {unknown}, choose from {list(VARIANTS)}")
+
+    print(
+        f"{'page':<12} {'parser':<17} {'KiB':>6} {'tags':>7} {'strings':>8} {'ms':>8} "
+        f"{'retained KiB':>13} {'peak KiB':>9} {'B/node':>7} {'vs base':>8}"
+    )
+    for path in args.pages or DEFAULT_PAGES:
+        markup = enlarge(path.read_text(encoding="utf-8", errors="replace"), args.target_kib * 1024)
+        for name in names:
+            row = bench(name, markup, args.runs)
+            report["pages"].setdefault(path.name, {})[name] = row
+            old = baseline["pages"].get(path.name, {}).get(name, {})
+            print(
+                f"{path.name:<12} {name:<17} {len(markup) / 1024:>6.0f} {row['tags']:>7} {row['strings']:>8} "
+                f"{row['ms']:>8.1f} {row['retained_kib']:>13.0f} {row['peak_kib']:>9.0f} "
+                f"{row['bytes_per_node']:>7.0f} {delta(row['retained_kib'], old.get('retained_kib')):>8}"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"\nsaved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Scout CSS selector benchmark: compiled selectors vs find_all chains.
+
+Parses large saved pages (see ``bench_memory.py``) and, for a set of
+selectors scraping code uses, times in turns:
+
+- ``select`` on a document with the tag/class/id index
+- ``select`` on the same document parsed without the index
+- the ``find_all`` chain the selector replaces, which must return the same tags
+
+plus the cost of compiling each selector against a cache hit.
+
+    python benchmarks/scout/bench_select.py
+    python benchmarks/scout/bench_select.py --parser lxml --runs 50
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from bench_memory import DEFAULT_PAGES, enlarge  # noqa: E402
+from webscout.scout import Scout  # noqa: E402
+from webscout.scout.selector import compile_selector  # noqa: E402
+
+
+def chain_result_links(s: Scout) -> list:
+    links = []
+    for block in s.find_all("div", class_="links_main"):
+        for h2 in block.find_all("h2"):
+            if h2.parent is block:
+                links.extend(a for a in h2.find_all("a", href=True) if a is not h2)
+    return links
+
+
+def chain_snippets(s: Scout) -> list:
+    return [
+        td for table in s.find_all("table") for tr in table.find_all("tr")
+        for td in tr.contents if getattr(td, "name", None) == "td" and "result-snippet" in td.get("class", "").split()
+    ]
+
+
+def chain_odd_rows(s: Scout) -> list:
+    rows = []
+    for tr in s.find_all("tr"):
+        elements = [c for c in tr.parent.contents if not isinstance(c, str)]
+        if next(i for i, c in enumerate(elements) if c is tr) % 2 == 0:
+            rows.append(tr)
+    return rows
+
+
+# Selector -> the find_all chain scraping code writes for it
+CASES: Dict[str, Callable[[Scout], list]] = {
+    "a.result__a": lambda s: s.find_all("a", class_="result__a"),
+    "div.links_main > h2 a[href]": chain_result_links,
+    "#links a": lambda s: [a for links in s.find_all(id="links") for a in links.find_all("a")],
+    "a[href^='https://']": lambda s: [a for a in s.find_all("a") if (a.get("href") or "").startswith("https://")],
+    "tr > td.result-snippet": chain_snippets,
+    "tr:nth-child(odd)": chain_odd_rows,
+}
+
+
+def median_us(fns: List[Callable[[], object]], runs: int) -> List[float]:
+    """Median microseconds of each function, run in turns so machine noise hits them alike."""
+    times = [[] for _ in fns]
+    for fn in fns:
+        fn()
+    for _ in range(runs):
+        for fn, samples in zip(fns, times):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+    return [statistics.median(samples) * 1e6 for samples in times]
+
+
+def unique(tags: list) -> list:
+    seen, ordered = set(), []
+    for tag in tags:
+        if id(tag) not in seen:
+            seen.add(id(tag))
+            ordered.append(tag)
+    return ordered
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", type=Path, help="Saved HTML pages (defaults to the search fixtures)")
+    parser.add_argument("--parser", default="html.parser", help="Scout parser backend")
+    parser.add_argument("--target-kib", type=int, default=2048, help="Grow every page to this size; 0 keeps it")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per selector")
+    args = parser.parse_args()
+
+    compile_us: List[Tuple[str, float, float]] = []
+    for selector in CASES:
+        uncached, cached = median_us(
+            [lambda: compile_selector.__wrapped__(selector), lambda: compile_selector(selector)], 200
+        )
+        compile_us.append((selector, uncached, cached))
+    print(f"{'compile':<28} {'parse us':>9} {'cached us':>10}")
+    for selector, uncached, cached in compile_us:
+        print(f"{selector:<28} {uncached:>9.1f} {cached:>10.2f}")
+
+    for path in args.pages or DEFAULT_PAGES:
+        markup = enlarge(path.read_text(encoding="utf-8", errors="replace"), args.target_kib * 1024)
+        indexed = Scout(markup, features=args.parser, index=True)
+        walked = Scout(markup, features=args.parser, index=False)
+        print(f"\n{path.name} ({len(markup) / 1024:.0f} KiB, {args.parser})")
+        print(f"{'selector':<28} {'results':>8} {'select us':>10} {'no index':>10} {'find_all':>10} {'speedup':>8}")
+        for selector, chain in CASES.items():
+            expected = unique(chain(walked))
+            got = walked.select(selector)
+            assert len(got) == len(expected) and all(a is b for a, b in zip(got, expected)), (
+                f"{path.name} {selector}: select and find_all chain disagree ({len(got)} vs {len(expected)})"
+            )
+            assert len(indexed.select(selector)) == len(expected), f"{path.name} {selector}: index disagrees"
+            fast, plain, slow = median_us(
+                [lambda: indexed.select(selector), lambda: walked.select(selector), lambda: unique(chain(walked))],
+                args.runs,
+            )
+            print(
+                f"{selector:<28} {len(expected):>8} {fast:>10.0f} {plain:>10.0f} {slow:>10.0f} "
+                f"{slow / max(1e-9, fast):>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+DuckDuckGo html/lite result extraction: per-element XPath vs one walk.
+
+Parses the saved html.duckduckgo.com and lite.duckduckgo.com result pages
+with:
+
+- the extraction the parsers used before (three string XPath queries per
+  result, ``_normalize`` on every field, kept here as the reference), and
+- ``_parse_text_html`` / ``_parse_text_lite`` as they are now (compiled
+  XPath for the rows, one walk over each result's children).
+
+Both must return the same results. Times are per page, split into the lxml
+document build both share and the extraction on top of it.
+
+    python benchmarks/search/bench_parsers.py
+    python benchmarks/search/bench_parsers.py --runs 500
+"""
+
+import argparse
+import re
+import statistics
+import sys
+import time
+from html import unescape
+from itertools import cycle
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from lxml.html import document_fromstring  # noqa: E402
+
+from stub import fixture  # noqa: E402
+from webscout.utils import _normalize_url  # noqa: E402
+from webscout.webscout_search import _AD_PREFIXES, _html_parser, _parse_text_html, _parse_text_lite  # noqa: E402
+
+REGEX_STRIP_TAGS = re.compile("<.*?>")
+
+
+def old_normalize(raw_html: str) -> str:
+    return unescape(REGEX_STRIP_TAGS.sub("", raw_html)) if raw_html else ""
+
+
+def old_parse_text_html(resp_content: bytes, cache: set) -> list:
+    page_results = []
+    tree = document_fromstring(resp_content, _html_parser())
+    for e in tree.xpath("//div[h2]"):
+        hrefxpath = e.xpath("./a/@href")
+        href = str(hrefxpath[0]) if hrefxpath else None
+        if href and href not in cache and not href.startswith(_AD_PREFIXES):
+            cache.add(href)
+            titlexpath = e.xpath("./h2/a/text()")
+            title = str(titlexpath[0]) if titlexpath else ""
+            bodyxpath = e.xpath("./a//text()")
+            body = "".join(str(x) for x in bodyxpath) if bodyxpath else ""
+            page_results.append(
+                {"title": old_normalize(title), "href": _normalize_url(href), "body": old_normalize(body)}
+            )
+    return page_results
+
+
+def old_parse_text_lite(resp_content: bytes, cache: set) -> list:
+    page_results = []
+    tree = document_fromstring(resp_content, _html_parser())
+    data = zip(cycle(range(1, 5)), tree.xpath("//table[last()]//tr"))
+    for i, e in data:
+        if i == 1:
+            hrefxpath = e.xpath(".//a//@href")
+            href = str(hrefxpath[0]) if hrefxpath else None
+            if href is None or href in cache or href.startswith(_AD_PREFIXES):
+                [next(data, None) for _ in range(3)]
+            else:
+                cache.add(href)
+                titlexpath = e.xpath(".//a//text()")
+                title = str(titlexpath[0]) if titlexpath else ""
+        elif i == 2:
+            bodyxpath = e.xpath(".//td[@class='result-snippet']//text()")
+            body = "".join(str(x) for x in bodyxpath).strip() if bodyxpath else ""
+            if href:
+                page_results.append(
+                    {"title": old_normalize(title), "href": _normalize_url(href), "body": old_normalize(body)}
+                )
+    return page_results
+
+
+def median_us(fns: list, content: bytes, runs: int) -> list:
+    """Median microseconds of each function, run in turns so machine noise hits them alike."""
+    times = [[] for _ in fns]
+    for fn in fns:
+        fn(content)
+    for _ in range(runs):
+        for fn, samples in zip(fns, times):
+            start = time.perf_counter()
+            fn(content)
+            samples.append(time.perf_counter() - start)
+    return [statistics.median(samples) * 1e6 for samples in times]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200, help="Parses timed per page and parser")
+    args = parser.parse_args()
+
+    print(f"{'page':<6} {'results':>8} {'document us':>12} {'before us':>10} {'now us':>8} {'extraction':>11}")
+    for name, page, old, new in (
+        ("html", fixture("html.html"), old_parse_text_html, _parse_text_html),
+        ("lite", fixture("lite.html"), old_parse_text_lite, _parse_text_lite),
+    ):
+        expected = old(page, set())
+        assert new(page, set()) == expected, f"{name}: results differ from the reference extraction"
+        document, before, now = median_us(
+            [lambda c: document_fromstring(c, _html_parser()), lambda c: old(c, set()), lambda c: new(c, set())],
+            page,
+            args.runs,
+        )
+        speedup = (before - document) / max(1e-9, now - document)
+        print(f"{name:<6} {len(expected):>8} {document:>12.0f} {before:>10.0f} {now:>8.0f} {speedup:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Search benchmark suite: WEBS, AsyncWEBS, GoogleS and YepSearch, offline.
+
+Every endpoint (d.js, html and lite DuckDuckGo, i.js, v.js, news.js,
+local.js, the Google results page and the Yep API) is answered by
+``stub.py`` with its recorded fixture, so the numbers only move when the
+parsing, pagination or client code does. Three measurements:
+
+- parse: time and peak allocation to parse one page of each fixture with the
+  parser the client uses, and the results it yields
+- search: end-to-end latency (median and p95 of sequential queries) through
+  the real client code against the stub, with ``--latency`` per request
+- throughput: queries per second with ``--concurrency`` queries in flight
+  (threads for the sync clients, one event loop for AsyncWEBS)
+
+Save a run with ``--json`` and compare a later one against it with
+``--baseline`` to see what a release changed.
+
+    python benchmarks/search/bench_search.py
+    python benchmarks/search/bench_search.py --latency 50 --concurrency 16 --only ddg
+    python benchmarks/search/bench_search.py --json before.json
+    python benchmarks/search/bench_search.py --baseline before.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from stub import HOSTS, AsyncStubTransport, StubServer, StubTransport, fixture, mount  # noqa: E402
+from webscout import ratelimit  # noqa: E402
+from webscout.DWEBS import GoogleS, _parse_results as _parse_google  # noqa: E402
+from webscout.utils import _text_extract_json  # noqa: E402
+from webscout.webscout_search import (  # noqa: E402
+    WEBS,
+    _parse_images,
+    _parse_maps,
+    _parse_news,
+    _parse_text_html,
+    _parse_text_lite,
+    _parse_videos,
+)
+from webscout.webscout_search_async import AsyncWEBS  # noqa: E402
+from webscout.yep_search import YepSearch  # noqa: E402
+
+
+def parsers(yep: YepSearch) -> Dict[str, tuple]:
+    """Parser name -> (fixture, function parsing one page of it into results)."""
+    return {
+        "ddg d.js": ("d.js", lambda c: _text_extract_json(c, "bench")),
+        "ddg html": ("html.html", lambda c: _parse_text_html(c, set())),
+        "ddg lite": ("lite.html", lambda c: _parse_text_lite(c, set())),
+        "ddg i.js": ("i.js.json", lambda c: _parse_images(c, set())),
+        "ddg v.js": ("v.js.json", lambda c: _parse_videos(c, set())),
+        "ddg news.js": ("news.js.json", lambda c: _parse_news(c, set())),
+        "ddg local.js": ("local.js.json", lambda c: _parse_maps(c, set())),
+        "google": ("google.html", _parse_google),
+        "yep": ("yep.json", lambda c: yep.format_results(json.loads(c))),
+    }
+
+
+def bench_parse(parse: Callable[[bytes], list], content: bytes, runs: int) -> Dict[str, float]:
+    results = parse(content)  # warm-up, and lazily built parsers/caches
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        parse(content)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        parse(content)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "kib": len(content) / 1024,
+        "results": len(results),
+        "ms": statistics.median(times) * 1000,
+        "us_per_result": statistics.median(times) * 1e6 / max(1, len(results)),
+        "peak_kib": peak / 1024,
+    }
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def bench_search(
+    call: Callable[[str], list],
+    runs: int,
+    concurrency: int,
+    stub: StubServer,
+    many: Optional[Callable[[List[str]], Any]] = None,
+) -> Dict[str, float]:
+    """Sequential latency, then throughput with ``concurrency`` queries in flight."""
+    tag = uuid.uuid4().hex[:8]  # fresh keywords: no vqd or result cache hits from earlier runs
+    call(f"warm {tag}")
+    hits_before = sum(stub.hits.values())
+    latencies, count = [], 0
+    for i in range(runs):
+        start = time.perf_counter()
+        count = len(call(f"query {tag} {i}"))
+        latencies.append(time.perf_counter() - start)
+    requests_per_query = (sum(stub.hits.values()) - hits_before) / runs
+
+    queries = [f"load {tag} {i}" for i in range(concurrency * 4)]
+    start = time.perf_counter()
+    if many is not None:
+        many(queries)
+    else:
+        with ThreadPoolExecutor(concurrency) as pool:
+            list(pool.map(call, queries))
+    elapsed = time.perf_counter() - start
+    return {
+        "results": count,
+        "requests": requests_per_query,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "qps": len(queries) / elapsed,
+    }
+
+
+def delta(new: float, old: Optional[float]) -> str:
+    if not old:
+        return ""
+    return f"{(new - old) / old * 100:+.0f}%"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=20, help="Stub response latency in ms")
+    parser.add_argument("--max-results", type=int, default=100, help="Results asked per search")
+    parser.add_argument("--parse-runs", type=int, default=50, help="Parses timed per fixture")
+    parser.add_argument("--runs", type=int, default=10, help="Sequential queries timed per search")
+    parser.add_argument("--concurrency", type=int, default=8, help="Queries in flight for the throughput run")
+    parser.add_argument("--only", default="", help="Only benchmarks whose name contains this")
+    parser.add_argument("--json", type=Path, help="Save the results to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare with results saved by an earlier --json run")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else {"parse": {}, "search": {}}
+    report: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "latency_ms": args.latency,
+        "max_results": args.max_results,
+        "concurrency": args.concurrency,
+        "parse": {},
+        "search": {},
+    }
+    yep = YepSearch()
+
+    print(f"{'parse':<14} {'KiB':>7} {'results':>8} {'ms/page':>9} {'us/result':>10} {'peak KiB':>9} {'vs base':>8}")
+    for name, (fixture_name, parse) in parsers(yep).items():
+        if args.only not in name:
+            continue
+        row = report["parse"][name] = bench_parse(parse, fixture(fixture_name), args.parse_runs)
+        print(
+            f"{name:<14} {row['kib']:>7.1f} {row['results']:>8} {row['ms']:>9.3f} {row['us_per_result']:>10.1f} "
+            f"{row['peak_kib']:>9.0f} {delta(row['ms'], baseline['parse'].get(name, {}).get('ms')):>8}"
+        )
+
+    for host in HOSTS:
+        ratelimit.configure_host(host, rate=1e6, burst=1e6, concurrency=args.concurrency)
+
+    n = args.max_results
+    with StubServer(latency=args.latency / 1000) as stub:
+        webs = WEBS(result_cache=None, max_workers=args.concurrency * 4)
+        webs.client = httpx.Client(transport=StubTransport(stub.port), headers=webs.headers)
+        google = GoogleS(rate_limit=0, max_workers=args.concurrency)
+        mount(google.client, stub.port)
+        mount(yep.session, stub.port)
+
+        loop = asyncio.new_event_loop()
+        awebs = AsyncWEBS(result_cache=None)
+        awebs.client = httpx.AsyncClient(transport=AsyncStubTransport(stub.port), headers=awebs.headers)
+
+        def run_async(make):
+            return lambda q: loop.run_until_complete(make(q))
+
+        def gather_async(make):
+            async def gather(queries):
+                return await asyncio.gather(*(make(q) for q in queries))
+            return lambda queries: loop.run_until_complete(gather(queries))
+
+        async_text = lambda q: awebs.atext(q, backend="html", max_results=n)  # noqa: E731
+        async_images = lambda q: awebs.aimages(q, max_results=n)  # noqa: E731
+        searches = {
+            "ddg d.js": (lambda q: webs._text_api(q, max_results=n), None),
+            "ddg html": (lambda q: webs.text(q, backend="html", max_results=n), None),
+            "ddg lite": (lambda q: webs.text(q, backend="lite", max_results=n), None),
+            "ddg images": (lambda q: webs.images(q, max_results=n), None),
+            "ddg videos": (lambda q: webs.videos(q, max_results=n), None),
+            "ddg news": (lambda q: webs.news(q, max_results=n), None),
+            "ddg maps": (lambda q: webs.maps(q, place="New York", max_results=n), None),
+            "async ddg html": (run_async(async_text), gather_async(async_text)),
+            "async ddg images": (run_async(async_images), gather_async(async_images)),
+            "google": (lambda q: google.search(q, max_results=min(n, 30)), None),
+            "yep": (lambda q: yep.text(q, max_results=n), None),
+        }
+
+        print(f"\nstub latency {args.latency:.0f} ms, {n} results asked, {args.concurrency} queries in flight")
+        print(f"{'search':<17} {'results':>8} {'requests':>9} {'p50 ms':>8} {'p95 ms':>8} {'q/s':>8} {'vs base':>8}")
+        for name, (call, many) in searches.items():
+            if args.only not in name:
+                continue
+            row = report["search"][name] = bench_search(call, args.runs, args.concurrency, stub, many)
+            old = baseline["search"].get(name, {})
+            print(
+                f"{name:<17} {row['results']:>8} {row['requests']:>9.1f} {row['p50_ms']:>8.1f} "
+                f"{row['p95_ms']:>8.1f} {row['qps']:>8.1f} {delta(row['p50_ms'], old.get('p50_ms')):>8}"
+            )
+
+        loop.run_until_complete(awebs.client.aclose())
+        loop.close()
+
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+        print(f"\nsaved to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+if (DDG.deep && DDG.deep.setUpstream) DDG.deep.setUpstream("bingv7aa");DDG.deep.bn={'ivc':1};if (DDG.pageLayout) DDG.pageLayout.initialize({"mainline":{"items":[["organic"]]}}, { start: 0 });;DDG.deep.signalSummary = "";DDG.inject('DDG.Data.languages.resultLanguages', {"en":["docs.python.org/3/library/asyncio.html","realpython.com/async-io-python/","www.geeksforgeeks.org/asyncio-in-python/","superfastpython.com/python-asyncio/","stackoverflow.com/questions/50757497/simplest-async-await-example-possible-in-python","www.datacamp.com/tutorial/asyncio-tutorial","medium.com/@moraneus/mastering-pythons-asyncio-a-practical-guide-0a673265cf04","www.youtube.com/watch?v=t5Bo1Je9EmE","github.com/timofurrer/awesome-asyncio","www.pythontutorial.net/python-concurrency/python-asyncio/","testdriven.io/blog/concurrency-parallelism-asyncio/","www.educative.io/blog/python-asyncio-tutorial","pymotw.com/3/asyncio/","docs.aiohttp.org/en/stable/","www.integralist.co.uk/posts/python-asyncio/","bbc.github.io/cloudfit-public-docs/asyncio/asyncio-part-1","www.pythonpool.com/python-asyncio/","lucumr.pocoo.org/2016/10/30/i-dont-understand-asyncio/","www.roguelynn.com/words/asyncio-we-did-it-wrong/","hackernoon.com/a-simple-introduction-to-pythons-asyncio-595d9c9ecf8c","www.twilio.com/blog/asynchronous-http-requests-in-python-with-aiohttp","fastapi.tiangolo.com/async/","peps.python.org/pep-3156/","www.reddit.com/r/learnpython/comments/asyncio_explained/","trio.readthedocs.io/en/stable/tutorial.html","www.programiz.com/python-programming/asyncio","jacobpadilla.com/articles/recreating-asyncio","www.velotio.com/engineering-blog/async-features-in-python","codilime.com/blog/python-asyncio/","www.infoworld.com/article/3454954/get-started-with-async-in-python.html"]});DDG.pageLayout.load('d',[{"a": "<b>asyncio</b> is a library to write concurrent code using the async/await syntax. <b>asyncio</b> is used as a foundation for multiple <b>Python</b> asynchronous frameworks that provide high-performance network and web-servers, database connection libraries, distributed task queues, etc.", "ae": null, "c": "https://docs.python.org/3/library/asyncio.html", "d": "docs.python.org/3/library/asyncio.html", "da": "", "h": 0, "i": "docs.python.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "asyncio — Asynchronous I/O — Python 3.12 documentation", "u": "https://docs.python.org/3/library/asyncio.html"}, {"a": "In this <b>tutorial</b>, you&#x27;ll learn how <b>Python</b>&#x27;s <b>asyncio</b> library works: coroutines, the event loop, tasks and futures, with practical examples you can run today.", "ae": null, "c": "https://realpython.com/async-io-python/", "d": "realpython.com/async-io-python/", "da": "", "h": 0, "i": "realpython.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Async IO in Python: A Complete Walkthrough – Real Python", "u": "https://realpython.com/async-io-python/"}, {"a": "Learn how to use <b>asyncio</b> in <b>Python</b> to write concurrent programs. This step-by-step guide covers async def, await, gather() and timeouts &amp; cancellation.", "ae": null, "c": "https://www.geeksforgeeks.org/asyncio-in-python/", "d": "www.geeksforgeeks.org/asyncio-in-python/", "da": "", "h": 0, "i": "www.geeksforgeeks.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "asyncio in Python - GeeksforGeeks", "u": "https://www.geeksforgeeks.org/asyncio-in-python/"}, {"a": "Jan 12, 2024 · The <b>asyncio</b> module provides infrastructure for writing single-threaded concurrent code using coroutines, multiplexing I/O access over sockets and other resources.", "ae": null, "c": "https://superfastpython.com/python-asyncio/", "d": "superfastpython.com/python-asyncio/", "da": "", "h": 0, "i": "superfastpython.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python Asyncio: The Complete Guide - Super Fast Python", "u": "https://superfastpython.com/python-asyncio/"}, {"a": "A complete guide to <b>Python</b> <b>asyncio</b>: what it is, when to use it, and how to avoid the most common pitfalls like blocking the event loop.", "ae": null, "c": "https://stackoverflow.com/questions/50757497/simplest-async-await-example-possible-in-python", "d": "stackoverflow.com/questions/50757497/simplest-async-await-example-possible-in-python", "da": "", "h": 0, "i": "stackoverflow.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Simplest async/await example possible in Python - Stack Overflow", "u": "https://stackoverflow.com/questions/50757497/simplest-async-await-example-possible-in-python"}, {"a": "<b>asyncio</b> is a library to write concurrent code using the async/await syntax. <b>asyncio</b> is used as a foundation for multiple <b>Python</b> asynchronous frameworks that provide high-performance network and web-servers, database connection libraries, distributed task queues, etc.", "ae": null, "c": "https://www.datacamp.com/tutorial/asyncio-tutorial", "d": "www.datacamp.com/tutorial/asyncio-tutorial", "da": "", "h": 0, "i": "www.datacamp.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python Asyncio Tutorial: A Complete Guide | DataCamp", "u": "https://www.datacamp.com/tutorial/asyncio-tutorial"}, {"a": "In this <b>tutorial</b>, you&#x27;ll learn how <b>Python</b>&#x27;s <b>asyncio</b> library works: coroutines, the event loop, tasks and futures, with practical examples you can run today.", "ae": null, "c": "https://medium.com/@moraneus/mastering-pythons-asyncio-a-practical-guide-0a673265cf04", "d": "medium.com/@moraneus/mastering-pythons-asyncio-a-practical-guide-0a673265cf04", "da": "", "h": 0, "i": "medium.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Mastering Python&#x27;s Asyncio: A Practical Guide | by Moraneus | Medium", "u": "https://medium.com/@moraneus/mastering-pythons-asyncio-a-practical-guide-0a673265cf04"}, {"a": "Learn how to use <b>asyncio</b> in <b>Python</b> to write concurrent programs. This step-by-step guide covers async def, await, gather() and timeouts &amp; cancellation.", "ae": null, "c": "https://www.youtube.com/watch?v=t5Bo1Je9EmE", "d": "www.youtube.com/watch?v=t5Bo1Je9EmE", "da": "", "h": 0, "i": "www.youtube.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python Asyncio, Requests, Aiohttp | Make faster API Calls - YouTube", "u": "https://www.youtube.com/watch?v=t5Bo1Je9EmE"}, {"a": "Jan 12, 2024 · The <b>asyncio</b> module provides infrastructure for writing single-threaded concurrent code using coroutines, multiplexing I/O access over sockets and other resources.", "ae": null, "c": "https://github.com/timofurrer/awesome-asyncio", "d": "github.com/timofurrer/awesome-asyncio", "da": "", "h": 0, "i": "github.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "GitHub - timofurrer/awesome-asyncio: A curated list of awesome Python asyncio frameworks", "u": "https://github.com/timofurrer/awesome-asyncio"}, {"a": "A complete guide to <b>Python</b> <b>asyncio</b>: what it is, when to use it, and how to avoid the most common pitfalls like blocking the event loop.", "ae": null, "c": "https://www.pythontutorial.net/python-concurrency/python-asyncio/", "d": "www.pythontutorial.net/python-concurrency/python-asyncio/", "da": "", "h": 0, "i": "www.pythontutorial.net", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python asyncio - Python Tutorial", "u": "https://www.pythontutorial.net/python-concurrency/python-asyncio/"}, {"a": "<b>asyncio</b> is a library to write concurrent code using the async/await syntax. <b>asyncio</b> is used as a foundation for multiple <b>Python</b> asynchronous frameworks that provide high-performance network and web-servers, database connection libraries, distributed task queues, etc.", "ae": null, "c": "https://testdriven.io/blog/concurrency-parallelism-asyncio/", "d": "testdriven.io/blog/concurrency-parallelism-asyncio/", "da": "", "h": 0, "i": "testdriven.io", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Speeding Up Python with Concurrency, Parallelism, and asyncio | TestDriven.io", "u": "https://testdriven.io/blog/concurrency-parallelism-asyncio/"}, {"a": "In this <b>tutorial</b>, you&#x27;ll learn how <b>Python</b>&#x27;s <b>asyncio</b> library works: coroutines, the event loop, tasks and futures, with practical examples you can run today.", "ae": null, "c": "https://www.educative.io/blog/python-asyncio-tutorial", "d": "www.educative.io/blog/python-asyncio-tutorial", "da": "", "h": 0, "i": "www.educative.io", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python asyncio tutorial: A beginner&#x27;s guide - Educative", "u": "https://www.educative.io/blog/python-asyncio-tutorial"}, {"a": "Learn how to use <b>asyncio</b> in <b>Python</b> to write concurrent programs. This step-by-step guide covers async def, await, gather() and timeouts &amp; cancellation.", "ae": null, "c": "https://pymotw.com/3/asyncio/", "d": "pymotw.com/3/asyncio/", "da": "", "h": 0, "i": "pymotw.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "asyncio — Asynchronous I/O, event loop, and concurrency tools — PyMOTW 3", "u": "https://pymotw.com/3/asyncio/"}, {"a": "Jan 12, 2024 · The <b>asyncio</b> module provides infrastructure for writing single-threaded concurrent code using coroutines, multiplexing I/O access over sockets and other resources.", "ae": null, "c": "https://docs.aiohttp.org/en/stable/", "d": "docs.aiohttp.org/en/stable/", "da": "", "h": 0, "i": "docs.aiohttp.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Welcome to AIOHTTP — aiohttp 3.9.5 documentation", "u": "https://docs.aiohttp.org/en/stable/"}, {"a": "A complete guide to <b>Python</b> <b>asyncio</b>: what it is, when to use it, and how to avoid the most common pitfalls like blocking the event loop.", "ae": null, "c": "https://www.integralist.co.uk/posts/python-asyncio/", "d": "www.integralist.co.uk/posts/python-asyncio/", "da": "", "h": 0, "i": "www.integralist.co.uk", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Guide to Concurrency in Python with Asyncio ⋆ Mark McDonnell", "u": "https://www.integralist.co.uk/posts/python-asyncio/"}, {"a": "<b>asyncio</b> is a library to write concurrent code using the async/await syntax. <b>asyncio</b> is used as a foundation for multiple <b>Python</b> asynchronous frameworks that provide high-performance network and web-servers, database connection libraries, distributed task queues, etc.", "ae": null, "c": "https://bbc.github.io/cloudfit-public-docs/asyncio/asyncio-part-1", "d": "bbc.github.io/cloudfit-public-docs/asyncio/asyncio-part-1", "da": "", "h": 0, "i": "bbc.github.io", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python Asyncio Part 1 – Basic Concepts and Patterns | cloudfit-public-docs", "u": "https://bbc.github.io/cloudfit-public-docs/asyncio/asyncio-part-1"}, {"a": "In this <b>tutorial</b>, you&#x27;ll learn how <b>Python</b>&#x27;s <b>asyncio</b> library works: coroutines, the event loop, tasks and futures, with practical examples you can run today.", "ae": null, "c": "https://www.pythonpool.com/python-asyncio/", "d": "www.pythonpool.com/python-asyncio/", "da": "", "h": 0, "i": "www.pythonpool.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python Asyncio: Basic Fundamentals - Python Pool", "u": "https://www.pythonpool.com/python-asyncio/"}, {"a": "Learn how to use <b>asyncio</b> in <b>Python</b> to write concurrent programs. This step-by-step guide covers async def, await, gather() and timeouts &amp; cancellation.", "ae": null, "c": "https://lucumr.pocoo.org/2016/10/30/i-dont-understand-asyncio/", "d": "lucumr.pocoo.org/2016/10/30/i-dont-understand-asyncio/", "da": "", "h": 0, "i": "lucumr.pocoo.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "I don&#x27;t understand Python&#x27;s Asyncio | Armin Ronacher&#x27;s Thoughts and Writings", "u": "https://lucumr.pocoo.org/2016/10/30/i-dont-understand-asyncio/"}, {"a": "Jan 12, 2024 · The <b>asyncio</b> module provides infrastructure for writing single-threaded concurrent code using coroutines, multiplexing I/O access over sockets and other resources.", "ae": null, "c": "https://www.roguelynn.com/words/asyncio-we-did-it-wrong/", "d": "www.roguelynn.com/words/asyncio-we-did-it-wrong/", "da": "", "h": 0, "i": "www.roguelynn.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "asyncio: We Did It Wrong – roguelynn", "u": "https://www.roguelynn.com/words/asyncio-we-did-it-wrong/"}, {"a": "A complete guide to <b>Python</b> <b>asyncio</b>: what it is, when to use it, and how to avoid the most common pitfalls like blocking the event loop.", "ae": null, "c": "https://hackernoon.com/a-simple-introduction-to-pythons-asyncio-595d9c9ecf8c", "d": "hackernoon.com/a-simple-introduction-to-pythons-asyncio-595d9c9ecf8c", "da": "", "h": 0, "i": "hackernoon.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "A simple introduction to Python&#x27;s asyncio | HackerNoon", "u": "https://hackernoon.com/a-simple-introduction-to-pythons-asyncio-595d9c9ecf8c"}, {"a": "<b>asyncio</b> is a library to write concurrent code using the async/await syntax. <b>asyncio</b> is used as a foundation for multiple <b>Python</b> asynchronous frameworks that provide high-performance network and web-servers, database connection libraries, distributed task queues, etc.", "ae": null, "c": "https://www.twilio.com/blog/asynchronous-http-requests-in-python-with-aiohttp", "d": "www.twilio.com/blog/asynchronous-http-requests-in-python-with-aiohttp", "da": "", "h": 0, "i": "www.twilio.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Asynchronous HTTP Requests in Python with aiohttp and asyncio - Twilio", "u": "https://www.twilio.com/blog/asynchronous-http-requests-in-python-with-aiohttp"}, {"a": "In this <b>tutorial</b>, you&#x27;ll learn how <b>Python</b>&#x27;s <b>asyncio</b> library works: coroutines, the event loop, tasks and futures, with practical examples you can run today.", "ae": null, "c": "https://fastapi.tiangolo.com/async/", "d": "fastapi.tiangolo.com/async/", "da": "", "h": 0, "i": "fastapi.tiangolo.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Concurrency and async / await - FastAPI", "u": "https://fastapi.tiangolo.com/async/"}, {"a": "Learn how to use <b>asyncio</b> in <b>Python</b> to write concurrent programs. This step-by-step guide covers async def, await, gather() and timeouts &amp; cancellation.", "ae": null, "c": "https://peps.python.org/pep-3156/", "d": "peps.python.org/pep-3156/", "da": "", "h": 0, "i": "peps.python.org", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "PEP 3156 – Asynchronous IO Support Rebooted: the “asyncio” Module", "u": "https://peps.python.org/pep-3156/"}, {"a": "Jan 12, 2024 · The <b>asyncio</b> module provides infrastructure for writing single-threaded concurrent code using coroutines, multiplexing I/O access over sockets and other resources.", "ae": null, "c": "https://www.reddit.com/r/learnpython/comments/asyncio_explained/", "d": "www.reddit.com/r/learnpython/comments/asyncio_explained/", "da": "", "h": 0, "i": "www.reddit.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Can someone explain asyncio like I&#x27;m five? : r/learnpython", "u": "https://www.reddit.com/r/learnpython/comments/asyncio_explained/"}, {"a": "A complete guide to <b>Python</b> <b>asyncio</b>: what it is, when to use it, and how to avoid the most common pitfalls like blocking the event loop.", "ae": null, "c": "https://trio.readthedocs.io/en/stable/tutorial.html", "d": "trio.readthedocs.io/en/stable/tutorial.html", "da": "", "h": 0, "i": "trio.readthedocs.io", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Tutorial — Trio 0.25.0 documentation", "u": "https://trio.readthedocs.io/en/stable/tutorial.html"}, {"a": "<b>asyncio</b> is a library to write concurrent code using the async/await syntax. <b>asyncio</b> is used as a foundation for multiple <b>Python</b> asynchronous frameworks that provide high-performance network and web-servers, database connection libraries, distributed task queues, etc.", "ae": null, "c": "https://www.programiz.com/python-programming/asyncio", "d": "www.programiz.com/python-programming/asyncio", "da": "", "h": 0, "i": "www.programiz.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python asyncio (With Examples) - Programiz", "u": "https://www.programiz.com/python-programming/asyncio"}, {"a": "In this <b>tutorial</b>, you&#x27;ll learn how <b>Python</b>&#x27;s <b>asyncio</b> library works: coroutines, the event loop, tasks and futures, with practical examples you can run today.", "ae": null, "c": "https://jacobpadilla.com/articles/recreating-asyncio", "d": "jacobpadilla.com/articles/recreating-asyncio", "da": "", "h": 0, "i": "jacobpadilla.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Recreating Python&#x27;s Asyncio Library from Scratch", "u": "https://jacobpadilla.com/articles/recreating-asyncio"}, {"a": "Learn how to use <b>asyncio</b> in <b>Python</b> to write concurrent programs. This step-by-step guide covers async def, await, gather() and timeouts &amp; cancellation.", "ae": null, "c": "https://www.velotio.com/engineering-blog/async-features-in-python", "d": "www.velotio.com/engineering-blog/async-features-in-python", "da": "", "h": 0, "i": "www.velotio.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "An Introduction to Asynchronous Programming in Python - Velotio", "u": "https://www.velotio.com/engineering-blog/async-features-in-python"}, {"a": "Jan 12, 2024 · The <b>asyncio</b> module provides infrastructure for writing single-threaded concurrent code using coroutines, multiplexing I/O access over sockets and other resources.", "ae": null, "c": "https://codilime.com/blog/python-asyncio/", "d": "codilime.com/blog/python-asyncio/", "da": "", "h": 0, "i": "codilime.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Python asyncio: a guide to asynchronous programming - CodiLime", "u": "https://codilime.com/blog/python-asyncio/"}, {"a": "A complete guide to <b>Python</b> <b>asyncio</b>: what it is, when to use it, and how to avoid the most common pitfalls like blocking the event loop.", "ae": null, "c": "https://www.infoworld.com/article/3454954/get-started-with-async-in-python.html", "d": "www.infoworld.com/article/3454954/get-started-with-async-in-python.html", "da": "", "h": 0, "i": "www.infoworld.com", "k": null, "m": 0, "o": 0, "p": 0, "s": "bingv7aa", "t": "Get started with async in Python | InfoWorld", "u": "https://www.infoworld.com/article/3454954/get-started-with-async-in-python.html"}, {"n": "/d.js?q=python%20asyncio%20tutorial&t=D&l=us-en&s=23&ct=US&bing_market=en-US&p_ent=&ex=-1&sp=0&vqd=4-211724446271582302340856356227424577474"}]);DDG.duckbar.load('images');DDG.duckbar.load('news');DDG.duckbar.load('videos');DDG.duckbar.loadModule('related_searches', {"ads":[],"query":"python asyncio tutorial"});
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Re-record the search fixtures from the live endpoints.
+
+Runs one search of each kind with the real clients and saves the first
+response of every endpoint into ``fixtures/``, under the names ``stub.py``
+serves them by. Needs network access; the benchmark itself never does.
+Re-record when an engine changes its markup, then compare a benchmark run
+against one saved before (``bench_search.py --baseline``).
+
+    python benchmarks/search/record.py
+    python benchmarks/search/record.py --query "rust borrow checker" --place "Berlin"
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Dict
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from stub import FIXTURES, ROUTES  # noqa: E402
+from webscout.DWEBS import GoogleS  # noqa: E402
+from webscout.webscout_search import WEBS  # noqa: E402
+from webscout.yep_search import YepSearch  # noqa: E402
+
+
+def _route(url: str):
+    parts = urlsplit(url)
+    return ROUTES.get((parts.hostname, parts.path or "/"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--query", default="python asyncio tutorial")
+    parser.add_argument("--place", default="New York", help="Place for the maps search")
+    args = parser.parse_args()
+
+    recorded: Dict[str, bytes] = {}
+
+    def keep(url: str, content: bytes) -> None:
+        route = _route(url)
+        if route and route[0] not in recorded:
+            recorded[route[0]] = content
+
+    webs = WEBS(result_cache=None)
+    get_url = webs._get_url
+
+    def recording_get_url(method, url, *a, **kw):
+        content = get_url(method, url, *a, **kw)
+        keep(url, content)
+        return content
+
+    webs._get_url = recording_get_url
+    google = GoogleS(rate_limit=3.0)
+    google_get_url = google._get_url
+
+    def recording_google_get_url(method, url, *a, **kw):
+        content = google_get_url(method, url, *a, **kw)
+        keep(url, content)
+        return content
+
+    google._get_url = recording_google_get_url
+    yep = YepSearch()
+    yep_get = yep.session.get
+
+    def recording_yep_get(url, *a, **kw):
+        response = yep_get(url, *a, **kw)
+        keep(url, response.content)
+        return response
+
+    yep.session.get = recording_yep_get
+
+    searches = {
+        "d.js": lambda: webs._text_api(args.query, max_results=30),
+        "html": lambda: webs.text(args.query, backend="html", max_results=30),
+        "lite": lambda: webs.text(args.query, backend="lite", max_results=30),
+        "images": lambda: webs.images(args.query, max_results=100),
+        "videos": lambda: webs.videos(args.query, max_results=60),
+        "news": lambda: webs.news(args.query, max_results=30),
+        "maps": lambda: webs.maps("coffee", place=args.place, max_results=20),
+        "google": lambda: google.search(args.query, max_results=10),
+        "yep": lambda: yep.text(args.query, max_results=20),
+    }
+    for name, search in searches.items():
+        try:
+            print(f"{name:<8} {len(search())} results")
+        except Exception as ex:
+            print(f"{name:<8} failed: {type(ex).__name__}: {ex}")
+
+    for name, content in sorted(recorded.items()):
+        (FIXTURES / name).write_bytes(content)
+        print(f"saved {name} ({len(content)} bytes)")
+    missing = sorted({name for name, _ in ROUTES.values()} - set(recorded))
+    if missing:
+        print(f"not re-recorded, kept the existing fixtures: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
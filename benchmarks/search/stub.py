@@ -0,0 +1,183 @@
+"""
+Offline stand-in for the search endpoints, serving the recorded fixtures.
+
+:class:`StubServer` is an ``http.server`` that answers every endpoint WEBS,
+AsyncWEBS, GoogleS and YepSearch call, with the fixture recorded for it
+(see ``record.py``), after a fixed latency. The clients reach it through
+transports that send each request to the stub and pass the original host
+along in ``X-Stub-Host``:
+
+>>> with StubServer(latency=0.05) as stub:
+...     webs = WEBS(result_cache=None)
+...     webs.client = httpx.Client(transport=StubTransport(stub.port), headers=webs.headers)
+
+Later pages of a search get the links of the first page with ``p<offset>.``
+prepended to their host, so pagination and deduplication do the same work as
+against the real endpoints.
+"""
+
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# (host, path) -> (fixture file, content type)
+ROUTES: Dict[Tuple[str, str], Tuple[str, str]] = {
+    ("duckduckgo.com", "/"): ("vqd.html", "text/html; charset=UTF-8"),
+    ("links.duckduckgo.com", "/d.js"): ("d.js", "application/x-javascript"),
+    ("html.duckduckgo.com", "/html"): ("html.html", "text/html; charset=UTF-8"),
+    ("lite.duckduckgo.com", "/lite/"): ("lite.html", "text/html; charset=UTF-8"),
+    ("duckduckgo.com", "/i.js"): ("i.js.json", "application/json"),
+    ("duckduckgo.com", "/v.js"): ("v.js.json", "application/json"),
+    ("duckduckgo.com", "/news.js"): ("news.js.json", "application/json"),
+    ("duckduckgo.com", "/local.js"): ("local.js.json", "application/json"),
+    ("nominatim.openstreetmap.org", "/search.php"): ("nominatim.json", "application/json"),
+    ("www.google.com", "/search"): ("google.html", "text/html; charset=UTF-8"),
+    ("api.yep.com", "/fs/2/search"): ("yep.json", "application/json"),
+}
+
+HOSTS = sorted({host for host, _ in ROUTES})
+
+
+def fixture(name: str) -> bytes:
+    return (FIXTURES / name).read_bytes()
+
+
+def paged(body: bytes, offset: int) -> bytes:
+    """The fixture as page ``offset`` of a search: same results, distinct links."""
+    return body.replace(b"://", f"://p{offset}.".encode()) if offset else body
+
+
+class StubServer:
+    """Threaded stub serving the fixtures; use as a context manager.
+
+    Attributes:
+        port (int): Port the stub listens on, on 127.0.0.1
+        hits (Counter): Requests served per fixture
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Args:
+            latency (float): Seconds each response is held back. Defaults to 0.0.
+        """
+        self.latency = latency
+        self.hits: Counter = Counter()
+        self._lock = threading.Lock()
+        self._bodies = {route: (fixture(name), kind) for route, (name, kind) in ROUTES.items()}
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _reply(self, query: Dict[str, list]) -> None:
+                url = urlsplit(self.path)
+                route = (self.headers.get("X-Stub-Host", ""), url.path)
+                if route not in stub._bodies:
+                    self.send_error(404, f"No fixture for {route}")
+                    return
+                if stub.latency:
+                    time.sleep(stub.latency)
+                body, kind = stub._bodies[route]
+                offset = int((query.get("s") or query.get("start") or ["0"])[0] or 0)
+                body = paged(body, offset)
+                with stub._lock:
+                    stub.hits[ROUTES[route][0]] += 1
+                self.send_response(200)
+                self.send_header("Content-Type", kind)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                self._reply(parse_qs(urlsplit(self.path).query))
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                query = parse_qs(urlsplit(self.path).query)
+                query.update(parse_qs(self.rfile.read(length).decode()))
+                self._reply(query)
+
+        return Handler
+
+    def __enter__(self) -> "StubServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _to_stub(url: str, port: int) -> Tuple[str, Optional[str]]:
+    parts = urlsplit(url)
+    return urlunsplit(("http", f"127.0.0.1:{port}", parts.path or "/", parts.query, "")), parts.hostname
+
+
+def _rewrite(request: httpx.Request, port: int) -> None:
+    request.headers["X-Stub-Host"] = request.url.host
+    request.headers["Host"] = f"127.0.0.1:{port}"
+    request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=port)
+
+
+class StubTransport(httpx.HTTPTransport):
+    """httpx transport sending every request to the stub (WEBS)."""
+
+    def __init__(self, port: int):
+        super().__init__()
+        self.port = port
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        _rewrite(request, self.port)
+        return super().handle_request(request)
+
+
+class AsyncStubTransport(httpx.AsyncHTTPTransport):
+    """Async twin of :class:`StubTransport` (AsyncWEBS)."""
+
+    def __init__(self, port: int):
+        super().__init__()
+        self.port = port
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        _rewrite(request, self.port)
+        return await super().handle_async_request(request)
+
+
+class StubAdapter(HTTPAdapter):
+    """requests adapter sending every request to the stub (GoogleS, YepSearch)."""
+
+    def __init__(self, port: int):
+        super().__init__()
+        self.port = port
+
+    def send(self, request, **kwargs):
+        request.url, host = _to_stub(request.url, self.port)
+        request.headers["X-Stub-Host"] = host
+        request.headers["Host"] = f"127.0.0.1:{self.port}"
+        return super().send(request, **kwargs)
+
+
+def mount(session: requests.Session, port: int) -> requests.Session:
+    """Route every request of a requests session to the stub."""
+    adapter = StubAdapter(port)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
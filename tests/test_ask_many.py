@@ -0,0 +1,66 @@
+"""Provider.ask_many / AsyncProvider.ask_many keep each prompt's answer apart under concurrency."""
+
+import asyncio
+import random
+import time
+
+from webscout.AIasync import to_async
+from webscout.AIbase import AsyncProvider, Provider
+
+PROMPTS = [str(i) for i in range(10)]
+
+
+class SharedStateProvider(Provider):
+    """Fills in and returns one shared ``last_response`` dict, like most providers do."""
+
+    def __init__(self):
+        self.last_response = {}
+
+    def ask(self, prompt, stream=False, raw=False, optimizer=None, conversationally=False):
+        self.last_response.update({"text": f"answer to {prompt}"})
+        time.sleep(random.uniform(0, 0.02))
+        return self.last_response
+
+    def chat(self, prompt, stream=False, optimizer=None, conversationally=False):
+        return self.get_message(self.ask(prompt))
+
+    def get_message(self, response):
+        return response["text"]
+
+
+class AsyncSharedStateProvider(AsyncProvider):
+    """Async twin of :class:`SharedStateProvider`."""
+
+    def __init__(self):
+        self.last_response = {}
+
+    async def ask(self, prompt, stream=False, raw=False, optimizer=None, conversationally=False):
+        self.last_response.update({"text": f"answer to {prompt}"})
+        await asyncio.sleep(random.uniform(0, 0.02))
+        return self.last_response
+
+    async def chat(self, prompt, stream=False, optimizer=None, conversationally=False):
+        return await self.get_message(await self.ask(prompt))
+
+    async def get_message(self, response):
+        return response["text"]
+
+
+def check(results):
+    assert sorted(i for i, _ in results) == list(range(len(PROMPTS)))
+    for i, response in results:
+        assert response["text"] == f"answer to {PROMPTS[i]}"
+
+
+def test_ask_many_results_match_prompts():
+    check(list(SharedStateProvider().ask_many(PROMPTS, concurrency=4)))
+    check(list(SharedStateProvider().ask_many(PROMPTS, concurrency=4, ordered=False)))
+
+
+def test_async_ask_many_results_match_prompts():
+    async def collect(provider, **kwargs):
+        return [result async for result in provider.ask_many(PROMPTS, concurrency=4, **kwargs)]
+
+    check(asyncio.run(collect(AsyncSharedStateProvider())))
+    check(asyncio.run(collect(AsyncSharedStateProvider(), ordered=False)))
+    check(asyncio.run(collect(to_async(SharedStateProvider()))))
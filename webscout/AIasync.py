@@ -0,0 +1,383 @@
+"""
+Async access to blocking providers.
+
+Most providers are built on blocking ``requests`` and would stall an event loop
+if called from a coroutine. :class:`AsyncAdapter` gives any
+:class:`~webscout.AIbase.Provider` the :class:`~webscout.AIbase.AsyncProvider`
+interface:
+
+>>> from webscout.AIasync import to_async
+>>> from webscout.Provider import PhindSearch
+>>> ai = to_async(PhindSearch(is_conversation=False))
+>>> print(await ai.chat("Hello"))
+>>> async for text in await ai.chat("Tell me a story", stream=True):
+...     print(text, end="")
+
+Blocking calls run on one bounded thread pool shared by every adapter; each
+provider class gets a concurrency limit on top of it, so one slow provider
+can't use up all the workers. Streams are handed over through a bounded queue:
+when the consumer falls behind, the worker thread waits instead of buffering
+the whole response.
+
+Providers opt into a native async transport by defining ``aask`` (same
+arguments as ``ask``, streaming responses as async generators), typically on
+top of :func:`webscout.transport.async_client`. The adapter awaits it directly
+and no thread is used. :class:`~webscout.AIbase.AsyncProvider` instances are
+returned by :func:`to_async` unchanged.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import threading
+import weakref
+from functools import partial
+from typing import Any, AsyncGenerator, Callable, Dict, Optional, Union
+
+from webscout.AIbase import AsyncProvider, Provider, Response, _isolated
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_PROVIDER_CONCURRENCY = 8
+DEFAULT_QUEUE_SIZE = 64
+
+_lock = threading.Lock()
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_max_workers = DEFAULT_MAX_WORKERS
+_limits: Dict[str, int] = {}
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _Limiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+_DONE = object()
+_ERROR = object()
+
+
+def configure(max_workers: Optional[int] = None, limits: Optional[Dict[str, int]] = None) -> None:
+    """
+    Sets the size of the shared thread pool and per-provider concurrency limits.
+
+    Args:
+        max_workers: Threads in the shared pool. Takes effect for calls started
+            afterwards; the old pool finishes its running work and shuts down.
+        limits: Mapping of provider class name to the max number of calls it may
+            run at once, e.g. ``{"PhindSearch": 2}``. Providers not listed use
+            :data:`DEFAULT_PROVIDER_CONCURRENCY`. A changed limit applies to
+            calls already waiting; running calls are not interrupted.
+    """
+    global _executor, _max_workers
+    with _lock:
+        if max_workers is not None and max_workers != _max_workers:
+            _max_workers = max_workers
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+                _executor = None
+        changed = [name for name, limit in (limits or {}).items() if _limits.get(name) != limit]
+        for name in changed:
+            _limits[name] = limits[name]
+        if changed:
+            # Resize the live limiters in place: calls holding a slot keep it
+            # and release it to the same limiter.
+            for loop, per_loop in list(_semaphores.items()):
+                for name in changed:
+                    if name in per_loop:
+                        try:
+                            loop.call_soon_threadsafe(per_loop[name].wake)
+                        except RuntimeError:
+                            pass
+
+
+def executor() -> concurrent.futures.ThreadPoolExecutor:
+    """The shared thread pool blocking provider calls run on."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_max_workers, thread_name_prefix="webscout-provider"
+            )
+        return _executor
+
+
+class _Limiter:
+    """Semaphore of one provider class on one loop, sized by the current limit.
+
+    Unlike :class:`asyncio.Semaphore` it reads the limit from :data:`_limits`
+    on every acquire, so :func:`configure` can change it while calls hold
+    slots. Waiters are served first come, first served.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.active = 0
+        self._waiters: "collections.deque[asyncio.Future]" = collections.deque()
+
+    def _free(self) -> bool:
+        return self.active < _limits.get(self.name, DEFAULT_PROVIDER_CONCURRENCY)
+
+    async def acquire(self) -> None:
+        if not self._waiters and self._free():
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation.
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self) -> None:
+        self.active -= 1
+        self.wake()
+
+    def wake(self) -> None:
+        """Hand free slots to waiters; also called when the limit is raised."""
+        while self._waiters and self._free():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+
+def _semaphore(name: str) -> _Limiter:
+    """Concurrency limit of provider ``name`` on the running loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        per_loop = _semaphores.setdefault(loop, {})
+        semaphore = per_loop.get(name)
+        if semaphore is None:
+            semaphore = per_loop[name] = _Limiter(name)
+        return semaphore
+
+
+def _release_when_done(future: concurrent.futures.Future, semaphore: _Limiter) -> None:
+    """Release ``semaphore`` once the worker thread is actually free again.
+
+    Cancelling the awaiting task doesn't stop a running thread, so the slot is
+    tied to the thread rather than to the coroutine.
+    """
+    loop = asyncio.get_running_loop()
+
+    def release(_: concurrent.futures.Future) -> None:
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            # Loop already closed; its semaphores went with it.
+            pass
+
+    future.add_done_callback(release)
+
+
+class AsyncAdapter(AsyncProvider):
+    """Runs a blocking provider without blocking the event loop.
+
+    Calls made concurrently through one adapter share the wrapped instance, so
+    its ``last_response`` and conversation history follow whichever call
+    finished last. Serve unrelated users with ``is_conversation=False``, or
+    with one adapter per conversation.
+
+    Attributes:
+        provider (Provider): The wrapped provider
+        name (str): Key of the concurrency limit, the provider's class name
+        queue_size (int): Max chunks buffered per stream before the worker waits
+    """
+
+    def __init__(
+        self,
+        provider: Provider,
+        max_concurrency: Optional[int] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+    ):
+        """
+        Args:
+            provider (Provider): Provider instance to wrap
+            max_concurrency (int, optional): Concurrency limit for this provider class,
+                see :func:`configure`; adapters created with the same value leave
+                it as is. Defaults to None, leaving the current limit.
+            queue_size (int, optional): Max chunks buffered per stream. Defaults to 64.
+        """
+        self.provider = provider
+        self.name = type(provider).__name__
+        self.queue_size = max(1, queue_size)
+        if max_concurrency is not None:
+            configure(limits={self.name: max_concurrency})
+
+    def __getattr__(self, name: str) -> Any:
+        # last_response, conversation, model, ... of the wrapped provider
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    def __copy__(self) -> "AsyncAdapter":
+        # ask_many copies the adapter per call; the state worth isolating is the wrapped provider's
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.provider = _isolated(self.provider)
+        return clone
+
+    @property
+    def is_native(self) -> bool:
+        """Whether the wrapped provider brings its own async transport (``aask``)."""
+        return asyncio.iscoroutinefunction(getattr(self.provider, "aask", None))
+
+    async def _run(self, call: Callable[[], Any]) -> Any:
+        """Run a blocking call on the shared pool, within the provider's limit."""
+        semaphore = _semaphore(self.name)
+        await semaphore.acquire()
+        try:
+            future = executor().submit(call)
+        except BaseException:
+            semaphore.release()
+            raise
+        _release_when_done(future, semaphore)
+        return await asyncio.wrap_future(future)
+
+    async def _stream(self, call: Callable[[], Any]) -> AsyncGenerator[Any, None]:
+        """Drive a blocking generator on the shared pool and hand its chunks over a bounded queue."""
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue(self.queue_size)
+        stop = threading.Event()
+
+        def put(item: Any) -> None:
+            if stop.is_set():
+                return
+            waiter = asyncio.run_coroutine_threadsafe(chunks.put(item), loop)
+            while True:
+                try:
+                    return waiter.result(timeout=1)
+                except concurrent.futures.TimeoutError:
+                    if loop.is_closed():
+                        return
+
+        def produce() -> None:
+            try:
+                response = call()
+                try:
+                    for chunk in response:
+                        put((None, chunk))
+                        if stop.is_set():
+                            break
+                finally:
+                    close = getattr(response, "close", None)
+                    if close is not None:
+                        close()
+            except BaseException as e:
+                put((_ERROR, e))
+            else:
+                put((_DONE, None))
+
+        semaphore = _semaphore(self.name)
+        await semaphore.acquire()
+        try:
+            future = executor().submit(produce)
+        except BaseException:
+            semaphore.release()
+            raise
+        _release_when_done(future, semaphore)
+        try:
+            while True:
+                kind, item = await chunks.get()
+                if kind is _DONE:
+                    return
+                if kind is _ERROR:
+                    raise item
+                yield item
+        finally:
+            # Consumer is done (or gone): stop the worker and unblock a pending put.
+            stop.set()
+            while not chunks.empty():
+                chunks.get_nowait()
+
+    async def ask(
+        self,
+        prompt: str,
+        stream: bool = False,
+        raw: bool = False,
+        optimizer: str = None,
+        conversationally: bool = False,
+    ) -> Union[Response, AsyncGenerator]:
+        """Chat with AI asynchronously.
+
+        Args:
+            prompt (str): Prompt to be send.
+            stream (bool, optional): Flag for streaming response. Defaults to False.
+            raw (bool, optional): Stream back raw response as received. Defaults to False.
+            optimizer (str, optional): Prompt optimizer name - `[code, shell_command]`. Defaults to None.
+            conversationally (bool, optional): Chat conversationally when using optimizer. Defaults to False.
+        Returns:
+           dict|AsyncGenerator : ai content
+        """
+        kwargs = dict(
+            prompt=prompt, stream=stream, raw=raw, optimizer=optimizer, conversationally=conversationally
+        )
+        if self.is_native:
+            return await self.provider.aask(**kwargs)
+        call = partial(self.provider.ask, **kwargs)
+        if stream:
+            return self._stream(call)
+        return await self._run(call)
+
+    async def chat(
+        self,
+        prompt: str,
+        stream: bool = False,
+        optimizer: str = None,
+        conversationally: bool = False,
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        """Generate response `str` asynchronously.
+
+        Args:
+            prompt (str): Prompt to be send.
+            stream (bool, optional): Flag for streaming response. Defaults to False.
+            optimizer (str, optional): Prompt optimizer name - `[code, shell_command]`. Defaults to None.
+            conversationally (bool, optional): Chat conversationally when using optimizer. Defaults to False.
+        Returns:
+            str|AsyncGenerator: Response generated
+        """
+        response = await self.ask(
+            prompt, stream, optimizer=optimizer, conversationally=conversationally
+        )
+        if stream:
+            async def for_stream():
+                async for chunk in response:
+                    yield await self.get_message(chunk)
+            return for_stream()
+        return await self.get_message(response)
+
+    async def get_message(self, response: Response) -> str:
+        """Retrieves message only from response
+
+        Args:
+            response (dict): Response generated by `self.ask`
+
+        Returns:
+            str: Message extracted
+        """
+        return self.provider.get_message(response)
+
+
+def to_async(
+    provider: Union[Provider, AsyncProvider],
+    max_concurrency: Optional[int] = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> AsyncProvider:
+    """
+    Async interface for any provider.
+
+    Args:
+        provider: Provider instance; native async providers are returned as they are
+        max_concurrency: Concurrency limit for the provider class, see :func:`configure`
+        queue_size: Max chunks buffered per stream
+
+    Returns:
+        AsyncProvider
+    """
+    if isinstance(provider, AsyncProvider):
+        return provider
+    return AsyncAdapter(provider, max_concurrency=max_concurrency, queue_size=queue_size)
@@ -1,33 +1,383 @@
-from webscout.AIbase import Provider
-from webscout.exceptions import AllProvidersFailure
-from typing import Union, Any, Dict, Generator
-import importlib
-import pkgutil
+from webscout.AIbase import Provider, AsyncProvider
+from webscout.AIasync import to_async
+from webscout.Provider import registry
+from webscout.Provider.registry import LazyProviderMap
+from webscout.exceptions import (
+    AllProvidersFailure,
+    APIConnectionError,
+    AuthenticationError,
+    RatelimitE,
+    TimeoutE,
+    WebscoutE,
+)
+from typing import Union, Any, AsyncGenerator, Dict, Generator, Iterator, List, Optional, Tuple
+from collections import Counter, deque
+import asyncio
+import queue
 import random
 import inspect
+import math
+import threading
+import time
 
 def load_providers():
-    provider_map = {}
-    api_key_providers = set()
-    provider_package = importlib.import_module("webscout.Provider")
-    
-    for _, module_name, _ in pkgutil.iter_modules(provider_package.__path__):
+    """Build lazy provider maps from the static manifest; nothing is imported here."""
+    provider_map = LazyProviderMap(registry.providers(is_async=False))
+    async_provider_map = LazyProviderMap(registry.providers(is_async=True))
+    api_key_providers = {name.upper() for name in registry.providers(requires_api_key=True)}
+    return provider_map, async_provider_map, api_key_providers
+
+provider_map, async_provider_map, api_key_providers = load_providers()
+all_provider_map = LazyProviderMap(registry.providers())
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an unsorted list of samples."""
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+def classify_error(error: BaseException) -> str:
+    """Map an exception raised by a provider to a stable error class name.
+
+    Webscout exceptions keep their own class name. Transport errors coming from
+    requests/httpx/curl_cffi are folded into the closest class from
+    ``webscout.exceptions`` so that stats stay comparable across providers.
+
+    Args:
+        error (BaseException): The exception raised by the provider.
+
+    Returns:
+        str: Error class name, e.g. ``"TimeoutE"`` or ``"RatelimitE"``.
+    """
+    if isinstance(error, WebscoutE):
+        return type(error).__name__
+    name = type(error).__name__.lower()
+    message = str(error).lower()
+    if "timeout" in name or "timed out" in message:
+        return TimeoutE.__name__
+    if "429" in message or "rate limit" in message or "too many requests" in message:
+        return RatelimitE.__name__
+    if "401" in message or "403" in message or "unauthorized" in message:
+        return AuthenticationError.__name__
+    if "connect" in name or "connection" in message or "ssl" in name or "dns" in message:
+        return APIConnectionError.__name__
+    return type(error).__name__
+
+
+class ProviderHealth:
+    """Rolling health statistics and circuit breaker for a single provider.
+
+    Tracks the outcome and time-to-first-token (TTFT) of the last ``window``
+    calls together with a counter of error classes. After ``failure_threshold``
+    consecutive failures the breaker opens for ``cooldown`` seconds. Once the
+    cooldown has passed the breaker is half-open and lets a single probe call
+    through: a success closes it, a failure opens it again with the cooldown
+    doubled, up to ``max_cooldown``.
+    """
+
+    # Errors that say the provider will keep failing for a while, no matter how often we retry.
+    TRIP_IMMEDIATELY = (RatelimitE.__name__, AuthenticationError.__name__)
+
+    def __init__(
+        self,
+        window: int = 50,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        max_cooldown: float = 3600.0,
+    ):
+        self.outcomes: deque = deque(maxlen=window)
+        self.ttft: deque = deque(maxlen=window)
+        self.errors: Counter = Counter()
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.consecutive_failures = 0
+        self.current_cooldown = cooldown
+        self.open_until = 0.0
+        self.probing = False
+        self.last_error: Optional[str] = None
+
+    @property
+    def calls(self) -> int:
+        return len(self.outcomes)
+
+    @property
+    def success_rate(self) -> float:
+        """Laplace-smoothed success rate, so unseen providers start at 0.5."""
+        return (sum(self.outcomes) + 1) / (len(self.outcomes) + 2)
+
+    @property
+    def ttft_p50(self) -> Optional[float]:
+        return _percentile(list(self.ttft), 50) if self.ttft else None
+
+    @property
+    def ttft_p90(self) -> Optional[float]:
+        return _percentile(list(self.ttft), 90) if self.ttft else None
+
+    @property
+    def ttft_p95(self) -> Optional[float]:
+        return _percentile(list(self.ttft), 95) if self.ttft else None
+
+    def is_open(self, now: Optional[float] = None) -> bool:
+        """Whether the circuit breaker currently blocks this provider."""
+        return (now or time.monotonic()) < self.open_until
+
+    def is_half_open(self, now: Optional[float] = None) -> bool:
+        """Whether the breaker tripped and its cooldown has passed, but no call has succeeded since."""
+        return bool(self.open_until) and not self.is_open(now)
+
+    def is_available(self, now: Optional[float] = None) -> bool:
+        """Whether a call may be started: the breaker is closed, or half-open with no probe in flight."""
+        if self.is_open(now):
+            return False
+        return not (self.probing and self.is_half_open(now))
+
+    def record_success(self, ttft: float) -> None:
+        self.probing = False
+        self.outcomes.append(1)
+        self.ttft.append(ttft)
+        self.consecutive_failures = 0
+        self.current_cooldown = self.base_cooldown
+        self.open_until = 0.0
+
+    def record_failure(self, error_class: str) -> None:
+        self.probing = False
+        self.outcomes.append(0)
+        self.errors[error_class] += 1
+        self.last_error = error_class
+        self.consecutive_failures += 1
+        if error_class in self.TRIP_IMMEDIATELY or self.consecutive_failures >= self.failure_threshold:
+            # A trip from half-open (cooldown already expired once) backs off exponentially
+            if self.open_until:
+                self.current_cooldown = min(self.current_cooldown * 2, self.max_cooldown)
+            self.open_until = time.monotonic() + self.current_cooldown
+
+    def expected_cost(self, default_ttft: float) -> float:
+        """Expected seconds spent before getting a first token from this provider."""
+        latency = self.ttft_p95 if self.ttft else default_ttft
+        return latency / self.success_rate
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "success_rate": round(self.success_rate, 4),
+            "ttft_p50": self.ttft_p50,
+            "ttft_p95": self.ttft_p95,
+            "errors": dict(self.errors),
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_open": self.is_open(),
+            "probing": self.probing,
+            "cooldown_remaining": max(0.0, self.open_until - time.monotonic()),
+        }
+
+
+class ProviderRouter:
+    """Ranks providers by their rolling health stats.
+
+    A single router is shared by every :class:`AUTO` instance in the process so
+    that one caller learning a provider is down spares all the others the
+    timeout. Providers with no history are ranked with ``default_ttft`` as their
+    latency estimate and are shuffled among themselves so they still get explored.
+
+    Examples:
+        >>> router = ProviderRouter()
+        >>> router.record_failure("DEADPROVIDER", TimeoutError("timed out"))
+        'TimeoutE'
+        >>> router.rank(["DEADPROVIDER", "NEWPROVIDER"])
+        ['NEWPROVIDER', 'DEADPROVIDER']
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0,
+        max_cooldown: float = 3600.0,
+        default_ttft: float = 5.0,
+    ):
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.default_ttft = default_ttft
+        self._health: Dict[str, ProviderHealth] = {}
+        self._lock = threading.Lock()
+
+    def health(self, name: str) -> ProviderHealth:
+        with self._lock:
+            health = self._health.get(name)
+            if health is None:
+                health = self._health[name] = ProviderHealth(
+                    self.window, self.failure_threshold, self.cooldown, self.max_cooldown
+                )
+            return health
+
+    def rank(self, names: List[str], include_open: bool = False) -> List[str]:
+        """Order provider names from most to least promising.
+
+        Providers whose breaker is open, or half-open with its probe call still
+        in flight, are left out.
+
+        Args:
+            names (List[str]): Candidate provider names.
+            include_open (bool, optional): Append the providers left out,
+                soonest-to-recover first, instead of dropping them. Defaults to False.
+
+        Returns:
+            List[str]: Ranked provider names.
+        """
+        now = time.monotonic()
+        available, blocked = [], []
+        with self._lock:
+            for name in names:
+                health = self._health.get(name)
+                if health is not None and not health.is_available(now):
+                    blocked.append((health.open_until, name))
+                else:
+                    cost = health.expected_cost(self.default_ttft) if health else self.default_ttft / 0.5
+                    available.append((cost, random.random(), name))
+        available.sort()
+        ranked = [name for _, _, name in available]
+        if include_open:
+            ranked.extend(name for _, name in sorted(blocked))
+        return ranked
+
+    def admit(self, name: str) -> bool:
+        """Claim the right to call a provider now.
+
+        Returns False while its breaker is open or another call is probing it.
+        When the breaker is half-open the caller becomes the probe and must
+        report the outcome with :meth:`record_success`, :meth:`record_failure`
+        or, if the call is abandoned, :meth:`release`.
+
+        Args:
+            name (str): Provider name.
+
+        Returns:
+            bool: Whether the call may go ahead.
+        """
+        health = self.health(name)
+        with self._lock:
+            now = time.monotonic()
+            if not health.is_available(now):
+                return False
+            if health.is_half_open(now):
+                health.probing = True
+            return True
+
+    def release(self, name: str) -> None:
+        """Give up a probe claimed with :meth:`admit` without an outcome."""
+        health = self.health(name)
+        with self._lock:
+            health.probing = False
+
+    def record_success(self, name: str, ttft: float) -> None:
+        health = self.health(name)
+        with self._lock:
+            health.record_success(ttft)
+
+    def record_failure(self, name: str, error: BaseException) -> str:
+        error_class = classify_error(error)
+        health = self.health(name)
+        with self._lock:
+            health.record_failure(error_class)
+        return error_class
+
+    def reset(self, name: Optional[str] = None) -> None:
+        """Forget the stats of one provider, or of all providers."""
+        with self._lock:
+            if name is None:
+                self._health.clear()
+            else:
+                self._health.pop(name, None)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of the health of every provider seen so far."""
+        with self._lock:
+            return {name: health.snapshot() for name, health in self._health.items()}
+
+
+
+default_router = ProviderRouter()
+
+
+class _PrimedStream:
+    """Iterator over a provider stream whose first chunk has already been read.
+
+    Failures after the first chunk are reported to ``on_error``; ``close()``
+    closes the underlying provider generator, releasing its HTTP response.
+    """
+
+    def __init__(self, first_chunk: Any, chunks: Iterator[Any], on_error):
+        self._pending = [first_chunk]
+        self._chunks = chunks
+        self._on_error = on_error
+
+    def __iter__(self) -> "_PrimedStream":
+        return self
+
+    def __next__(self) -> Any:
+        if self._pending:
+            return self._pending.pop()
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise
+        except Exception as e:
+            self._on_error(e)
+            raise
+
+    def close(self) -> None:
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+
+class _AsyncPrimedStream:
+    """Async twin of :class:`_PrimedStream`, over an async iterator."""
+
+    def __init__(self, first_chunk: Any, chunks: Any, on_error):
+        self._pending = [first_chunk]
+        self._chunks = chunks
+        self._on_error = on_error
+
+    def __aiter__(self) -> "_AsyncPrimedStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._pending:
+            return self._pending.pop()
         try:
-            module = importlib.import_module(f"webscout.Provider.{module_name}")
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if isinstance(attr, type) and issubclass(attr, Provider) and attr != Provider:
-                    provider_map[attr_name.upper()] = attr
-                    # Check if the provider needs an API key
-                    if 'api_key' in inspect.signature(attr.__init__).parameters:
-                        api_key_providers.add(attr_name.upper())
-        except Exception:
-            pass
-    return provider_map, api_key_providers
-
-provider_map, api_key_providers = load_providers()
-
-class AUTO(Provider):
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            raise
+        except Exception as e:
+            self._on_error(e)
+            raise
+
+    async def aclose(self) -> None:
+        if hasattr(self._chunks, "aclose"):
+            await self._chunks.aclose()
+
+
+class _Cancelled(Exception):
+    """Raised in a losing racer once another provider has won."""
+
+
+def _close_quietly(response: Any) -> None:
+    """Close a losing stream, ignoring whatever the provider raises on the way out."""
+    try:
+        if hasattr(response, "close"):
+            response.close()
+    except Exception:
+        pass
+
+
+class _AutoRouting:
+    """Provider selection shared by :class:`AUTO` and :class:`AsyncAUTO`."""
+
     def __init__(
         self,
         is_conversation: bool = True,
@@ -40,7 +390,32 @@ class AUTO(Provider):
         history_offset: int = 10250,
         act: str = None,
         exclude: list[str] = [],
+        router: Optional[ProviderRouter] = None,
+        race: int = 1,
+        hedge_delay: Optional[float] = None,
     ):
+        """Instantiates AUTO
+
+        Args:
+            is_conversation (bool, optional): Flag for chatting conversationally. Defaults to True.
+            max_tokens (int, optional): Maximum number of tokens to be generated upon completion. Defaults to 600.
+            timeout (int, optional): Http request timeout. Defaults to 30.
+            intro (str, optional): Conversation introductory prompt. Defaults to None.
+            filepath (str, optional): Path to file containing conversation history. Defaults to None.
+            update_file (bool, optional): Add new prompts and responses to the file. Defaults to True.
+            proxies (dict, optional): Http request proxies. Defaults to {}.
+            history_offset (int, optional): Limit conversation history to this number of last texts. Defaults to 10250.
+            act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
+            exclude (list[str], optional): Provider names to never use. Defaults to [].
+            router (ProviderRouter, optional): Router holding provider health stats.
+                Defaults to the router shared by the whole process.
+            race (int, optional): Maximum number of providers in flight at once. With 1 providers
+                are tried one after another; with N > 1 the top-ranked providers are hedged and the
+                first to return a token wins. Defaults to 1.
+            hedge_delay (float, optional): Seconds to wait for the in-flight providers before starting
+                the next one. Defaults to None, the p90 time-to-first-token of the best ranked
+                provider (or no delay at all while it has no history).
+        """
         self.provider = None
         self.provider_name = None
         self.is_conversation = is_conversation
@@ -53,6 +428,11 @@ class AUTO(Provider):
         self.history_offset = history_offset
         self.act = act
         self.exclude = [e.upper() for e in exclude]
+        self.router = router or default_router
+        self.race = max(1, race)
+        self.hedge_delay = hedge_delay
+        self._instances: Dict[str, Any] = {}
+        self._instances_lock = threading.Lock()
 
     @property
     def last_response(self) -> dict[str, Any]:
@@ -62,6 +442,212 @@ class AUTO(Provider):
     def conversation(self) -> object:
         return self.provider.conversation if self.provider else None
 
+    def _provider_pool(self) -> Dict[str, type]:
+        return provider_map
+
+    def _candidates(self) -> List[str]:
+        """Names of providers usable without an API key, best ranked first."""
+        names = [
+            name for name in self._provider_pool()
+            if name not in api_key_providers and name not in self.exclude
+        ]
+        return self.router.rank(names)
+
+    def _hedge_delay(self, candidates: List[str]) -> float:
+        """Delay before hedging: configured value, else p90 TTFT of the best candidate."""
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        if not candidates:
+            return 0.0
+        return self.router.health(candidates[0]).ttft_p90 or 0.0
+
+    def _get_instance(self, provider_name: str) -> Any:
+        """Return the warm instance of a provider, importing and creating it on first use."""
+        with self._instances_lock:
+            instance = self._instances.get(provider_name)
+        if instance is None:
+            provider_class = self._provider_pool()[provider_name]
+            instance = provider_class(
+                is_conversation=self.is_conversation,
+                max_tokens=self.max_tokens,
+                timeout=self.timeout,
+                intro=self.intro,
+                filepath=self.filepath,
+                update_file=self.update_file,
+                proxies=self.proxies,
+                history_offset=self.history_offset,
+                act=self.act,
+            )
+            with self._instances_lock:
+                instance = self._instances.setdefault(provider_name, instance)
+        return instance
+
+    def _discard_instance(self, provider_name: str) -> None:
+        """Drop a warm instance so the next attempt starts from a fresh session."""
+        with self._instances_lock:
+            self._instances.pop(provider_name, None)
+
+    def _on_stream_error(self, provider_name: str):
+        def record(error: BaseException) -> None:
+            self.router.record_failure(provider_name, error)
+            self._discard_instance(provider_name)
+        return record
+
+    def _use(self, provider_name: str, provider: Any) -> None:
+        self.provider, self.provider_name = provider, f"webscout-{provider_name}"
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Health stats of every provider this process has tried."""
+        return self.router.stats()
+
+
+class AUTO(_AutoRouting, Provider):
+    """Routes each request to the healthiest provider that needs no API key.
+
+    Examples:
+        >>> auto = AUTO(race=2)
+        >>> print(auto.chat("Hello, how are you?"))
+    """
+
+    def _attempt(
+        self, provider_name: str, ask_kwargs: dict, cancel: Optional[threading.Event] = None
+    ) -> Tuple[Any, Any]:
+        """Run one provider and record the outcome in the router.
+
+        Streams are primed up to their first chunk before returning, so a provider
+        that fails before producing any output is reported as a failure here and
+        the caller can move on to the next candidate.
+
+        ``cancel`` is checked before each blocking step (the request, the first
+        chunk) and once the answer is in; when it is set the response is closed
+        and :class:`_Cancelled` raised. A request already waiting on the network
+        can't be interrupted, so it is stopped at the next check.
+
+        Args:
+            provider_name (str): Provider to run.
+            ask_kwargs (dict): Arguments of ``ask``.
+            cancel (threading.Event, optional): Set when the caller no longer
+                needs this answer. Defaults to None.
+
+        Returns:
+            tuple: ``(provider instance, response)``.
+
+        Raises:
+            WebscoutE: If the provider's circuit breaker does not admit the call.
+        """
+        if not self.router.admit(provider_name):
+            raise WebscoutE(f"{provider_name} is cooling down after repeated failures")
+
+        def check(response: Any = None) -> None:
+            if cancel is not None and cancel.is_set():
+                _close_quietly(response)
+                raise _Cancelled(provider_name)
+
+        started = time.monotonic()
+        response = None
+        try:
+            provider = self._get_instance(provider_name)
+            check()
+            response = provider.ask(**ask_kwargs)
+            if ask_kwargs["stream"]:
+                chunks = response = iter(response)
+                check(chunks)
+                try:
+                    first_chunk = next(chunks)
+                except StopIteration:
+                    raise WebscoutE(f"{provider_name} returned an empty stream")
+                response = _PrimedStream(first_chunk, chunks, self._on_stream_error(provider_name))
+            self.router.record_success(provider_name, time.monotonic() - started)
+            check(response)
+            return provider, response
+        except _Cancelled:
+            # No failure to record; only free the probe slot if this call held it
+            self.router.release(provider_name)
+            raise
+        except Exception as e:
+            self.router.record_failure(provider_name, e)
+            self._discard_instance(provider_name)
+            raise
+
+    def _ask_sequential(self, ask_kwargs: dict) -> Union[Dict, Generator]:
+        errors = {}
+        for provider_name in self._candidates():
+            try:
+                provider, response = self._attempt(provider_name, ask_kwargs)
+            except Exception as e:
+                errors[provider_name] = classify_error(e)
+                continue
+            self._use(provider_name, provider)
+            return response
+        raise AllProvidersFailure(f"All providers failed to process the request: {errors}")
+
+    def _ask_racing(self, ask_kwargs: dict) -> Union[Dict, Generator]:
+        """Hedge the request over up to ``self.race`` providers, first token wins.
+
+        Providers are started one at a time; whenever ``hedge_delay`` passes without
+        an answer, or an in-flight provider fails, the next candidate is started as
+        long as fewer than ``self.race`` are running. Once the winner is picked the
+        losers are cancelled through a shared event: each one stops at its next
+        check in :meth:`_attempt` and closes its response.
+        """
+        candidates = deque(self._candidates())
+        delay = self._hedge_delay(list(candidates))
+        finished: queue.Queue = queue.Queue()
+        cancel = threading.Event()
+        cancel_lock = threading.Lock()
+        errors = {}
+        in_flight = 0
+
+        def run(provider_name: str) -> None:
+            try:
+                provider, response = self._attempt(provider_name, ask_kwargs, cancel)
+            except _Cancelled:
+                return
+            except Exception as e:
+                finished.put((provider_name, None, None, e))
+                return
+            with cancel_lock:
+                if not cancel.is_set():
+                    finished.put((provider_name, provider, response, None))
+                    return
+            _close_quietly(response)
+
+        def launch() -> None:
+            nonlocal in_flight
+            provider_name = candidates.popleft()
+            threading.Thread(target=run, args=(provider_name,), daemon=True).start()
+            in_flight += 1
+
+        if candidates:
+            launch()
+        while in_flight:
+            can_hedge = bool(candidates) and in_flight < self.race
+            try:
+                provider_name, provider, response, error = finished.get(timeout=delay if can_hedge else None)
+            except queue.Empty:
+                launch()
+                continue
+            in_flight -= 1
+            if error is not None:
+                errors[provider_name] = classify_error(error)
+                if candidates and in_flight < self.race:
+                    launch()
+                continue
+
+            with cancel_lock:
+                cancel.set()
+            # Answers that came in before the cancel
+            while True:
+                try:
+                    _, _, late_response, _ = finished.get_nowait()
+                except queue.Empty:
+                    break
+                _close_quietly(late_response)
+            self._use(provider_name, provider)
+            return response
+
+        raise AllProvidersFailure(f"All providers failed to process the request: {errors}")
+
     def ask(
         self,
         prompt: str,
@@ -78,39 +664,9 @@ class AUTO(Provider):
             "optimizer": optimizer,
             "conversationally": conversationally,
         }
-
-        # Filter out API key required providers and excluded providers
-        available_providers = [
-            (name, cls) for name, cls in provider_map.items()
-            if name not in api_key_providers and name not in self.exclude
-        ]
-
-        # Shuffle the list of available providers
-        random.shuffle(available_providers)
-
-        # Try webscout-based providers
-        for provider_name, provider_class in available_providers:
-            try:
-                self.provider_name = f"webscout-{provider_name}"
-                
-                self.provider = provider_class(
-                    is_conversation=self.is_conversation,
-                    max_tokens=self.max_tokens,
-                    timeout=self.timeout,
-                    intro=self.intro,
-                    filepath=self.filepath,
-                    update_file=self.update_file,
-                    proxies=self.proxies,
-                    history_offset=self.history_offset,
-                    act=self.act,
-                )
-                response = self.provider.ask(**ask_kwargs)
-                return response
-            except Exception:
-                continue
-
-        # If we get here, all providers failed
-        raise AllProvidersFailure("All providers failed to process the request")
+        if self.race > 1:
+            return self._ask_racing(ask_kwargs)
+        return self._ask_sequential(ask_kwargs)
 
     def chat(
         self,
@@ -119,7 +675,7 @@ class AUTO(Provider):
         optimizer: str = None,
         conversationally: bool = False,
         run_new_test: bool = False,
-    ) -> Union[str, Generator[str, None, None]]: 
+    ) -> Union[str, Generator[str, None, None]]:
         response = self.ask(
             prompt,
             stream,
@@ -127,7 +683,7 @@ class AUTO(Provider):
             conversationally=conversationally,
             run_new_test=run_new_test,
         )
-        
+
         if stream:
             return (self.get_message(chunk) for chunk in response)
         else:
@@ -136,7 +692,162 @@ class AUTO(Provider):
     def get_message(self, response: dict) -> str:
         assert self.provider is not None, "Chat with AI first"
         return self.provider.get_message(response)
-    
+
+
+
+class AsyncAUTO(_AutoRouting, AsyncProvider):
+    """Async twin of :class:`AUTO`.
+
+    Native :class:`~webscout.AIbase.AsyncProvider` implementations are awaited
+    directly; blocking providers run through :class:`~webscout.AIasync.AsyncAdapter`. With ``race > 1``
+    the losers are real asyncio tasks and are cancelled as soon as a winner
+    produces its first token.
+
+    Examples:
+        >>> auto = AsyncAUTO(race=3)
+        >>> async for text in await auto.chat("Hello!", stream=True):
+        ...     print(text, end="")
+    """
+
+    def _provider_pool(self) -> Dict[str, type]:
+        return all_provider_map
+
+    async def _attempt(self, provider_name: str, ask_kwargs: dict) -> Tuple[Any, Any]:
+        if not self.router.admit(provider_name):
+            raise WebscoutE(f"{provider_name} is cooling down after repeated failures")
+        started = time.monotonic()
+        try:
+            provider = self._get_instance(provider_name)
+            response = await to_async(provider).ask(**ask_kwargs)
+            if ask_kwargs["stream"]:
+                chunks = response
+                try:
+                    first_chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    raise WebscoutE(f"{provider_name} returned an empty stream")
+                response = _AsyncPrimedStream(first_chunk, chunks, self._on_stream_error(provider_name))
+            self.router.record_success(provider_name, time.monotonic() - started)
+            return provider, response
+        except asyncio.CancelledError:
+            # A losing racer: no outcome to record, but free the probe slot
+            self.router.release(provider_name)
+            raise
+        except Exception as e:
+            self.router.record_failure(provider_name, e)
+            self._discard_instance(provider_name)
+            raise
+
+    async def _ask_sequential(self, ask_kwargs: dict) -> Union[Dict, AsyncGenerator]:
+        errors = {}
+        for provider_name in self._candidates():
+            try:
+                provider, response = await self._attempt(provider_name, ask_kwargs)
+            except Exception as e:
+                errors[provider_name] = classify_error(e)
+                continue
+            self._use(provider_name, provider)
+            return response
+        raise AllProvidersFailure(f"All providers failed to process the request: {errors}")
+
+    async def _ask_racing(self, ask_kwargs: dict) -> Union[Dict, AsyncGenerator]:
+        candidates = deque(self._candidates())
+        delay = self._hedge_delay(list(candidates))
+        pending: Dict[asyncio.Task, str] = {}
+        errors = {}
+
+        def launch() -> None:
+            provider_name = candidates.popleft()
+            task = asyncio.ensure_future(self._attempt(provider_name, ask_kwargs))
+            pending[task] = provider_name
+
+        if candidates:
+            launch()
+        winner = None
+        while pending and winner is None:
+            can_hedge = bool(candidates) and len(pending) < self.race
+            done, _ = await asyncio.wait(
+                pending, timeout=delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                launch()
+                continue
+            for task in done:
+                provider_name = pending.pop(task)
+                if task.exception() is not None:
+                    errors[provider_name] = classify_error(task.exception())
+                    if winner is None and candidates and len(pending) < self.race:
+                        launch()
+                elif winner is None:
+                    winner = (provider_name, *task.result())
+                elif ask_kwargs["stream"]:
+                    await task.result()[1].aclose()
+
+        # Racers that finished while a loser was being closed above are still pending:
+        # cancelling them is a no-op, so close their streams instead.
+        finished = []
+        for task in pending:
+            if task.done():
+                finished.append(task)
+            else:
+                task.cancel()
+        for task in finished:
+            if not task.cancelled() and task.exception() is None and ask_kwargs["stream"]:
+                await task.result()[1].aclose()
+        if winner is None:
+            raise AllProvidersFailure(f"All providers failed to process the request: {errors}")
+        provider_name, provider, response = winner
+        self._use(provider_name, provider)
+        return response
+
+    async def ask(
+        self,
+        prompt: str,
+        stream: bool = False,
+        raw: bool = False,
+        optimizer: str = None,
+        conversationally: bool = False,
+        run_new_test: bool = False,
+    ) -> Union[Dict, AsyncGenerator]:
+        ask_kwargs = {
+            "prompt": prompt,
+            "stream": stream,
+            "raw": raw,
+            "optimizer": optimizer,
+            "conversationally": conversationally,
+        }
+        if self.race > 1:
+            return await self._ask_racing(ask_kwargs)
+        return await self._ask_sequential(ask_kwargs)
+
+    async def chat(
+        self,
+        prompt: str,
+        stream: bool = False,
+        optimizer: str = None,
+        conversationally: bool = False,
+        run_new_test: bool = False,
+    ) -> Union[str, AsyncGenerator[str, None]]:
+        response = await self.ask(
+            prompt,
+            stream,
+            optimizer=optimizer,
+            conversationally=conversationally,
+            run_new_test=run_new_test,
+        )
+
+        if stream:
+            async def for_stream():
+                async for chunk in response:
+                    yield await self.get_message(chunk)
+            return for_stream()
+        return await self.get_message(response)
+
+    async def get_message(self, response: dict) -> str:
+        assert self.provider is not None, "Chat with AI first"
+        message = self.provider.get_message(response)
+        return await message if inspect.isawaitable(message) else message
+
+
 if __name__ == "__main__":
     auto = AUTO()
     response = auto.chat("Hello, how are you?")
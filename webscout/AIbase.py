@@ -1,7 +1,14 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from pathlib import Path
-from typing import AsyncGenerator, List, Union, Generator, Optional
+import copy
+from typing import Any, AsyncGenerator, Iterable, Iterator, List, Tuple, Union, Generator, Optional
 from typing_extensions import TypeAlias
+import asyncio
+
+from webscout import ratelimit
 
 # Type aliases for better readability
 Response: TypeAlias = dict[str, Union[str, bool, None]]
@@ -11,6 +18,37 @@ AsyncImageData: TypeAlias = Union[bytes, str, AsyncGenerator[bytes, None]]
 class AIProviderError(Exception):
     pass
 
+
+@contextmanager
+def _conversation_paused(provider: Any) -> Iterator[None]:
+    """Keep batch prompts out of the provider's conversation history."""
+    conversation = getattr(provider, "conversation", None)
+    if conversation is None or not hasattr(conversation, "status"):
+        yield
+        return
+    status, conversation.status = conversation.status, False
+    try:
+        yield
+    finally:
+        conversation.status = status
+
+
+def _isolated(provider: Any) -> Any:
+    """Shallow copy of a provider for one batch call.
+
+    The copy shares the HTTP session and settings but has its own
+    ``last_response``, which most providers fill in and return from ``ask``;
+    concurrent calls on one instance would otherwise overwrite each other's.
+    """
+    worker = copy.copy(provider)
+    if "last_response" in vars(worker):
+        worker.last_response = copy.copy(worker.last_response)
+    return worker
+
+
+def _limiter(provider: Any, rate: Optional[float]) -> Optional[ratelimit.TokenBucket]:
+    return ratelimit.bucket(type(provider).__name__, rate) if rate else None
+
 class Provider(ABC):
 
     @abstractmethod
@@ -38,6 +76,108 @@ class Provider(ABC):
     def get_message(self, response: Response) -> str:
         raise NotImplementedError("Method needs to be implemented in subclass")
 
+    def ask_many(
+        self,
+        prompts: Iterable[str],
+        concurrency: int = 4,
+        stream: bool = False,
+        raw: bool = False,
+        optimizer: Optional[str] = None,
+        conversationally: bool = False,
+        ordered: bool = True,
+        rate: Optional[float] = None,
+        return_exceptions: bool = True,
+    ) -> Generator[Tuple[int, Any], None, None]:
+        """Run many independent prompts through this provider instance.
+
+        Prompts are read lazily, so ``prompts`` may be a generator over a large
+        file. Each one runs on a shallow copy of this instance with its own
+        ``last_response``, sharing the HTTP session, and is kept out of the
+        conversation history.
+
+        Args:
+            prompts (Iterable[str]): Prompts to send.
+            concurrency (int, optional): Requests in flight at once. Defaults to 4.
+            stream (bool, optional): Call ``ask`` with streaming; each result is then the
+                list of chunks. Defaults to False.
+            raw (bool, optional): Passed to ``ask``. Defaults to False.
+            optimizer (str, optional): Passed to ``ask``. Defaults to None.
+            conversationally (bool, optional): Passed to ``ask``. Defaults to False.
+            ordered (bool, optional): Yield results in prompt order; otherwise as they
+                complete. Defaults to True.
+            rate (float, optional): Max requests per second, shared with every other batch
+                on the same provider class. Defaults to None, unlimited.
+            return_exceptions (bool, optional): Yield a failed prompt's exception as its
+                result instead of raising it. Defaults to True.
+
+        Yields:
+            tuple: ``(index, result)``, ``index`` being the prompt's position in ``prompts``.
+
+        Examples:
+            >>> for i, response in ai.ask_many(prompts, concurrency=8, rate=5):
+            ...     print(i, ai.get_message(response))
+        """
+        limiter = _limiter(self, rate)
+        concurrency = max(1, concurrency)
+
+        def run(prompt: str) -> Any:
+            if limiter is not None:
+                limiter.acquire()
+            response = _isolated(self).ask(
+                prompt, stream=stream, raw=raw, optimizer=optimizer, conversationally=conversationally
+            )
+            return list(response) if stream else response
+
+        def outcome(index: int, future) -> Tuple[int, Any]:
+            error = future.exception()
+            if error is None:
+                return index, future.result()
+            if return_exceptions:
+                return index, error
+            raise error
+
+        source = enumerate(prompts)
+        with _conversation_paused(self), ThreadPoolExecutor(concurrency) as pool:
+            def submit() -> Any:
+                item = next(source, None)
+                if item is None:
+                    return None
+                index, prompt = item
+                future = pool.submit(run, prompt)
+                pending[future] = index
+                return future
+
+            pending: dict = {}
+            try:
+                if ordered:
+                    # A window of twice the concurrency keeps workers busy behind a slow head.
+                    window = deque()
+                    while len(window) < 2 * concurrency:
+                        future = submit()
+                        if future is None:
+                            break
+                        window.append(future)
+                    while window:
+                        future = window.popleft()
+                        wait((future,))
+                        index = pending.pop(future)
+                        following = submit()
+                        if following is not None:
+                            window.append(following)
+                        yield outcome(index, future)
+                else:
+                    while len(pending) < concurrency and submit() is not None:
+                        pass
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            index = pending.pop(future)
+                            submit()
+                            yield outcome(index, future)
+            finally:
+                for future in pending:
+                    future.cancel()
+
 class AsyncProvider(ABC):
 
     @abstractmethod
@@ -65,6 +205,88 @@ class AsyncProvider(ABC):
     async def get_message(self, response: Response) -> str:
         raise NotImplementedError("Method needs to be implemented in subclass")
 
+    async def ask_many(
+        self,
+        prompts: Iterable[str],
+        concurrency: int = 4,
+        stream: bool = False,
+        raw: bool = False,
+        optimizer: Optional[str] = None,
+        conversationally: bool = False,
+        ordered: bool = True,
+        rate: Optional[float] = None,
+        return_exceptions: bool = True,
+    ) -> AsyncGenerator[Tuple[int, Any], None]:
+        """Async twin of :meth:`Provider.ask_many`, with the same arguments.
+
+        Yields:
+            tuple: ``(index, result)``, ``index`` being the prompt's position in ``prompts``.
+
+        Examples:
+            >>> async for i, response in ai.ask_many(prompts, concurrency=32):
+            ...     print(i, await ai.get_message(response))
+        """
+        limiter = _limiter(self, rate)
+        concurrency = max(1, concurrency)
+
+        async def run(prompt: str) -> Any:
+            if limiter is not None:
+                await limiter.aacquire()
+            response = await _isolated(self).ask(
+                prompt, stream=stream, raw=raw, optimizer=optimizer, conversationally=conversationally
+            )
+            return [chunk async for chunk in response] if stream else response
+
+        def outcome(index: int, task: asyncio.Task) -> Tuple[int, Any]:
+            error = task.exception()
+            if error is None:
+                return index, task.result()
+            if return_exceptions:
+                return index, error
+            raise error
+
+        source = enumerate(prompts)
+        pending: dict = {}
+
+        def submit() -> Optional[asyncio.Task]:
+            item = next(source, None)
+            if item is None:
+                return None
+            index, prompt = item
+            task = asyncio.ensure_future(run(prompt))
+            pending[task] = index
+            return task
+
+        with _conversation_paused(self):
+            try:
+                if ordered:
+                    window = deque()
+                    while len(window) < concurrency:
+                        task = submit()
+                        if task is None:
+                            break
+                        window.append(task)
+                    while window:
+                        task = window.popleft()
+                        await asyncio.wait((task,))
+                        index = pending.pop(task)
+                        following = submit()
+                        if following is not None:
+                            window.append(following)
+                        yield outcome(index, task)
+                else:
+                    while len(pending) < concurrency and submit() is not None:
+                        pass
+                    while pending:
+                        done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            index = pending.pop(task)
+                            submit()
+                            yield outcome(index, task)
+            finally:
+                for task in pending:
+                    task.cancel()
+
 class TTSProvider(ABC):
 
     @abstractmethod
@@ -1,8 +1,18 @@
 import json
 import platform
 import subprocess
-from typing import Union
+from typing import Any, AsyncGenerator, AsyncIterable, Generator, Iterable, List, Optional, Sequence, Union
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_loads(data: Union[bytes, str]) -> Any:
+        # Decoding first skips json's per-call encoding detection on bytes
+        return json.loads(data.decode("utf-8") if isinstance(data, bytes) else data)
+
+JSONPath = Union[str, Sequence[Union[str, int]]]
 
 
 def sanitize_stream(
@@ -24,6 +34,271 @@ def sanitize_stream(
 
     return json.loads(chunk) if to_json else chunk
 
+
+class StreamAccumulator:
+    """Collects streamed text deltas and joins them once, when the text is read.
+
+    ``text += delta`` is only cheap while nothing else references ``text``;
+    once the running string is also stored in a response dict (as streaming
+    providers used to do for every delta) each token copies everything
+    received so far, which is quadratic over a long generation.
+
+    Examples:
+        >>> message = StreamAccumulator()
+        >>> message += "Hello"
+        >>> message += ", world"
+        >>> message.text
+        'Hello, world'
+    """
+
+    __slots__ = ("_chunks", "_text")
+
+    def __init__(self):
+        self._chunks: List[str] = []
+        self._text: Optional[str] = ""
+
+    def append(self, delta: str) -> None:
+        """Add a delta; empty deltas are ignored."""
+        if delta:
+            self._chunks.append(delta)
+            self._text = None
+
+    def __iadd__(self, delta: str) -> "StreamAccumulator":
+        self.append(delta)
+        return self
+
+    @property
+    def text(self) -> str:
+        """The full text so far, joined on first access after a change."""
+        if self._text is None:
+            self._text = "".join(self._chunks)
+            self._chunks = [self._text]
+        return self._text
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+
+def _compile_path(path: Optional[JSONPath]) -> Optional[tuple]:
+    if path is None:
+        return None
+    if isinstance(path, str):
+        path = path.split(".")
+    return tuple(int(key) if isinstance(key, str) and key.lstrip("-").isdigit() else key for key in path)
+
+
+def extract_path(obj: Any, path: Optional[JSONPath]) -> Any:
+    """Walk a decoded JSON document along ``path``.
+
+    Args:
+        obj (Any): Decoded JSON document.
+        path (str|Sequence, optional): ``"choices.0.delta.content"`` or
+            ``("choices", 0, "delta", "content")``. None returns ``obj``.
+
+    Returns:
+        Any: The value at ``path``, or None if any step is missing.
+    """
+    return _walk(obj, _compile_path(path) or ())
+
+
+def _walk(obj: Any, keys: tuple) -> Any:
+    for key in keys:
+        try:
+            obj = obj[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    return obj
+
+
+class StreamDecoder:
+    """Incremental byte-level decoder for SSE and NDJSON response bodies.
+
+    Feed it raw chunks as they arrive off the wire; it yields one item per
+    complete event. Lines are split on bytes, so UTF-8 sequences cut across
+    chunk boundaries are reassembled before decoding.
+
+    SSE handling:
+        - ``data:`` lines of one event are joined with newlines; an event ends
+          at a blank line, as the SSE spec says.
+        - For servers that omit the blank line between events, pass
+          ``split_json=True``: a ``data:`` line starting a new JSON document
+          (``{`` or ``[``) then closes the pending one. Off by default, as it
+          splits valid multi-line events whose continuation starts with one.
+        - ``event:``, ``id:``, ``retry:`` fields and ``:`` comments are ignored.
+        - A ``[DONE]`` payload ends the stream.
+
+    Args:
+        mode (str, optional): ``"sse"`` or ``"ndjson"``. Defaults to "sse".
+        path (str|Sequence, optional): JSON path to extract from every event,
+            e.g. ``"choices.0.delta.content"``. Events where it is missing or
+            null are skipped. Defaults to None (yield the whole document).
+        to_json (bool, optional): Decode payloads as JSON (orjson when
+            installed). Invalid JSON is skipped. Defaults to True.
+        done (str, optional): End-of-stream sentinel. Defaults to "[DONE]".
+        split_json (bool, optional): Also end an event at a ``data:`` line
+            starting a JSON document. Defaults to False.
+
+    Examples:
+        >>> decoder = StreamDecoder(path="choices.0.delta.content")
+        >>> decoder.feed(b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n\nda')
+        ['Hi']
+    """
+
+    def __init__(
+        self,
+        mode: str = "sse",
+        path: Optional[JSONPath] = None,
+        to_json: bool = True,
+        done: Optional[str] = "[DONE]",
+        split_json: bool = False,
+    ):
+        if mode not in ("sse", "ndjson"):
+            raise ValueError(f"Unknown stream mode: {mode}")
+        self.mode = mode
+        self.path = _compile_path(path)
+        self.to_json = to_json
+        self.done = done.encode() if done is not None else None
+        self.split_json = split_json and to_json
+        self.finished = False
+        self._buffer = b""
+        self._data: List[bytes] = []
+
+    def _emit(self, payload: bytes, out: list) -> None:
+        if self.done is not None and payload.strip() == self.done:
+            self.finished = True
+            return
+        if not self.to_json:
+            out.append(payload.decode("utf-8", errors="replace"))
+            return
+        try:
+            value = _json_loads(payload)
+        except ValueError:
+            return
+        if self.path is not None:
+            value = _walk(value, self.path)
+            if value is None:
+                return
+        out.append(value)
+
+    def _dispatch(self, out: list) -> None:
+        if self._data:
+            payload = self._data[0] if len(self._data) == 1 else b"\n".join(self._data)
+            self._data = []
+            self._emit(payload, out)
+
+    def _line(self, line: bytes, out: list) -> None:
+        if line[-1:] == b"\r":
+            line = line[:-1]
+        if self.mode == "ndjson":
+            if line.strip():
+                self._emit(line, out)
+        elif not line:
+            self._dispatch(out)
+        elif line[:5] == b"data:":
+            value = line[6:] if line[5:6] == b" " else line[5:]
+            if self._data and self.split_json and value[:1] in (b"{", b"["):
+                self._dispatch(out)
+            self._data.append(value)
+
+    def feed(self, chunk: Union[bytes, str]) -> list:
+        """Decode a chunk and return the events it completed.
+
+        Args:
+            chunk (bytes|str): Next piece of the response body.
+
+        Returns:
+            list: Completed events (empty once the stream is finished).
+        """
+        if self.finished:
+            return []
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if self._buffer:
+            chunk = self._buffer + chunk
+        lines = chunk.split(b"\n")
+        self._buffer = lines.pop()
+        out: list = []
+        line_handler = self._line
+        for line in lines:
+            line_handler(line, out)
+            if self.finished:
+                self._buffer = b""
+                break
+        return out
+
+    def flush(self) -> list:
+        """Decode whatever is left once the body has ended.
+
+        Returns:
+            list: The final events, if any.
+        """
+        out: list = []
+        if not self.finished:
+            if self._buffer:
+                self._line(self._buffer, out)
+                self._buffer = b""
+            self._dispatch(out)
+        return out
+
+
+def iter_stream(
+    chunks: Iterable[Union[bytes, str]],
+    mode: str = "sse",
+    path: Optional[JSONPath] = None,
+    to_json: bool = True,
+    done: Optional[str] = "[DONE]",
+    split_json: bool = False,
+) -> Generator[Any, None, None]:
+    """Decode an SSE/NDJSON body incrementally.
+
+    Args:
+        chunks (Iterable): Body chunks, e.g. ``response.iter_content(chunk_size=None)``.
+        mode, path, to_json, done, split_json: See :class:`StreamDecoder`.
+
+    Yields:
+        Any: One decoded event (or the value at ``path``) at a time.
+
+    Examples:
+        >>> for text in iter_stream(response.iter_content(chunk_size=None), path="choices.0.delta.content"):
+        ...     print(text, end="")
+    """
+    decoder = StreamDecoder(mode=mode, path=path, to_json=to_json, done=done, split_json=split_json)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+        if decoder.finished:
+            return
+    yield from decoder.flush()
+
+
+async def aiter_stream(
+    chunks: AsyncIterable[Union[bytes, str]],
+    mode: str = "sse",
+    path: Optional[JSONPath] = None,
+    to_json: bool = True,
+    done: Optional[str] = "[DONE]",
+    split_json: bool = False,
+) -> AsyncGenerator[Any, None]:
+    """Async twin of :func:`iter_stream`, e.g. for ``response.aiter_bytes()``.
+
+    Args:
+        chunks (AsyncIterable): Body chunks.
+        mode, path, to_json, done, split_json: See :class:`StreamDecoder`.
+
+    Yields:
+        Any: One decoded event (or the value at ``path``) at a time.
+    """
+    decoder = StreamDecoder(mode=mode, path=path, to_json=to_json, done=done, split_json=split_json)
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+        if decoder.finished:
+            return
+    for item in decoder.flush():
+        yield item
+
 def run_system_command(
     command: str,
     exit_on_error: bool = True,
@@ -127,6 +402,13 @@ from .conversation import Conversation
 
 from .optimizers import Optimizers
 
-from .Extra.autocoder import AutoCoder
+from .prompt_manager import AwesomePrompts
+
 
-from .prompt_manager import AwesomePrompts
\ No newline at end of file
+def __getattr__(name):
+    # AutoCoder pulls in the whole Extra package (gguf, huggingface_hub), which
+    # every provider would otherwise pay for just by importing this module.
+    if name == "AutoCoder":
+        from .Extra.autocoder import AutoCoder
+        return AutoCoder
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,8 +12,9 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Tuple, Union, Optional
 
-import httpx
-from httpx import AsyncClient, HTTPStatusError
+from httpx import HTTPStatusError
+
+from webscout import transport
 
 # For image models using validation. Adjust based on organization internal pydantic.
 from pydantic import BaseModel, validator
@@ -130,7 +131,7 @@ async def upload_file(file: Union[bytes, str, Path], proxy: Optional[str] = None
         with open(file, "rb") as f:
             file = f.read()
 
-    async with AsyncClient(http2=True, proxies=proxy) as client:
+    async with transport.async_client(proxies=proxy) as client:
         response = await client.post(
             url=Endpoint.UPLOAD.value,
             headers=Headers.UPLOAD.value,
@@ -242,7 +243,7 @@ class AsyncChatbot:
         self.choice_id = ""
         self.secure_1psid = secure_1psid
         self.secure_1psidts = secure_1psidts
-        self.session = httpx.AsyncClient(proxies=self.proxy)
+        self.session = transport.async_client(proxies=self.proxy)
         self.session.headers = headers
         self.session.cookies.set("__Secure-1PSID", secure_1psid)
         self.session.cookies.set("__Secure-1PSIDTS", secure_1psidts)
@@ -430,7 +431,7 @@ class Image(BaseModel):
                 console.log(f"Invalid filename: {filename}")
             if skip_invalid_filename:
                 return None
-        async with AsyncClient(http2=True, follow_redirects=True, cookies=cookies, proxies=self.proxy) as client:
+        async with transport.async_client(proxies=self.proxy, follow_redirects=True, cookies=cookies) as client:
             response = await client.get(self.url)
             if response.status_code == 200:
                 content_type = response.headers.get("content-type")
@@ -1,16 +1,109 @@
 import requests
-from typing import Dict, List, Optional, Union, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, wait
+from html.parser import HTMLParser
 from webscout.scout import Scout
 from urllib.parse import urljoin
 from webscout.litagent import LitAgent
+from webscout import ratelimit, transport
+from webscout.cache import ResultCache
 
+import codecs
+import threading
 import time
 import json
 import os
-from datetime import datetime, timedelta
-from functools import lru_cache
 from webscout.Litlogger import Logger, LogFormat
+
+# Subtrees whose text never shows on the page (or is page chrome rather than content)
+_INVISIBLE_TAGS = frozenset({"script", "style", "header", "footer", "nav", "noscript", "template"})
+
+
+class _VisibleTextParser(HTMLParser):
+    """Collects a page's visible text as it is fed, up to ``limit`` characters."""
+
+    def __init__(self, limit: Optional[int] = None):
+        super().__init__()
+        self.limit = limit
+        self.parts: List[str] = []
+        self.length = 0
+        self._hidden = 0
+
+    @property
+    def full(self) -> bool:
+        return bool(self.limit) and self.length >= self.limit
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _INVISIBLE_TAGS:
+            self._hidden += 1
+
+    def handle_endtag(self, tag):
+        if tag in _INVISIBLE_TAGS and self._hidden:
+            self._hidden -= 1
+
+    def handle_data(self, data):
+        if self._hidden or self.full:
+            return
+        text = data.strip()
+        if text:
+            self.parts.append(text)
+            self.length += len(text) + 1
+
+    def text(self) -> str:
+        text = " ".join(self.parts)
+        return text[:self.limit] if self.limit else text
+
+
+def _visible_text(
+    chunks: Iterable[bytes],
+    encoding: str = "utf-8",
+    max_characters: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    cancelled: Optional[threading.Event] = None,
+) -> str:
+    """
+    Visible text of an HTML document read chunk by chunk.
+
+    Stops reading as soon as ``max_characters`` of text are collected,
+    ``max_bytes`` are read or ``cancelled`` is set, so a huge page costs no
+    more than its first few kilobytes.
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parser = _VisibleTextParser(max_characters)
+    read = 0
+    for chunk in chunks:
+        if max_bytes is not None:
+            chunk = chunk[:max_bytes - read]
+        read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.full or (max_bytes is not None and read >= max_bytes) or (cancelled and cancelled.is_set()):
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    return parser.text()
+
+
+def _parse_results(resp_content: bytes) -> List[Dict[str, str]]:
+    """Title, href and abstract of each result on one Google results page."""
+    soup = Scout(resp_content)  # Use Scout parser
+    page_results = []
+    for result_block in soup.select("div.g"):
+        link = result_block.select_one("a[href]")
+        title = result_block.select_one("h3")
+        description_box = result_block.select_one('div[style="-webkit-line-clamp:2"]')
+        if link and title and description_box:
+            page_results.append({
+                "title": title.get_text(strip=True),
+                "href": link["href"],
+                "abstract": description_box.get_text(strip=True),
+            })
+    return page_results
+
+
 class GoogleS:
     """A Python interface for Google search with advanced features
 
@@ -73,6 +166,7 @@ class GoogleS:
         - Logging: Optional LitLogger integration for beautiful console output
         - Proxy Support: Use custom proxies for requests
         - Concurrent Processing: Multi-threaded requests for better performance
+        - Text Extraction: Result pages fetched concurrently, politely per domain, with a size cap
 
     Response Format:
         Web Search Results:
@@ -108,6 +202,8 @@ class GoogleS:
         max_workers: int = 20,
         cache_dir: Optional[str] = None,
         rate_limit: float = 2.0,
+        max_page_bytes: int = 1_000_000,
+        extract_timeout: float = 20.0,
     ):
         """
         Initialize the GoogleS object with enhanced features.
@@ -115,23 +211,29 @@ class GoogleS:
         Args:
             cache_dir: Directory to store search result cache
             rate_limit: Minimum time between requests in seconds
+            max_page_bytes: Bytes read at most from each result page when extracting text
+            extract_timeout: Seconds allowed for extracting text from all results; pages not
+                done by then keep an empty ``visible_text``
         """
         self.proxy = proxy
         self.headers = headers if headers else {
             "User-Agent": LitAgent().random()  # Use LitAgent to generate user agent
         }
         self.headers["Referer"] = "https://www.google.com/"
-        self.client = requests.Session()
+        self.client = transport.session()
         self.client.headers.update(self.headers)
         if proxy:
             self.client.proxies.update({"http": proxy, "https": proxy})
         self.timeout = timeout
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self.cache_dir = cache_dir
-        if cache_dir and not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
+        self.result_cache = ResultCache(
+            ttls={"google": 86400.0}, path=os.path.join(cache_dir, "results.sqlite3")
+        ) if cache_dir else None
         self.last_request_time = 0
         self.rate_limit = rate_limit
+        self.max_page_bytes = max_page_bytes
+        self.extract_timeout = extract_timeout
 
     def _respect_rate_limit(self):
         """Ensure minimum time between requests"""
@@ -190,35 +292,6 @@ class GoogleS:
                 
         raise Exception("Max retries reached")
 
-    @lru_cache(maxsize=100)
-    def _cache_key(self, query: str, **kwargs) -> str:
-        """Generate a cache key from search parameters"""
-        cache_data = {'query': query, **kwargs}
-        return json.dumps(cache_data, sort_keys=True)
-
-    def _get_cached_results(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
-        """Retrieve cached results if they exist and are not expired"""
-        if not self.cache_dir:
-            return None
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
-                if datetime.fromisoformat(cached_data['timestamp']) + timedelta(hours=24) > datetime.now():
-                    return cached_data['results']
-        return None
-
-    def _cache_results(self, cache_key: str, results: List[Dict[str, Any]]):
-        """Cache search results"""
-        if not self.cache_dir:
-            return
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        with open(cache_file, 'w') as f:
-            json.dump({
-                'timestamp': datetime.now().isoformat(),
-                'results': results
-            }, f)
-
     def search_images(
         self,
         query: str,
@@ -284,7 +357,7 @@ class GoogleS:
         soup = Scout(content)  # Use Scout parser
         
         results = []
-        for img in soup.find_all("img", class_="rg_i"):
+        for img in soup.select("img.rg_i"):
             if len(results) >= max_results:
                 break
             
@@ -340,16 +413,26 @@ class GoogleS:
         if exact_phrase:
             advanced_query = f'"{exact_phrase}"' + advanced_query
         
-        # Check cache first
-        cache_key = self._cache_key(advanced_query, region=region, language=language,
-                                  safe=safe, time_period=time_period, sort_by=sort_by)
-        cached_results = self._get_cached_results(cache_key)
-        if cached_results:
-            return cached_results[:max_results]
-
-        # Continue with regular search implementation...
+        args = (advanced_query, region, language, safe, time_period, max_results, extract_text, max_text_length)
+        if self.result_cache is None:
+            return self._search(*args)
+        return self.result_cache.get_or_fetch(
+            "google", ResultCache.key("google", *args, sort_by=sort_by), lambda: self._search(*args)
+        )
+
+    def _search(
+        self,
+        advanced_query: str,
+        region: str,
+        language: str,
+        safe: str,
+        time_period: Optional[str],
+        max_results: int,
+        extract_text: bool,
+        max_text_length: Optional[int],
+    ) -> List[Dict[str, Union[str, int]]]:
+        """Fetch and parse result pages until ``max_results`` results are collected."""
         results = []
-        futures = []
         start = 0
 
         while len(results) < max_results:
@@ -363,65 +446,89 @@ class GoogleS:
             }
             if time_period:
                 params["tbs"] = f"qdr:{time_period}"
-
-            futures.append(self._executor.submit(self._get_url, "GET", self.SEARCH_TYPES["web"], params=params))
             start += 10
 
-            for future in as_completed(futures):
-                try:
-                    resp_content = future.result()
-                    soup = Scout(resp_content)  # Use Scout parser
-                    
-                    result_blocks = soup.find_all("div", class_="g")
-
-                    if not result_blocks:
-                        break
-
-                    # Extract links and titles first
-                    for result_block in result_blocks:
-                        link = result_block.find("a", href=True)
-                        title = result_block.find("h3")
-                        description_box = result_block.find(
-                            "div", {"style": "-webkit-line-clamp:2"}
-                        )
-
-                        if link and title and description_box:
-                            url = link["href"]
-                            results.append({
-                                "title": title.text,
-                                "href": url,
-                                "abstract": description_box.text,
-                                "index": len(results),
-                                "type": "web",
-                                "visible_text": ""  # Initialize visible_text as empty string
-                            })
-
-                            if len(results) >= max_results:
-                                break  # Stop if we have enough results
-
-                    # Parallelize text extraction if needed
-                    if extract_text:
-                        with ThreadPoolExecutor(max_workers=self._executor._max_workers) as text_extractor:
-                            extraction_futures = [
-                                text_extractor.submit(self._extract_text_from_webpage, 
-                                                    self._get_url("GET", result['href']),
-                                                    max_characters=max_text_length)
-                                for result in results 
-                                if 'href' in result
-                            ]
-                            for i, future in enumerate(as_completed(extraction_futures)):
-                                try:
-                                    results[i]['visible_text'] = future.result()
-                                except Exception as e:
-                                    print(f"Error extracting text: {e}")
-
-                except Exception as e:
-                    print(f"Error: {e}")  
-
-        # Cache results before returning
-        self._cache_results(cache_key, results)
+            try:
+                resp_content = self._get_url("GET", self.SEARCH_TYPES["web"], params=params)
+            except Exception:
+                if results:
+                    break
+                raise
+            page_results = _parse_results(resp_content)
+            if not page_results:
+                break  # Last page
+
+            for result in page_results:
+                results.append({
+                    **result,
+                    "index": len(results),
+                    "type": "web",
+                    "visible_text": ""  # Filled in below if extract_text
+                })
+                if len(results) >= max_results:
+                    break
+
+        if extract_text and results:
+            self._extract_texts(results, max_text_length)
         return results
 
+    def _extract_texts(self, results: List[Dict[str, Union[str, int]]], max_characters: Optional[int]) -> None:
+        """
+        Fills in each result's ``visible_text`` from its page, fetching pages concurrently.
+
+        Text is attached to the result it was fetched for. Pages still loading
+        after ``extract_timeout`` are abandoned and keep an empty text, so a
+        slow site delays the search by at most that long.
+        """
+        cancelled = threading.Event()
+        futures = {
+            self._executor.submit(self._fetch_visible_text, result["href"], max_characters, cancelled): result
+            for result in results
+            if result.get("href")
+        }
+        done, not_done = wait(futures, timeout=self.extract_timeout)
+        cancelled.set()
+        for future in not_done:
+            future.cancel()
+        for future in done:
+            try:
+                futures[future]["visible_text"] = future.result()
+            except Exception as e:
+                print(f"Error extracting text: {e}")
+
+    def _fetch_visible_text(self, url: str, max_characters: Optional[int], cancelled: threading.Event) -> str:
+        """
+        Streams a result page and returns its visible text.
+
+        Requests are paced per domain with :func:`webscout.ratelimit.for_host`
+        and :func:`webscout.ratelimit.host_slots` instead of Google's rate
+        limit. At most ``max_page_bytes`` are read, and reading stops once
+        ``max_characters`` of text are collected.
+        """
+        if not url.startswith(("http://", "https://")):
+            return ""
+        limiter = ratelimit.for_host(url)
+        with ratelimit.host_slots(url):
+            limiter.acquire()
+            if cancelled.is_set():
+                return ""
+            with self.client.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code == 429:
+                    limiter.throttled(ratelimit.retry_after(response.headers))
+                response.raise_for_status()
+                limiter.succeeded()
+                content_type = response.headers.get("Content-Type", "").lower()
+                if content_type and "html" not in content_type and not content_type.startswith("text/"):
+                    return ""  # PDFs, images and the like have no visible HTML text
+                encoding = response.encoding if "charset=" in content_type else "utf-8"
+                return _visible_text(
+                    response.iter_content(chunk_size=16384),
+                    encoding=encoding or "utf-8",
+                    max_characters=max_characters,
+                    max_bytes=self.max_page_bytes,
+                    cancelled=cancelled,
+                )
+
     def get_search_suggestions(self, query: str) -> List[str]:
         """Get search suggestions for a query"""
         params = {
@@ -435,15 +542,9 @@ class GoogleS:
 
     def _extract_text_from_webpage(self, html_content: bytes, max_characters: Optional[int] = None) -> str:
         """
-        Extracts visible text from HTML content using Scout parser.
+        Extracts visible text from HTML content.
         """
-        soup = Scout(html_content)  # Use Scout parser
-        for tag in soup(["script", "style", "header", "footer", "nav"]):
-            tag.extract()
-        visible_text = soup.get_text(strip=True)
-        if max_characters:
-            visible_text = visible_text[:max_characters]
-        return visible_text
+        return _visible_text([html_content], max_characters=max_characters)
 
     def __enter__(self):
         return self
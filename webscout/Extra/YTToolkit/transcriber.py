@@ -16,6 +16,7 @@ from typing import List, Dict, Union, Optional
 from functools import lru_cache  #
 from concurrent.futures import ThreadPoolExecutor  
 from webscout.exceptions import *  
+from webscout import transport
 
 WATCH_URL = 'https://www.youtube.com/watch?v={video_id}'
 MAX_WORKERS = 4 
@@ -34,7 +35,7 @@ class YTTranscriber:
     @classmethod
     def _get_session(cls):
         if cls._session is None:
-            cls._session = requests.Session()
+            cls._session = transport.session()
             cls._session.headers.update({
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             })
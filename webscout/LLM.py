@@ -15,6 +15,8 @@ import base64
 import json
 from typing import List, Dict, Union, Generator, Optional, Any
 
+from webscout import transport
+
 class LLMError(Exception):
     """Custom exception for LLM API errors 🚫
 
@@ -83,6 +85,7 @@ class LLM:
             'sec-ch-ua-mobile': '?0',
             'sec-ch-ua-platform': '"macOS"'
         }
+        self.session = transport.session()
 
     def _prepare_payload(
         self, 
@@ -192,7 +195,7 @@ class LLM:
             ...     print(chunk, end='')
         """
         try:
-            with requests.post(self.api_url, json=payload, headers=self.headers, stream=True) as response:
+            with self.session.post(self.api_url, json=payload, headers=self.headers, stream=True) as response:
                 response.raise_for_status()
                 for line in response.iter_lines():
                     if line:
@@ -228,7 +231,7 @@ class LLM:
             >>> print(response)
         """
         try:
-            response = requests.post(self.api_url, json=payload, headers=self.headers)
+            response = self.session.post(self.api_url, json=payload, headers=self.headers)
             response.raise_for_status()
             result = response.json()
             return result['choices'][0]['message']['content']
@@ -297,6 +300,7 @@ class VLM:
             'sec-ch-ua-mobile': '?0',
             'sec-ch-ua-platform': '"macOS"'
         }
+        self.session = transport.session()
 
     def chat(
         self, 
@@ -358,7 +362,7 @@ class VLM:
     def _stream_response(self, payload: Dict[str, Any]) -> Generator[str, None, None]:
         """Stream the VLM chat response."""
         try:
-            with requests.post(self.api_url, json=payload, headers=self.headers, stream=True) as response:
+            with self.session.post(self.api_url, json=payload, headers=self.headers, stream=True) as response:
                 response.raise_for_status()
                 for line in response.iter_lines():
                     if line:
@@ -377,7 +381,7 @@ class VLM:
     def _send_request(self, payload: Dict[str, Any]) -> str:
         """Send a non-streaming VLM chat request."""
         try:
-            response = requests.post(self.api_url, json=payload, headers=self.headers)
+            response = self.session.post(self.api_url, json=payload, headers=self.headers)
             response.raise_for_status()
             result = response.json()
             return result['choices'][0]['message']['content']
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import json
 from typing import Union, Dict, Any
 
@@ -40,7 +40,7 @@ class AI21(Provider):
         self.temperature = temperature
         self.top_p = top_p
         self.system_prompt = system_prompt
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.timeout = timeout
@@ -1,7 +1,8 @@
 from uuid import uuid4
 import requests
+from webscout import transport
 import re
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Optional, Union
 
 from webscout.AIbase import AISearch
 from webscout import exceptions
@@ -83,7 +84,7 @@ class DeepFind(AISearch):
             >>> ai = DeepFind(timeout=60)  # Longer timeout
             >>> ai = DeepFind(proxies={'http': 'http://proxy.com:8080'})  # With proxy
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.api_endpoint = "https://www.deepfind.co/?q={query}"
         self.stream_chunk_size = 1024
         self.timeout = timeout
@@ -114,7 +115,7 @@ class DeepFind(AISearch):
         prompt: str,
         stream: bool = False,
         raw: bool = False,
-    ) -> Union[Dict[str, Any], Generator[Any, None, None]][str, None, None]:
+    ) -> Union[Dict[str, Any], Generator[Any, None, None]]:
         """Search using the DeepFind API and get AI-generated responses.
         
         This method sends a search query to DeepFind and returns the AI-generated response.
@@ -1,7 +1,8 @@
 import requests
+from webscout import transport
 import json
 import re
-from typing import Dict, Optional, Generator, Any
+from typing import Dict, Optional, Generator, Any, Union
 from webscout import LitAgent
 from webscout import exceptions
 from webscout.AIbase import AISearch
@@ -84,7 +85,7 @@ class Isou(AISearch):
                 f"Invalid model: {model}. Choose from: {self.available_models}"
             )
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.api_endpoint = "https://isou.chat/api/search"
         self.stream_chunk_size = 64
         self.timeout = timeout
@@ -118,7 +119,7 @@ class Isou(AISearch):
         prompt: str,
         stream: bool = False,
         raw: bool = False,
-    ) -> Union[Dict[str, Any], Generator[Any, None, None]][Dict[str, Any], None, None]:
+    ) -> Union[Dict[str, Any], Generator[Any, None, None]]:
         """Search using the Isou API and get AI-generated responses.
         
         Args:
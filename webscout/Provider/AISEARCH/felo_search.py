@@ -1,7 +1,8 @@
 import requests
+from webscout import transport
 from uuid import uuid4
 import json
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Optional, Union
 
 from webscout.AIbase import AISearch
 from webscout import exceptions
@@ -85,7 +86,7 @@ class Felo(AISearch):
             >>> ai = Felo(timeout=60)  # Longer timeout
             >>> ai = Felo(proxies={'http': 'http://proxy.com:8080'})  # With proxy
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.chat_endpoint = "https://api.felo.ai/search/threads"
         self.stream_chunk_size = 64
         self.timeout = timeout
@@ -115,7 +116,7 @@ class Felo(AISearch):
         prompt: str,
         stream: bool = False,
         raw: bool = False,
-    ) -> Union[Dict[str, Any], Generator[Any, None, None]][str, None, None]:
+    ) -> Union[Dict[str, Any], Generator[Any, None, None]]:
         """Search using the Felo API and get AI-generated responses.
         
         This method sends a search query to Felo and returns the AI-generated response.
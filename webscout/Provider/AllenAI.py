@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import os
 from uuid import uuid4
@@ -64,7 +65,7 @@ class AllenAI(Provider):
             'sec-ch-ua-platform': '"Windows"'
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.model = model
@@ -1,5 +1,5 @@
 from uuid import uuid4
-import requests
+from webscout import transport
 import json
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
@@ -36,7 +36,7 @@ class AndiSearch(Provider):
             history_offset (int, optional): Limit conversation history to this number of last texts. Defaults to 10250.
             act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.chat_endpoint = "https://write.andisearch.com/v1/write_streaming"
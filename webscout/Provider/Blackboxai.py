@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 from typing import Any, Dict, Optional, Union, Generator, List
 from webscout.AIutel import Optimizers, Conversation, AwesomePrompts
@@ -52,7 +53,7 @@ class BLACKBOXAI(Provider):
 
         ) if logging else None
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.max_tokens_to_sample = max_tokens
         self.is_conversation = is_conversation
         self.timeout = timeout
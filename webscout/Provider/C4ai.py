@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import uuid
 import json
 import time
@@ -42,7 +43,7 @@ class C4ai(Provider):
     ):
         """Initialize the C4ai client."""
         self.url = "https://cohereforai-c4ai-command.hf.space"
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.proxies.update(proxies)
         
         # Set up headers for all requests
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import re
 import json
 import os
@@ -37,7 +38,7 @@ class ChatGPTES(Provider):
         if model not in self.SUPPORTED_MODELS:
             raise ValueError(f"Unsupported model: {model}. Choose from: {self.SUPPORTED_MODELS}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = 'https://chatgpt.es/wp-admin/admin-ajax.php'
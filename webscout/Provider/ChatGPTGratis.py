@@ -1,8 +1,7 @@
 from typing import Union, Any, Dict, Generator, Optional
-import requests
-import json
+from webscout import transport
 
-from webscout.AIutel import Optimizers, Conversation, AwesomePrompts
+from webscout.AIutel import Optimizers, Conversation, AwesomePrompts, iter_stream
 from webscout.AIbase import Provider
 from webscout import exceptions
 from webscout import LitAgent as Lit
@@ -38,7 +37,7 @@ class ChatGPTGratis(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.timeout = timeout
         self.api_endpoint = "https://chatgptgratis.eu/backend/chat.php"
         self.model = model
@@ -110,23 +109,11 @@ class ChatGPTGratis(Provider):
                 )
 
             full_response = ""
-            for line in response.iter_lines():
-                if line:
-                    line_decoded = line.decode('utf-8').strip()
-                    if line_decoded == "data: [DONE]":
-                        break
-                    if line_decoded.startswith("data: "):
-                        try:
-                            json_data = json.loads(line_decoded[6:])
-                            choices = json_data.get("choices", [])
-                            if choices and "delta" in choices[0]:
-                                content = choices[0]["delta"].get("content", "")
-                            else:
-                                content = ""
-                            full_response += content
-                            yield content if raw else {"text": content}
-                        except json.JSONDecodeError:
-                            continue
+            for content in iter_stream(
+                response.iter_content(chunk_size=None), path="choices.0.delta.content"
+            ):
+                full_response += content
+                yield content if raw else {"text": content}
             # Update last response and conversation history.
             self.conversation.update_chat_history(prompt, self.get_message({"text": full_response}))
 
@@ -3,7 +3,7 @@ from webscout.AIutel import Conversation
 from webscout.AIutel import AwesomePrompts
 from webscout.AIbase import Provider
 from webscout import exceptions
-import requests
+from webscout import transport
 
 class Chatify(Provider):
     """
@@ -26,7 +26,7 @@ class Chatify(Provider):
         """
         Initializes the Chatify AI API with given parameters.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://chatify-ai.vercel.app/api/chat"
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import json
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
@@ -46,7 +46,7 @@ class Cohere(Provider):
             history_offset (int, optional): Limit conversation history to this number of last texts. Defaults to 10250.
             act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_key = api_key
@@ -1,9 +1,9 @@
 import requests
-import json
+from webscout import transport
 from typing import Union, Any, Dict, Generator
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
-from webscout.AIutel import AwesomePrompts
+from webscout.AIutel import AwesomePrompts, iter_stream
 from webscout.AIbase import Provider
 from webscout import exceptions
 from webscout import LitAgent as Lit
@@ -39,7 +39,7 @@ class DeepSeek(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS.keys()}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://www.deepseekapp.io/v1/chat/completions"
@@ -111,24 +111,12 @@ class DeepSeek(Provider):
                         )
                     
                     streaming_text = ""
-                    for line in response.iter_lines(decode_unicode=True):
-                        if line:
-                            line = line.strip()
-                            if line.startswith("data: "):
-                                json_str = line[6:]  # Remove "data: " prefix
-                                if json_str == "[DONE]":
-                                    break
-                                try:
-                                    json_data = json.loads(json_str)
-                                    if 'choices' in json_data:
-                                        choice = json_data['choices'][0]
-                                        if 'delta' in choice and 'content' in choice['delta']:
-                                            content = choice['delta']['content']
-                                            streaming_text += content
-                                            resp = {"text": content}
-                                            yield resp if raw else resp
-                                except json.JSONDecodeError:
-                                    continue
+                    for content in iter_stream(
+                        response.iter_content(chunk_size=None), path="choices.0.delta.content"
+                    ):
+                        streaming_text += content
+                        resp = {"text": content}
+                        yield resp if raw else resp
                     
                     self.last_response = {"text": streaming_text}
                     self.conversation.update_chat_history(prompt, streaming_text)
@@ -1,11 +1,12 @@
 import requests
+from webscout import transport
 import json
 import os
 from typing import Any, Dict, Optional, Generator, Union
 
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
-from webscout.AIutel import AwesomePrompts, sanitize_stream
+from webscout.AIutel import AwesomePrompts, sanitize_stream, iter_stream
 from webscout.AIbase import Provider, AsyncProvider
 from webscout import exceptions
 from webscout import LitAgent
@@ -106,7 +107,7 @@ class DeepInfra(Provider):
             "User-Agent": self.fingerprint["user_agent"],
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
@@ -195,24 +196,12 @@ class DeepInfra(Provider):
                         )
                     
                     streaming_text = ""
-                    for line in response.iter_lines(decode_unicode=True):
-                        if line:
-                            line = line.strip()
-                            if line.startswith("data: "):
-                                json_str = line[6:]
-                                if json_str == "[DONE]":
-                                    break
-                                try:
-                                    json_data = json.loads(json_str)
-                                    if 'choices' in json_data:
-                                        choice = json_data['choices'][0]
-                                        if 'delta' in choice and 'content' in choice['delta']:
-                                            content = choice['delta']['content']
-                                            streaming_text += content
-                                            resp = dict(text=content)
-                                            yield resp if raw else resp
-                                except json.JSONDecodeError:
-                                    continue
+                    for content in iter_stream(
+                        response.iter_content(chunk_size=None), path="choices.0.delta.content"
+                    ):
+                        streaming_text += content
+                        resp = dict(text=content)
+                        yield resp if raw else resp
                     
                     self.last_response = {"text": streaming_text}
                     self.conversation.update_chat_history(prompt, streaming_text)
@@ -17,6 +17,7 @@ from typing import Union, Optional, Dict
 import time
 import json
 import requests
+from webscout import transport
 from hashlib import sha256
 
 from webscout.AIutel import Optimizers, Conversation, AwesomePrompts
@@ -62,7 +63,7 @@ class Free2GPT(Provider):
             system_prompt (str): System prompt. Defaults to "You are a helpful AI assistant.".
             variant (str): Select API variant: "claude" or "gpt". Defaults to "claude".
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
 
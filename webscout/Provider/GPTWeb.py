@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import json
 
 from webscout.AIutel import Optimizers
@@ -39,7 +39,7 @@ class GPTWeb(Provider):
             act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
             system_prompt (str, optional): System prompt for GPTWeb. Defaults to "You are a helpful AI assistant.".
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = 'https://nexra.aryahcr.cc/api/chat/gptweb'
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import time
 from typing import Any, Dict, List, Optional, Union, Generator
@@ -49,7 +50,7 @@ class GithubChat(Provider):
         self.url = "https://github.com/copilot"
         self.api_url = "https://api.individual.githubcopilot.com"
         self.cookie_path = cookie_path
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.proxies.update(proxies)
         
         # Load cookies for authentication
@@ -1,8 +1,7 @@
-import requests
-import json
+from webscout import transport
 from typing import Union, Any, Dict, Generator, Optional
 
-from webscout.AIutel import Optimizers, Conversation, AwesomePrompts
+from webscout.AIutel import Optimizers, Conversation, AwesomePrompts, iter_stream
 from webscout.AIbase import Provider
 from webscout import exceptions
 from webscout import LitAgent as Lit
@@ -37,7 +36,7 @@ class GliderAI(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {', '.join(self.AVAILABLE_MODELS)}")
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://glider.so/api/chat"
@@ -119,22 +118,12 @@ class GliderAI(Provider):
                     f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                 )
             streaming_text = ""
-            for value in response.iter_lines(decode_unicode=True):
-                if value:
-                    if value.startswith("data: "):
-                        try:
-                            data = json.loads(value[6:])
-                            # Handle both standard and DeepSeek response formats
-                            if "choices" in data and len(data["choices"]) > 0:
-                                choice = data["choices"][0]
-                                if "delta" in choice and "content" in choice["delta"]:
-                                    content = choice["delta"]["content"]
-                                    if content:
-                                        streaming_text += content
-                                        yield content if raw else {"text": content}
-                        except json.JSONDecodeError:
-                            if "stop" in value:
-                                break
+            for content in iter_stream(
+                response.iter_content(chunk_size=None), path="choices.0.delta.content"
+            ):
+                if content:
+                    streaming_text += content
+                    yield content if raw else {"text": content}
             self.last_response.update(dict(text=streaming_text))
             self.conversation.update_chat_history(prompt, self.get_message(self.last_response))
 
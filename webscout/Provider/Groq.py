@@ -1,12 +1,12 @@
 from typing import Any, AsyncGenerator, Dict, Optional, Callable, List, Union
 
-import httpx
-import requests
+from webscout import transport
 import json
 
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
 from webscout.AIutel import AwesomePrompts, sanitize_stream
+from webscout.AIutel import StreamAccumulator, iter_stream, aiter_stream
 from webscout.AIbase import Provider, AsyncProvider
 from webscout import exceptions
 
@@ -80,7 +80,7 @@ class GROQ(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_key = api_key
@@ -186,24 +186,19 @@ class GROQ(Provider):
                     f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                 )
 
-            message_load = ""
-            for value in response.iter_lines(
-                decode_unicode=True,
-                delimiter="" if raw else "data:",
-                chunk_size=self.stream_chunk_size,
-            ):
-                try:
-                    resp = json.loads(value)
-                    incomplete_message = self.get_message(resp)
-                    if incomplete_message:
-                        message_load += incomplete_message
-                        resp["choices"][0]["delta"]["content"] = message_load
-                        self.last_response.update(resp)
-                        yield value if raw else resp
-                    elif raw:
-                        yield value
-                except json.decoder.JSONDecodeError:
-                    pass
+            message = StreamAccumulator()
+            last_event = None
+            for resp in iter_stream(response.iter_content(chunk_size=self.stream_chunk_size)):
+                delta = self.get_message(resp)
+                if delta:
+                    message.append(delta)
+                    last_event = resp
+                    yield delta if raw else resp
+            if last_event is not None:
+                # The full text is materialized once, into a copy of the final event
+                self.last_response.update(
+                    last_event, choices=[dict(last_event["choices"][0], delta={"content": message.text})]
+                )
 
             # Handle tool calls if any
             if 'tool_calls' in self.last_response.get('choices', [{}])[0].get('message', {}):
@@ -335,7 +330,7 @@ class GROQ(Provider):
             if response["choices"][0].get("delta"):
                 return response["choices"][0]["delta"]["content"]
             return response["choices"][0]["message"]["content"]
-        except KeyError:
+        except (KeyError, IndexError):
             return ""
 
 
@@ -440,7 +435,7 @@ class AsyncGROQ(AsyncProvider):
             is_conversation, self.max_tokens_to_sample, filepath, update_file
         )
         self.conversation.history_offset = history_offset
-        self.session = httpx.AsyncClient(headers=self.headers, proxies=proxies)
+        self.session = transport.async_client(headers=self.headers, proxies=proxies)
 
     def add_function(self, function_name: str, function: Callable):
         """Add a function to the available functions dictionary.
@@ -507,23 +502,19 @@ class AsyncGROQ(AsyncProvider):
                         f"Failed to generate response - ({response.status_code}, {response.reason_phrase})"
                     )
 
-                message_load = ""
-                intro_value = "data:"
-                async for value in response.aiter_lines():
-                    try:
-                        if value.startswith(intro_value):
-                            value = value[len(intro_value) :]
-                        resp = json.loads(value)
-                        incomplete_message = await self.get_message(resp)
-                        if incomplete_message:
-                            message_load += incomplete_message
-                            resp["choices"][0]["delta"]["content"] = message_load
-                            self.last_response.update(resp)
-                            yield value if raw else resp
-                        elif raw:
-                            yield value
-                    except json.decoder.JSONDecodeError:
-                        pass
+                message = StreamAccumulator()
+                last_event = None
+                async for resp in aiter_stream(response.aiter_bytes()):
+                    delta = await self.get_message(resp)
+                    if delta:
+                        message.append(delta)
+                        last_event = resp
+                        yield delta if raw else resp
+                if last_event is not None:
+                    # The full text is materialized once, into a copy of the final event
+                    self.last_response.update(
+                        last_event, choices=[dict(last_event["choices"][0], delta={"content": message.text})]
+                    )
 
                 # Handle tool calls if any (in streaming mode)
                 if 'tool_calls' in self.last_response.get('choices', [{}])[0].get('message', {}):
@@ -652,5 +643,5 @@ class AsyncGROQ(AsyncProvider):
             if response["choices"][0].get("delta"):
                 return response["choices"][0]["delta"]["content"]
             return response["choices"][0]["message"]["content"]
-        except KeyError:
+        except (KeyError, IndexError):
             return ""
\ No newline at end of file
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import uuid
 import sys
@@ -54,7 +55,7 @@ class HeckAI(Provider):
             'Connection': 'keep-alive'
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import uuid
 import json
 import time
@@ -50,7 +51,7 @@ class HuggingFaceChat(Provider):
         """Initialize the HuggingFaceChat client."""
         self.url = "https://huggingface.co/chat"
         self.cookie_path = cookie_path
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.proxies.update(proxies)
         self.assistantId = assistantId
         self.system_prompt = system_prompt
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import os
 from typing import Any, Dict, Optional, Generator, Union
@@ -77,7 +78,7 @@ class Hunyuan(Provider):
             # Default test key (may not work long-term)
             self.headers["Authorization"] = "Bearer 7auGXNATFSKl7dF"
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.system_message = system_prompt
@@ -1,12 +1,11 @@
-import requests
-import json
+from webscout import transport
 from ..AIutel import Optimizers
 from ..AIutel import Conversation
-from ..AIutel import AwesomePrompts, sanitize_stream
+from ..AIutel import AwesomePrompts
+from ..AIutel import StreamAccumulator, iter_stream, aiter_stream
 from ..AIbase import  Provider, AsyncProvider
 from webscout import exceptions
 from typing import Union, Any, AsyncGenerator, Dict
-import httpx
 #------------------------------------------------------KOBOLDAI-----------------------------------------------------------
 class KOBOLDAI(Provider):
     def __init__(
@@ -38,7 +37,7 @@ class KOBOLDAI(Provider):
             history_offset (int, optional): Limit conversation history to this number of last texts. Defaults to 10250.
             act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.temperature = temperature
@@ -124,20 +123,14 @@ class KOBOLDAI(Provider):
                     f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                 )
 
-            message_load = ""
-            for value in response.iter_lines(
-                decode_unicode=True,
-                delimiter="" if raw else "event: message\ndata:",
-                chunk_size=self.stream_chunk_size,
-            ):
-                try:
-                    resp = json.loads(value)
-                    message_load += self.get_message(resp)
-                    resp["token"] = message_load
-                    self.last_response.update(resp)
-                    yield value if raw else resp
-                except json.decoder.JSONDecodeError:
-                    pass
+            message = StreamAccumulator()
+            for resp in iter_stream(response.iter_content(chunk_size=self.stream_chunk_size)):
+                delta = self.get_message(resp)
+                message.append(delta)
+                self.last_response.update(resp)
+                yield delta if raw else resp
+            # The full text is materialized once, at the end of the stream
+            self.last_response["token"] = message.text
             self.conversation.update_chat_history(
                 prompt, self.get_message(self.last_response)
             )
@@ -257,7 +250,7 @@ class AsyncKOBOLDAI(AsyncProvider):
             is_conversation, self.max_tokens_to_sample, filepath, update_file
         )
         self.conversation.history_offset = history_offset
-        self.session = httpx.AsyncClient(headers=self.headers, proxies=proxies)
+        self.session = transport.async_client(headers=self.headers, proxies=proxies)
 
     async def ask(
         self,
@@ -309,16 +302,14 @@ class AsyncKOBOLDAI(AsyncProvider):
                         f"Failed to generate response - ({response.status_code}, {response.reason_phrase})"
                     )
 
-                message_load = ""
-                async for value in response.aiter_lines():
-                    try:
-                        resp = sanitize_stream(value)
-                        message_load += await self.get_message(resp)
-                        resp["token"] = message_load
-                        self.last_response.update(resp)
-                        yield value if raw else resp
-                    except json.decoder.JSONDecodeError:
-                        pass
+                message = StreamAccumulator()
+                async for resp in aiter_stream(response.aiter_bytes()):
+                    delta = await self.get_message(resp)
+                    message.append(delta)
+                    self.last_response.update(resp)
+                    yield delta if raw else resp
+                # The full text is materialized once, at the end of the stream
+                self.last_response["token"] = message.text
 
             self.conversation.update_chat_history(
                 prompt, await self.get_message(self.last_response)
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import time
 import random
@@ -44,7 +45,7 @@ class LambdaChat(Provider):
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
             
         self.model = model
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.proxies.update(proxies)
         self.assistantId = assistantId
         self.system_prompt = system_prompt
@@ -1,9 +1,9 @@
-import requests
-import json
+from webscout import transport
 
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
 from webscout.AIutel import AwesomePrompts, sanitize_stream
+from webscout.AIutel import StreamAccumulator, iter_stream
 from webscout.AIbase import Provider, AsyncProvider
 from webscout import exceptions
 from typing import Any, AsyncGenerator, Dict, Union
@@ -62,7 +62,7 @@ class LLAMA(Provider):
             is_conversation, self.max_tokens_to_sample, filepath, update_file
         )
         self.conversation.history_offset = history_offset
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.proxies = proxies
 
     def ask(
@@ -114,15 +114,16 @@ class LLAMA(Provider):
                     f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                 )
             
-            message_load = ""
-            for chunk in response.iter_lines():
-                try:
-                    resp = json.loads(chunk)
-                    message_load += resp['message']
-                    yield chunk if raw else dict(text=message_load)
-                    self.last_response.update(resp)
-                except:
-                    pass
+            message = StreamAccumulator()
+            for resp in iter_stream(response.iter_content(chunk_size=None), mode="ndjson"):
+                delta = resp.get("message") if isinstance(resp, dict) else None
+                if delta is None:
+                    continue
+                message.append(delta)
+                yield delta if raw else dict(text=delta)
+                self.last_response.update(resp)
+            # The full text is materialized once, at the end of the stream
+            self.last_response["message"] = message.text
             self.conversation.update_chat_history(
                 prompt, self.get_message(self.last_response)
             )
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 from typing import Union, Any, Dict, Generator
 
@@ -52,7 +53,7 @@ class Sambanova(Provider):
         self.model = model
         self.system_prompt = system_prompt
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.proxies = proxies
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 from typing import Union, Any, Dict, Optional, Generator
 
@@ -27,7 +28,7 @@ class Marcus(Provider):
         act: str = None
     ):
         """Initializes the Marcus API."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://www.askmarcus.app/api/response"
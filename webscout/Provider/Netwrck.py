@@ -1,6 +1,7 @@
 import time
 import uuid
 import requests
+from webscout import transport
 import json
 from typing import Any, Dict, Optional, Generator, Union
 from dataclasses import dataclass, asdict
@@ -52,7 +53,7 @@ class Netwrck(Provider):
         self.model = model
         self.model_name = model  # Use the model name directly since it's already in the correct format
         self.system_prompt = system_prompt
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.timeout = timeout
@@ -1,13 +1,13 @@
-import json
 from ..AIutel import Optimizers
 from ..AIutel import Conversation
-from ..AIutel import AwesomePrompts, sanitize_stream
+from ..AIutel import AwesomePrompts
+from ..AIutel import StreamAccumulator, iter_stream, aiter_stream
 from ..AIbase import  Provider, AsyncProvider
 
 from webscout import exceptions
 from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 import requests
-import httpx
+from webscout import transport
 #----------------------------------------------------------OpenAI-----------------------------------
 class OPENAI(Provider):
     def __init__(
@@ -156,24 +156,19 @@ class OPENAI(Provider):
                     f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                 )
 
-            message_load = ""
-            for value in response.iter_lines(
-                decode_unicode=True,
-                delimiter="" if raw else "data:",
-                chunk_size=self.stream_chunk_size,
-            ):
-                try:
-                    resp = json.loads(value)
-                    incomplete_message = self.get_message(resp)
-                    if incomplete_message:
-                        message_load += incomplete_message
-                        resp["choices"][0]["delta"]["content"] = message_load
-                        self.last_response.update(resp)
-                        yield value if raw else resp
-                    elif raw:
-                        yield value
-                except json.decoder.JSONDecodeError:
-                    pass
+            message = StreamAccumulator()
+            last_event = None
+            for resp in iter_stream(response.iter_content(chunk_size=self.stream_chunk_size)):
+                delta = self.get_message(resp)
+                if delta:
+                    message.append(delta)
+                    last_event = resp
+                    yield delta if raw else resp
+            if last_event is not None:
+                # The full text is materialized once, into a copy of the final event
+                self.last_response.update(
+                    last_event, choices=[dict(last_event["choices"][0], delta={"content": message.text})]
+                )
             self.conversation.update_chat_history(
                 prompt, self.get_message(self.last_response)
             )
@@ -247,7 +242,7 @@ class OPENAI(Provider):
             if response["choices"][0].get("delta"):
                 return response["choices"][0]["delta"]["content"]
             return response["choices"][0]["message"]["content"]
-        except KeyError:
+        except (KeyError, IndexError):
             return ""
 class AsyncOPENAI(AsyncProvider):
     def __init__(
@@ -320,7 +315,7 @@ class AsyncOPENAI(AsyncProvider):
             is_conversation, self.max_tokens_to_sample, filepath, update_file
         )
         self.conversation.history_offset = history_offset
-        self.session = httpx.AsyncClient(
+        self.session = transport.async_client(
             headers=self.headers,
             proxies=proxies,
         )
@@ -398,31 +393,28 @@ class AsyncOPENAI(AsyncProvider):
                         f"Failed to generate response - ({response.status_code}, {response.reason_phrase})"
                     )
 
-                message_load = ""
-                async for value in response.aiter_lines():
-                    try:
-
-                        resp = sanitize_stream(value)
-                        incomplete_message = await self.get_message(resp)
-                        if incomplete_message:
-                            message_load += incomplete_message
-                            resp["choices"][0]["delta"]["content"] = message_load
-                            self.last_response.update(resp)
-                            yield value if raw else resp
-                        elif raw:
-                            yield value
-                    except json.decoder.JSONDecodeError:
-                        pass
+                message = StreamAccumulator()
+                last_event = None
+                async for resp in aiter_stream(response.aiter_bytes()):
+                    delta = await self.get_message(resp)
+                    if delta:
+                        message.append(delta)
+                        last_event = resp
+                        yield delta if raw else resp
+                if last_event is not None:
+                    # The full text is materialized once, into a copy of the final event
+                    self.last_response.update(
+                        last_event, choices=[dict(last_event["choices"][0], delta={"content": message.text})]
+                    )
             self.conversation.update_chat_history(
                 prompt, await self.get_message(self.last_response)
             )
 
         async def for_non_stream():
-            response = httpx.post(
+            response = await self.session.post(
                 self.chat_endpoint,
                 json=payload,
                 timeout=self.timeout,
-                headers=self.headers,
             )
             if (
                 not response.is_success
@@ -492,5 +484,5 @@ class AsyncOPENAI(AsyncProvider):
             if response["choices"][0].get("delta"):
                 return response["choices"][0]["delta"]["content"]
             return response["choices"][0]["message"]["content"]
-        except KeyError:
+        except (KeyError, IndexError):
             return ""
\ No newline at end of file
@@ -4,6 +4,7 @@ import json
 import re
 import threading
 import requests
+from webscout import transport
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
 from webscout.AIutel import AwesomePrompts
@@ -88,7 +89,7 @@ class PiAI(Provider):
             '__cf_bm': uuid4().hex
         }
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies = proxies
 
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import re
 import json
 import yaml
@@ -56,7 +56,7 @@ class PhindSearch:
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
             
-        self.session = requests.Session()
+        self.session = transport.session()
         self.max_tokens_to_sample = max_tokens
         self.is_conversation = is_conversation
         self.chat_endpoint = "https://https.extension.phind.com/agent/"
@@ -313,7 +313,7 @@ class Phindv2(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
             
-        self.session = requests.Session()
+        self.session = transport.session()
         self.max_tokens_to_sample = max_tokens
         self.is_conversation = is_conversation
         self.chat_endpoint = "https://https.extension.phind.com/agent/"
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import re
 from typing import Any, Dict, Optional, Union, Generator
@@ -31,7 +32,7 @@ class PIZZAGPT(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
             
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://www.pizzagpt.it/api/chatx-completion"
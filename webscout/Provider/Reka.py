@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 
 
 import json
@@ -45,7 +45,7 @@ class REKA(Provider):
             use_search_engine (bool, optional): Whether to use the search engine. Defaults to False.
             use_code_interpreter (bool, optional): Whether to use the code interpreter. Defaults to False.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://chat.reka.ai/api/chat"
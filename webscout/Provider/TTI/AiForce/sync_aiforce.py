@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import os
 import time
 from typing import List, Optional, Union
@@ -62,7 +62,7 @@ class AiForceimager(ImageProvider):
             "Accept-Encoding": "gzip, deflate",
             "User-Agent": agent.random()
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import os
 from typing import Union, List
 from string import punctuation
@@ -48,7 +48,7 @@ class FreeAIImager(ImageProvider):
             "Origin": "https://freeaichatplayground.com",
             "Referer": "https://freeaichatplayground.com/",
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
@@ -9,7 +9,7 @@ Examples:
     >>> provider.save(images, dir="my_images")
 """
 
-import requests
+from webscout import transport
 import os
 import time
 from typing import List, Optional, Union
@@ -59,7 +59,7 @@ class ImgSys(ImageProvider):
             "Content-Type": "application/json",
             "User-Agent": agent.random(),
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import os
 import uuid
 import time
@@ -25,7 +25,7 @@ class MagicStudioImager(ImageProvider):
             "DNT": "1",
             "Sec-GPC": "1"
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import os
 import time
@@ -82,7 +83,7 @@ class NexraImager(ImageProvider):
             "Accept": "application/json",
             "User-Agent": agent.random()
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
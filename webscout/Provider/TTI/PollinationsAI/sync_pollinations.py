@@ -18,7 +18,7 @@ Examples:
     ... )
 """
 
-import requests
+from webscout import transport
 import os
 import time
 from typing import List, Optional, Union
@@ -106,7 +106,7 @@ class PollinationsAI(ImageProvider):
             "Accept-Encoding": "gzip, deflate",
             "User-Agent": agent.random(),
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
@@ -17,7 +17,7 @@ Examples:
     >>> provider.save(images, dir="dragon_pics")
 """
 
-import requests
+from webscout import transport
 import json
 import os
 import time
@@ -124,7 +124,7 @@ class AIArtaImager(ImageProvider):
             "Accept-Language": "en-US,en;q=0.5",
             "User-Agent": agent.random()
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
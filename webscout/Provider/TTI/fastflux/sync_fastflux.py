@@ -17,7 +17,7 @@ Examples:
     >>> provider.save(images, dir="dragon_pics")
 """
 
-import requests
+from webscout import transport
 import base64
 import json
 import os
@@ -82,7 +82,7 @@ class FastFluxImager(ImageProvider):
             "referer": "https://fastflux.co/",
             "user-agent": agent.random()
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
@@ -27,6 +27,7 @@ Examples:
 
 import os
 import requests
+from webscout import transport
 import io
 from PIL import Image
 from typing import Union, Any, List, Optional, Dict
@@ -67,7 +68,7 @@ class HFimager(ImageProvider):
             "User-Agent": agent.random(),
             "Accept": "application/json"
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
@@ -16,7 +16,7 @@ Examples:
     >>> provider.save(images, dir="creatures")
 """
 
-import requests
+from webscout import transport
 import os
 import time
 import json
@@ -84,7 +84,7 @@ class PiclumenImager(ImageProvider):
             "Sec-Gpc": "1",
             "User-Agent": agent.random(),  # Using our fire random agent! 🔥
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
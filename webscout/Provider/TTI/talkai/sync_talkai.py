@@ -1,5 +1,6 @@
 import uuid
 import requests
+from webscout import transport
 import json
 import os
 from typing import Union, Any, Dict, List, Optional
@@ -46,7 +47,7 @@ class TalkaiImager(ImageProvider):
             'referer': 'https://talkai.info/image/',
             'user-agent': agent.random(),  # Using our fire random agent! 🔥
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
@@ -1,5 +1,6 @@
 import time
 import requests
+from webscout import transport
 import pathlib
 import base64
 import tempfile
@@ -27,7 +28,7 @@ class DeepgramTTS(TTSProvider):
 
     def __init__(self, timeout: int = 20, proxies: dict = None):
         """Initializes the DeepgramTTS TTS client."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
@@ -1,5 +1,6 @@
 import time
 import requests
+from webscout import transport
 import pathlib
 import tempfile
 from io import BytesIO
@@ -21,7 +22,7 @@ class ElevenlabsTTS(TTSProvider):
 
     def __init__(self, timeout: int = 20, proxies: dict = None):
         """Initializes the ElevenlabsTTS TTS client."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
@@ -1,5 +1,6 @@
 import time
 import requests
+from webscout import transport
 import pathlib
 import base64
 from io import BytesIO
@@ -30,7 +31,7 @@ class GesseritTTS(TTSProvider):
 
     def __init__(self, timeout: int = 20, proxies: dict = None):
         """Initializes the GesseritTTS TTS client."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
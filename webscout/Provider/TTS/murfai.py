@@ -1,5 +1,6 @@
 import time
 import requests
+from webscout import transport
 import pathlib
 import tempfile
 from io import BytesIO
@@ -20,7 +21,7 @@ class MurfAITTS(TTSProvider):
 
     def __init__(self, timeout: int = 20, proxies: dict = None):
         """Initializes the MurfAITTS TTS client."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
@@ -3,6 +3,7 @@
 ##################################################################################
 import time
 import requests
+from webscout import transport
 import pathlib
 import tempfile
 from io import BytesIO
@@ -37,7 +38,7 @@ class SpeechMaTTS(TTSProvider):
     def __init__(self, timeout: int = 20, proxies: dict = None):
         """Initializes the SpeechMa TTS client."""
         self.api_url = "https://speechma.com/com.api/tts-api.php"
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
@@ -1,5 +1,6 @@
 import time
 import requests
+from webscout import transport
 import pathlib
 import urllib.parse
 import tempfile
@@ -231,7 +232,7 @@ class StreamElements(TTSProvider):
 
     def __init__(self, timeout: int = 20, proxies: dict = None):
         """Initializes the StreamElements TTS client."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         if proxies:
             self.session.proxies.update(proxies)
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 from requests.exceptions import RequestException
 from typing import Union, Any, Dict
 from webscout.AIutel import Conversation, Optimizers
@@ -40,7 +40,7 @@ class TeachAnything:
         """
 
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://www.teach-anything.com/api/generate"
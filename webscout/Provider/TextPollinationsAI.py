@@ -1,7 +1,6 @@
-import requests
-import json
+from webscout import transport
 from typing import Union, Any, Dict, Generator
-from webscout.AIutel import Optimizers, Conversation, AwesomePrompts
+from webscout.AIutel import Optimizers, Conversation, AwesomePrompts, iter_stream
 from webscout.AIbase import Provider
 from webscout import exceptions
 from webscout import LitAgent as Lit
@@ -58,7 +57,7 @@ class TextPollinationsAI(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://text.pollinations.ai/openai"
@@ -138,24 +137,11 @@ class TextPollinationsAI(Provider):
                 )
 
             full_response = ""
-            for line in response.iter_lines():
-                if line:
-                    line = line.decode('utf-8').strip()
-                    if line == "data: [DONE]":
-                        break
-                    if line.startswith('data: '):
-                        try:
-                            json_data = json.loads(line[6:])
-                            if 'choices' in json_data and len(json_data['choices']) > 0:
-                                choice = json_data['choices'][0]
-                                if 'delta' in choice and 'content' in choice['delta']:
-                                    content = choice['delta']['content']
-                                else:
-                                    content = ""
-                                full_response += content
-                                yield content if raw else dict(text=content)
-                        except json.JSONDecodeError:
-                            continue
+            for content in iter_stream(
+                response.iter_content(chunk_size=None), path="choices.0.delta.content"
+            ):
+                full_response += content
+                yield content if raw else dict(text=content)
 
             self.last_response.update(dict(text=full_response))
             self.conversation.update_chat_history(
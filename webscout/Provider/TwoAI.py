@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import os
 from typing import Any, Dict, Optional, Generator, Union
@@ -48,7 +49,7 @@ class TwoAI(Provider):
             'Referer': 'https://api.two.app/'
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
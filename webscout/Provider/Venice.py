@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 from typing import Generator, Dict, Any, List, Union
 from uuid import uuid4
@@ -44,7 +45,7 @@ class Venice(Provider):
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
             
         self.api_endpoint = "https://venice.ai/api/inference/chat"
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.temperature = temperature
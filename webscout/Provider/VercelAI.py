@@ -1,6 +1,6 @@
 import re
 import time
-import requests
+from webscout import transport
 import json
 from typing import Union, Any, Dict, Generator, Optional
 import uuid
@@ -42,7 +42,7 @@ class VercelAI(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://chat.vercel.ai/api/chat"
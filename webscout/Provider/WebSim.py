@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import string
 import random
@@ -68,7 +69,7 @@ class WebSim(Provider):
             'websim-flags;': ''
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
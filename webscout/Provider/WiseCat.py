@@ -1,5 +1,5 @@
 import re
-import requests
+from webscout import transport
 import json
 from typing import Union, Any, Dict, Generator, Optional
 
@@ -41,7 +41,7 @@ class WiseCat(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://wise-cat-groq.vercel.app/api/chat"
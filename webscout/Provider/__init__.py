@@ -1,176 +1,97 @@
 # webscout/providers/__init__.py
-from .PI import *
-from .Llama import LLAMA
-from .Cohere import Cohere
-from .Reka import REKA
-from .Groq import GROQ
-from .Groq import AsyncGROQ
-from .Openai import OPENAI
-from .Openai import AsyncOPENAI
-from .Koboldai import KOBOLDAI
-from .Koboldai import AsyncKOBOLDAI
-from .Blackboxai import BLACKBOXAI 
-from .Phind import PhindSearch 
-from .Phind import Phindv2
-from .ai4chat import *
-from .Gemini import GEMINI
-from .Deepinfra import DeepInfra
-from .cleeai import *
-from .OLLAMA import OLLAMA
-from .Andi import AndiSearch
-from .PizzaGPT import *
-from .Llama3 import *
-from .DARKAI import *
-from .koala import *
-from .meta import *
-from .julius import *
-from .Youchat import *
-from .yep import *
-from .Cloudflare import *
-from .turboseek import *
-from .Free2GPT import *
-from .EDITEE import *
-from .TeachAnything import *
-from .AI21 import *
-from .Chatify import *
-from .x0gpt import *
-from .cerebras import *
-from .lepton import *
-from .geminiapi import *
-from .elmo import *
-from .GPTWeb import *
-from .Netwrck import Netwrck
-from .llamatutor import *
-from .promptrefine import *
-from .tutorai import *
-from .ChatGPTES import *
-from .bagoodex import *
-from .aimathgpt import *
-from .gaurish import *
-from .geminiprorealtime import *
-from .llmchat import *
-from .talkai import *
-from .askmyai import *
-from .llama3mitril import *
-from .Marcus import *
-from .typegpt import *
-from .multichat import *
-from .Jadve import *
-from .chatglm import *
-from .hermes import *
-from .TextPollinationsAI import *
-from .Glider import *
-from .ChatGPTGratis import *
-from .QwenLM import *
-from .granite import *
-from .WiseCat import *
-from .DeepSeek import *
-from .freeaichat import FreeAIChat
-from .akashgpt import *
-from .Perplexitylabs import *
-from .AllenAI import *
-from .HeckAI import *
-from .TwoAI import *
-from .Venice import *
-from .ElectronHub import *
-from .HuggingFaceChat import *
-from .GithubChat import *
-from .copilot import *
-from .C4ai import *
-from .flowith import *
-from .sonus import *
-from .uncovr import *
-from .labyrinth import *
-from .WebSim import *
-from .LambdaChat import *
-from .ChatGPTClone import *
-from .VercelAI import *
-__all__ = [
-    'LLAMA',
-    'LabyrinthAI',
-    'Flowith',
-    'C4ai',
-    'Venice',
-    'Copilot',
-    'HuggingFaceChat',
-    'TwoAI',
-    'HeckAI',
-    'AllenAI',
-    'PerplexityLabs',
-    'AkashGPT',
-    'DeepSeek',
-    'WiseCat',
-    'IBMGranite',
-    'QwenLM',
-    'ChatGPTGratis',
-    'LambdaChat',
-    'TextPollinationsAI',
-    'GliderAI',
-    'Cohere',
-    'REKA',
-    'GROQ',
-    'AsyncGROQ',
-    'OPENAI',
-    'AsyncOPENAI',
-    'KOBOLDAI',
-    'AsyncKOBOLDAI',
-    'BLACKBOXAI', 
-    'PhindSearch', 
-    'GEMINI',
-    'DeepInfra',
-    'AI4Chat',
-    'Phindv2',
-    'OLLAMA',
-    'AndiSearch',
-    'PIZZAGPT',
-    'Sambanova',
-    'DARKAI',
-    'KOALA',
-    'Meta',
-    'AskMyAI',
-    'PiAI',
-    'Julius',
-    'YouChat',
-    'YEPCHAT',
-    'Cloudflare',
-    'TurboSeek',
-    'Editee',
-    'TeachAnything',
-    'AI21',
-    'Chatify',
-    'X0GPT',
-    'Cerebras',
-    'Lepton',
-    'GEMINIAPI',
-    'SonusAI',
-    'Cleeai',
-    'Elmo',
-    'ChatGPTClone',
-    'Free2GPT',
-    'GPTWeb',
-    'Netwrck',
-    'LlamaTutor',
-    'PromptRefine',
-    'TutorAI',
-    'ChatGPTES',
-    'Bagoodex',
-    'AIMathGPT',
-    'GaurishCerebras',
-    'GeminiPro',
-    'LLMChat',
-    'Talkai',
-    'Llama3Mitril',
-    'Marcus',
-    'TypeGPT',
-    'Netwrck',
-    'MultiChatAI',
-    'JadveOpenAI',
-    'ChatGLM',
-    'NousHermes',
-    'FreeAIChat',
-    'ElectronHub',
-    'GithubChat',
-    'UncovrAI',
-    'WebSim',
-    'VercelAI',
-]
+# Providers are imported on first access; see webscout/Provider/manifest.py for
+# model and API key metadata that doesn't need an import at all.
+from webscout.lazy import install as _install
+
+_EXPORTS = {
+    "LLAMA": ".Llama",
+    "LabyrinthAI": ".labyrinth",
+    "Flowith": ".flowith",
+    "C4ai": ".C4ai",
+    "Venice": ".Venice",
+    "Copilot": ".copilot",
+    "HuggingFaceChat": ".HuggingFaceChat",
+    "TwoAI": ".TwoAI",
+    "HeckAI": ".HeckAI",
+    "AllenAI": ".AllenAI",
+    "PerplexityLabs": ".Perplexitylabs",
+    "AkashGPT": ".akashgpt",
+    "DeepSeek": ".DeepSeek",
+    "WiseCat": ".WiseCat",
+    "IBMGranite": ".granite",
+    "QwenLM": ".QwenLM",
+    "ChatGPTGratis": ".ChatGPTGratis",
+    "LambdaChat": ".LambdaChat",
+    "TextPollinationsAI": ".TextPollinationsAI",
+    "GliderAI": ".Glider",
+    "Cohere": ".Cohere",
+    "REKA": ".Reka",
+    "GROQ": ".Groq",
+    "AsyncGROQ": ".Groq",
+    "OPENAI": ".Openai",
+    "AsyncOPENAI": ".Openai",
+    "KOBOLDAI": ".Koboldai",
+    "AsyncKOBOLDAI": ".Koboldai",
+    "BLACKBOXAI": ".Blackboxai",
+    "PhindSearch": ".Phind",
+    "GEMINI": ".Gemini",
+    "DeepInfra": ".Deepinfra",
+    "AI4Chat": ".ai4chat",
+    "Phindv2": ".Phind",
+    "OLLAMA": ".OLLAMA",
+    "AndiSearch": ".Andi",
+    "PIZZAGPT": ".PizzaGPT",
+    "Sambanova": ".Llama3",
+    "DARKAI": ".DARKAI",
+    "KOALA": ".koala",
+    "Meta": ".meta",
+    "AskMyAI": ".askmyai",
+    "PiAI": ".PI",
+    "Julius": ".julius",
+    "YouChat": ".Youchat",
+    "YEPCHAT": ".yep",
+    "Cloudflare": ".Cloudflare",
+    "TurboSeek": ".turboseek",
+    "Editee": ".EDITEE",
+    "TeachAnything": ".TeachAnything",
+    "AI21": ".AI21",
+    "Chatify": ".Chatify",
+    "X0GPT": ".x0gpt",
+    "Cerebras": ".cerebras",
+    "Lepton": ".lepton",
+    "GEMINIAPI": ".geminiapi",
+    "SonusAI": ".sonus",
+    "Cleeai": ".cleeai",
+    "Elmo": ".elmo",
+    "ChatGPTClone": ".ChatGPTClone",
+    "Free2GPT": ".Free2GPT",
+    "GPTWeb": ".GPTWeb",
+    "Netwrck": ".Netwrck",
+    "LlamaTutor": ".llamatutor",
+    "PromptRefine": ".promptrefine",
+    "TutorAI": ".tutorai",
+    "ChatGPTES": ".ChatGPTES",
+    "Bagoodex": ".bagoodex",
+    "AIMathGPT": ".aimathgpt",
+    "GaurishCerebras": ".gaurish",
+    "GeminiPro": ".geminiprorealtime",
+    "LLMChat": ".llmchat",
+    "Talkai": ".talkai",
+    "Llama3Mitril": ".llama3mitril",
+    "Marcus": ".Marcus",
+    "TypeGPT": ".typegpt",
+    "MultiChatAI": ".multichat",
+    "JadveOpenAI": ".Jadve",
+    "ChatGLM": ".chatglm",
+    "NousHermes": ".hermes",
+    "FreeAIChat": ".freeaichat",
+    "ElectronHub": ".ElectronHub",
+    "GithubChat": ".GithubChat",
+    "UncovrAI": ".uncovr",
+    "WebSim": ".WebSim",
+    "VercelAI": ".VercelAI",
+}
+
+__all__ = list(_EXPORTS)
+
+_install(__name__, _EXPORTS)
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import json
 import html
 import re
@@ -42,7 +42,7 @@ class AI4Chat(Provider):
             act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
             system_prompt (str, optional): System prompt to guide the AI's behavior. Defaults to "You are a helpful and informative AI assistant.".
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://www.ai4chat.co/generate-response"
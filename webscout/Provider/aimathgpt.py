@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import os
 from typing import Any, Dict, Optional, Generator, List, Union
@@ -64,7 +65,7 @@ class AIMathGPT(Provider):
                 "Chrome/129.0.0.0 Safari/537.36 Edg/129.0.0.0"
             ),
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
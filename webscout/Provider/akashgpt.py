@@ -1,6 +1,6 @@
 from typing import Union, Any, Dict, Generator
 from uuid import uuid4
-import requests
+from webscout import transport
 import re
 import json
 import time
@@ -81,7 +81,7 @@ class AkashGPT(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
             
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://chat.akash.network/api/chat"
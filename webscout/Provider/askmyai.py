@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import json
 import re
 from typing import Union, Any, Dict, Optional, Generator
@@ -29,7 +29,7 @@ class AskMyAI(Provider):
         system_prompt: str = "You are a helpful assistant.", # Added system prompt
     ):
         """Initializes the AskMyAI API."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://www.askmyai.chat/api/chat"
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import os
 from typing import Any, Dict, Optional, Generator, Union
@@ -29,7 +30,7 @@ class Bagoodex(Provider):
         """Initializes the Bagoodex API client."""
         self.url = "https://bagoodex.io/front-api/chat"
         self.headers = {"Content-Type": "application/json"}
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)  # Use provided proxies
         self.timeout = timeout
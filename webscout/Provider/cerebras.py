@@ -4,7 +4,7 @@ import requests
 import json
 import os
 from typing import Any, Dict, Optional, Generator, List, Union
-from webscout.AIutel import Optimizers, Conversation, AwesomePrompts
+from webscout.AIutel import Optimizers, Conversation, AwesomePrompts, iter_stream
 from webscout.AIbase import Provider
 from webscout import exceptions
 from webscout import LitAgent as UserAgent
@@ -155,17 +155,11 @@ class Cerebras(Provider):
 
             if stream:
                 def generate_stream():
-                    for line in response.iter_lines():
-                        if line:
-                            line = line.decode('utf-8')
-                            if line.startswith('data:'):
-                                try:
-                                    data = json.loads(line[6:])
-                                    if data.get('choices') and data['choices'][0].get('delta', {}).get('content'):
-                                        content = data['choices'][0]['delta']['content']
-                                        yield content
-                                except json.JSONDecodeError:
-                                    continue
+                    for content in iter_stream(
+                        response.iter_content(chunk_size=None), path="choices.0.delta.content"
+                    ):
+                        if content:
+                            yield content
 
                 return generate_stream()
             else:
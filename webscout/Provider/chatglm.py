@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 from typing import Any, Dict, Optional, Generator, List, Union
 import uuid
@@ -29,7 +30,7 @@ class ChatGLM(Provider):
         plus_model: bool = True,
     ):
         """Initializes the ChatGLM API client."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://chatglm.cn/chatglm/mainchat-api/guest/stream"
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import json
 from uuid import uuid4
 
@@ -37,7 +37,7 @@ class Cleeai(Provider):
             history_offset (int, optional): Limit conversation history to this number of last texts. Defaults to 10250.
             act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://qna-api.cleeai.com/open_research"
@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
 from webscout.AIutel import AwesomePrompts
@@ -39,7 +39,7 @@ class Elmo(Provider):
             system_prompt (str, optional): System prompt for Elmo. Defaults to the provided string.
             web_search (bool, optional): Enables web search mode when True. Defaults to False.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://www.elmo.chat/api/v1/prompt"
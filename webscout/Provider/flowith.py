@@ -1,5 +1,6 @@
 import uuid
 import requests
+from webscout import transport
 import json
 import os
 import re
@@ -73,7 +74,7 @@ class Flowith(Provider):
             "user-agent": LitAgent().random()  # Use LitAgent for user-agent
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
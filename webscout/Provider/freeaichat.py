@@ -1,11 +1,11 @@
 import requests
-import json
+from webscout import transport
 import time
 from typing import Any, Dict, Optional, Generator, Union
 
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
-from webscout.AIutel import AwesomePrompts, sanitize_stream
+from webscout.AIutel import AwesomePrompts, sanitize_stream, iter_stream
 from webscout.AIbase import Provider, AsyncProvider
 from webscout import exceptions
 from webscout import LitAgent
@@ -71,7 +71,7 @@ class FreeAIChat(Provider):
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'same-origin'
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
@@ -142,24 +142,12 @@ class FreeAIChat(Provider):
                         )
                     
                     streaming_text = ""
-                    for line in response.iter_lines(decode_unicode=True):
-                        if line:
-                            line = line.strip()
-                            if line.startswith("data: "):
-                                json_str = line[6:]  # Remove "data: " prefix
-                                if json_str == "[DONE]":
-                                    break
-                                try:
-                                    json_data = json.loads(json_str)
-                                    if 'choices' in json_data:
-                                        choice = json_data['choices'][0]
-                                        if 'delta' in choice and 'content' in choice['delta']:
-                                            content = choice['delta']['content']
-                                            streaming_text += content
-                                            resp = dict(text=content)
-                                            yield resp if raw else resp
-                                except json.JSONDecodeError:
-                                    pass
+                    for content in iter_stream(
+                        response.iter_content(chunk_size=None), path="choices.0.delta.content"
+                    ):
+                        streaming_text += content
+                        resp = dict(text=content)
+                        yield resp if raw else resp
                     
                     self.conversation.update_chat_history(prompt, streaming_text)
                         
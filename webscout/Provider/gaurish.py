@@ -1,11 +1,11 @@
 import requests
-import json
+from webscout import transport
 from typing import Any, Dict, Generator, Union
 import uuid
 
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
-from webscout.AIutel import AwesomePrompts, sanitize_stream
+from webscout.AIutel import AwesomePrompts, sanitize_stream, iter_stream
 from webscout.AIbase import Provider, AsyncProvider
 from webscout import exceptions
 from webscout import LitAgent
@@ -61,7 +61,7 @@ class GaurishCerebras(Provider):
                            "AppleWebKit/537.36 (KHTML, like Gecko) "
                            "Chrome/132.0.0.0 Safari/537.36 Edg/132.0.0.0"),
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
@@ -152,27 +152,13 @@ class GaurishCerebras(Provider):
                         self.logger.info(f"API connection established successfully. Status: {response.status_code}")
 
                     streaming_text = ""
-                    for line in response.iter_lines(decode_unicode=True):
-                        if line:
-                            line = line.strip()
-                            if line.startswith("data: "):
-                                json_str = line[6:]
-                                if json_str == "[DONE]":
-                                    if self.logger:
-                                        self.logger.debug("Stream completed")
-                                    break
-                                try:
-                                    json_data = json.loads(json_str)
-                                    if 'choices' in json_data:
-                                        choice = json_data['choices'][0]
-                                        if 'delta' in choice and 'content' in choice['delta']:
-                                            content = choice['delta']['content']
-                                            streaming_text += content
-                                            yield dict(text=content) if raw else dict(text=content)
-                                except json.JSONDecodeError as e:
-                                    if self.logger:
-                                        self.logger.error(f"JSON parsing error: {str(e)}")
-                                    pass
+                    for content in iter_stream(
+                        response.iter_content(chunk_size=None), path="choices.0.delta.content"
+                    ):
+                        streaming_text += content
+                        yield dict(text=content) if raw else dict(text=content)
+                    if self.logger:
+                        self.logger.debug("Stream completed")
 
                     self.conversation.update_chat_history(prompt, streaming_text)
                     if self.logger:
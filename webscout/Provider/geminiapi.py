@@ -8,7 +8,7 @@ import os
 import google.generativeai as genai
 
 from google.generativeai.types import HarmCategory, HarmBlockThreshold
-import requests
+from webscout import transport
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
 from webscout.AIutel import AwesomePrompts
@@ -70,7 +70,7 @@ class GEMINIAPI(Provider):
         self.max_output_tokens = max_output_tokens
         self.system_instruction = system_instruction
         self.safety_settings = safety_settings if safety_settings else {}
-        self.session = requests.Session()  # Not directly used for Gemini API calls, but can be used for other requests
+        self.session = transport.session()  # Not directly used for Gemini API calls, but can be used for other requests
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_output_tokens
         self.timeout = timeout
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import os
 import secrets
@@ -50,7 +51,7 @@ class GeminiPro(Provider):
             'user-agent': LitAgent().random(),
             'x-requested-with': 'XMLHttpRequest'
         }
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
         self.timeout = timeout
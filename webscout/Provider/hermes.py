@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import json
 from typing import Union, Any, Dict, Generator, Optional
 
@@ -38,7 +38,7 @@ class NousHermes(Provider):
                 f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}"
             )
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.timeout = timeout
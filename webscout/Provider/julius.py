@@ -1,7 +1,7 @@
 
 import uuid
 
-import requests
+from webscout import transport
 import json
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
@@ -62,7 +62,7 @@ class Julius(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.chat_endpoint = "https://api.julius.ai/api/chat/message"
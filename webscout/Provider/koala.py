@@ -1,9 +1,8 @@
-import requests
-import json
+from webscout import transport
 from typing import Union, Any, Dict, Optional
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
-from webscout.AIutel import AwesomePrompts, sanitize_stream
+from webscout.AIutel import AwesomePrompts, sanitize_stream, iter_stream, extract_path, StreamAccumulator
 from webscout.AIbase import Provider
 from webscout import exceptions
 
@@ -52,7 +51,7 @@ class KOALA(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
             
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://koala.sh/api/gpt/"
@@ -146,19 +145,12 @@ class KOALA(Provider):
                     f"Failed to generate response - ({response.status_code}, {response.reason})"
                 )
             
-            streaming_response = ""
-            for line in response.iter_lines(decode_unicode=True):
-                if line:
-                    if line.startswith("data:"):
-                        data = line[len("data:"):].strip()
-                        if data:
-                            try:
-                                event = json.loads(data)
-                                streaming_response += event.get("choices", [{}])[0].get("delta", {}).get("content", "")
-                                yield event if raw else dict(text=streaming_response)
-                            except json.decoder.JSONDecodeError:
-                                continue
-            self.last_response.update(dict(text=streaming_response))
+            streaming_response = StreamAccumulator()
+            for event in iter_stream(response.iter_content(chunk_size=None)):
+                delta = extract_path(event, "choices.0.delta.content") or ""
+                streaming_response.append(delta)
+                yield event if raw else dict(text=delta)
+            self.last_response.update(dict(text=streaming_response.text))
             self.conversation.update_chat_history(
                 prompt, self.get_message(self.last_response)
             )
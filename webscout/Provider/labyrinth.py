@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import uuid
 from typing import Any, Dict, Optional, Generator, Union
@@ -62,7 +63,7 @@ class LabyrinthAI(Provider):
             "Sec-GPC": "1"
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
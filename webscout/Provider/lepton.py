@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import re
 import json
 
@@ -36,7 +36,7 @@ class Lepton(Provider):
             history_offset (int, optional): Limit conversation history to this number of last texts. Defaults to 10250.
             act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://search.lepton.run/api/query"
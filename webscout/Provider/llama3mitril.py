@@ -1,4 +1,4 @@
-import requests
+from webscout import transport
 import json
 import re
 from typing import Union, Any, Dict, Optional, Generator
@@ -29,7 +29,7 @@ class Llama3Mitril(Provider):
         temperature: float = 0.8,
     ):
         """Initializes the Llama3Mitril API."""
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens = max_tokens
         self.temperature = temperature
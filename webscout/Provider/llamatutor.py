@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 
 from webscout.AIutel import Optimizers
@@ -30,7 +31,7 @@ class LlamaTutor(Provider):
         Initializes the LlamaTutor API with given parameters.
         """
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://llamatutor.together.ai/api/getChat"
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 from typing import Union, Any, Dict, Optional, Generator, List
 
@@ -44,7 +45,7 @@ class LLMChat(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://llmchat.in/inference/stream"
@@ -0,0 +1,1391 @@
+"""
+Static provider manifest, generated by ``python -m webscout.Provider.registry``.
+
+Do not edit by hand.
+"""
+
+PROVIDERS = {'AI21': {'module': 'webscout.Provider.AI21',
+          'models': None,
+          'requires_api_key': True,
+          'is_async': False},
+ 'AI4Chat': {'module': 'webscout.Provider.ai4chat',
+             'models': None,
+             'requires_api_key': False,
+             'is_async': False},
+ 'AIMathGPT': {'module': 'webscout.Provider.aimathgpt',
+               'models': None,
+               'requires_api_key': False,
+               'is_async': False},
+ 'AkashGPT': {'module': 'webscout.Provider.akashgpt',
+              'models': ['Meta-Llama-3-3-70B-Instruct',
+                         'DeepSeek-R1',
+                         'Meta-Llama-3-1-405B-Instruct-FP8',
+                         'Qwen-QwQ-32B'],
+              'requires_api_key': False,
+              'is_async': False},
+ 'AllenAI': {'module': 'webscout.Provider.AllenAI',
+             'models': ['tulu3-405b'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'AndiSearch': {'module': 'webscout.Provider.Andi',
+                'models': None,
+                'requires_api_key': False,
+                'is_async': False},
+ 'AskMyAI': {'module': 'webscout.Provider.askmyai',
+             'models': None,
+             'requires_api_key': False,
+             'is_async': False},
+ 'AsyncGROQ': {'module': 'webscout.Provider.Groq',
+               'models': ['llama3-70b-8192',
+                          'llama-3.2-3b-preview',
+                          'gemma2-9b-it',
+                          'llama-3.2-11b-vision-preview',
+                          'llama3-8b-8192',
+                          'llama-3.3-70b-versatile',
+                          'deepseek-r1-distill-llama-70b',
+                          'mixtral-8x7b-32768',
+                          'llama-3.3-70b-specdec',
+                          'llama-3.2-90b-vision-preview',
+                          'llama-3.2-1b-preview',
+                          'llama-3.1-8b-instant',
+                          'llama-guard-3-8b'],
+               'requires_api_key': True,
+               'is_async': True},
+ 'AsyncKOBOLDAI': {'module': 'webscout.Provider.Koboldai',
+                   'models': None,
+                   'requires_api_key': False,
+                   'is_async': True},
+ 'AsyncOPENAI': {'module': 'webscout.Provider.Openai',
+                 'models': None,
+                 'requires_api_key': True,
+                 'is_async': True},
+ 'BLACKBOXAI': {'module': 'webscout.Provider.Blackboxai',
+                'models': {'deepseek-v3': 'deepseek-ai/DeepSeek-V3',
+                           'deepseek-r1': 'deepseek-ai/DeepSeek-R1',
+                           'deepseek-chat': 'deepseek-ai/deepseek-llm-67b-chat',
+                           'mixtral-small-28b': 'mistralai/Mistral-Small-24B-Instruct-2501',
+                           'dbrx-instruct': 'databricks/dbrx-instruct',
+                           'qwq-32b': 'Qwen/QwQ-32B-Preview',
+                           'hermes-2-dpo': 'NousResearch/Nous-Hermes-2-Mixtral-8x7B-DPO',
+                           'claude-3.5-sonnet': 'claude-sonnet-3.5',
+                           'gemini-1.5-flash': 'gemini-1.5-flash',
+                           'gemini-1.5-pro': 'gemini-pro',
+                           'gemini-2.0-flash': 'Gemini-Flash-2.0'},
+                'requires_api_key': False,
+                'is_async': False},
+ 'Bagoodex': {'module': 'webscout.Provider.bagoodex',
+              'models': None,
+              'requires_api_key': False,
+              'is_async': False},
+ 'C4ai': {'module': 'webscout.Provider.C4ai',
+          'models': ['command-a-03-2025',
+                     'command-r-plus-08-2024',
+                     'command-r-08-2024',
+                     'command-r-plus',
+                     'command-r',
+                     'command-r7b-12-2024',
+                     'command-r7b-arabic-02-2025'],
+          'requires_api_key': False,
+          'is_async': False},
+ 'Cerebras': {'module': 'webscout.Provider.cerebras',
+              'models': ['llama3.1-8b', 'llama-3.3-70b', 'deepseek-r1-distill-llama-70b'],
+              'requires_api_key': False,
+              'is_async': False},
+ 'ChatGLM': {'module': 'webscout.Provider.chatglm',
+             'models': None,
+             'requires_api_key': False,
+             'is_async': False},
+ 'ChatGPTClone': {'module': 'webscout.Provider.ChatGPTClone',
+                  'models': ['gpt-4', 'gpt-3.5-turbo'],
+                  'requires_api_key': False,
+                  'is_async': False},
+ 'ChatGPTES': {'module': 'webscout.Provider.ChatGPTES',
+               'models': None,
+               'requires_api_key': False,
+               'is_async': False},
+ 'ChatGPTGratis': {'module': 'webscout.Provider.ChatGPTGratis',
+                   'models': ['Meta-Llama-3.2-1B-Instruct',
+                              'Meta-Llama-3.2-3B-Instruct',
+                              'Meta-Llama-3.1-8B-Instruct',
+                              'Meta-Llama-3.1-70B-Instruct',
+                              'Meta-Llama-3.1-405B-Instruct',
+                              'gpt4o'],
+                   'requires_api_key': False,
+                   'is_async': False},
+ 'Chatify': {'module': 'webscout.Provider.Chatify',
+             'models': None,
+             'requires_api_key': False,
+             'is_async': False},
+ 'Cleeai': {'module': 'webscout.Provider.cleeai',
+            'models': None,
+            'requires_api_key': False,
+            'is_async': False},
+ 'Cloudflare': {'module': 'webscout.Provider.Cloudflare',
+                'models': ['@hf/thebloke/deepseek-coder-6.7b-base-awq',
+                           '@hf/thebloke/deepseek-coder-6.7b-instruct-awq',
+                           '@cf/deepseek-ai/deepseek-math-7b-instruct',
+                           '@cf/deepseek-ai/deepseek-r1-distill-qwen-32b',
+                           '@cf/thebloke/discolm-german-7b-v1-awq',
+                           '@cf/tiiuae/falcon-7b-instruct',
+                           '@hf/google/gemma-7b-it',
+                           '@hf/nousresearch/hermes-2-pro-mistral-7b',
+                           '@hf/thebloke/llama-2-13b-chat-awq',
+                           '@cf/meta/llama-2-7b-chat-fp16',
+                           '@cf/meta/llama-2-7b-chat-int8',
+                           '@cf/meta/llama-3-8b-instruct',
+                           '@cf/meta/llama-3-8b-instruct-awq',
+                           '@cf/meta/llama-3.1-8b-instruct',
+                           '@cf/meta/llama-3.1-8b-instruct-awq',
+                           '@cf/meta/llama-3.1-8b-instruct-fp8',
+                           '@cf/meta/llama-3.2-11b-vision-instruct',
+                           '@cf/meta/llama-3.2-1b-instruct',
+                           '@cf/meta/llama-3.2-3b-instruct',
+                           '@cf/meta/llama-3.3-70b-instruct-fp8-fast',
+                           '@hf/thebloke/llamaguard-7b-awq',
+                           '@hf/meta-llama/meta-llama-3-8b-instruct',
+                           '@cf/mistral/mistral-7b-instruct-v0.1',
+                           '@hf/thebloke/mistral-7b-instruct-v0.1-awq',
+                           '@hf/mistral/mistral-7b-instruct-v0.2',
+                           '@hf/thebloke/neural-chat-7b-v3-1-awq',
+                           '@cf/openchat/openchat-3.5-0106',
+                           '@hf/thebloke/openhermes-2.5-mistral-7b-awq',
+                           '@cf/microsoft/phi-2',
+                           '@cf/qwen/qwen1.5-0.5b-chat',
+                           '@cf/qwen/qwen1.5-1.8b-chat',
+                           '@cf/qwen/qwen1.5-14b-chat-awq',
+                           '@cf/qwen/qwen1.5-7b-chat-awq',
+                           '@cf/defog/sqlcoder-7b-2',
+                           '@hf/nexusflow/starling-lm-7b-beta',
+                           '@cf/tinyllama/tinyllama-1.1b-chat-v1.0',
+                           '@cf/fblgit/una-cybertron-7b-v2-bf16',
+                           '@hf/thebloke/zephyr-7b-beta-awq'],
+                'requires_api_key': False,
+                'is_async': False},
+ 'Cohere': {'module': 'webscout.Provider.Cohere',
+            'models': None,
+            'requires_api_key': True,
+            'is_async': False},
+ 'Copilot': {'module': 'webscout.Provider.copilot',
+             'models': ['Copilot'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'DARKAI': {'module': 'webscout.Provider.DARKAI',
+            'models': ['llama-3-70b', 'llama-3-405b', 'gpt-3.5-turbo', 'gpt-4o'],
+            'requires_api_key': False,
+            'is_async': False},
+ 'DeepInfra': {'module': 'webscout.Provider.Deepinfra',
+               'models': ['deepseek-ai/DeepSeek-R1',
+                          'deepseek-ai/DeepSeek-R1-Distill-Llama-70B',
+                          'deepseek-ai/DeepSeek-R1-Distill-Qwen-32B',
+                          'deepseek-ai/DeepSeek-R1-Turbo',
+                          'deepseek-ai/DeepSeek-V3',
+                          'google/gemma-3-27b-it',
+                          'meta-llama/Llama-3.2-90B-Vision-Instruct',
+                          'meta-llama/Llama-3.2-11B-Vision-Instruct',
+                          'meta-llama/Meta-Llama-3.1-70B-Instruct-Turbo',
+                          'meta-llama/Meta-Llama-3.1-8B-Instruct',
+                          'meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo',
+                          'microsoft/phi-4',
+                          'microsoft/Phi-4-multimodal-instruct',
+                          'microsoft/WizardLM-2-8x22B',
+                          'mistralai/Mistral-Small-24B-Instruct-2501',
+                          'nvidia/Llama-3.1-Nemotron-70B-Instruct',
+                          'Qwen/QwQ-32B',
+                          'Qwen/Qwen2.5-72B-Instruct',
+                          'Qwen/Qwen2.5-Coder-32B-Instruct',
+                          'meta-llama/Llama-3.3-70B-Instruct',
+                          'meta-llama/Llama-3.3-70B-Instruct-Turbo'],
+               'requires_api_key': False,
+               'is_async': False},
+ 'DeepSeek': {'module': 'webscout.Provider.DeepSeek',
+              'models': ['deepseek-v3', 'deepseek-r1', 'deepseek-llm-67b-chat'],
+              'requires_api_key': False,
+              'is_async': False},
+ 'Editee': {'module': 'webscout.Provider.EDITEE',
+            'models': ['gemini', 'claude', 'gpt4', 'mistrallarge'],
+            'requires_api_key': False,
+            'is_async': False},
+ 'ElectronHub': {'module': 'webscout.Provider.ElectronHub',
+                 'models': ['gpt-3.5-turbo',
+                            'gpt-3.5-turbo-16k',
+                            'gpt-3.5-turbo-1106',
+                            'gpt-3.5-turbo-0125',
+                            'gpt-4',
+                            'gpt-4-turbo',
+                            'gpt-4-turbo-preview',
+                            'gpt-4-0125-preview',
+                            'gpt-4-1106-preview',
+                            'gpt-4o',
+                            'gpt-4o-2024-05-13',
+                            'gpt-4o-2024-08-06',
+                            'gpt-4o-2024-11-20',
+                            'gpt-4o-mini',
+                            'gpt-4o-mini-2024-07-18',
+                            'chatgpt-4o-latest',
+                            'gpt-4.5-preview',
+                            'gpt-4.5-preview-2025-02-27',
+                            'o1-mini',
+                            'o1-preview',
+                            'o1',
+                            'o1-low',
+                            'o1-high',
+                            'o3-mini',
+                            'o3-mini-low',
+                            'o3-mini-high',
+                            'o3-mini-online',
+                            'claude-2',
+                            'claude-2.1',
+                            'claude-3-opus-20240229',
+                            'claude-3-sonnet-20240229',
+                            'claude-3-haiku-20240307',
+                            'claude-3-5-sonnet-20240620',
+                            'claude-3-5-sonnet-20241022',
+                            'claude-3-5-haiku-20241022',
+                            'claude-3-7-sonnet-20250219',
+                            'claude-3-7-sonnet-20250219-thinking',
+                            'gemini-1.0-pro',
+                            'gemini-1.5-pro',
+                            'gemini-1.5-pro-latest',
+                            'gemini-1.5-flash-8b',
+                            'gemini-1.5-flash',
+                            'gemini-1.5-flash-latest',
+                            'gemini-1.5-flash-exp',
+                            'gemini-1.5-flash-online',
+                            'gemini-exp-1206',
+                            'learnlm-1.5-pro-experimental',
+                            'gemini-2.0-flash-001',
+                            'gemini-2.0-flash-exp',
+                            'gemini-2.0-flash-thinking-exp',
+                            'gemini-2.0-flash-thinking-exp-1219',
+                            'gemini-2.0-flash-thinking-exp-01-21',
+                            'gemini-2.0-flash-lite-preview-02-05',
+                            'gemini-2.0-flash-lite-001',
+                            'gemini-2.0-pro-exp-02-05',
+                            'palm-2-chat-bison',
+                            'palm-2-codechat-bison',
+                            'palm-2-chat-bison-32k',
+                            'palm-2-codechat-bison-32k',
+                            'llama-2-13b-chat',
+                            'llama-2-70b-chat',
+                            'llama-guard-3-8b',
+                            'code-llama-34b-instruct',
+                            'llama-3-8b',
+                            'llama-3-70b',
+                            'llama-3.1-8b',
+                            'llama-3.1-70b',
+                            'llama-3.1-405b',
+                            'llama-3.2-1b',
+                            'llama-3.2-3b',
+                            'llama-3.2-11b',
+                            'llama-3.2-90b',
+                            'llama-3.3-70b-instruct',
+                            'llama-3.1-nemotron-70b-instruct',
+                            'llama-3.1-tulu-3-8b',
+                            'llama-3.1-tulu-3-70b',
+                            'llama-3.1-tulu-3-405b',
+                            'mistral-7b-instruct',
+                            'mistral-tiny-latest',
+                            'mistral-tiny',
+                            'mistral-tiny-2312',
+                            'mistral-tiny-2407',
+                            'mistral-small-24b-instruct-2501',
+                            'mistral-small-latest',
+                            'mistral-small',
+                            'mistral-small-2312',
+                            'mistral-small-2402',
+                            'mistral-small-2409',
+                            'mistral-medium-latest',
+                            'mistral-medium',
+                            'mistral-medium-2312',
+                            'mistral-large-latest',
+                            'mistral-large-2411',
+                            'mistral-large-2407',
+                            'mistral-large-2402',
+                            'mixtral-8x7b',
+                            'mixtral-8x22b',
+                            'deepseek-r1',
+                            'deepseek-r1-nitro',
+                            'deepseek-r1-distill-llama-8b',
+                            'deepseek-r1-distill-llama-70b',
+                            'deepseek-r1-distill-qwen-1.5b',
+                            'deepseek-r1-distill-qwen-7b',
+                            'deepseek-r1-distill-qwen-14b',
+                            'deepseek-r1-distill-qwen-32b',
+                            'deepseek-v3',
+                            'deepseek-coder',
+                            'deepseek-v2.5',
+                            'deepseek-vl2',
+                            'deepseek-llm-67b-chat',
+                            'deepseek-math-7b-instruct',
+                            'deepseek-coder-6.7b-base-awq',
+                            'deepseek-coder-6.7b-instruct-awq',
+                            'qwen-1.5-0.5b-chat',
+                            'qwen-1.5-1.8b-chat',
+                            'qwen-1.5-14b-chat-awq',
+                            'qwen-1.5-7b-chat-awq',
+                            'qwen-2-7b-instruct',
+                            'qwen-2-72b-instruct',
+                            'qwen-2-vl-7b-instruct',
+                            'qwen-2-vl-72b-instruct',
+                            'qwen-2.5-7b-instruct',
+                            'qwen-2.5-32b-instruct',
+                            'qwen-2.5-72b-instruct',
+                            'qwen-2.5-coder-32b-instruct',
+                            'qwq-32b-preview',
+                            'qvq-72b-preview',
+                            'qwen-vl-plus',
+                            'qwen2.5-vl-72b-instruct',
+                            'qwen-turbo',
+                            'qwen-plus',
+                            'qwen-max',
+                            'phi-4',
+                            'phi-3.5-mini-128k-instruct',
+                            'phi-3-medium-128k-instruct',
+                            'phi-3-mini-128k-instruct',
+                            'phi-2',
+                            'gemma-7b-it',
+                            'gemma-2-9b-it',
+                            'gemma-2-27b-it',
+                            'nemotron-4-340b',
+                            'pixtral-large-2411',
+                            'pixtral-12b',
+                            'open-mistral-nemo',
+                            'open-mistral-nemo-2407',
+                            'open-mixtral-8x22b-2404',
+                            'open-mixtral-8x7b',
+                            'codestral-mamba',
+                            'codestral-latest',
+                            'codestral-2405',
+                            'codestral-2412',
+                            'codestral-2501',
+                            'codestral-2411-rc5',
+                            'ministral-3b',
+                            'ministral-3b-2410',
+                            'ministral-8b',
+                            'ministral-8b-2410',
+                            'mistral-saba-latest',
+                            'mistral-saba-2502',
+                            'f1-mini-preview',
+                            'f1-preview',
+                            'dolphin-mixtral-8x7b',
+                            'dolphin-mixtral-8x22b',
+                            'dolphin3.0-mistral-24b',
+                            'dolphin3.0-r1-mistral-24b',
+                            'dbrx-instruct',
+                            'command',
+                            'command-light',
+                            'command-nightly',
+                            'command-light-nightly',
+                            'command-r',
+                            'command-r-03-2024',
+                            'command-r-08-2024',
+                            'command-r-plus',
+                            'command-r-plus-04-2024',
+                            'command-r-plus-08-2024',
+                            'command-r7b-12-2024',
+                            'c4ai-aya-expanse-8b',
+                            'c4ai-aya-expanse-32b',
+                            'reka-flash',
+                            'reka-core',
+                            'grok-2',
+                            'grok-2-mini',
+                            'grok-beta',
+                            'grok-vision-beta',
+                            'grok-2-1212',
+                            'grok-2-vision-1212',
+                            'grok-3-early',
+                            'grok-3-preview-02-24',
+                            'r1-1776',
+                            'sonar-deep-research',
+                            'sonar-reasoning-pro',
+                            'sonar-reasoning',
+                            'sonar-pro',
+                            'sonar',
+                            'llama-3.1-sonar-small-128k-online',
+                            'llama-3.1-sonar-large-128k-online',
+                            'llama-3.1-sonar-huge-128k-online',
+                            'llama-3.1-sonar-small-128k-chat',
+                            'llama-3.1-sonar-large-128k-chat',
+                            'wizardlm-2-7b',
+                            'wizardlm-2-8x22b',
+                            'minimax-01',
+                            'jamba-1.5-large',
+                            'jamba-1.5-mini',
+                            'jamba-instruct',
+                            'openchat-3.5-7b',
+                            'openchat-3.6-8b',
+                            'aion-1.0',
+                            'aion-1.0-mini',
+                            'aion-rp-llama-3.1-8b',
+                            'nova-lite-v1',
+                            'nova-micro-v1',
+                            'nova-pro-v1',
+                            'inflection-3-pi',
+                            'inflection-3-productivity',
+                            'mytho-max-l2-13b',
+                            'deephermes-3-llama-3-8b-preview',
+                            'nous-hermes-llama2-13b',
+                            'hermes-3-llama-3.1-8b',
+                            'hermes-3-llama-3.1-405b',
+                            'hermes-2-pro-llama-3-8b',
+                            'nous-hermes-2-mixtral-8x7b-dpo',
+                            'doubao-lite-4k',
+                            'doubao-lite-32k',
+                            'doubao-pro-4k',
+                            'doubao-pro-32k',
+                            'ernie-lite-8k',
+                            'ernie-tiny-8k',
+                            'ernie-speed-8k',
+                            'ernie-speed-128k',
+                            'hunyuan-lite',
+                            'hunyuan-standard-2025-02-10',
+                            'hunyuan-large-2025-02-10',
+                            'glm-3-130b',
+                            'glm-4-flash',
+                            'glm-4-long',
+                            'glm-4-airx',
+                            'glm-4-air',
+                            'glm-4-plus',
+                            'glm-4-alltools',
+                            'yi-vl-plus',
+                            'yi-large',
+                            'yi-large-turbo',
+                            'yi-large-rag',
+                            'yi-medium',
+                            'yi-34b-chat-200k',
+                            'spark-desk-v1.5',
+                            'step-2-16k-exp-202412',
+                            'granite-3.1-2b-instruct',
+                            'granite-3.1-8b-instruct',
+                            'solar-0-70b-16bit',
+                            'mistral-nemo-inferor-12b',
+                            'unslopnemo-12b',
+                            'rocinante-12b-v1.1',
+                            'rocinante-12b-v1',
+                            'sky-t1-32b-preview',
+                            'lfm-3b',
+                            'lfm-7b',
+                            'lfm-40b',
+                            'rogue-rose-103b-v0.2',
+                            'eva-llama-3.33-70b-v0.0',
+                            'eva-llama-3.33-70b-v0.1',
+                            'eva-qwen2.5-72b',
+                            'eva-qwen2.5-32b-v0.2',
+                            'sorcererlm-8x22b',
+                            'mythalion-13b',
+                            'zephyr-7b-beta',
+                            'zephyr-7b-alpha',
+                            'toppy-m-7b',
+                            'openhermes-2.5-mistral-7b',
+                            'l3-lunaris-8b',
+                            'llama-3.1-lumimaid-8b',
+                            'llama-3.1-lumimaid-70b',
+                            'llama-3-lumimaid-8b',
+                            'llama-3-lumimaid-70b',
+                            'llama3-openbiollm-70b',
+                            'l3.1-70b-hanami-x1',
+                            'magnum-v4-72b',
+                            'magnum-v2-72b',
+                            'magnum-72b',
+                            'mini-magnum-12b-v1.1',
+                            'remm-slerp-l2-13b',
+                            'midnight-rose-70b',
+                            'athene-v2-chat',
+                            'airoboros-l2-70b',
+                            'xwin-lm-70b',
+                            'noromaid-20b',
+                            'violet-twilight-v0.2',
+                            'saiga-nemo-12b',
+                            'l3-8b-stheno-v3.2',
+                            'llama-3.1-8b-lexi-uncensored-v2',
+                            'l3.3-70b-euryale-v2.3',
+                            'l3.3-ms-evayale-70b',
+                            '70b-l3.3-cirrus-x1',
+                            'l31-70b-euryale-v2.2',
+                            'l3-70b-euryale-v2.1',
+                            'fimbulvetr-11b-v2',
+                            'goliath-120b',
+                            'weaver',
+                            'sdxl',
+                            'sdxl-turbo',
+                            'sdxl-lightning',
+                            'stable-diffusion-3',
+                            'stable-diffusion-3-2b',
+                            'stable-diffusion-3.5-large',
+                            'stable-diffusion-3.5-turbo',
+                            'playground-v3',
+                            'playground-v2.5',
+                            'animaginexl-3.1',
+                            'realvisxl-4.0',
+                            'imagen',
+                            'imagen-3-fast',
+                            'imagen-3',
+                            'luma-photon',
+                            'luma-photon-flash',
+                            'recraft-20b',
+                            'recraft-v3',
+                            'grok-2-aurora',
+                            'flux-schnell',
+                            'flux-dev',
+                            'flux-pro',
+                            'flux-1.1-pro',
+                            'flux-1.1-pro-ultra',
+                            'flux-1.1-pro-ultra-raw',
+                            'flux-realism',
+                            'flux-half-illustration',
+                            'ideogram-v2-turbo',
+                            'ideogram-v2',
+                            'amazon-titan',
+                            'amazon-titan-v2',
+                            'nova-canvas',
+                            'omni-gen',
+                            'aura-flow',
+                            'cogview-3-flash',
+                            'sana',
+                            'kandinsky-3',
+                            'dall-e-3',
+                            'midjourney-v6.1',
+                            'midjourney-v6',
+                            'midjourney-v5.2',
+                            'midjourney-v5.1',
+                            'midjourney-v5',
+                            'niji-v6',
+                            'niji-v5',
+                            't2v-turbo',
+                            'cogvideox-5b',
+                            'ltx-video',
+                            'mochi-1',
+                            'dream-machine',
+                            'hailuo-ai',
+                            'haiper-video-2.5',
+                            'haiper-video-2',
+                            'hunyuan-video',
+                            'kling-video/v1/standard/text-to-video',
+                            'kling-video/v1/pro/text-to-video',
+                            'kling-video/v1.6/standard/text-to-video',
+                            'kling-video/v1.5/pro/text-to-video',
+                            'kokoro-82m',
+                            'elevenlabs',
+                            'myshell-tts',
+                            'deepinfra-tts',
+                            'whisper-large-v3',
+                            'distil-large-v3',
+                            'text-embedding-3-large',
+                            'text-embedding-3-small',
+                            'omni-moderation-latest',
+                            'omni-moderation-2024-09-26',
+                            'text-moderation-latest',
+                            'text-moderation-stable',
+                            'text-moderation-007'],
+                 'requires_api_key': True,
+                 'is_async': False},
+ 'Elmo': {'module': 'webscout.Provider.elmo',
+          'models': None,
+          'requires_api_key': False,
+          'is_async': False},
+ 'Flowith': {'module': 'webscout.Provider.flowith',
+             'models': ['gpt-4o-mini',
+                        'deepseek-chat',
+                        'deepseek-reasoner',
+                        'claude-3.5-haiku',
+                        'llama-3.2-11b',
+                        'llama-3.2-90b',
+                        'gemini-2.0-flash',
+                        'o1',
+                        'o3-mini',
+                        'gpt-4o',
+                        'claude-3.5-sonnet',
+                        'gemini-2.0-pro',
+                        'claude-3.7-sonnet'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'Free2GPT': {'module': 'webscout.Provider.Free2GPT',
+              'models': None,
+              'requires_api_key': False,
+              'is_async': False},
+ 'FreeAIChat': {'module': 'webscout.Provider.freeaichat',
+                'models': ['mistral-nemo',
+                           'mistral-large',
+                           'gemini-2.0-flash',
+                           'gemini-1.5-pro',
+                           'gemini-1.5-flash',
+                           'gemini-2.0-pro-exp-02-05',
+                           'deepseek-v3',
+                           'o3-mini-high',
+                           'o3-mini-medium',
+                           'o3-mini-low',
+                           'o3-mini',
+                           'GPT-4o-mini',
+                           'o1',
+                           'o1-mini',
+                           'GPT-4o',
+                           'Qwen coder',
+                           'Llama 3.1 405B',
+                           'claude 3.5 haiku',
+                           'claude 3.5 sonnet'],
+                'requires_api_key': False,
+                'is_async': False},
+ 'GEMINI': {'module': 'webscout.Provider.Gemini',
+            'models': None,
+            'requires_api_key': False,
+            'is_async': False},
+ 'GEMINIAPI': {'module': 'webscout.Provider.geminiapi',
+               'models': None,
+               'requires_api_key': True,
+               'is_async': False},
+ 'GPTWeb': {'module': 'webscout.Provider.GPTWeb',
+            'models': None,
+            'requires_api_key': False,
+            'is_async': False},
+ 'GROQ': {'module': 'webscout.Provider.Groq',
+          'models': ['llama3-70b-8192',
+                     'qwen-2.5-32b',
+                     'qwen-2.5-coder-32b',
+                     'deepseek-r1-distill-qwen-32b',
+                     'deepseek-r1-distill-llama-70b',
+                     'llama-3.2-3b-preview',
+                     'gemma2-9b-it',
+                     'llama-3.2-11b-vision-preview',
+                     'llama3-8b-8192',
+                     'llama-3.3-70b-versatile',
+                     'llama-3.2-11b-vision-preview',
+                     'mixtral-8x7b-32768',
+                     'llama-3.3-70b-specdec',
+                     'llama-3.2-90b-vision-preview',
+                     'llama-3.2-1b-preview',
+                     'llama-3.1-8b-instant',
+                     'llama-guard-3-8b'],
+          'requires_api_key': True,
+          'is_async': False},
+ 'GaurishCerebras': {'module': 'webscout.Provider.gaurish',
+                     'models': None,
+                     'requires_api_key': False,
+                     'is_async': False},
+ 'GeminiPro': {'module': 'webscout.Provider.geminiprorealtime',
+               'models': None,
+               'requires_api_key': False,
+               'is_async': False},
+ 'GithubChat': {'module': 'webscout.Provider.GithubChat',
+                'models': ['gpt-4o',
+                           'o3-mini',
+                           'o1',
+                           'claude-3.5-sonnet',
+                           'claude-3.7-sonnet',
+                           'claude-3.7-sonnet-thought',
+                           'gemini-2.0-flash-001'],
+                'requires_api_key': False,
+                'is_async': False},
+ 'GliderAI': {'module': 'webscout.Provider.Glider',
+              'models': ['chat-llama-3-1-70b',
+                         'chat-llama-3-1-8b',
+                         'chat-llama-3-2-3b',
+                         'deepseek-ai/DeepSeek-R1'],
+              'requires_api_key': False,
+              'is_async': False},
+ 'HeckAI': {'module': 'webscout.Provider.HeckAI',
+            'models': ['deepseek/deepseek-chat',
+                       'openai/gpt-4o-mini',
+                       'deepseek/deepseek-r1',
+                       'google/gemini-2.0-flash-001'],
+            'requires_api_key': False,
+            'is_async': False},
+ 'HuggingFaceChat': {'module': 'webscout.Provider.HuggingFaceChat',
+                     'models': ['meta-llama/Llama-3.3-70B-Instruct',
+                                'Qwen/Qwen2.5-72B-Instruct',
+                                'CohereForAI/c4ai-command-r-plus-08-2024',
+                                'deepseek-ai/DeepSeek-R1-Distill-Qwen-32B',
+                                'nvidia/Llama-3.1-Nemotron-70B-Instruct-HF',
+                                'Qwen/QwQ-32B',
+                                'Qwen/Qwen2.5-Coder-32B-Instruct',
+                                'meta-llama/Llama-3.2-11B-Vision-Instruct',
+                                'NousResearch/Hermes-3-Llama-3.1-8B',
+                                'mistralai/Mistral-Nemo-Instruct-2407',
+                                'microsoft/Phi-3.5-mini-instruct',
+                                'meta-llama/Llama-3.1-8B-Instruct'],
+                     'requires_api_key': False,
+                     'is_async': False},
+ 'Hunyuan': {'module': 'webscout.Provider.Hunyuan',
+             'models': ['hunyuan-t1-latest'],
+             'requires_api_key': True,
+             'is_async': False},
+ 'IBMGranite': {'module': 'webscout.Provider.granite',
+                'models': ['granite-3-8b-instruct', 'granite-3-2-8b-instruct'],
+                'requires_api_key': True,
+                'is_async': False},
+ 'JadveOpenAI': {'module': 'webscout.Provider.Jadve',
+                 'models': ['gpt-4o',
+                            'gpt-4o-mini',
+                            'claude-3-7-sonnet-20250219',
+                            'claude-3-5-sonnet-20240620',
+                            'o1-mini',
+                            'deepseek-chat',
+                            'o1-mini',
+                            'claude-3-5-haiku-20241022'],
+                 'requires_api_key': False,
+                 'is_async': False},
+ 'Julius': {'module': 'webscout.Provider.julius',
+            'models': ['Llama 3',
+                       'GPT-4o',
+                       'GPT-3.5',
+                       'Command R',
+                       'Gemini Flash',
+                       'Gemini 1.5',
+                       'Claude Sonnet',
+                       'Claude Opus',
+                       'Claude Haiku',
+                       'GPT-4',
+                       'GPT-4o mini',
+                       'Command R+',
+                       'o1-mini',
+                       'o1-preview'],
+            'requires_api_key': True,
+            'is_async': False},
+ 'KOALA': {'module': 'webscout.Provider.koala',
+           'models': ['gpt-4o-mini', 'gpt-4o'],
+           'requires_api_key': False,
+           'is_async': False},
+ 'KOBOLDAI': {'module': 'webscout.Provider.Koboldai',
+              'models': None,
+              'requires_api_key': False,
+              'is_async': False},
+ 'LLAMA': {'module': 'webscout.Provider.Llama',
+           'models': None,
+           'requires_api_key': False,
+           'is_async': False},
+ 'LLMChat': {'module': 'webscout.Provider.llmchat',
+             'models': ['@cf/meta/llama-3.1-70b-instruct',
+                        '@cf/meta/llama-3.1-8b-instruct',
+                        '@cf/meta/llama-3.2-3b-instruct',
+                        '@cf/meta/llama-3.2-1b-instruct',
+                        '@cf/meta/llama-3.3-70b-instruct-fp8-fast',
+                        '@cf/deepseek-ai/deepseek-r1-distill-qwen-32b'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'LabyrinthAI': {'module': 'webscout.Provider.labyrinth',
+                 'models': None,
+                 'requires_api_key': False,
+                 'is_async': False},
+ 'LambdaChat': {'module': 'webscout.Provider.LambdaChat',
+                'models': ['deepseek-llama3.3-70b',
+                           'deepseek-r1',
+                           'hermes-3-llama-3.1-405b-fp8',
+                           'llama3.1-nemotron-70b-instruct',
+                           'lfm-40b',
+                           'llama3.3-70b-instruct-fp8'],
+                'requires_api_key': False,
+                'is_async': False},
+ 'LearnFast': {'module': 'webscout.Provider.learnfastai',
+               'models': None,
+               'requires_api_key': False,
+               'is_async': False},
+ 'Lepton': {'module': 'webscout.Provider.lepton',
+            'models': None,
+            'requires_api_key': False,
+            'is_async': False},
+ 'Llama3Mitril': {'module': 'webscout.Provider.llama3mitril',
+                  'models': None,
+                  'requires_api_key': False,
+                  'is_async': False},
+ 'LlamaTutor': {'module': 'webscout.Provider.llamatutor',
+                'models': ['UNKNOWN'],
+                'requires_api_key': False,
+                'is_async': False},
+ 'Marcus': {'module': 'webscout.Provider.Marcus',
+            'models': None,
+            'requires_api_key': False,
+            'is_async': False},
+ 'Meta': {'module': 'webscout.Provider.meta',
+          'models': None,
+          'requires_api_key': False,
+          'is_async': False},
+ 'MultiChatAI': {'module': 'webscout.Provider.multichat',
+                 'models': ['llama-3.3-70b-versatile',
+                            'llama-3.2-11b-vision-preview',
+                            'deepseek-r1-distill-llama-70b',
+                            'gemma2-9b-it',
+                            'gemini-2.0-flash',
+                            'Sao10K/L3.1-70B-Euryale-v2.2',
+                            'Gryphe/MythoMax-L2-13b',
+                            'nvidia/Llama-3.1-Nemotron-70B-Instruct',
+                            'deepseek-ai/DeepSeek-V3',
+                            'meta-llama/Meta-Llama-3.1-405B-Instruct',
+                            'NousResearch/Hermes-3-Llama-3.1-405B',
+                            'Qwen/Qwen2.5-72B-Instruct',
+                            'Qwen/Qwen2.5-Coder-32B-Instruct',
+                            'Qwen/QwQ-32B-Preview'],
+                 'requires_api_key': False,
+                 'is_async': False},
+ 'Netwrck': {'module': 'webscout.Provider.Netwrck',
+             'models': ['neversleep/llama-3-lumimaid-8b:extended',
+                        'x-ai/grok-2',
+                        'anthropic/claude-3-7-sonnet-20250219',
+                        'sao10k/l3-euryale-70b',
+                        'openai/gpt-4o-mini',
+                        'gryphe/mythomax-l2-13b',
+                        'google/gemini-pro-1.5',
+                        'nvidia/llama-3.1-nemotron-70b-instruct',
+                        'deepseek-r1',
+                        'deepseek'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'NousHermes': {'module': 'webscout.Provider.hermes',
+                'models': ['Hermes-3-Llama-3.1-70B', 'Hermes-3-Llama-3.1-8B'],
+                'requires_api_key': False,
+                'is_async': False},
+ 'OLLAMA': {'module': 'webscout.Provider.OLLAMA',
+            'models': None,
+            'requires_api_key': False,
+            'is_async': False},
+ 'OPENAI': {'module': 'webscout.Provider.Openai',
+            'models': None,
+            'requires_api_key': True,
+            'is_async': False},
+ 'PIZZAGPT': {'module': 'webscout.Provider.PizzaGPT',
+              'models': ['gpt-4o-mini'],
+              'requires_api_key': False,
+              'is_async': False},
+ 'PerplexityLabs': {'module': 'webscout.Provider.Perplexitylabs',
+                    'models': ['r1-1776',
+                               'sonar-pro',
+                               'sonar',
+                               'sonar-reasoning-pro',
+                               'sonar-reasoning'],
+                    'requires_api_key': False,
+                    'is_async': False},
+ 'Phindv2': {'module': 'webscout.Provider.Phind',
+             'models': ['Claude 3.7 Sonnet',
+                        'Claude Opus',
+                        'GPT-4o',
+                        'o3-mini',
+                        'Phind-405B',
+                        'Phind-70B'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'PiAI': {'module': 'webscout.Provider.PI',
+          'models': ['inflection_3_pi'],
+          'requires_api_key': False,
+          'is_async': False},
+ 'PromptRefine': {'module': 'webscout.Provider.promptrefine',
+                  'models': ['openai/gpt-4', 'openai/gpt-4o', 'openai/gpt-4-1106-preview'],
+                  'requires_api_key': False,
+                  'is_async': False},
+ 'QwenLM': {'module': 'webscout.Provider.QwenLM',
+            'models': ['qwen-max-latest',
+                       'qwen-plus-latest',
+                       'qwen2.5-14b-instruct-1m',
+                       'qwq-32b',
+                       'qwen2.5-coder-32b-instruct',
+                       'qwen-turbo-latest',
+                       'qwen2.5-72b-instruct',
+                       'qwen2.5-vl-72b-instruct',
+                       'qvq-72b-preview'],
+            'requires_api_key': False,
+            'is_async': False},
+ 'REKA': {'module': 'webscout.Provider.Reka',
+          'models': None,
+          'requires_api_key': True,
+          'is_async': False},
+ 'Sambanova': {'module': 'webscout.Provider.Llama3',
+               'models': ['Meta-Llama-3.1-8B-Instruct',
+                          'Meta-Llama-3.1-70B-Instruct',
+                          'Meta-Llama-3.1-405B-Instruct',
+                          'DeepSeek-R1-Distill-Llama-70B',
+                          'Llama-3.1-Tulu-3-405B',
+                          'Meta-Llama-3.2-1B-Instruct',
+                          'Meta-Llama-3.2-3B-Instruct',
+                          'Meta-Llama-3.3-70B-Instruct',
+                          'Qwen2.5-72B-Instruct',
+                          'Qwen2.5-Coder-32B-Instruct',
+                          'QwQ-32B-Preview'],
+               'requires_api_key': True,
+               'is_async': False},
+ 'SonusAI': {'module': 'webscout.Provider.sonus',
+             'models': ['pro', 'air', 'mini'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'Talkai': {'module': 'webscout.Provider.talkai',
+            'models': None,
+            'requires_api_key': False,
+            'is_async': False},
+ 'TextPollinationsAI': {'module': 'webscout.Provider.TextPollinationsAI',
+                        'models': ['openai',
+                                   'openai-large',
+                                   'openai-reasoning',
+                                   'qwen-coder',
+                                   'llama',
+                                   'mistral',
+                                   'unity',
+                                   'midijourney',
+                                   'rtist',
+                                   'searchgpt',
+                                   'evil',
+                                   'claude-hybridspace',
+                                   'deepseek-r1',
+                                   'gemini',
+                                   'gemini-thinking',
+                                   'hormoz',
+                                   'hypnosis-tracy',
+                                   'sur',
+                                   'sur-mistral',
+                                   'phi'],
+                        'requires_api_key': False,
+                        'is_async': False},
+ 'TurboSeek': {'module': 'webscout.Provider.turboseek',
+               'models': ['Llama 3.1 70B'],
+               'requires_api_key': False,
+               'is_async': False},
+ 'TutorAI': {'module': 'webscout.Provider.tutorai',
+             'models': ['gpt-4o'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'TwoAI': {'module': 'webscout.Provider.TwoAI',
+           'models': ['sutra-light'],
+           'requires_api_key': True,
+           'is_async': False},
+ 'TypeGPT': {'module': 'webscout.Provider.typegpt',
+             'models': ['gpt-3.5-turbo',
+                        'gpt-3.5-turbo-202201',
+                        'gpt-4o',
+                        'gpt-4o-2024-05-13',
+                        'gpt-4o-2024-11-20',
+                        'gpt-4o-mini',
+                        'gpt-4o-mini-2024-07-18',
+                        'o1',
+                        'o1-preview',
+                        'o3-mini',
+                        'chatgpt-4o-latest',
+                        'claude-3-5-sonnet',
+                        'claude-3-5-sonnet-20240620',
+                        'claude-3-5-sonnet-x',
+                        'claude-hybridspace',
+                        'claude-sonnet-3.5',
+                        'Claude-sonnet-3.7',
+                        'anthropic/claude-3.5-sonnet',
+                        'anthropic/claude-3.7-sonnet',
+                        '@cf/meta/llama-2-7b-chat-fp16',
+                        '@cf/meta/llama-2-7b-chat-int8',
+                        '@cf/meta/llama-3-8b-instruct',
+                        '@cf/meta/llama-3.1-8b-instruct',
+                        '@cf/meta/llama-3.3-70b-instruct-fp8-fast',
+                        'llama-3.1-405b',
+                        'llama-3.1-70b',
+                        'llama-3.1-8b',
+                        'llama3.1-8b',
+                        'llama3.3-70b',
+                        'Meta-Llama-3.1-405B-Instruct-Turbo',
+                        'Meta-Llama-3.3-70B-Instruct-Turbo',
+                        'meta-llama/Llama-3.2-11B-Vision-Instruct',
+                        'meta-llama/Llama-3.2-90B-Vision-Instruct',
+                        'meta-llama/Llama-3.3-70B-Instruct',
+                        'meta-llama/Llama-3.3-70B-Instruct-Turbo',
+                        'meta-llama/Meta-Llama-3.1-70B-Instruct-Turbo',
+                        'meta-llama/Meta-Llama-3.1-8B-Instruct',
+                        'meta-llama/Meta-Llama-3.1-8B-Instruct-Turbo',
+                        'mistral',
+                        'mistral-large',
+                        '@cf/mistral/mistral-7b-instruct-v0.1',
+                        '@hf/mistralai/mistral-7b-instruct-v0.2',
+                        'mistralai/Mistral-7B-Instruct-v0.2',
+                        'mistralai/Mistral-7B-Instruct-v0.3',
+                        'mistralai/Mixtral-8x22B-Instruct-v0.1',
+                        'mistralai/Mixtral-8x7B-Instruct-v0.1',
+                        'Mistral-7B-Instruct-v0.2',
+                        '@cf/qwen/qwen1.5-0.5b-chat',
+                        '@cf/qwen/qwen1.5-1.8b-chat',
+                        '@cf/qwen/qwen1.5-14b-chat-awq',
+                        '@cf/qwen/qwen1.5-7b-chat-awq',
+                        'Qwen/Qwen2.5-3B-Instruct',
+                        'Qwen/Qwen2.5-72B-Instruct',
+                        'Qwen/Qwen2.5-Coder-32B-Instruct',
+                        'Qwen/Qwen2-72B-Instruct',
+                        'Qwen/QwQ-32B',
+                        'Qwen/QwQ-32B-Preview',
+                        'Qwen2.5-72B-Instruct',
+                        'qwen',
+                        'qwen-coder',
+                        '@hf/google/gemma-7b-it',
+                        'google/gemma-1.1-2b-it',
+                        'google/gemma-1.1-7b-it',
+                        'gemini-pro',
+                        'gemini-1.5-pro',
+                        'gemini-1.5-pro-latest',
+                        'gemini-1.5-flash',
+                        'gemini-flash-2.0',
+                        'gemini-thinking',
+                        '@cf/microsoft/phi-2',
+                        'microsoft/DialoGPT-medium',
+                        'microsoft/Phi-3-medium-4k-instruct',
+                        'microsoft/Phi-3-mini-4k-instruct',
+                        'microsoft/Phi-3.5-mini-instruct',
+                        'microsoft/phi-4',
+                        'microsoft/WizardLM-2-8x22B',
+                        '01-ai/Yi-1.5-34B-Chat',
+                        '@cf/deepseek-ai/deepseek-math-7b-base',
+                        '@cf/deepseek-ai/deepseek-math-7b-instruct',
+                        '@cf/deepseek-ai/deepseek-r1-distill-qwen-32b',
+                        'deepseek',
+                        'deepseek-ai/DeepSeek-R1',
+                        'deepseek-ai/DeepSeek-R1-Distill-Llama-70B',
+                        'deepseek-llm-67b-chat',
+                        'deepseek-r1',
+                        'deepseek-r1-distill-llama-70b',
+                        'deepseek-v3',
+                        '@cf/defog/sqlcoder-7b-2',
+                        '@cf/thebloke/discolm-german-7b-v1-awq',
+                        '@cf/tiiuae/falcon-7b-instruct',
+                        'AndroidDeveloper',
+                        'AngularJSAgent',
+                        'AzureAgent',
+                        'BitbucketAgent',
+                        'DigitalOceanAgent',
+                        'DockerAgent',
+                        'ElectronAgent',
+                        'ErlangAgent',
+                        'FastAPIAgent',
+                        'FirebaseAgent',
+                        'FlaskAgent',
+                        'FlutterAgent',
+                        'GitAgent',
+                        'GitlabAgent',
+                        'GoAgent',
+                        'GodotAgent',
+                        'GoogleCloudAgent',
+                        'HTMLAgent',
+                        'JavaAgent',
+                        'JavaScriptAgent',
+                        'MongoDBAgent',
+                        'Next.jsAgent',
+                        'PyTorchAgent',
+                        'PythonAgent',
+                        'ReactAgent',
+                        'RepoMap',
+                        'SwiftDeveloper',
+                        'XcodeAgent',
+                        'blackboxai',
+                        'blackboxai-pro',
+                        'builderAgent',
+                        'flux'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'UncovrAI': {'module': 'webscout.Provider.uncovr',
+              'models': ['default',
+                         'gpt-4o-mini',
+                         'gemini-2-flash',
+                         'o3-mini',
+                         'claude-3-7-sonnet',
+                         'gpt-4o',
+                         'claude-3-5-sonnet-v2',
+                         'groq-llama-3-1-8b',
+                         'deepseek-r1-distill-llama-70b',
+                         'deepseek-r1-distill-qwen-32b',
+                         'gemini-2-flash-lite-preview',
+                         'qwen-qwq-32b'],
+              'requires_api_key': False,
+              'is_async': False},
+ 'Venice': {'module': 'webscout.Provider.Venice',
+            'models': ['llama-3.3-70b',
+                       'llama-3.2-3b-akash',
+                       'qwen2dot5-coder-32b',
+                       'deepseek-coder-v2-lite'],
+            'requires_api_key': False,
+            'is_async': False},
+ 'VercelAI': {'module': 'webscout.Provider.VercelAI',
+              'models': ['chat-model', 'chat-model-reasoning'],
+              'requires_api_key': False,
+              'is_async': False},
+ 'WebSim': {'module': 'webscout.Provider.WebSim',
+            'models': ['gemini-1.5-flash',
+                       'gemini-1.5-pro',
+                       'gemini-flash',
+                       'gemini-pro',
+                       'gemini-flash-thinking',
+                       'flux'],
+            'requires_api_key': False,
+            'is_async': False},
+ 'WiseCat': {'module': 'webscout.Provider.WiseCat',
+             'models': ['chat-model-small', 'chat-model-large', 'chat-model-reasoning'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'X0GPT': {'module': 'webscout.Provider.x0gpt',
+           'models': ['UNKNOWN'],
+           'requires_api_key': False,
+           'is_async': False},
+ 'YEPCHAT': {'module': 'webscout.Provider.yep',
+             'models': ['DeepSeek-R1-Distill-Qwen-32B', 'Mixtral-8x7B-Instruct-v0.1'],
+             'requires_api_key': False,
+             'is_async': False},
+ 'YouChat': {'module': 'webscout.Provider.Youchat',
+             'models': ['gpt_4o_mini',
+                        'gpt_4o',
+                        'gpt_4_turbo',
+                        'claude_3_sonnet',
+                        'claude_3_5_haiku',
+                        'qwen2p5_72b',
+                        'qwen2p5_coder_32b',
+                        'grok_2',
+                        'llama3_1_405b',
+                        'mistral_large_2',
+                        'gemini_2_flash',
+                        'gemini_1_5_flash',
+                        'gemini_1_5_pro',
+                        'databricks_dbrx_instruct',
+                        'command_r_plus',
+                        'solar_1_mini',
+                        'dolphin_2_5'],
+             'requires_api_key': False,
+             'is_async': False}}
+
+TTS_PROVIDERS = {'DeepgramTTS': {'module': 'webscout.Provider.TTS.deepgram',
+                 'voices': {'Asteria': 'aura-asteria-en',
+                            'Arcas': 'aura-arcas-en',
+                            'Luna': 'aura-luna-en',
+                            'Zeus': 'aura-zeus-en',
+                            'Orpheus': 'aura-orpheus-en',
+                            'Angus': 'aura-angus-en',
+                            'Athena': 'aura-athena-en',
+                            'Helios': 'aura-helios-en',
+                            'Hera': 'aura-hera-en',
+                            'Orion': 'aura-orion-en',
+                            'Perseus': 'aura-perseus-en',
+                            'Stella': 'aura-stella-en'}},
+ 'ElevenlabsTTS': {'module': 'webscout.Provider.TTS.elevenlabs',
+                   'voices': {'Brian': 'nPczCjzI2devNBz1zQrb',
+                              'Alice': 'Xb7hH8MSUJpSbSDYk0k2',
+                              'Bill': 'pqHfZKP75CvOlQylNhV4',
+                              'Callum': 'N2lVS1w4EtoT3dr4eOWO',
+                              'Charlie': 'IKne3meq5aSn9XLyUdCD',
+                              'Charlotte': 'XB0fDUnXU5powFXDhCwa',
+                              'Chris': 'iP95p4xoKVk53GoZ742B',
+                              'Daniel': 'onwK4e9ZLuTAKqWW03F9',
+                              'Eric': 'cjVigY5qzO86Huf0OWal',
+                              'George': 'JBFqnCBsd6RMkjVDRZzb',
+                              'Jessica': 'cgSgspJ2msm6clMCkdW9',
+                              'Laura': 'FGY2WhTYpPnrIDTdsKH5',
+                              'Liam': 'TX3LPaxmHKxFdv7VOQHJ',
+                              'Lily': 'pFZP5JQG7iQjIQuC4Bku',
+                              'Matilda': 'XrExE9yKIg1WjnnlVkGX',
+                              'Sarah': 'EXAVITQu4vr4xnSDxMaL',
+                              'Will': 'bIHbv24MWmeRgasZH58o'}},
+ 'GesseritTTS': {'module': 'webscout.Provider.TTS.gesserit',
+                 'voices': {'Emma': 'en_us_001',
+                            'Liam': 'en_us_006',
+                            'Noah': 'en_us_007',
+                            'Oliver': 'en_us_009',
+                            'Elijah': 'en_us_010',
+                            'James': 'en_male_narration',
+                            'Charlie': 'en_male_funny',
+                            'Sophia': 'en_female_emotional',
+                            'Cody': 'en_male_cody'}},
+ 'MurfAITTS': {'module': 'webscout.Provider.TTS.murfai', 'voices': {'Hazel': 'en-UK-hazel'}},
+ 'SpeechMaTTS': {'module': 'webscout.Provider.TTS.speechma',
+                 'voices': {'Ava': 'voice-110',
+                            'Emma': 'voice-115',
+                            'Andrew': 'voice-107',
+                            'Brian': 'voice-112'}},
+ 'StreamElements': {'module': 'webscout.Provider.TTS.streamElements',
+                    'voices': ['Filiz',
+                               'Astrid',
+                               'Tatyana',
+                               'Maxim',
+                               'Carmen',
+                               'Ines',
+                               'Cristiano',
+                               'Vitoria',
+                               'Ricardo',
+                               'Maja',
+                               'Jan',
+                               'Jacek',
+                               'Ewa',
+                               'Ruben',
+                               'Lotte',
+                               'Liv',
+                               'Seoyeon',
+                               'Takumi',
+                               'Mizuki',
+                               'Giorgio',
+                               'Carla',
+                               'Bianca',
+                               'Karl',
+                               'Dora',
+                               'Mathieu',
+                               'Celine',
+                               'Chantal',
+                               'Penelope',
+                               'Miguel',
+                               'Mia',
+                               'Enrique',
+                               'Conchita',
+                               'Geraint',
+                               'Salli',
+                               'Matthew',
+                               'Kimberly',
+                               'Kendra',
+                               'Justin',
+                               'Joey',
+                               'Joanna',
+                               'Ivy',
+                               'Raveena',
+                               'Aditi',
+                               'Emma',
+                               'Brian',
+                               'Amy',
+                               'Russell',
+                               'Nicole',
+                               'Vicki',
+                               'Marlene',
+                               'Hans',
+                               'Naja',
+                               'Mads',
+                               'Gwyneth',
+                               'Zhiyu',
+                               'es-ES-Standard-A',
+                               'it-IT-Standard-A',
+                               'it-IT-Wavenet-A',
+                               'ja-JP-Standard-A',
+                               'ja-JP-Wavenet-A',
+                               'ko-KR-Standard-A',
+                               'ko-KR-Wavenet-A',
+                               'pt-BR-Standard-A',
+                               'tr-TR-Standard-A',
+                               'sv-SE-Standard-A',
+                               'nl-NL-Standard-A',
+                               'nl-NL-Wavenet-A',
+                               'en-US-Wavenet-A',
+                               'en-US-Wavenet-B',
+                               'en-US-Wavenet-C',
+                               'en-US-Wavenet-D',
+                               'en-US-Wavenet-E',
+                               'en-US-Wavenet-F',
+                               'en-GB-Standard-A',
+                               'en-GB-Standard-B',
+                               'en-GB-Standard-C',
+                               'en-GB-Standard-D',
+                               'en-GB-Wavenet-A',
+                               'en-GB-Wavenet-B',
+                               'en-GB-Wavenet-C',
+                               'en-GB-Wavenet-D',
+                               'en-US-Standard-B',
+                               'en-US-Standard-C',
+                               'en-US-Standard-D',
+                               'en-US-Standard-E',
+                               'de-DE-Standard-A',
+                               'de-DE-Standard-B',
+                               'de-DE-Wavenet-A',
+                               'de-DE-Wavenet-B',
+                               'de-DE-Wavenet-C',
+                               'de-DE-Wavenet-D',
+                               'en-AU-Standard-A',
+                               'en-AU-Standard-B',
+                               'en-AU-Wavenet-A',
+                               'en-AU-Wavenet-B',
+                               'en-AU-Wavenet-C',
+                               'en-AU-Wavenet-D',
+                               'en-AU-Standard-C',
+                               'en-AU-Standard-D',
+                               'fr-CA-Standard-A',
+                               'fr-CA-Standard-B',
+                               'fr-CA-Standard-C',
+                               'fr-CA-Standard-D',
+                               'fr-FR-Standard-C',
+                               'fr-FR-Standard-D',
+                               'fr-FR-Wavenet-A',
+                               'fr-FR-Wavenet-B',
+                               'fr-FR-Wavenet-C',
+                               'fr-FR-Wavenet-D',
+                               'da-DK-Wavenet-A',
+                               'pl-PL-Wavenet-A',
+                               'pl-PL-Wavenet-B',
+                               'pl-PL-Wavenet-C',
+                               'pl-PL-Wavenet-D',
+                               'pt-PT-Wavenet-A',
+                               'pt-PT-Wavenet-B',
+                               'pt-PT-Wavenet-C',
+                               'pt-PT-Wavenet-D',
+                               'ru-RU-Wavenet-A',
+                               'ru-RU-Wavenet-B',
+                               'ru-RU-Wavenet-C',
+                               'ru-RU-Wavenet-D',
+                               'sk-SK-Wavenet-A',
+                               'tr-TR-Wavenet-A',
+                               'tr-TR-Wavenet-B',
+                               'tr-TR-Wavenet-C',
+                               'tr-TR-Wavenet-D',
+                               'tr-TR-Wavenet-E',
+                               'uk-UA-Wavenet-A',
+                               'ar-XA-Wavenet-A',
+                               'ar-XA-Wavenet-B',
+                               'ar-XA-Wavenet-C',
+                               'cs-CZ-Wavenet-A',
+                               'nl-NL-Wavenet-B',
+                               'nl-NL-Wavenet-C',
+                               'nl-NL-Wavenet-D',
+                               'nl-NL-Wavenet-E',
+                               'en-IN-Wavenet-A',
+                               'en-IN-Wavenet-B',
+                               'en-IN-Wavenet-C',
+                               'fil-PH-Wavenet-A',
+                               'fi-FI-Wavenet-A',
+                               'el-GR-Wavenet-A',
+                               'hi-IN-Wavenet-A',
+                               'hi-IN-Wavenet-B',
+                               'hi-IN-Wavenet-C',
+                               'hu-HU-Wavenet-A',
+                               'id-ID-Wavenet-A',
+                               'id-ID-Wavenet-B',
+                               'id-ID-Wavenet-C',
+                               'it-IT-Wavenet-B',
+                               'it-IT-Wavenet-C',
+                               'it-IT-Wavenet-D',
+                               'ja-JP-Wavenet-B',
+                               'ja-JP-Wavenet-C',
+                               'ja-JP-Wavenet-D',
+                               'cmn-CN-Wavenet-A',
+                               'cmn-CN-Wavenet-B',
+                               'cmn-CN-Wavenet-C',
+                               'cmn-CN-Wavenet-D',
+                               'nb-no-Wavenet-E',
+                               'nb-no-Wavenet-A',
+                               'nb-no-Wavenet-B',
+                               'nb-no-Wavenet-C',
+                               'nb-no-Wavenet-D',
+                               'vi-VN-Wavenet-A',
+                               'vi-VN-Wavenet-B',
+                               'vi-VN-Wavenet-C',
+                               'vi-VN-Wavenet-D',
+                               'sr-rs-Standard-A',
+                               'lv-lv-Standard-A',
+                               'is-is-Standard-A',
+                               'bg-bg-Standard-A',
+                               'af-ZA-Standard-A',
+                               'Tracy',
+                               'Danny',
+                               'Huihui',
+                               'Yaoyao',
+                               'Kangkang',
+                               'HanHan',
+                               'Zhiwei',
+                               'Asaf',
+                               'An',
+                               'Stefanos',
+                               'Filip',
+                               'Ivan',
+                               'Heidi',
+                               'Herena',
+                               'Kalpana',
+                               'Hemant',
+                               'Matej',
+                               'Andika',
+                               'Rizwan',
+                               'Lado',
+                               'Valluvar',
+                               'Linda',
+                               'Heather',
+                               'Sean',
+                               'Michael',
+                               'Karsten',
+                               'Guillaume',
+                               'Pattara',
+                               'Jakub',
+                               'Szabolcs',
+                               'Hoda',
+                               'Naayf']}}
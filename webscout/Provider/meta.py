@@ -7,6 +7,7 @@ from typing import Dict, Generator, Iterator, List, Union
 
 import random
 import requests
+from webscout import transport
 from webscout.scout import Scout
 
 from webscout.AIutel import Optimizers
@@ -328,7 +329,7 @@ class Meta(Provider):
             history_offset (int, optional): Limit conversation history to this number of last texts. Defaults to 10250.
             act (str|int, optional): Awesome prompt key or index. (Used as intro). Defaults to None.
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(
             {
                 "user-agent": Lit().random(),
@@ -513,7 +514,7 @@ class Meta(Provider):
         if self.is_authed:
             headers["cookie"] = f'abra_sess={self.cookies["abra_sess"]}'
             # Recreate the session to avoid cookie leakage when user is authenticated
-            self.session = requests.Session()
+            self.session = transport.session()
             self.session.proxies = self.proxy
 
         if stream:
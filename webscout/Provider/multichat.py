@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import uuid
 from typing import Any, Dict, Union
@@ -126,7 +127,7 @@ class MultiChatAI(Provider):
         """Initializes the MultiChatAI API client."""
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.timeout = timeout
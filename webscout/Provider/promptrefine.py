@@ -1,10 +1,10 @@
-import requests
+from webscout import transport
 import uuid
 import json
 
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
-from webscout.AIutel import AwesomePrompts
+from webscout.AIutel import AwesomePrompts, StreamAccumulator
 from webscout.AIbase import Provider
 from webscout import LitAgent as UserAgent
 
@@ -43,7 +43,7 @@ class PromptRefine(Provider):
             system_prompt (str, optional): System prompt for PromptRefine. Defaults to "You are a helpful AI assistant.".
             model (str, optional): Model to use for generation. Defaults to "openai/gpt-4o".
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = 'https://www.promptrefine.com/api/completion'
@@ -132,12 +132,12 @@ class PromptRefine(Provider):
                     f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                 )
 
-            full_response = ""
+            full_response = StreamAccumulator()
             for line in response.iter_lines(decode_unicode=True):
                 if line:
-                    full_response += line  # No need to decode here
-                    yield full_response if raw else dict(text=line)
-            self.last_response.update(dict(text=full_response))
+                    full_response.append(line)  # No need to decode here
+                    yield line if raw else dict(text=line)
+            self.last_response.update(dict(text=full_response.text))
             self.conversation.update_chat_history(
                 prompt, self.get_message(self.last_response)
             )
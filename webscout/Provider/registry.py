@@ -0,0 +1,201 @@
+"""
+Lazy provider registry.
+
+Provider metadata (module path, AVAILABLE_MODELS, whether an API key is
+required) lives in the generated ``manifest.py`` so that listing providers or
+models never imports the provider modules themselves. A provider module is only
+imported when its class is actually requested.
+
+Regenerate the manifest after adding or changing a provider:
+
+    python -m webscout.Provider.registry
+"""
+
+import importlib
+import inspect
+import pkgutil
+import pprint
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from webscout.Provider.manifest import PROVIDERS, TTS_PROVIDERS
+
+
+def load(name: str) -> type:
+    """
+    Imports and returns a provider class by name.
+
+    Args:
+        name: Provider class name as listed in the manifest (e.g. ``"GROQ"``)
+
+    Returns:
+        The provider class
+
+    Raises:
+        KeyError: If the provider is not in the manifest
+    """
+    entry = PROVIDERS.get(name) or TTS_PROVIDERS[name]
+    return getattr(importlib.import_module(entry["module"]), name)
+
+
+def providers(requires_api_key: Optional[bool] = None, is_async: Optional[bool] = None) -> List[str]:
+    """
+    Lists provider names from the manifest without importing them.
+
+    Args:
+        requires_api_key: Only keep providers that do (True) or don't (False) need an API key
+        is_async: Only keep AsyncProvider (True) or Provider (False) subclasses
+
+    Returns:
+        List of provider class names
+    """
+    return [
+        name for name, entry in PROVIDERS.items()
+        if (requires_api_key is None or entry["requires_api_key"] == requires_api_key)
+        and (is_async is None or entry["is_async"] == is_async)
+    ]
+
+
+def models(name: str) -> Union[List[str], Dict[str, str]]:
+    """
+    Returns the AVAILABLE_MODELS recorded for a provider.
+
+    Args:
+        name: Provider class name
+
+    Returns:
+        List of models, or an empty list when the provider declares none
+    """
+    entry = PROVIDERS.get(name)
+    return entry["models"] if entry and entry["models"] is not None else []
+
+
+class LazyProviderMap:
+    """
+    Read-only mapping of provider name to class that imports on lookup.
+
+    Keys come from the manifest, so iterating the map is free; indexing it
+    imports the provider module. Imported classes are cached.
+    """
+
+    def __init__(self, names: List[str], key=str.upper):
+        self._names = {key(name): name for name in names}
+        self._loaded: Dict[str, type] = {}
+
+    def __getitem__(self, key: str) -> type:
+        cls = self._loaded.get(key)
+        if cls is None:
+            cls = self._loaded[key] = load(self._names[key])
+        return cls
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def keys(self):
+        return self._names.keys()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._names else default
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._names)})"
+
+
+def _serializable(value: Any) -> Any:
+    if isinstance(value, (set, frozenset, tuple)):
+        return sorted(value) if isinstance(value, (set, frozenset)) else list(value)
+    return value
+
+
+def build_manifest() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Imports every provider module and collects the manifest entries.
+
+    This is the slow path the manifest exists to avoid; it only runs when the
+    manifest is regenerated.
+
+    Returns:
+        Dictionary with ``"PROVIDERS"`` and ``"TTS_PROVIDERS"`` sections
+    """
+    from webscout.AIbase import AsyncProvider, Provider, TTSProvider
+
+    found: Dict[str, Dict[str, Any]] = {}
+    package = importlib.import_module("webscout.Provider")
+    for _, module_name, _ in pkgutil.iter_modules(package.__path__):
+        if module_name in ("manifest", "registry"):
+            continue
+        try:
+            module = importlib.import_module(f"webscout.Provider.{module_name}")
+        except Exception:
+            continue
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if not isinstance(attr, type) or attr_name in found or attr.__name__ != attr_name:
+                continue
+            if issubclass(attr, Provider) and attr is not Provider:
+                is_async = False
+            elif issubclass(attr, AsyncProvider) and attr is not AsyncProvider:
+                is_async = True
+            else:
+                continue
+            found[attr_name] = {
+                "module": attr.__module__,
+                "models": _serializable(getattr(attr, "AVAILABLE_MODELS", None)),
+                "requires_api_key": "api_key" in inspect.signature(attr.__init__).parameters,
+                "is_async": is_async,
+            }
+
+    tts: Dict[str, Dict[str, Any]] = {}
+    tts_package = importlib.import_module("webscout.Provider.TTS")
+    for _, module_name, _ in pkgutil.iter_modules(tts_package.__path__):
+        try:
+            module = importlib.import_module(f"webscout.Provider.TTS.{module_name}")
+        except Exception:
+            continue
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (isinstance(attr, type) and issubclass(attr, TTSProvider) and attr is not TTSProvider
+                    and attr_name not in tts and hasattr(attr, "all_voices")):
+                tts[attr_name] = {"module": attr.__module__, "voices": _serializable(attr.all_voices)}
+
+    return {
+        "PROVIDERS": dict(sorted(found.items())),
+        "TTS_PROVIDERS": dict(sorted(tts.items())),
+    }
+
+
+def write_manifest(path: Optional[Union[str, Path]] = None) -> Path:
+    """
+    Regenerates ``manifest.py``.
+
+    Args:
+        path: Output file, defaults to the manifest next to this module
+
+    Returns:
+        Path of the written manifest
+    """
+    path = Path(path) if path else Path(__file__).with_name("manifest.py")
+    sections = build_manifest()
+    lines = [
+        '"""',
+        "Static provider manifest, generated by ``python -m webscout.Provider.registry``.",
+        "",
+        "Do not edit by hand.",
+        '"""',
+        "",
+    ]
+    for section, entries in sections.items():
+        lines.append(f"{section} = {pprint.pformat(entries, width=100, sort_dicts=False)}")
+        lines.append("")
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Wrote {write_manifest()}")
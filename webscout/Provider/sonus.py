@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 from typing import Any, Dict, Optional, Generator, Union
 from webscout.AIutel import Optimizers
@@ -46,7 +47,7 @@ class SonusAI(Provider):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36'
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import os
 from typing import Union, List, Optional
 from string import punctuation
@@ -47,7 +48,7 @@ class TutorAI(Provider):
             system_prompt (str, optional): System prompt for TutorAI.
                                    Defaults to "You are a helpful AI assistant.".
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://ai-tutor.ai/api/generate-homeworkify-response"
@@ -1,11 +1,11 @@
 import requests
-import json
+from webscout import transport
 from typing import Union, Any, Dict, Generator
 import requests.exceptions
 
 from webscout.AIutel import Optimizers
 from webscout.AIutel import Conversation
-from webscout.AIutel import AwesomePrompts
+from webscout.AIutel import AwesomePrompts, iter_stream
 from webscout.AIbase import Provider
 from webscout import exceptions
 from webscout.litagent import LitAgent
@@ -264,7 +264,7 @@ class TypeGPT(Provider):
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {', '.join(self.AVAILABLE_MODELS)}")
 
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://chat.typegpt.net/api/openai/typegpt/v1/chat/completions"
@@ -351,27 +351,13 @@ class TypeGPT(Provider):
                     f"Failed to generate response - ({response.status_code}, {response.reason}) - {response.text}"
                 )
             message_load = ""
-            for line in response.iter_lines():
-                if line:
-                    line = line.decode("utf-8")
-                    if line.startswith("data: "):
-                        line = line[6:]  # Remove "data: " prefix
-                        # Skip [DONE] message
-                        if line.strip() == "[DONE]":
-                            break
-                        try:
-                            data = json.loads(line)
-                            # Extract and yield only new content
-                            if 'choices' in data and len(data['choices']) > 0:
-                                delta = data['choices'][0].get('delta', {})
-                                if 'content' in delta:
-                                    new_content = delta['content']
-                                    message_load += new_content
-                                    # Yield only the new content
-                                    yield dict(text=new_content) if not raw else new_content
-                                    self.last_response = dict(text=message_load)
-                        except json.JSONDecodeError:
-                            continue
+            for new_content in iter_stream(
+                response.iter_content(chunk_size=None), path="choices.0.delta.content"
+            ):
+                message_load += new_content
+                # Yield only the new content
+                yield dict(text=new_content) if not raw else new_content
+                self.last_response = dict(text=message_load)
             self.conversation.update_chat_history(prompt, self.get_message(self.last_response))
 
         def for_non_stream():
@@ -1,4 +1,5 @@
 import requests
+from webscout import transport
 import json
 import uuid
 import re
@@ -74,7 +75,7 @@ class UncovrAI(Provider):
             "Sec-Fetch-Site": "same-origin"
         }
         
-        self.session = requests.Session()
+        self.session = transport.session()
         self.session.headers.update(self.headers)
         self.session.proxies.update(proxies)
 
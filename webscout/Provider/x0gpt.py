@@ -1,6 +1,6 @@
 from typing import Union, Any, Dict
 from uuid import uuid4
-import requests
+from webscout import transport
 import re
 
 from webscout.AIutel import Optimizers
@@ -60,7 +60,7 @@ class X0GPT(Provider):
             >>> print(ai.system_prompt)
             'You are a friendly assistant.'
         """
-        self.session = requests.Session()
+        self.session = transport.session()
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
         self.api_endpoint = "https://x0-gpt.devwtf.in/api/stream/reply"
@@ -1,36 +1,122 @@
 # webscout/__init__.py
+# Public names are resolved on first access (see webscout/lazy.py), so
+# ``from webscout import WEBS`` doesn't import every provider and its deps.
 
-from .webscout_search import WEBS
-from .webscout_search_async import AsyncWEBS
 from .version import __version__
-from .DWEBS import *
-from .tempid import *
-from .LLM import VLM, LLM
-from .Provider import *
-from .Provider.TTI import *
-from .Provider.TTS import *
-from .Provider.AISEARCH import *
-from .Extra import *
-from .Litlogger import *
-from .optimizers import *
-from .swiftcli import *
-from .litagent import LitAgent
-from .scout import *
-from .zeroart import *
-from .yep_search import *
-agent = LitAgent()
+from .lazy import install as _install
+from .Provider import __all__ as _provider_names
+
+_MODULE_EXPORTS = {
+    ".webscout_search": (
+        "WEBS",
+    ),
+    ".webscout_search_async": (
+        "AsyncWEBS",
+    ),
+    ".DWEBS": (
+        "GoogleS",
+    ),
+    ".tempid": (
+        "DomainModel", "CreateEmailResponseModel", "MessageResponseModel", "TempMail",
+        "VNEngine", "sms_message",
+    ),
+    ".AIasync": (
+        "AsyncAdapter", "to_async",
+    ),
+    ".LLM": (
+        "VLM", "LLM",
+    ),
+    ".Provider": _provider_names,
+    ".Provider.TTI": (
+        "FreeAIImager", "AsyncFreeAIImager", "PollinationsAI", "AsyncPollinationsAI",
+        "AiForceimager", "AsyncAiForceimager", "NexraImager", "AsyncNexraImager",
+        "HFimager", "AsyncHFimager", "ArtbitImager", "AsyncArtbitImager",
+        "TalkaiImager", "AsyncTalkaiImager", "PiclumenImager", "AsyncPiclumenImager",
+        "AsyncImageProvider", "AsyncMagicStudioImager", "ImageProvider",
+        "MagicStudioImager", "FastFluxImager", "AsyncFastFluxImager",
+    ),
+    ".Provider.TTS": (
+        "TTSProvider", "StreamElements", "ParlerTTS", "DeepgramTTS", "ElevenlabsTTS",
+        "MurfAITTS", "GesseritTTS", "SpeechMaTTS",
+    ),
+    ".Provider.AISEARCH": (
+        "AISearch", "Response", "Felo", "DeepFind", "Isou", "Genspark",
+    ),
+    ".Extra": (
+        "gguf", "ConversionError", "QuantizationMethod", "ModelConverter", "app",
+        "convert_command", "main", "weather", "CurrentCondition", "Location",
+        "HourlyForecast", "DayForecast", "Weather", "WeatherClient", "get",
+        "weather_ascii", "WeatherAscii", "WeatherAsciiClient", "autocoder",
+        "run_system_command", "get_intro_prompt", "AutoCoder", "get_current_app",
+        "YTToolkit", "get_excep", "first_query", "second_query", "third_query",
+        "Handler", "launch_media", "confirm_from_user", "download", "WebscoutE",
+        "APIConnectionError", "AuthenticationError", "RatelimitE",
+        "ConversationLimitException", "TimeoutE", "FailedToGenerateResponseError",
+        "AllProvidersFailure", "FacebookInvalidCredentialsException",
+        "FacebookRegionBlocked", "ModelUnloadedException", "TranscriptRetrievalError",
+        "YouTubeRequestFailedError", "VideoUnavailableError", "InvalidVideoIdError",
+        "TooManyRequestsError", "TranscriptsDisabledError",
+        "NoTranscriptAvailableError", "NotTranslatableError",
+        "TranslationLanguageNotAvailableError", "CookiePathInvalidError",
+        "CookiesInvalidError", "FailedToCreateConsentCookieError",
+        "NoTranscriptFoundError", "YTTranscriber", "TranscriptListFetcher",
+        "TranscriptList", "Transcript", "TranscriptParser", "TooManyRequests",
+        "InvalidURL", "RequestError", "Video", "Search", "Extras", "Channel",
+        "Playlist",
+    ),
+    ".Litlogger": (
+        "Logger", "LogLevel", "LogColors", "LogFormat", "TextStyle", "ConsoleHandler",
+        "ErrorConsoleHandler", "FileHandler", "NetworkHandler", "LevelDetector",
+        "MessageFormatter", "debug", "info", "warning", "error", "critical",
+    ),
+    ".optimizers": (
+        "Optimizers",
+    ),
+    ".swiftcli": (
+        "UsageError", "BadParameter", "Context", "Plugin", "PluginManager", "Group",
+        "CLI", "command", "option", "argument", "group", "pass_context", "envvar",
+        "config_file", "table_output", "progress",
+    ),
+    ".scout": (
+        "Scout", "ScoutCrawler", "Tag", "NavigableString", "ScoutTextAnalyzer",
+        "ScoutWebAnalyzer", "ScoutSearchResult",
+    ),
+    ".zeroart": (
+        "figlet_format", "print_figlet", "rainbow", "glitch", "wrap_text", "outline",
+        "BlockFont", "SlantFont", "NeonFont", "CyberFont",
+    ),
+    ".litagent": (
+        "LitAgent", "agent",
+    ),
+    ".yep_search": (
+        "YepSearch",
+    ),
+    ".federated_search": (
+        "FederatedSearch",
+    ),
+    ".update_checker": (
+        "check_for_updates",
+    ),
+    ".models": (
+        "model",
+    ),
+}
+
+_EXPORTS = {
+    name: module
+    for module, names in _MODULE_EXPORTS.items()
+    for name in names
+}
+
+__all__ = list(_EXPORTS)
+
+_install(__name__, _EXPORTS)
 
 __repo__ = "https://github.com/OE-LUCIFER/Webscout"
 
-# Add update checker
-from .update_checker import check_for_updates
-try:
-    check_for_updates()
-except Exception:
-    pass  # Silently handle any update check errors
+# Opt-in (WEBSCOUT_CHECK_UPDATES=1) and never blocks the import
+from .update_checker import check_for_updates_in_background
+check_for_updates_in_background()
 
 import logging
 logging.getLogger("webscout").addHandler(logging.NullHandler())
-
-# Import models for easy access
-from webscout.models import model
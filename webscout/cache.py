@@ -0,0 +1,519 @@
+"""
+Small caches shared by the search clients.
+
+- :class:`TTLCache`: thread-safe in-memory LRU with per-entry expiry
+- :class:`SQLiteCache`: the same interface on an SQLite file, so several
+  worker processes can share entries
+- :class:`VQDCache`: DuckDuckGo ``vqd`` tokens, memory in front of an
+  optional SQLite file
+- :class:`ResultCache`: search results, with per-method TTLs,
+  stale-while-revalidate and coalescing of identical in-flight queries
+
+>>> from webscout import cache
+>>> cache.vqd_cache.get("python")                  # None until a search stored one
+>>> cache.configure_vqd(path="~/.cache/webscout/vqd.sqlite3")   # share across processes
+>>> cache.configure_results(ttls={"news": 60})     # WEBS/AsyncWEBS result cache
+
+The shared on-disk stores can also be switched on with the
+``WEBSCOUT_VQD_CACHE`` and ``WEBSCOUT_RESULT_CACHE`` environment variables set
+to a file path.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after being set.
+
+    Attributes:
+        maxsize (int): Max number of entries; the least recently used go first
+        ttl (float): Default lifetime of an entry in seconds
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Value of ``key``, or ``default`` if it's missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (defaults to ``self.ttl``)."""
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Drop ``key`` if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_value(self, value: Any) -> None:
+        """Drop every entry holding ``value``."""
+        with self._lock:
+            for key in [k for k, (_, v) in self._data.items() if v == value]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """TTL cache in an SQLite file, shareable between processes.
+
+    Keys and values are strings. Expired rows are skipped on read and
+    purged on write. Each thread gets its own connection.
+
+    Attributes:
+        path (str): Database file
+        ttl (float): Default lifetime of an entry in seconds
+    """
+
+    def __init__(self, path: str, ttl: float = 600.0, table: str = "cache"):
+        """
+        Args:
+            path (str): Database file, created with its directory if missing
+            ttl (float, optional): Default lifetime of an entry. Defaults to 600.
+            table (str, optional): Table name, to keep several caches in one file. Defaults to "cache".
+        """
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.table = table
+        self._local = threading.local()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Value of ``key``, or ``default`` if it's missing or expired."""
+        row = self._connection().execute(
+            f"SELECT value FROM {self.table} WHERE key = ? AND expires > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else default
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds (defaults to ``self.ttl``)."""
+        now = time.time()
+        conn = self._connection()
+        conn.execute(
+            f"INSERT OR REPLACE INTO {self.table} (key, value, expires) VALUES (?, ?, ?)",
+            (key, value, now + (self.ttl if ttl is None else ttl)),
+        )
+        conn.execute(f"DELETE FROM {self.table} WHERE expires <= ?", (now,))
+
+    def delete(self, key: str) -> None:
+        """Drop ``key`` if present."""
+        self._connection().execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def delete_value(self, value: str) -> None:
+        """Drop every entry holding ``value``."""
+        self._connection().execute(f"DELETE FROM {self.table} WHERE value = ?", (value,))
+
+    def clear(self) -> None:
+        self._connection().execute(f"DELETE FROM {self.table}")
+
+
+class VQDCache:
+    """Cache of DuckDuckGo ``vqd`` tokens by search keywords.
+
+    A token is tied to the query it was issued for, not to the region or
+    other search options, so one token serves every search of those keywords
+    until it expires or an endpoint rejects it.
+
+    Attributes:
+        memory (TTLCache): Per-process cache, always consulted first
+        disk (SQLiteCache): Optional store shared between processes
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600.0, path: Optional[str] = None):
+        """
+        Args:
+            maxsize (int, optional): Max tokens kept in memory. Defaults to 1024.
+            ttl (float, optional): Seconds a token is reused. Defaults to 600.
+            path (str, optional): SQLite file shared by processes. Defaults to None, memory only.
+        """
+        self.memory = TTLCache(maxsize, ttl)
+        self.disk = SQLiteCache(path, ttl, table="vqd") if path else None
+
+    def get(self, keywords: str) -> Optional[str]:
+        """Cached token for ``keywords``, if any."""
+        vqd = self.memory.get(keywords)
+        if vqd is None and self.disk is not None:
+            vqd = self.disk.get(keywords)
+            if vqd is not None:
+                self.memory.set(keywords, vqd)
+        return vqd
+
+    def set(self, keywords: str, vqd: str) -> None:
+        self.memory.set(keywords, vqd)
+        if self.disk is not None:
+            self.disk.set(keywords, vqd)
+
+    def invalidate(self, keywords: Optional[str] = None, vqd: Optional[str] = None) -> None:
+        """Forget the token of ``keywords``, and/or every entry holding the token ``vqd``."""
+        for store in (self.memory, self.disk):
+            if store is None:
+                continue
+            if keywords is not None:
+                store.delete(keywords)
+            if vqd is not None:
+                store.delete_value(vqd)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+vqd_cache = VQDCache(path=os.environ.get("WEBSCOUT_VQD_CACHE") or None)
+
+
+def configure_vqd(maxsize: int = 1024, ttl: float = 600.0, path: Optional[str] = None) -> VQDCache:
+    """
+    Reconfigures the process-wide vqd cache in place; cached tokens are dropped.
+
+    Args:
+        maxsize: Max tokens kept in memory
+        ttl: Seconds a token is reused
+        path: SQLite file shared between processes, or None for memory only
+
+    Returns:
+        The shared cache
+    """
+    vqd_cache.__init__(maxsize, ttl, path)
+    return vqd_cache
+
+
+DEFAULT_RESULT_TTLS: Dict[str, float] = {
+    "text": 600.0,
+    "images": 3600.0,
+    "videos": 3600.0,
+    "news": 300.0,
+    "answers": 3600.0,
+    "suggestions": 3600.0,
+    "maps": 3600.0,
+    "translate": 86400.0,
+    "weather": 900.0,
+}
+
+
+class ResultCache:
+    """Cache of search results keyed by method and arguments.
+
+    - Entries are fresh for the method's TTL; for as long again they are
+      stale: still served, while one background fetch refreshes them.
+    - Concurrent identical queries that miss share one upstream fetch.
+    - Memory (LRU, ``maxsize`` entries) sits in front of an optional SQLite
+      file whose keys are SHA-256 hashes of the query.
+    - Values must be JSON-serialisable; callers get their own copy.
+
+    Attributes:
+        ttls (dict): TTL in seconds by method name
+        default_ttl (float): TTL of methods missing from ``ttls``
+        stale_ttl (float): Seconds past expiry an entry is served stale; None for one TTL
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 600.0,
+        stale_ttl: Optional[float] = None,
+        path: Optional[str] = None,
+    ):
+        """
+        Args:
+            maxsize (int, optional): Max entries kept in memory. Defaults to 512.
+            ttls (dict, optional): TTLs by method name, on top of :data:`DEFAULT_RESULT_TTLS`.
+            default_ttl (float, optional): TTL of other methods. Defaults to 600.
+            stale_ttl (float, optional): Stale window. Defaults to None, one TTL.
+            path (str, optional): SQLite file shared by processes. Defaults to None, memory only.
+        """
+        self.ttls = {**DEFAULT_RESULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.memory = TTLCache(maxsize)
+        self.disk = SQLiteCache(path, table="results") if path else None
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._ainflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.hits = self.stale_hits = self.misses = self.coalesced = 0
+
+    @staticmethod
+    def key(namespace: str, *args: Any, **kwargs: Any) -> str:
+        """Stable hashed key of a call."""
+        blob = json.dumps([namespace, args, kwargs], sort_keys=True, default=str, ensure_ascii=False)
+        return f"{namespace}:{hashlib.sha256(blob.encode()).hexdigest()}"
+
+    # -- storage ------------------------------------------------------------
+
+    def _ttls(self, namespace: str) -> Tuple[float, float]:
+        ttl = self.ttls.get(namespace, self.default_ttl)
+        return ttl, ttl if self.stale_ttl is None else self.stale_ttl
+
+    def _lookup(self, key: str) -> Tuple[Any, Optional[float]]:
+        """``(value, fresh_until)``; ``fresh_until`` is None on a miss."""
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            blob = self.disk.get(key)
+            if blob is not None:
+                entry = tuple(json.loads(blob))
+                self.memory.set(key, entry, ttl=max(0.0, entry[0] + self._stale_of(key) - time.time()))
+        if entry is None:
+            return None, None
+        fresh_until, value = entry
+        return value, fresh_until
+
+    def _stale_of(self, key: str) -> float:
+        return self._ttls(key.split(":", 1)[0])[1]
+
+    def _store(self, key: str, namespace: str, value: Any) -> None:
+        ttl, stale = self._ttls(namespace)
+        entry = (time.time() + ttl, value)
+        self.memory.set(key, entry, ttl=ttl + stale)
+        if self.disk is not None:
+            self.disk.set(key, json.dumps(entry, default=str), ttl=ttl + stale)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop one entry, or everything when ``key`` is None."""
+        for store in (self.memory, self.disk):
+            if store is None:
+                continue
+            if key is None:
+                store.clear()
+            else:
+                store.delete(key)
+
+    # -- sync ---------------------------------------------------------------
+
+    def _fetch(self, key: str, namespace: str, fetch: Callable[[], Any]) -> Any:
+        """Run ``fetch`` once per key at a time; concurrent callers wait for the same result."""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            value = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._store(key, namespace, value)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _refresh_in_background(self, key: str, namespace: str, fetch: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._inflight:
+                return
+
+        def refresh() -> None:
+            try:
+                self._fetch(key, namespace, fetch)
+            except Exception:
+                # Keep serving the stale entry; the next caller past its life fetches again
+                pass
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def get_or_fetch(self, namespace: str, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Cached value of ``key``, fetching it on a miss.
+
+        Args:
+            namespace: Method name, selects the TTL
+            key: See :meth:`key`
+            fetch: Blocking call producing the value
+
+        Returns:
+            A copy of the cached or fetched value
+        """
+        value, fresh_until = self._lookup(key)
+        if fresh_until is None:
+            self.misses += 1
+            value = self._fetch(key, namespace, fetch)
+        elif fresh_until > time.time():
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+            self._refresh_in_background(key, namespace, fetch)
+        return copy.deepcopy(value)
+
+    # -- async --------------------------------------------------------------
+
+    def _afetch(self, key: str, namespace: str, fetch: Callable[[], Awaitable[Any]]) -> "asyncio.Task":
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            tasks = self._ainflight.setdefault(loop, {})
+            task = tasks.get(key)
+            if task is not None:
+                self.coalesced += 1
+                return task
+
+        async def run() -> Any:
+            try:
+                value = await fetch()
+                self._store(key, namespace, value)
+                return value
+            finally:
+                with self._lock:
+                    tasks.pop(key, None)
+
+        task = tasks[key] = loop.create_task(run())
+        return task
+
+    async def aget_or_fetch(self, namespace: str, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Async twin of :meth:`get_or_fetch`; ``fetch`` returns an awaitable."""
+        value, fresh_until = self._lookup(key)
+        if fresh_until is None:
+            self.misses += 1
+            # shield: one caller giving up mustn't cancel the fetch the others wait for
+            value = await asyncio.shield(self._afetch(key, namespace, fetch))
+        elif fresh_until > time.time():
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+            task = self._afetch(key, namespace, fetch)
+            # Retrieve the exception, if any, so it isn't logged as never retrieved
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return copy.deepcopy(value)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "entries": len(self.memory),
+        }
+
+
+result_cache = ResultCache(path=os.environ.get("WEBSCOUT_RESULT_CACHE") or None)
+
+
+def configure_results(
+    maxsize: int = 512,
+    ttls: Optional[Dict[str, float]] = None,
+    default_ttl: float = 600.0,
+    stale_ttl: Optional[float] = None,
+    path: Optional[str] = None,
+) -> ResultCache:
+    """
+    Reconfigures the process-wide result cache in place; cached results are dropped.
+
+    Args:
+        maxsize: Max entries kept in memory
+        ttls: TTLs by method name, on top of :data:`DEFAULT_RESULT_TTLS`
+        default_ttl: TTL of other methods
+        stale_ttl: Stale window, None for one TTL
+        path: SQLite file shared between processes, or None for memory only
+
+    Returns:
+        The shared cache
+    """
+    result_cache.__init__(maxsize, ttls, default_ttl, stale_ttl, path)
+    return result_cache
+
+
+def cached(namespace: str) -> Callable:
+    """
+    Caches a search method's results in its instance's ``result_cache``.
+
+    Works on both plain and ``async def`` methods. Arguments are bound to the
+    signature first, so ``text("q")`` and ``text(keywords="q")`` share an
+    entry. An instance whose ``result_cache`` is None isn't cached.
+
+    Args:
+        namespace: Method name, selects the TTL (see :data:`DEFAULT_RESULT_TTLS`)
+    """
+
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        def cache_key(self, args, kwargs) -> str:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self", None)
+            return ResultCache.key(namespace, **arguments)
+
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                results = getattr(self, "result_cache", None)
+                if results is None:
+                    return await method(self, *args, **kwargs)
+                return await results.aget_or_fetch(
+                    namespace, cache_key(self, args, kwargs), lambda: method(self, *args, **kwargs)
+                )
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            results = getattr(self, "result_cache", None)
+            if results is None:
+                return method(self, *args, **kwargs)
+            return results.get_or_fetch(
+                namespace, cache_key(self, args, kwargs), lambda: method(self, *args, **kwargs)
+            )
+        return wrapper
+
+    return decorator
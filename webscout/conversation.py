@@ -1,16 +1,70 @@
+import atexit
+import json
 import os
-from typing import Optional
+import re
+import weakref
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, List, Optional, TextIO
+
+
+def approx_tokens(text: str) -> int:
+    """Rough token count for English text (~4 characters per token).
+
+    Pass it (or a real tokenizer's ``lambda s: len(enc.encode(s))``) as
+    ``Conversation(token_estimator=...)`` to budget history in tokens.
+    """
+    return (len(text) + 3) // 4
+
+
+class Message:
+    """One history record: who said what, rendered once with its cost cached."""
+
+    __slots__ = ("role", "content", "text", "cost")
+
+    def __init__(self, role: str, content: str, text: str, cost: int):
+        self.role = role
+        self.content = content
+        self.text = text
+        self.cost = cost
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"role": self.role, "content": self.content}
+
+
+_open_logs: "weakref.WeakSet[Conversation]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_logs() -> None:
+    for conversation in list(_open_logs):
+        conversation.close()
 
 
 class Conversation:
     """Handles prompt generation based on history and maintains chat context.
-    
+
     This class is responsible for managing chat conversations, including:
     - Maintaining chat history
     - Loading/saving conversations from/to files
     - Generating prompts based on context
     - Managing token limits and history pruning
-    
+
+    History is a deque of :class:`Message` records, each rendered once with its
+    cost cached. Prompts are trimmed at message boundaries against a running
+    total, so a turn costs the same whether the session is ten messages or ten
+    thousand long. Messages that no longer fit are evicted from memory; the
+    file keeps all of them.
+
+    ``history_offset``, ``max_tokens`` and ``prompt_allowance`` are measured
+    with ``token_estimator``. It defaults to ``len`` (characters), which keeps
+    the budgets providers already pass meaningful; use :func:`approx_tokens` or
+    a real tokenizer to budget in tokens.
+
+    New history files are an append-only JSONL log of ``{"role": ...,
+    "content": ...}`` lines, the intro being the first record, written through
+    one long-lived buffered handle. Existing plain-text history files are still
+    read and appended to in their own format.
+
     Examples:
         >>> chat = Conversation(max_tokens=500)
         >>> chat.add_message("user", "Hello!")
@@ -23,12 +77,21 @@ class Conversation:
         "Assume role of the LLM and give your response."
     )
 
+    role_formats = {
+        "user": "\nUser : %s",
+        "llm": "\nLLM :%s",
+        "tool": "\nTool : %s",
+        "reasoning": "\nReasoning : %s",
+        "text": "%s",
+    }
+
     def __init__(
         self,
         status: bool = True,
         max_tokens: int = 600,
         filepath: Optional[str] = None,
         update_file: bool = True,
+        token_estimator: Callable[[str], int] = len,
     ):
         """Initialize a new Conversation manager.
 
@@ -37,25 +100,77 @@ class Conversation:
             max_tokens (int): Maximum tokens for completion response. Defaults to 600.
             filepath (str, optional): Path to save/load conversation history. Defaults to None.
             update_file (bool): Whether to append new messages to file. Defaults to True.
+            token_estimator (Callable[[str], int]): Cost of a piece of text. Defaults to ``len``.
 
         Examples:
             >>> chat = Conversation(max_tokens=500)
-            >>> chat = Conversation(filepath="chat_history.txt")
+            >>> chat = Conversation(filepath="chat_history.jsonl", token_estimator=approx_tokens)
         """
         self.status = status
         self.max_tokens_to_sample = max_tokens
-        self.chat_history = ""  # Initialize as empty string
         self.history_format = "\nUser : %(user)s\nLLM :%(llm)s"
         self.file = filepath
         self.update_file = update_file
         self.history_offset = 10250
         self.prompt_allowance = 10
-        
+        self.token_estimator = token_estimator
+        self.messages: Deque[Message] = deque()
+        self._cost = 0
+        self._trimmed = False
+        self._rendered: Optional[str] = None
+        self._intro_cost = (None, 0)
+        self._log: Optional[TextIO] = None
+        self._log_format = "jsonl"
+
         if filepath:
             self.load_conversation(filepath, False)
 
+    # -- history ------------------------------------------------------------
+
+    def _message(self, role: str, content: str) -> Message:
+        text = self.role_formats[role] % content
+        return Message(role, content, text, self.token_estimator(text))
+
+    def _append(self, message: Message) -> None:
+        self.messages.append(message)
+        self._cost += message.cost
+        self._rendered = None
+
+    def _evict(self) -> None:
+        message = self.messages.popleft()
+        self._cost -= message.cost
+        self._trimmed = True
+        self._rendered = None
+
+    @property
+    def chat_history(self) -> str:
+        """The retained history as one string, rendered on demand and cached."""
+        if self._rendered is None:
+            self._rendered = "".join(message.text for message in self.messages)
+        return self._rendered
+
+    @chat_history.setter
+    def chat_history(self, value: str) -> None:
+        self.messages.clear()
+        self._cost = 0
+        self._trimmed = False
+        self._rendered = None
+        for chunk in self._split_text(value):
+            self._append(self._message("text", chunk))
+
+    @staticmethod
+    def _split_text(history: str) -> List[str]:
+        """Cut plain-text history at turn boundaries so it can be trimmed per turn."""
+        return [chunk for chunk in re.split(r"(?=\nUser : )", history) if chunk]
+
+    def iter_messages(self) -> Iterator[Dict[str, str]]:
+        """Retained messages as ``{"role": ..., "content": ...}`` dicts, oldest first."""
+        return (message.to_dict() for message in self.messages)
+
+    # -- file ---------------------------------------------------------------
+
     def load_conversation(self, filepath: str, exists: bool = True) -> None:
-        """Load conversation history from a text file.
+        """Load conversation history from a JSONL log or a legacy text file.
 
         Args:
             filepath (str): Path to the history file
@@ -71,47 +186,92 @@ class Conversation:
             os.path.isfile(filepath) if exists else True
         ), f"File '{filepath}' does not exist"
 
-        if not os.path.isfile(filepath):
-            with open(filepath, "w", encoding="utf-8") as fh:
-                fh.write(self.intro)
+        self.close()
+        self.file = filepath
+        if not os.path.isfile(filepath) or os.path.getsize(filepath) == 0:
+            self._log_format = "jsonl"
+            self._write({"role": "intro", "content": self.intro})
+            return
+
+        with open(filepath, encoding="utf-8") as fh:
+            first_line = fh.readline()
+            try:
+                record = json.loads(first_line)
+                self._log_format = "jsonl" if isinstance(record, dict) and "role" in record else "text"
+            except ValueError:
+                self._log_format = "text"
+
+            if self._log_format == "text":
+                # The first line is the intro; its newline also opens the first turn.
+                self.intro = first_line.rstrip("\n")
+                history = fh.read()
+                self.chat_history = "\n" + history if history and first_line.endswith("\n") else history
+                return
+
+            self.chat_history = ""
+            for line in [first_line, *fh]:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn last line from a crash mid-write
+                    continue
+                if record.get("role") == "intro":
+                    self.intro = record.get("content", "")
+                elif record.get("role") in self.role_formats:
+                    self._append(self._message(record["role"], record.get("content", "")))
+
+    def _write(self, *records: Dict[str, str]) -> None:
+        """Append records to the history file through one long-lived buffered handle."""
+        if self._log is None:
+            self._log = open(self.file, "a", encoding="utf-8")
+            _open_logs.add(self)
+        if self._log_format == "jsonl":
+            for record in records:
+                self._log.write(json.dumps(record, ensure_ascii=False) + "\n")
         else:
-            with open(filepath, encoding="utf-8") as fh:
-                file_contents = fh.readlines()
-                if file_contents:
-                    self.intro = file_contents[0]  # First line is intro
-                    self.chat_history = "\n".join(file_contents[1:])
-    
-    def __trim_chat_history(self, chat_history: str, intro: str) -> str:
-        """Keep the chat history fresh by trimming it when it gets too long! 
-
-        This method makes sure we don't exceed our token limits by:
-        - Calculating total length (intro + history)
-        - Trimming older messages if needed
-        - Keeping the convo smooth and within limits
+            for record in records:
+                self._log.write(self.role_formats[record["role"]] % record["content"])
+        self._log.flush()
+
+    def close(self) -> None:
+        """Close the history file; it is reopened on the next write."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+            _open_logs.discard(self)
+
+    # -- prompts ------------------------------------------------------------
+
+    def _cost_of_intro(self, intro: str) -> int:
+        cached_intro, cost = self._intro_cost
+        if cached_intro is not intro:
+            cost = self.token_estimator(intro)
+            self._intro_cost = (intro, cost)
+        return cost
+
+    def __trim_chat_history(self, turn_cost: int, intro: str) -> None:
+        """Keep the chat history fresh by evicting the oldest messages that no longer fit.
+
+        The intro, the history, the new turn and the response budget
+        (``max_tokens_to_sample``) together must stay within ``history_offset``.
+        Messages are dropped whole, oldest first, until they do; the running
+        total makes this O(1) per evicted message.
 
         Args:
-            chat_history (str): The current chat history to trim
+            turn_cost (int): Cost of the new, not yet answered turn
             intro (str): The conversation's intro/system prompt
-
-        Returns:
-            str: The trimmed chat history, ready to use! 
-
-        Examples:
-            >>> chat = Conversation(max_tokens=500)
-            >>> trimmed = chat._Conversation__trim_chat_history("Hello! Hi!", "Intro")
         """
-        len_of_intro = len(intro)
-        len_of_chat_history = len(chat_history)
-        total = self.max_tokens_to_sample + len_of_intro + len_of_chat_history
-
-        if total > self.history_offset:
-            truncate_at = (total - self.history_offset) + self.prompt_allowance
-            trimmed_chat_history = chat_history[truncate_at:]
-            return "... " + trimmed_chat_history
-        return chat_history
+        fixed = self.max_tokens_to_sample + self._cost_of_intro(intro) + turn_cost
+        if fixed + self._cost <= self.history_offset:
+            return
+        budget = self.history_offset - self.prompt_allowance - fixed
+        while self.messages and self._cost > budget:
+            self._evict()
 
     def gen_complete_prompt(self, prompt: str, intro: Optional[str] = None) -> str:
-        """Generate a complete prompt that's ready to go! 
+        """Generate a complete prompt that's ready to go!
 
         This method:
         - Combines the intro, history, and new prompt
@@ -123,7 +283,7 @@ class Conversation:
             intro (str, optional): Custom intro to use. Default: None (uses class intro)
 
         Returns:
-            str: The complete conversation prompt, ready for the LLM! 
+            str: The complete conversation prompt, ready for the LLM!
 
         Examples:
             >>> chat = Conversation()
@@ -136,23 +296,19 @@ class Conversation:
             "You're a Large Language Model for chatting with people. "
             "Assume role of the LLM and give your response."
         )
-        
-        incomplete_chat_history = self.chat_history + self.history_format % {
-            "user": prompt,
-            "llm": ""
-        }
-        complete_prompt = intro + self.__trim_chat_history(incomplete_chat_history, intro)
-        # logger.info(f"Generated prompt: {complete_prompt}")
-        return complete_prompt
+
+        turn = self.history_format % {"user": prompt, "llm": ""}
+        self.__trim_chat_history(self.token_estimator(turn), intro)
+        return intro + ("... " if self._trimmed else "") + self.chat_history + turn
 
     def update_chat_history(
         self, prompt: str, response: str, force: bool = False
     ) -> None:
-        """Keep the conversation flowing by updating the chat history! 
+        """Keep the conversation flowing by updating the chat history!
 
         This method:
-        - Adds new messages to the history
-        - Updates the file if needed
+        - Adds the turn to the history
+        - Appends it to the file if needed
         - Keeps everything organized
 
         Args:
@@ -167,23 +323,14 @@ class Conversation:
         if not self.status and not force:
             return
 
-        new_history = self.history_format % {"user": prompt, "llm": response}
-        
+        user, llm = self._message("user", prompt), self._message("llm", response)
         if self.file and self.update_file:
-            # Create file if it doesn't exist
-            if not os.path.exists(self.file):
-                with open(self.file, "w", encoding="utf-8") as fh:
-                    fh.write(self.intro + "\n")
-            
-            # Append new history
-            with open(self.file, "a", encoding="utf-8") as fh:
-                fh.write(new_history)
-        
-        self.chat_history += new_history
-        # logger.info(f"Chat history updated with prompt: {prompt}")
+            self._write(user.to_dict(), llm.to_dict())
+        self._append(user)
+        self._append(llm)
 
     def add_message(self, role: str, content: str) -> None:
-        """Add a new message to the chat - simple and clean! 
+        """Add a new message to the chat - simple and clean!
 
         This method:
         - Validates the message role
@@ -194,39 +341,24 @@ class Conversation:
             role (str): Who's sending? ('user', 'llm', 'tool', or 'reasoning')
             content (str): What's the message?
 
+        Raises:
+            ValueError: On an unknown role or empty content
+
         Examples:
             >>> chat = Conversation()
             >>> chat.add_message("user", "Hey there!")
             >>> chat.add_message("llm", "Hi! How can I help?")
         """
         if not self.validate_message(role, content):
-            raise ValueError("Invalid message role or content")
-
-        role_formats = {
-            "user": "User",
-            "llm": "LLM",
-            "tool": "Tool",
-            "reasoning": "Reasoning"
-        }
-
-        if role in role_formats:
-            self.chat_history += f"\n{role_formats[role]} : {content}"
-        else:
-            raise ValueError(f"Invalid role: {role}. Must be one of {list(role_formats.keys())}")
-
-    #     # Enhanced logging for message addition
-    #     logger.info(f"Added message from {role}: {content}")
-    #     logging.info(f"Message added: {role}: {content}")
-
-    # def validate_message(self, role: str, content: str) -> bool:
-    #     """Validate the message role and content."""
-    #     valid_roles = {'user', 'llm', 'tool', 'reasoning'}
-    #     if role not in valid_roles:
-    #         logger.error(f"Invalid role: {role}")
-    #         return False
-    #     if not content:
-    #         logger.error("Content cannot be empty.")
-    #         return False
-    #     return True
+            raise ValueError(
+                f"Invalid message role or content. Role must be one of {list(self.role_formats)[:-1]}"
+            )
 
+        message = self._message(role, content)
+        if self.file and self.update_file:
+            self._write(message.to_dict())
+        self._append(message)
 
+    def validate_message(self, role: str, content: str) -> bool:
+        """Validate the message role and content."""
+        return role in self.role_formats and role != "text" and bool(content)
@@ -0,0 +1,346 @@
+"""
+Federated web search: one query, several engines, one ranked list.
+
+>>> from webscout.federated_search import FederatedSearch
+>>> search = FederatedSearch(timeout=4)
+>>> for r in search.search("python asyncio tutorial", max_results=10):
+...     print(r["score"], r["engines"], r["href"])
+>>> search.last_report["google"]["status"]
+'ok'
+
+The query goes to every engine at once (DuckDuckGo through
+:class:`~webscout.WEBS`, :class:`~webscout.GoogleS` and
+:class:`~webscout.YepSearch` by default). Results are normalised to
+``title``/``href``/``body``, deduplicated by :func:`canonical_url`, and
+merged with reciprocal rank fusion. A result that several engines rank well
+comes first.
+
+The call returns as soon as ``quorum`` engines have answered or the
+``timeout`` budget runs out, whichever comes first, so it takes about as long
+as the fastest engines rather than the slowest. An engine that answers with a
+rate-limit error is left out of later searches for ``cooldown`` seconds
+instead of failing them.
+"""
+
+import math
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+from webscout.exceptions import RatelimitE, WebscoutE
+
+Engine = Callable[[str, int], List[Dict[str, Any]]]
+
+RRF_K = 60
+
+# Query parameters that only track the click and never select content
+_TRACKING_PARAMS = re.compile(r"^(utm_\w+|gclid|fbclid|msclkid|yclid|mc_cid|mc_eid|ref|ref_src|_ga)$", re.I)
+
+# Redirect wrappers engines put around result links: (host suffix, path, parameter holding the target)
+_REDIRECTS = (
+    ("google.com", "/url", ("q", "url")),
+    ("duckduckgo.com", "/l/", ("uddg",)),
+    ("bing.com", "/ck/a", ("u",)),
+)
+
+
+def _unwrap(parts) -> Optional[str]:
+    """Target of an engine's click-tracking redirect link, if ``parts`` is one."""
+    host = (parts.hostname or "").lower()
+    for suffix, path, keys in _REDIRECTS:
+        if (host == suffix or host.endswith("." + suffix)) and parts.path == path:
+            query = dict(parse_qsl(parts.query))
+            for key in keys:
+                if query.get(key, "").startswith(("http://", "https://")):
+                    return query[key]
+    return None
+
+
+def canonical_url(url: str) -> str:
+    """
+    Key identifying the page a result links to, whatever engine returned it.
+
+    Unwraps redirect links, ignores the scheme, ``www.``, default ports,
+    fragments, trailing slashes and tracking parameters, and sorts the
+    remaining query.
+
+    >>> canonical_url("https://www.Example.com:443/a/?utm_source=x&b=2&a=1#top")
+    'example.com/a?a=1&b=2'
+
+    Args:
+        url: Result link as returned by an engine
+
+    Returns:
+        str: Canonical form; an empty string for an empty url
+    """
+    if not url:
+        return ""
+    if url.startswith("/url?"):
+        url = "https://www.google.com" + url
+    parts = urlsplit(url.strip())
+    target = _unwrap(parts)
+    if target:
+        parts = urlsplit(target)
+
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    path = re.sub(r"/{2,}", "/", unquote(parts.path)).rstrip("/")
+    query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query) if not _TRACKING_PARAMS.match(k)))
+    return urlunsplit(("", host, path, query, "")).lstrip("/")
+
+
+def _normalize(raw: Dict[str, Any]) -> Dict[str, str]:
+    """Common title/href/body fields of an engine's result."""
+    return {
+        "title": str(raw.get("title") or ""),
+        "href": str(raw.get("href") or raw.get("url") or raw.get("link") or ""),
+        "body": str(raw.get("body") or raw.get("abstract") or raw.get("snippet") or ""),
+    }
+
+
+def _is_ratelimit(ex: BaseException) -> bool:
+    if isinstance(ex, RatelimitE):
+        return True
+    response = getattr(ex, "response", None)
+    if getattr(response, "status_code", None) in (429, 503):
+        return True
+    return "429" in str(ex) or "ratelimit" in str(ex).lower().replace(" ", "").replace("-", "")
+
+
+def default_engines(timeout: int = 10) -> Dict[str, Engine]:
+    """
+    DuckDuckGo, Google and Yep, each client created on first use.
+
+    Args:
+        timeout: Request timeout passed to every client
+
+    Returns:
+        Dict[str, Engine]: Engine name to ``engine(query, max_results)`` callable
+    """
+    clients: Dict[str, Any] = {}
+    lock = threading.Lock()
+
+    def client(name: str, factory: Callable[[], Any]) -> Any:
+        with lock:
+            if name not in clients:
+                clients[name] = factory()
+            return clients[name]
+
+    def duckduckgo(query: str, max_results: int) -> List[Dict[str, Any]]:
+        from webscout.webscout_search import WEBS
+
+        return client("duckduckgo", lambda: WEBS(timeout=timeout)).text(query, max_results=max_results)
+
+    def google(query: str, max_results: int) -> List[Dict[str, Any]]:
+        from webscout.DWEBS import GoogleS
+
+        return client("google", lambda: GoogleS(timeout=timeout)).search(query, max_results=max_results)
+
+    def yep(query: str, max_results: int) -> List[Dict[str, Any]]:
+        from webscout.yep_search import YepSearch
+
+        return client("yep", lambda: YepSearch(timeout=timeout)).text(query, max_results=max_results)
+
+    return {"duckduckgo": duckduckgo, "google": google, "yep": yep}
+
+
+class FederatedSearch:
+    """Fans a query out to several search engines and fuses their rankings.
+
+    Merged results carry ``title``, ``href`` and ``body`` from the engine that
+    ranked them highest. They also carry ``engines`` (the engines that
+    returned them), ``ranks`` (1-based rank per engine) and ``score``, the
+    reciprocal rank fusion score ``sum(weight / (k + rank))``.
+
+    Attributes:
+        engines (Dict[str, Engine]): Engine name to ``engine(query, max_results)`` callable
+        weights (Dict[str, float]): Per-engine weight in the fusion, 1.0 if missing
+        last_report (Dict[str, Dict[str, Any]]): Per-engine outcome of the last search:
+            ``status`` (ok, error, ratelimited, skipped, timeout, or pending when the quorum was
+            reached first), ``latency``, ``count``, ``error``, as of when the search returned
+    """
+
+    def __init__(
+        self,
+        engines: Optional[Dict[str, Engine]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        quorum: Optional[int] = None,
+        timeout: float = 5.0,
+        cooldown: float = 60.0,
+        k: int = RRF_K,
+        max_workers: int = 8,
+    ):
+        """
+        Args:
+            engines (Dict[str, Engine], optional): Engines to query. Defaults to None, :func:`default_engines`
+                with ``timeout`` as their request timeout.
+            weights (Dict[str, float], optional): Per-engine weights in the fusion. Defaults to None, all 1.0.
+            quorum (int, optional): Answers to wait for before merging. Defaults to None, two engines
+                (or all of them, if fewer).
+            timeout (float, optional): Latency budget in seconds. Defaults to 5.0.
+            cooldown (float, optional): Seconds a rate-limited engine is left out. Defaults to 60.0.
+            k (int, optional): Reciprocal rank fusion constant. Defaults to 60.
+            max_workers (int, optional): Threads running engine calls. Defaults to 8.
+        """
+        # Requests outliving the budget would only keep workers busy
+        self.engines = engines if engines is not None else default_engines(timeout=max(1, math.ceil(timeout)))
+        if not self.engines:
+            raise ValueError("At least one engine is required")
+        self.weights = weights or {}
+        self.quorum = quorum
+        self.timeout = timeout
+        self.cooldown = cooldown
+        self.k = k
+        self.last_report: Dict[str, Dict[str, Any]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="webscout-federated")
+        self._cooling: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "FederatedSearch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._executor.shutdown(wait=False)
+
+    def _available(self) -> List[str]:
+        """Engines not cooling down after a rate limit; all of them if every one is."""
+        now = time.monotonic()
+        with self._lock:
+            ready = [name for name in self.engines if self._cooling.get(name, 0.0) <= now]
+        return ready or list(self.engines)
+
+    def _call(
+        self, report: Dict[str, Dict[str, Any]], name: str, query: str, max_results: int
+    ) -> List[Dict[str, Any]]:
+        start = time.monotonic()
+        try:
+            results = self.engines[name](query, max_results) or []
+        except Exception as ex:
+            limited = _is_ratelimit(ex)
+            if limited:
+                with self._lock:
+                    self._cooling[name] = time.monotonic() + self.cooldown
+            report[name] = {
+                "status": "ratelimited" if limited else "error",
+                "latency": time.monotonic() - start,
+                "count": 0,
+                "error": f"{type(ex).__name__}: {ex}",
+            }
+            raise
+        with self._lock:
+            self._cooling.pop(name, None)
+        report[name] = {"status": "ok", "latency": time.monotonic() - start, "count": len(results)}
+        return results
+
+    def fuse(self, rankings: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Merge per-engine result lists with reciprocal rank fusion.
+
+        Args:
+            rankings: Engine name to its results, best first
+
+        Returns:
+            List[Dict[str, Any]]: Merged results, best score first
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        for name, results in rankings.items():
+            weight = self.weights.get(name, 1.0)
+            rank = 0
+            for raw in results:
+                result = _normalize(raw)
+                key = canonical_url(result["href"])
+                if not key:
+                    continue
+                entry = merged.get(key)
+                if entry is not None and name in entry["ranks"]:
+                    # The engine repeated itself; its best rank counts
+                    continue
+                rank += 1
+                if entry is None:
+                    entry = merged[key] = {**result, "engines": [], "ranks": {}, "score": 0.0, "_best": rank}
+                elif rank < entry["_best"] or not entry["body"]:
+                    entry.update(title=result["title"] or entry["title"], body=result["body"] or entry["body"])
+                    entry["_best"] = min(entry["_best"], rank)
+                entry["engines"].append(name)
+                entry["ranks"][name] = rank
+                entry["score"] += weight / (self.k + rank)
+
+        fused = sorted(merged.values(), key=lambda entry: (-entry["score"], entry["_best"]))
+        for entry in fused:
+            del entry["_best"]
+        return fused
+
+    def search(
+        self,
+        query: str,
+        max_results: int = 10,
+        per_engine: Optional[int] = None,
+        quorum: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search every available engine at once and return the fused ranking.
+
+        Args:
+            query: Search query
+            max_results: Merged results to return. Defaults to 10.
+            per_engine: Results asked from each engine. Defaults to None, ``max_results``.
+            quorum: Overrides the instance's quorum for this call
+            timeout: Overrides the instance's latency budget for this call
+
+        Returns:
+            List[Dict[str, Any]]: Up to ``max_results`` merged results
+
+        Raises:
+            WebscoutE: If no engine answered within the budget
+        """
+        assert query, "query is mandatory"
+        names = self._available()
+        per_engine = per_engine or max_results
+        timeout = self.timeout if timeout is None else timeout
+        quorum = quorum or self.quorum or min(2, len(self.engines))
+        quorum = min(quorum, len(names))
+
+        # Each search gets its own report, so a straggler finishing late can't touch the next one's
+        report = {name: {"status": "skipped", "latency": 0.0, "count": 0} for name in self.engines}
+        self.last_report = report
+        start = time.monotonic()
+        futures: Dict[Future, str] = {
+            self._executor.submit(self._call, report, name, query, per_engine): name for name in names
+        }
+        rankings: Dict[str, List[Dict[str, Any]]] = {}
+        errors: List[str] = []
+        deadline = start + timeout
+        pending = set(futures)
+        while pending and len(rankings) < quorum:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    rankings[futures[future]] = future.result()
+                except Exception as ex:
+                    errors.append(f"{futures[future]}: {ex}")
+        # Engines that answered while the last ones were being collected still count
+        for future in [f for f in pending if f.done()]:
+            pending.discard(future)
+            if future.exception() is None:
+                rankings[futures[future]] = future.result()
+        elapsed = time.monotonic() - start
+        for future in pending:
+            status = "timeout" if elapsed >= timeout else "pending"
+            report[futures[future]] = {"status": status, "latency": elapsed, "count": 0}
+        # Stragglers keep writing to ``report`` when they finish; last_report keeps the outcome seen here
+        self.last_report = {name: dict(entry) for name, entry in report.items()}
+
+        if not rankings:
+            raise WebscoutE(f"No engine answered for {query!r}: " + ("; ".join(errors) or "timed out"))
+        ordered = {name: rankings[name] for name in names if name in rankings}
+        return self.fuse(ordered)[:max_results]
@@ -0,0 +1,52 @@
+"""
+Lazy attribute loading for packages.
+
+A package calls :func:`install` at the end of its ``__init__`` with a table of
+exported names. Names are imported from their defining module on first access
+and cached on the package, so ``import webscout`` only pays for what is used.
+"""
+
+import importlib
+import sys
+import types
+from typing import Any, Dict, List
+
+
+class LazyModule(types.ModuleType):
+    """Module type that resolves exported names on first attribute access."""
+
+    def __getattr__(self, name: str) -> Any:
+        exports = self.__dict__.get("_lazy_exports", {})
+        if name not in exports:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], self.__name__), name)
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # The import system binds submodules on their parent. Several exports
+        # share their module's name (``webscout.LLM``, ``Provider.OLLAMA``); keep
+        # those resolving to the exported object, as the eager imports did.
+        if (
+            isinstance(value, types.ModuleType)
+            and name in self.__dict__.get("_lazy_exports", {})
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            return
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(self.__dict__) | set(self.__dict__.get("_lazy_exports", {})))
+
+
+def install(module_name: str, exports: Dict[str, str]) -> None:
+    """
+    Makes a module resolve ``exports`` lazily.
+
+    Args:
+        module_name: ``__name__`` of the module to convert
+        exports: Mapping of exported name to the (relative) module defining it
+    """
+    module = sys.modules[module_name]
+    module.__class__ = LazyModule
+    module.__dict__["_lazy_exports"] = exports
@@ -1,7 +1,5 @@
-import importlib
-import pkgutil
 from typing import Dict, List, Any, Union
-from webscout.AIbase import Provider, TTSProvider
+from webscout.Provider.manifest import PROVIDERS, TTS_PROVIDERS
 
 class _LLMModels:
     """
@@ -59,22 +57,11 @@ class _LLMModels:
             Dictionary mapping provider names to their available models
         """
         provider_models = {}
-        provider_package = importlib.import_module("webscout.Provider")
-        
-        for _, module_name, _ in pkgutil.iter_modules(provider_package.__path__):
-            try:
-                module = importlib.import_module(f"webscout.Provider.{module_name}")
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if isinstance(attr, type) and issubclass(attr, Provider) and attr != Provider:
-                        if hasattr(attr, 'AVAILABLE_MODELS'):
-                            # Convert any sets to lists to ensure serializability
-                            models = attr.AVAILABLE_MODELS
-                            if isinstance(models, set):
-                                models = list(models)
-                            provider_models[attr_name] = models
-            except Exception:
-                pass
+        
+        # Read from the static manifest so listing models doesn't import providers
+        for provider_name, entry in PROVIDERS.items():
+            if not entry["is_async"] and entry["models"] is not None:
+                provider_models[provider_name] = entry["models"]
         
         return provider_models
 
@@ -145,25 +132,8 @@ class _TTSModels:
         """
         provider_voices = {}
         
-        try:
-            # Import the TTS package specifically
-            tts_package = importlib.import_module("webscout.Provider.TTS")
-            
-            # Iterate through TTS modules
-            for _, module_name, _ in pkgutil.iter_modules(tts_package.__path__):
-                try:
-                    module = importlib.import_module(f"webscout.Provider.TTS.{module_name}")
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if isinstance(attr, type) and issubclass(attr, TTSProvider) and attr != TTSProvider:
-                            # TTS providers typically use 'all_voices' instead of 'AVAILABLE_MODELS'
-                            if hasattr(attr, 'all_voices'):
-                                voices = attr.all_voices
-                                provider_voices[attr_name] = voices
-                except Exception as e:
-                    pass
-        except Exception as e:
-            pass
+        for provider_name, entry in TTS_PROVIDERS.items():
+            provider_voices[provider_name] = entry["voices"]
         
         return provider_voices
 
@@ -2,16 +2,90 @@
 
 import os
 import json
-import requests
+import threading
+import time
 from typing import Optional, Dict, Union
-from rich.console import Console
-from rich.table import Table
 from datetime import datetime
 
-console = Console()
+# Refresh the local copy in the background at most this often (seconds)
+REFRESH_INTERVAL = 24 * 3600
+
+
+class _Console:
+    """Defers importing rich until something is actually printed."""
+
+    def __getattr__(self, name):
+        from rich.console import Console
+        console = Console()
+        globals()["console"] = console
+        return getattr(console, name)
+
+
+console = _Console()
+
+
+class _PromptStore:
+    """Process-wide cache of one prompts file, re-read only when its mtime changes."""
+
+    _stores: Dict[str, "_PromptStore"] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.RLock()
+        self.prompts: Dict[Union[str, int], str] = {}
+        self.mtime: Optional[float] = None
+        self.refreshing = False
+        self.refreshed_at: Optional[float] = None
+
+    @classmethod
+    def for_path(cls, path: str) -> "_PromptStore":
+        with cls._stores_lock:
+            store = cls._stores.get(path)
+            if store is None:
+                store = cls._stores[path] = cls(path)
+            return store
+
+    def load(self) -> Dict[Union[str, int], str]:
+        """Return the prompts, re-reading the file only if it changed on disk."""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return self.prompts
+        with self.lock:
+            if mtime != self.mtime:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.prompts = json.load(f)
+                self.mtime = mtime
+            return self.prompts
+
+    def save(self, prompts: Dict[Union[str, int], str]) -> None:
+        """Atomically replace the file so concurrent readers never see half a write."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self.lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(prompts, f, indent=4, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self.prompts = prompts
+            self.mtime = os.stat(self.path).st_mtime
+
+    def is_stale(self) -> bool:
+        try:
+            return time.time() - os.stat(self.path).st_mtime > REFRESH_INTERVAL
+        except OSError:
+            return True
+
 
 class AwesomePrompts:
-    """The most awesome prompts manager you'll ever see fr fr! 🔥"""
+    """The most awesome prompts manager you'll ever see fr fr! 🔥
+
+    Prompts are read from a local file that is shared by every instance in the
+    process, so creating one costs no I/O beyond a ``stat``. The local copy is
+    refreshed from ``repo_url`` in a background thread with a conditional
+    request (ETag / If-Modified-Since); the only blocking download is the first
+    lookup on a machine that has no local copy yet.
+    """
     
     def __init__(
         self,
@@ -24,7 +98,7 @@ class AwesomePrompts:
         Args:
             repo_url (str): URL to fetch prompts from
             local_path (str, optional): Where to save them prompts locally
-            auto_update (bool): Auto update prompts on init. Defaults to True
+            auto_update (bool): Refresh stale prompts in the background. Defaults to True
         """
         self.repo_url = repo_url
         self.local_path = local_path or os.path.join(
@@ -32,36 +106,118 @@ class AwesomePrompts:
             ".webscout",
             "awesome-prompts.json"
         )
-        self._cache: Dict[Union[str, int], str] = {}
+        self._store = _PromptStore.for_path(self.local_path)
         self._last_update: Optional[datetime] = None
+        self.auto_update = auto_update
         
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.local_path), exist_ok=True)
-        
-        # Load those prompts on init if auto_update is True
         if auto_update:
-            self.update_prompts_from_online()
-    
+            self.refresh_in_background()
+
     def _load_prompts(self) -> Dict[Union[str, int], str]:
         """Load prompts from the local file fr fr! 📂"""
         try:
-            if os.path.exists(self.local_path):
-                with open(self.local_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return {}
+            return self._store.load()
         except Exception as e:
             console.print(f"[red]❌ Error loading prompts: {str(e)}[/red]")
             return {}
     
-    def _save_prompts(self, prompts: Dict[Union[str, int], str]) -> None:
+    def _save_prompts(self, prompts: Dict[Union[str, int], str], quiet: bool = False) -> None:
         """Save them prompts with style! 💾"""
         try:
-            with open(self.local_path, 'w', encoding='utf-8') as f:
-                json.dump(prompts, f, indent=4, ensure_ascii=False)
-            self._cache = prompts
-            console.print("[green]✨ Prompts saved successfully![/green]")
+            self._store.save(prompts)
+            if not quiet:
+                console.print("[green]✨ Prompts saved successfully![/green]")
         except Exception as e:
             console.print(f"[red]❌ Error saving prompts: {str(e)}[/red]")
+
+    def _meta_path(self) -> str:
+        return f"{self.local_path}.meta"
+
+    def _fetch(self, force: bool = False) -> bool:
+        """Conditionally download prompts and merge them into the local file.
+
+        Returns:
+            bool: True if the local copy is now current (updated or not modified)
+        """
+        import requests
+
+        headers = {}
+        meta = {}
+        if not force and os.path.exists(self.local_path):
+            try:
+                with open(self._meta_path(), 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = requests.get(self.repo_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            # Touch the file so the staleness check restarts its clock
+            os.utime(self.local_path)
+            return True
+        response.raise_for_status()
+
+        # Merge new prompts with existing ones
+        new_prompts = response.json()
+        existing_prompts = self._load_prompts()
+        merged_prompts = {**existing_prompts, **new_prompts}
+        
+        # Create a new dictionary for numeric indices
+        indexed_prompts = merged_prompts.copy()
+        
+        # Add indices for numeric access
+        for i, (key, value) in enumerate(list(merged_prompts.items())):
+            if isinstance(key, str):
+                indexed_prompts[i] = value
+        
+        self._save_prompts(indexed_prompts, quiet=True)
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        with open(self._meta_path(), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        return True
+
+    def refresh_in_background(self) -> None:
+        """Refresh a missing or stale local copy without blocking the caller.
+
+        At most one refresh per file runs at a time, and a file is only
+        considered once per ``REFRESH_INTERVAL`` in a given process.
+        """
+        store = self._store
+        with store.lock:
+            recently = store.refreshed_at and time.time() - store.refreshed_at < REFRESH_INTERVAL
+            if store.refreshing or recently or not store.is_stale():
+                return
+            store.refreshing = True
+
+        def run():
+            try:
+                self._fetch()
+            except Exception:
+                pass  # Offline is fine, the local copy (if any) keeps working
+            finally:
+                with store.lock:
+                    store.refreshing = False
+                    store.refreshed_at = time.time()
+
+        threading.Thread(target=run, name="awesome-prompts-refresh", daemon=True).start()
+
+    def _ensure_loaded(self) -> Dict[Union[str, int], str]:
+        """Return the prompts, downloading them first if there is no local copy."""
+        prompts = self._load_prompts()
+        if not prompts and not os.path.exists(self.local_path):
+            try:
+                self._fetch()
+            except Exception as e:
+                console.print(f"[red]❌ Error updating prompts: {str(e)}[/red]")
+            prompts = self._load_prompts()
+        return prompts
     
     def update_prompts_from_online(self, force: bool = False) -> bool:
         """Update prompts from the repo! 🚀
@@ -80,23 +236,7 @@ class AwesomePrompts:
                 return True
                 
             console.print("[cyan]🔄 Updating prompts...[/cyan]")
-            response = requests.get(self.repo_url, timeout=10)
-            response.raise_for_status()
-            
-            # Merge new prompts with existing ones
-            new_prompts = response.json()
-            existing_prompts = self._load_prompts()
-            merged_prompts = {**existing_prompts, **new_prompts}
-            
-            # Create a new dictionary for numeric indices
-            indexed_prompts = merged_prompts.copy()
-            
-            # Add indices for numeric access
-            for i, (key, value) in enumerate(list(merged_prompts.items())):
-                if isinstance(key, str):
-                    indexed_prompts[i] = value
-            
-            self._save_prompts(indexed_prompts)
+            self._fetch(force=force)
             self._last_update = datetime.now()
             
             console.print("[green]✨ Prompts updated successfully![/green]")
@@ -110,7 +250,8 @@ class AwesomePrompts:
         self,
         key: Union[str, int],
         default: Optional[str] = None,
-        case_insensitive: bool = True
+        case_insensitive: bool = True,
+        raise_not_found: bool = False
     ) -> Optional[str]:
         """Get that perfect prompt! 🎯
 
@@ -118,11 +259,12 @@ class AwesomePrompts:
             key: Prompt name or index
             default: Default value if not found
             case_insensitive: Match case exactly?
+            raise_not_found: Raise KeyError instead of returning the default?
 
         Returns:
             str: The prompt or default value
         """
-        prompts = self._cache or self._load_prompts()
+        prompts = self._ensure_loaded()
         
         # Try direct access first
         if key in prompts:
@@ -135,6 +277,8 @@ class AwesomePrompts:
                 if isinstance(k, str) and k.lower() == key_lower:
                     return v
         
+        if raise_not_found:
+            raise KeyError(f"Prompt '{key}' not found!")
         return default
     
     def add_prompt(self, name: str, prompt: str) -> bool:
@@ -151,7 +295,7 @@ class AwesomePrompts:
             console.print("[red]❌ Name and prompt cannot be empty![/red]")
             return False
             
-        prompts = self._cache or self._load_prompts()
+        prompts = dict(self._load_prompts())
         prompts[name] = prompt
         self._save_prompts(prompts)
         return True
@@ -172,7 +316,7 @@ class AwesomePrompts:
         Returns:
             bool: Success status
         """
-        prompts = self._cache or self._load_prompts()
+        prompts = dict(self._load_prompts())
         
         # Handle direct key match
         if name in prompts:
@@ -201,10 +345,7 @@ class AwesomePrompts:
         Returns:
             dict: All prompts with their indices
         """
-        prompts = self._cache or self._load_prompts()
-        if not prompts:
-            self.update_prompts_from_online()
-            prompts = self._load_prompts()
+        prompts = self._ensure_loaded()
             
         # Create a new dictionary for the result
         result = prompts.copy()
@@ -224,6 +365,8 @@ class AwesomePrompts:
         """
         prompts = self.all_acts
         
+        from rich.table import Table
+
         # Create a fire table! 🔥
         table = Table(
             title="🚀 Awesome Prompts Collection",
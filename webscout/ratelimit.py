@@ -0,0 +1,334 @@
+"""
+Client-side rate limiting.
+
+>>> from webscout import ratelimit
+>>> bucket = ratelimit.bucket("GROQ", rate=5)      # 5 requests/second, shared
+>>> bucket.acquire()                               # blocks until a token is free
+>>> await bucket.aacquire()                        # same, without blocking the loop
+
+Buckets returned by :func:`bucket` are shared process-wide by key, so every
+batch or worker that talks to the same provider draws from the same budget.
+
+:func:`for_host` does the same per remote host, with limiters that back off
+when the host answers with 429/202 and recover afterwards:
+
+>>> limiter = ratelimit.for_host("https://html.duckduckgo.com/html")
+>>> limiter.acquire()
+>>> ratelimit.metrics()["html.duckduckgo.com"]["throttled"]
+0
+
+Clients also cap how many requests are in flight per host at once with
+:func:`host_semaphore` (async) and :func:`host_slots` (threads).
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``; each
+    request takes one.
+
+    Attributes:
+        rate (float): Tokens added per second
+        burst (float): Bucket capacity, the largest burst allowed after idling
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Args:
+            rate (float): Requests per second
+            burst (float, optional): Capacity. Defaults to None, ``max(1, rate)``.
+
+        Raises:
+            ValueError: If ``rate`` isn't positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Bring the token count up to date at the current rate. Call with the lock held."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self, tokens: float) -> float:
+        """Take ``tokens`` now, going into debt if needed; returns the seconds to wait."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` if they are available right now.
+
+        Returns:
+            bool: Whether the tokens were taken
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Take ``tokens``, sleeping until the budget allows it."""
+        delay = self._reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: float = 1.0) -> None:
+        """Async twin of :meth:`acquire`."""
+        delay = self._reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_lock = threading.Lock()
+_buckets: Dict[str, TokenBucket] = {}
+
+
+def bucket(key: str, rate: float, burst: Optional[float] = None) -> TokenBucket:
+    """
+    Returns the shared bucket for ``key``, creating it on first use.
+
+    A later call with a different rate or burst updates the existing bucket.
+
+    Args:
+        key: What is being limited, e.g. a provider class name
+        rate: Requests per second
+        burst: Bucket capacity, see :class:`TokenBucket`
+
+    Returns:
+        TokenBucket
+    """
+    with _lock:
+        limiter = _buckets.get(key)
+        if limiter is None:
+            limiter = _buckets[key] = TokenBucket(rate, burst)
+        elif limiter.rate != rate or (burst is not None and limiter.burst != burst):
+            with limiter._lock:
+                limiter._refill()
+                limiter.rate = float(rate)
+                limiter.burst = float(burst if burst is not None else max(1.0, rate))
+        return limiter
+
+
+class HostLimiter(TokenBucket):
+    """Token bucket for one remote host that backs off when the host pushes back.
+
+    On a throttling response (429, or DuckDuckGo's 202 "slow down") the refill
+    rate is halved, down to ``min_rate``, and the bucket goes into debt for the
+    cool-down, so every caller waits it out. Each success afterwards adds back
+    a tenth of the configured rate until it is reached again.
+
+    Attributes:
+        base_rate (float): Configured rate the limiter recovers to
+        min_rate (float): Floor for the backed-off rate
+        concurrency (int): Max requests in flight at once, see :func:`host_semaphore`
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        min_rate: Optional[float] = None,
+        concurrency: Optional[int] = None,
+    ):
+        """
+        Args:
+            rate (float): Requests per second when the host isn't pushing back
+            burst (float, optional): Capacity, see :class:`TokenBucket`
+            min_rate (float, optional): Backed-off rate floor. Defaults to None, ``rate / 16``.
+            concurrency (int, optional): Max requests in flight. Defaults to None,
+                :data:`DEFAULT_HOST_CONCURRENCY`.
+        """
+        super().__init__(rate, burst)
+        self.base_rate = self.rate
+        self.min_rate = min_rate if min_rate is not None else self.rate / 16
+        self.concurrency = concurrency if concurrency is not None else DEFAULT_HOST_CONCURRENCY
+        self.requests = 0
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.throttled_count = 0
+
+    def _reserve(self, tokens: float) -> float:
+        delay = super()._reserve(tokens)
+        with self._lock:
+            self.requests += 1
+            if delay:
+                self.delayed += 1
+                self.wait_seconds += delay
+        return delay
+
+    def throttled(self, cooldown: float = 5.0) -> None:
+        """Record a throttling response: halve the rate and make every caller wait ``cooldown``."""
+        with self._lock:
+            self._refill()
+            self.throttled_count += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            # Whoever comes next gets the first token once the cool-down is over
+            self._tokens = min(self._tokens, 1.0 - cooldown * self.rate)
+
+    def succeeded(self) -> None:
+        """Record a successful response, recovering the rate after a back-off."""
+        if self.rate < self.base_rate:
+            with self._lock:
+                self._refill()
+                self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current state and counters of the limiter."""
+        with self._lock:
+            self._refill()
+            return {
+                "rate": self.rate,
+                "base_rate": self.base_rate,
+                "burst": self.burst,
+                "tokens": self._tokens,
+                "requests": self.requests,
+                "delayed": self.delayed,
+                "wait_seconds": self.wait_seconds,
+                "throttled": self.throttled_count,
+            }
+
+
+DEFAULT_HOST_RATE = 1.0
+DEFAULT_HOST_BURST = 5.0
+DEFAULT_HOST_CONCURRENCY = 4
+
+_hosts: Dict[str, HostLimiter] = {}
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def _host(url_or_host: str) -> str:
+    return (urlsplit(url_or_host).hostname if "//" in url_or_host else url_or_host).lower()
+
+
+def configure_host(
+    host: str,
+    rate: float,
+    burst: Optional[float] = None,
+    min_rate: Optional[float] = None,
+    concurrency: Optional[int] = None,
+) -> HostLimiter:
+    """
+    Sets the request rate and burst allowed towards ``host``.
+
+    Args:
+        host: Host name or any URL on it
+        rate: Requests per second
+        burst: Requests allowed back to back after idling
+        min_rate: Floor for the backed-off rate
+        concurrency: Requests allowed in flight at once by async clients
+
+    Returns:
+        The host's (new) limiter
+    """
+    limiter = HostLimiter(rate, burst, min_rate, concurrency)
+    host = _host(host)
+    with _lock:
+        _hosts[host] = limiter
+        _slots.pop(host, None)
+        for per_loop in _semaphores.values():
+            per_loop.pop(host, None)
+    return limiter
+
+
+def for_host(url_or_host: str) -> HostLimiter:
+    """
+    Returns the limiter shared by every client talking to a host.
+
+    Hosts not set up with :func:`configure_host` get
+    :data:`DEFAULT_HOST_RATE` requests/second with bursts of
+    :data:`DEFAULT_HOST_BURST`.
+
+    Args:
+        url_or_host: Host name or any URL on it
+
+    Returns:
+        HostLimiter
+    """
+    host = _host(url_or_host)
+    limiter = _hosts.get(host)
+    if limiter is None:
+        with _lock:
+            limiter = _hosts.get(host)
+            if limiter is None:
+                limiter = _hosts[host] = HostLimiter(DEFAULT_HOST_RATE, DEFAULT_HOST_BURST)
+    return limiter
+
+
+def host_semaphore(url_or_host: str) -> asyncio.Semaphore:
+    """
+    Semaphore capping the requests in flight to a host on the running loop.
+
+    Its size is the host limiter's ``concurrency``; the rate itself is still
+    paced by :func:`for_host`.
+
+    Args:
+        url_or_host: Host name or any URL on it
+
+    Returns:
+        asyncio.Semaphore
+    """
+    loop = asyncio.get_running_loop()
+    host = _host(url_or_host)
+    with _lock:
+        per_loop = _semaphores.setdefault(loop, {})
+        semaphore = per_loop.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(for_host(host).concurrency)
+        with _lock:
+            semaphore = per_loop.setdefault(host, semaphore)
+    return semaphore
+
+
+def host_slots(url_or_host: str) -> threading.BoundedSemaphore:
+    """
+    Thread twin of :func:`host_semaphore`, shared by every thread in the process.
+
+    Args:
+        url_or_host: Host name or any URL on it
+
+    Returns:
+        threading.BoundedSemaphore
+    """
+    host = _host(url_or_host)
+    slots = _slots.get(host)
+    if slots is None:
+        concurrency = for_host(host).concurrency
+        with _lock:
+            slots = _slots.setdefault(host, threading.BoundedSemaphore(concurrency))
+    return slots
+
+
+def metrics() -> Dict[str, Dict[str, float]]:
+    """Snapshot of every host limiter in use, keyed by host."""
+    with _lock:
+        limiters = dict(_hosts)
+    return {host: limiter.snapshot() for host, limiter in limiters.items()}
+
+
+def retry_after(headers: Any, default: float = 5.0) -> float:
+    """Seconds from a ``Retry-After`` header (delta-seconds form), else ``default``."""
+    try:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        return max(0.0, float(value)) if value is not None else default
+    except (AttributeError, TypeError, ValueError):
+        return default
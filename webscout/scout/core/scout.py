@@ -6,16 +6,20 @@ import json
 import hashlib
 import unicodedata
 import urllib.parse
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Iterator, Optional, Any, Tuple
 
 from ..parsers import ParserRegistry
 from ..element import Tag, NavigableString
+from ..stream import iterparse
 from ..utils import decode_markup
 from .text_analyzer import ScoutTextAnalyzer
 from .web_analyzer import ScoutWebAnalyzer
 from .search_result import ScoutSearchResult
 from .text_utils import SentenceTokenizer
 
+# Scout(...) keywords handed to the parser; other keywords are ignored
+PARSER_OPTIONS = ('special_nodes',)
+
 
 class Scout:
     """
@@ -24,15 +28,24 @@ class Scout:
     Enhanced with advanced features and intelligent parsing.
     """
     
-    def __init__(self, markup="", features='html.parser', from_encoding=None, **kwargs):
+    def __init__(self, markup="", features='html.parser', from_encoding=None, index=False, **kwargs):
         """
         Initialize Scout with HTML content.
         
         Args:
             markup (str): HTML content to parse
-            features (str): Parser to use ('html.parser', 'lxml', 'html5lib', 'lxml-xml')
+            features (str): Parser to use ('html.parser', 'lxml', 'html5lib', 'lxml-xml').
+                'lxml-lazy' keeps the lxml tree and hands out tags as views
+                of its elements, with find_all/select run as lxml XPath queries.
             from_encoding (str): Source encoding (if known)
-            **kwargs: Additional parsing options
+            index (bool): Index tags by name, class and id while parsing, so
+                find/find_all/select on the document skip the tree walk. The
+                index adds parse time and memory; turn it on for documents
+                queried many times. Defaults to False.
+            **kwargs: Parsing options listed in :data:`PARSER_OPTIONS` are
+                passed to the parser (e.g. ``special_nodes=False`` to drop
+                comment, doctype and processing instruction nodes); other
+                keywords are ignored
         """
         # Intelligent markup handling
         self.markup = self._preprocess_markup(markup, from_encoding)
@@ -45,7 +58,12 @@ class Scout:
                 f"Invalid parser '{features}'! Choose from: {', '.join(ParserRegistry.list_parsers().keys())}"
             )
         
-        parser_class = ParserRegistry.get_parser(features)
+        # Only options that are set reach the parser, so parsers taking no
+        # arguments keep working
+        options = {key: kwargs[key] for key in PARSER_OPTIONS if key in kwargs}
+        if index:
+            options['index'] = True
+        parser_class = ParserRegistry.get_parser(features, **options)
         self.parser = parser_class
         
         # Parse that HTML! 🎯
@@ -61,7 +79,37 @@ class Scout:
         # Text and web analyzers
         self.text_analyzer = ScoutTextAnalyzer()
         self.web_analyzer = ScoutWebAnalyzer()
-    
+
+    @staticmethod
+    def iterparse(source, events=('end',), select: Optional[str] = None, encoding: Optional[str] = None,
+                  **kwargs) -> Iterator[Tuple[str, Any]]:
+        """
+        Parse markup incrementally, without building the whole tree first.
+
+        Yields ``(event, node)`` pairs as tags open ('start') and close
+        ('end') and text completes ('text'). Reading stops as soon as the
+        caller stops iterating; a streaming ``requests`` response is then
+        closed so the rest of the page is never downloaded.
+
+        >>> for _, tag in Scout.iterparse(requests.get(url, stream=True), select="a[href]"):
+        ...     links.append(tag.get("href"))
+        ...     if len(links) == 10:
+        ...         break
+
+        Args:
+            source: str, bytes, file object, iterable of chunks or a
+                ``requests`` response
+            events (Iterable[str]): Events to report. Defaults to ('end',).
+            select (str, optional): Only report tags matching this CSS selector
+            encoding (str, optional): Encoding of byte input (sniffed if not given)
+            **kwargs: Passed to :func:`webscout.scout.stream.iterparse`
+                (``chunk_size``, ``special_nodes``)
+
+        Returns:
+            Iterator[Tuple[str, Any]]: Parse events
+        """
+        return iterparse(source, events=events, select=select, encoding=encoding, **kwargs)
+
     def normalize_text(self, text: str, form='NFKD') -> str:
         """
         Normalize text using Unicode normalization.
@@ -228,13 +276,13 @@ class Scout:
         
         # Open Graph metadata
         for meta in self.find_all('meta', attrs={'property': re.compile(r'^og:')}):
-            key = meta.attrs('property')[0][3:]
-            metadata['og_metadata'][key] = meta.attrs('content')[0]
+            key = meta.get('property')[3:]
+            metadata['og_metadata'][key] = meta.get('content')
         
         # Twitter Card metadata
         for meta in self.find_all('meta', attrs={'name': re.compile(r'^twitter:')}):
-            key = meta.attrs('name')[0][8:]
-            metadata['twitter_metadata'][key] = meta.attrs('content')[0]
+            key = meta.get('name')[8:]
+            metadata['twitter_metadata'][key] = meta.get('content')
         
         return metadata
     
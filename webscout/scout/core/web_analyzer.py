@@ -33,7 +33,7 @@ class ScoutWebAnalyzer:
 
         # Class distribution
         for tag in scout_obj.find_all(attrs={'class': True}):
-            for cls in tag.get('class', []):
+            for cls in tag.get('class', '').split():
                 analysis['class_distribution'][cls] = analysis['class_distribution'].get(cls, 0) + 1
 
         # ID distribution
@@ -3,13 +3,22 @@ Scout Element Module - Advanced HTML Element Representation
 """
 
 import re
+import sys
+from types import MappingProxyType
 from typing import Optional, List, Dict, Union, Any
 
+from .selector import compile_selector
+
+# Read-only stand-in for the attributes of a tag that has none
+_NO_ATTRS = MappingProxyType({})
+
 class NavigableString(str):
     """
     A string that knows its place in the document tree.
     Mimics BeautifulSoup's NavigableString for better compatibility.
     """
+    __slots__ = ('parent',)
+
     def __new__(cls, text: str):
         """
         Create a new NavigableString instance.
@@ -60,7 +69,13 @@ class Tag:
     """
     Represents an HTML tag with advanced traversal and manipulation capabilities.
     Enhanced to closely mimic BeautifulSoup's Tag class.
+
+    Tags are slotted and their names interned, as a page parses into tens of
+    thousands of them. A tag without attributes holds no dict until ``attrs``
+    is first accessed.
     """
+    __slots__ = ('name', '_attrs', 'contents', 'parent', 'string', '_index')
+
     def __init__(self, name: str, attrs: Dict[str, str] = None):
         """
         Initialize a Tag with name and attributes.
@@ -69,11 +84,23 @@ class Tag:
             name (str): Tag name
             attrs (dict, optional): Tag attributes
         """
-        self.name = name
-        self.attrs = attrs or {}
+        self.name = sys.intern(name) if type(name) is str else name
+        self._attrs = attrs or None
         self.contents = []
         self.parent = None
         self.string = None  # For single string content
+        self._index = None  # DocumentIndex, on the root of an indexed document
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        """Tag attributes, as a mutable dict."""
+        if self._attrs is None:
+            self._attrs = {}
+        return self._attrs
+
+    @attrs.setter
+    def attrs(self, value: Dict[str, str]) -> None:
+        self._attrs = value
     
     def __str__(self):
         """String representation of the tag."""
@@ -81,7 +108,7 @@ class Tag:
     
     def __repr__(self):
         """Detailed representation of the tag."""
-        return f"<{self.name} {self.attrs}>"
+        return f"<{self.name} {dict(self._attrs or _NO_ATTRS)}>"
     
     def __call__(self, *args, **kwargs):
         """
@@ -112,7 +139,7 @@ class Tag:
         Returns:
             Any: Attribute value
         """
-        return self.attrs[key]
+        return (self._attrs or _NO_ATTRS)[key]
     
     def __iter__(self):
         """
@@ -137,7 +164,7 @@ class Tag:
             return False
         return (
             self.name == other.name and 
-            self.attrs == other.attrs and 
+            (self._attrs or _NO_ATTRS) == (other._attrs or _NO_ATTRS) and 
             str(self) == str(other)
         )
     
@@ -148,7 +175,7 @@ class Tag:
         Returns:
             int: Hash value
         """
-        return hash((self.name, frozenset(self.attrs.items()), str(self)))
+        return hash((self.name, frozenset((self._attrs or _NO_ATTRS).items()), str(self)))
     
     def find(self, name=None, attrs={}, recursive=True, text=None, **kwargs) -> Optional['Tag']:
         """
@@ -171,133 +198,68 @@ class Tag:
         """
         Find all matching child elements.
         Enhanced with more flexible matching and BeautifulSoup-like features.
+
+        On a document root carrying a :class:`~webscout.scout.index.DocumentIndex`
+        (``Scout(..., index=True)``), only the tags indexed under the requested
+        name, class or id are checked instead of the whole tree.
         
         Args:
-            name (str, optional): Tag name to search for
-            attrs (dict, optional): Attributes to match
+            name (str, list or re.Pattern, optional): Tag name(s) to search for
+            attrs (dict, optional): Attributes to match. A value of True matches
+                any tag that has the attribute.
             recursive (bool, optional): Search recursively
             text (str, optional): Text content to match
             limit (int, optional): Maximum number of results
+            **kwargs: More attributes to match; ``class_`` stands for ``class``
         
         Returns:
             List[Tag]: List of matching elements
         """
+        if kwargs:
+            attrs = {**attrs, **{('class' if k == 'class_' else k): v for k, v in kwargs.items()}}
+
+        index = self._index
+        if index is not None and recursive:
+            index.refresh(self)
+            results = []
+            for tag in index.lookup(name, attrs):
+                if _matches(tag, name, attrs, text):
+                    results.append(tag)
+                    if limit and len(results) >= limit:
+                        break
+            return results
+
         results = []
-        
-        def _match(tag):
-            # Check tag name with case-insensitive and regex support
-            if name:
-                if isinstance(name, str):
-                    if tag.name.lower() != name.lower():
-                        return False
-                elif isinstance(name, re.Pattern):
-                    if not name.search(tag.name):
-                        return False
-            
-            # Check attributes with more flexible matching
-            for k, v in attrs.items():
-                # Handle special attribute matching
-                if k == 'class':
-                    tag_classes = tag.get('class', [])
-                    if isinstance(v, str) and v not in tag_classes:
-                        return False
-                    elif isinstance(v, list) and not all(cls in tag_classes for cls in v):
-                        return False
-                elif k == 'id':
-                    if tag.get('id') != v:
-                        return False
-                else:
-                    # Regex or exact match for other attributes
-                    tag_attr = tag.attrs.get(k)
-                    if isinstance(v, re.Pattern):
-                        if not v.search(str(tag_attr)):
-                            return False
-                    elif tag_attr != v:
-                        return False
-            
-            # Check text content
-            if text:
-                tag_text = tag.get_text(strip=True)
-                if isinstance(text, str) and text.lower() not in tag_text.lower():
-                    return False
-                elif isinstance(text, re.Pattern) and not text.search(tag_text):
-                    return False
-            
-            return True
-        
-        def _search(element):
-            if _match(element):
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            if _matches(element, name, attrs, text):
                 results.append(element)
-                if limit and len(results) == limit:
-                    return
-            
+                if limit and len(results) >= limit:
+                    break
             if recursive:
-                for child in element.contents:
-                    if isinstance(child, Tag):
-                        _search(child)
-        
-        _search(self)
+                stack.extend(child for child in reversed(element.contents) if isinstance(child, Tag))
+            else:
+                break
         return results
     
     def select(self, selector: str) -> List['Tag']:
         """
-        Select elements using CSS selector.
-        Enhanced to support more complex selectors.
+        Select descendant elements using a CSS selector.
+
+        The selector is compiled once and cached (see
+        :mod:`webscout.scout.selector` for the supported syntax).
         
         Args:
             selector (str): CSS selector string
         
         Returns:
-            List[Tag]: List of matching elements
+            List[Tag]: List of matching elements, in document order
+
+        Raises:
+            ValueError: If the selector is invalid or unsupported
         """
-        # More advanced CSS selector parsing
-        # This is a simplified implementation and might need more robust parsing
-        parts = re.split(r'\s+', selector.strip())
-        results = []
-        
-        def _match_selector(tag, selector_part):
-            # Support more complex selectors
-            if selector_part.startswith('.'):
-                # Class selector
-                return selector_part[1:] in tag.get('class', [])
-            elif selector_part.startswith('#'):
-                # ID selector
-                return tag.get('id') == selector_part[1:]
-            elif '[' in selector_part and ']' in selector_part:
-                # Attribute selector
-                attr_match = re.match(r'(\w+)\[([^=]+)(?:=(.+))?\]', selector_part)
-                if attr_match:
-                    tag_name, attr, value = attr_match.groups()
-                    if tag_name and tag.name != tag_name:
-                        return False
-                    if value:
-                        return tag.get(attr) == value.strip("'\"")
-                    return attr in tag.attrs
-            else:
-                # Tag selector
-                return tag.name == selector_part
-        
-        def _recursive_select(element, selector_parts):
-            if not selector_parts:
-                results.append(element)
-                return
-            
-            current_selector = selector_parts[0]
-            remaining_selectors = selector_parts[1:]
-            
-            if _match_selector(element, current_selector):
-                if not remaining_selectors:
-                    results.append(element)
-                else:
-                    for child in element.contents:
-                        if isinstance(child, Tag):
-                            _recursive_select(child, remaining_selectors)
-        
-        for child in self.contents:
-            if isinstance(child, Tag):
-                _recursive_select(child, parts)
-        
-        return results
+        return compile_selector(selector).select(self)
     
     def select_one(self, selector: str) -> Optional['Tag']:
         """
@@ -309,8 +271,7 @@ class Tag:
         Returns:
             Tag or None: First matching element
         """
-        results = self.select(selector)
-        return results[0] if results else None
+        return compile_selector(selector).select_one(self)
     
     def get_text(self, separator=' ', strip=False, types=None) -> str:
         """
@@ -387,12 +348,14 @@ class Tag:
         Returns:
             Any: Attribute value or default
         """
-        return self.attrs.get(key, default)
+        return (self._attrs or _NO_ATTRS).get(key, default)
     
     def decompose(self) -> None:
         """Remove the tag and its contents from the document."""
         if self.parent:
-            self.parent.contents.remove(self)
+            self._invalidate_index()
+            contents = self.parent.contents
+            del contents[_position(contents, self)]
     
     def extract(self) -> 'Tag':
         """
@@ -406,6 +369,7 @@ class Tag:
     
     def clear(self) -> None:
         """Remove all contents of the tag."""
+        self._invalidate_index()
         self.contents.clear()
     
     def replace_with(self, new_tag: 'Tag') -> None:
@@ -416,9 +380,18 @@ class Tag:
             new_tag (Tag): Tag to replace the current tag
         """
         if self.parent:
-            index = self.parent.contents.index(self)
+            self._invalidate_index()
+            index = _position(self.parent.contents, self)
             self.parent.contents[index] = new_tag
             new_tag.parent = self.parent
+
+    def _invalidate_index(self) -> None:
+        """Mark the index of the document this tag belongs to, if any, out of date."""
+        root = self
+        while root.parent is not None:
+            root = root.parent
+        if root._index is not None:
+            root._index.invalidate()
     
     def decode_contents(self, eventual_encoding='utf-8') -> str:
         """
@@ -444,7 +417,7 @@ class Tag:
         """
         def _prettify(tag, indent=0):
             result = ' ' * indent + f'<{tag.name}'
-            for k, v in tag.attrs.items():
+            for k, v in (tag._attrs or _NO_ATTRS).items():
                 result += f' {k}="{v}"'
             result += '>\n'
             
@@ -457,4 +430,88 @@ class Tag:
             result += ' ' * indent + f'</{tag.name}>\n'
             return result
         
-        return _prettify(self)
\ No newline at end of file
+        return _prettify(self)
+
+
+def _position(contents: list, node: Any) -> int:
+    """Index of ``node`` itself (not of an equal tag) in a contents list."""
+    for i, child in enumerate(contents):
+        if child is node:
+            return i
+    raise ValueError(f"{node!r} is not in its parent's contents")
+
+
+def _classes(value: Any) -> List[str]:
+    if not value:
+        return []
+    return value.split() if isinstance(value, str) else list(value)
+
+
+def _matches(tag: Tag, name=None, attrs=None, text=None) -> bool:
+    """
+    Check a tag against ``find_all`` criteria.
+
+    Args:
+        tag (Tag): Tag to check
+        name (str, list or re.Pattern, optional): Tag name(s), case-insensitive
+        attrs (dict, optional): Attribute filters. ``class`` matches whole class
+            tokens (a list needs all of them); True/False require the attribute
+            to be present/absent; a regex is searched in the value.
+        text (str or re.Pattern, optional): Text content to match
+
+    Returns:
+        bool: True if the tag matches
+    """
+    # Check tag name with case-insensitive, list and regex support
+    if name:
+        tag_name = tag.name
+        if type(tag_name) is not str:
+            return False
+        if isinstance(name, str):
+            if tag_name.lower() != name.lower():
+                return False
+        elif isinstance(name, re.Pattern):
+            if not name.search(tag_name):
+                return False
+        elif isinstance(name, (list, tuple, set, frozenset)):
+            if tag_name.lower() not in {n.lower() for n in name}:
+                return False
+
+    # Check attributes with more flexible matching
+    if attrs:
+        tag_attrs = tag._attrs or _NO_ATTRS
+        for k, v in attrs.items():
+            if v is True or v is False:
+                if (k in tag_attrs) is not v:
+                    return False
+                continue
+            tag_attr = tag_attrs.get(k)
+            if k == 'class':
+                tag_classes = _classes(tag_attr)
+                if isinstance(v, str):
+                    if v not in tag_classes and tag_attr != v:
+                        return False
+                elif isinstance(v, re.Pattern):
+                    if not any(v.search(cls) for cls in tag_classes):
+                        return False
+                elif isinstance(v, (list, tuple)):
+                    if not all(cls in tag_classes for cls in v):
+                        return False
+                elif tag_attr != v:
+                    return False
+            elif isinstance(v, re.Pattern):
+                # Regex or exact match for other attributes
+                if tag_attr is None or not v.search(str(tag_attr)):
+                    return False
+            elif tag_attr != v:
+                return False
+
+    # Check text content
+    if text:
+        tag_text = tag.get_text(strip=True)
+        if isinstance(text, str) and text.lower() not in tag_text.lower():
+            return False
+        elif isinstance(text, re.Pattern) and not text.search(tag_text):
+            return False
+
+    return True
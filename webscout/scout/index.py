@@ -0,0 +1,153 @@
+"""
+Scout Document Index - Tag, class and id lookups without walking the tree
+"""
+
+from array import array
+from heapq import merge
+from typing import Any, Dict, List, Optional
+
+from .element import Tag
+
+_NO_POSITIONS = array('I')
+
+
+class DocumentIndex:
+    """
+    Tags of a parsed document by name, class token and id, in document order.
+
+    Parsers create it while building the tree (``index=True``) and hang it on
+    the root tag, whose ``find_all``, ``find`` and ``select`` calls then only
+    look at the tags listed under the name, class or id they ask for
+    instead of walking every node. Positions are kept in compact arrays into
+    ``tags``, so the index costs a few bytes per tag.
+
+    ``Tag.extract``, ``decompose``, ``replace_with`` and ``clear`` mark the
+    index stale and the next lookup rebuilds it. Edits made directly to
+    ``contents`` or ``attrs`` are not seen; call :meth:`invalidate` after them.
+    """
+
+    __slots__ = ('tags', 'names', 'classes', 'ids', 'stale')
+
+    def __init__(self):
+        """Create an empty index; tags are added in document order with :meth:`add`."""
+        self.tags: List[Tag] = []
+        self.names: Dict[str, array] = {}
+        self.classes: Dict[str, array] = {}
+        self.ids: Dict[str, array] = {}
+        self.stale = False
+
+    @classmethod
+    def build(cls, root: Tag) -> 'DocumentIndex':
+        """
+        Index an already parsed tree.
+
+        Args:
+            root (Tag): Document root
+
+        Returns:
+            DocumentIndex: Index of ``root`` and its descendants
+        """
+        index = cls()
+        index._add_tree(root)
+        return index
+
+    def _add_tree(self, root: Tag) -> None:
+        stack = [root]
+        while stack:
+            tag = stack.pop()
+            self.add(tag)
+            stack.extend([child for child in reversed(tag.contents) if isinstance(child, Tag)])
+
+    def add(self, tag: Tag) -> None:
+        """
+        Append a tag; tags must be added in document order.
+
+        Args:
+            tag (Tag): Tag to index
+        """
+        position = len(self.tags)
+        self.tags.append(tag)
+        if type(tag.name) is str:
+            _append(self.names, tag.name.lower(), position)
+        attrs = tag._attrs
+        if attrs:
+            classes = attrs.get('class')
+            if classes:
+                tokens = classes.split() if isinstance(classes, str) else classes
+                for token in dict.fromkeys(tokens):
+                    _append(self.classes, token, position)
+            tag_id = attrs.get('id')
+            if isinstance(tag_id, str):
+                _append(self.ids, tag_id, position)
+
+    def invalidate(self) -> None:
+        """Mark the index out of date; the next lookup rebuilds it."""
+        self.stale = True
+
+    def refresh(self, root: Tag) -> None:
+        """
+        Rebuild the index from the current tree if it is stale.
+
+        Args:
+            root (Tag): Document root the index belongs to
+        """
+        if self.stale:
+            self.tags, self.names, self.classes, self.ids = [], {}, {}, {}
+            self._add_tree(root)
+            self.stale = False
+
+    def positions(self, name: Any = None, attrs: Optional[Dict[str, Any]] = None) -> Optional[array]:
+        """
+        Positions in ``tags`` of the tags that can match a query, in document order.
+
+        Uses whichever of the name, class tokens and id narrows the query most.
+
+        Args:
+            name (str, list or re.Pattern, optional): Tag name(s)
+            attrs (dict, optional): Attribute filters
+
+        Returns:
+            array or None: Positions, or None when nothing in the query is indexed
+        """
+        choices = []
+        if isinstance(name, str):
+            choices.append(self.names.get(name.lower(), _NO_POSITIONS))
+        elif isinstance(name, (list, tuple, set, frozenset)) and name and all(isinstance(n, str) for n in name):
+            lists = [self.names.get(n, _NO_POSITIONS) for n in {n.lower() for n in name}]
+            choices.append(lists[0] if len(lists) == 1 else array('I', merge(*lists)))
+        if attrs:
+            classes = attrs.get('class')
+            if isinstance(classes, str):
+                classes = classes.split()
+            if isinstance(classes, (list, tuple)) and classes and all(isinstance(c, str) for c in classes):
+                choices.extend(self.classes.get(token, _NO_POSITIONS) for token in classes)
+            tag_id = attrs.get('id')
+            if isinstance(tag_id, str):
+                choices.append(self.ids.get(tag_id, _NO_POSITIONS))
+        return min(choices, key=len) if choices else None
+
+    def lookup(self, name: Any = None, attrs: Optional[Dict[str, Any]] = None) -> List[Tag]:
+        """
+        Tags that can match a query, in document order.
+
+        The caller still checks every candidate against the full query.
+
+        Args:
+            name (str, list or re.Pattern, optional): Tag name(s)
+            attrs (dict, optional): Attribute filters
+
+        Returns:
+            List[Tag]: Candidate tags, or every tag when nothing is indexed
+        """
+        positions = self.positions(name, attrs)
+        if positions is None:
+            return self.tags
+        tags = self.tags
+        return [tags[position] for position in positions]
+
+
+def _append(table: Dict[str, array], key: str, position: int) -> None:
+    positions = table.get(key)
+    if positions is None:
+        positions = table[key] = array('I')
+    positions.append(position)
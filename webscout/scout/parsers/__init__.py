@@ -6,6 +6,7 @@ from typing import Dict, Type, Any
 
 from .html_parser import HTMLParser
 from .lxml_parser import LXMLParser
+from .lxml_lazy_parser import LXMLLazyParser, LazyTag
 from .html5lib_parser import HTML5Parser
 
 class ParserRegistry:
@@ -17,16 +18,18 @@ class ParserRegistry:
     _PARSERS: Dict[str, Type[Any]] = {
         'html.parser': HTMLParser,
         'lxml': LXMLParser,
+        'lxml-lazy': LXMLLazyParser,
         'html5lib': HTML5Parser
     }
     
     @classmethod
-    def get_parser(cls, parser_name: str = 'html.parser') -> Any:
+    def get_parser(cls, parser_name: str = 'html.parser', **options) -> Any:
         """
         Retrieve a parser by its name.
         
         Args:
             parser_name (str): Name of the parser to retrieve
+            **options: Keyword arguments for the parser, e.g. ``special_nodes=False``
         
         Returns:
             Parser instance
@@ -37,12 +40,16 @@ class ParserRegistry:
         if parser_name not in cls._PARSERS:
             raise ValueError(f"Parser '{parser_name}' not found. Available parsers: {list(cls._PARSERS.keys())}")
         
-        return cls._PARSERS[parser_name]()
+        return cls._PARSERS[parser_name](**options)
     
     @classmethod
     def register_parser(cls, name: str, parser_class: Type[Any]):
         """
         Register a new parser dynamically.
+
+        Scout creates the parser with no arguments unless parsing options are
+        set (``index=True``, ``special_nodes``); those are
+        passed as keyword arguments, which the class should then accept.
         
         Args:
             name (str): Name of the parser
@@ -64,6 +71,8 @@ class ParserRegistry:
 __all__ = [
     'HTMLParser',
     'LXMLParser',
+    'LXMLLazyParser',
+    'LazyTag',
     'HTML5Parser',
     'ParserRegistry'
 ]
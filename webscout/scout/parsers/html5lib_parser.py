@@ -3,10 +3,12 @@ Scout HTML5 Parser - Advanced HTML5 Parsing with html5lib
 """
 
 import re
+from sys import intern
 from typing import List, Optional, Dict, Any, Union
 
 import html5lib
 from ..element import Tag, NavigableString
+from ..index import DocumentIndex
 
 class HTML5Parser:
     """
@@ -14,15 +16,24 @@ class HTML5Parser:
     Provides robust parsing with enhanced error handling and flexibility.
     """
     
-    def __init__(self, namespaces: bool = False, debug: bool = False):
+    def __init__(
+        self, namespaces: bool = False, debug: bool = False, special_nodes: bool = True, index: bool = False
+    ):
         """
         Initialize the HTML5 parser with advanced parsing capabilities.
         
         Args:
             namespaces (bool): Whether to preserve namespace information
             debug (bool): Enable debug mode for parsing
+            special_nodes (bool): Keep comments as tags. Pass False to drop
+                them. Defaults to True.
+            index (bool): Build a DocumentIndex of the tags as they are converted,
+                for fast lookups on the root. Defaults to False.
         """
         self._namespaces = namespaces
+        self.special_nodes = special_nodes
+        self.index = index
+        self._index = None
         self._debug = debug
         self._parsing_errors = []
     
@@ -40,15 +51,19 @@ class HTML5Parser:
             # Preprocess markup to handle common issues
             markup = self._preprocess_markup(markup)
             
-            # Parse the markup
+            # Parse the markup (html5lib only takes an encoding for bytes)
+            options = {} if isinstance(markup, str) else {'transport_encoding': 'utf-8'}
             tree = html5lib.parse(
                 markup, 
                 namespaceHTMLElements=self._namespaces,
-                transport_encoding='utf-8'
+                **options
             )
             
-            # Convert parsed tree to Scout Tag
-            return self._convert_element(tree.getroot())
+            # Convert parsed tree (html5lib returns the root element) to Scout Tag
+            self._index = DocumentIndex() if self.index else None
+            root = self._convert_element(tree)
+            root._index = self._index
+            return root
         
         except Exception as e:
             self._parsing_errors.append(str(e))
@@ -82,15 +97,26 @@ class HTML5Parser:
         Returns:
             Tag: Converted Scout Tag
         """
-        # Create Tag with name and attributes
-        tag = Tag(element.tag, dict(element.attrib))
+        # Create Tag with name and attributes, sharing one copy of each attribute name
+        tag = Tag(element.tag, {intern(k): v for k, v in element.attrib.items()})
+        if self._index is not None:
+            self._index.add(tag)
         
         # Add text content
         if element.text:
-            tag.contents.append(NavigableString(element.text))
+            text = NavigableString(element.text)
+            text.parent = tag
+            tag.contents.append(text)
         
         # Recursively add child elements
         for child in element:
+            if not self.special_nodes and not isinstance(child.tag, str):
+                # Comment or processing instruction: keep only its tail text
+                if child.tail:
+                    tail_text = NavigableString(child.tail)
+                    tail_text.parent = tag
+                    tag.contents.append(tail_text)
+                continue
             child_tag = self._convert_element(child)
             child_tag.parent = tag
             tag.contents.append(child_tag)
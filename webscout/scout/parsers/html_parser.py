@@ -5,9 +5,11 @@ Scout HTML Parser - Advanced HTML Parsing with Python's Built-in Parser
 import html
 import re
 from html.parser import HTMLParser as StdHTMLParser
+from sys import intern
 from typing import List
 
 from ..element import Tag, NavigableString
+from ..index import DocumentIndex
 
 class HTMLParser:
     """
@@ -15,11 +17,23 @@ class HTMLParser:
     Provides robust parsing with enhanced error handling and flexibility.
     """
     
-    def __init__(self):
+    def __init__(self, special_nodes: bool = True, index: bool = False):
         """
         Initialize the HTML parser with advanced parsing capabilities.
+
+        Args:
+            special_nodes (bool): Keep comments, declarations and processing
+                instructions as tags. Pass False to drop them and save a node
+                each. Defaults to True.
+            index (bool): Build a DocumentIndex of the tags as they are parsed,
+                for fast lookups on the root. Defaults to False.
         """
+        self.special_nodes = special_nodes
         self._root = Tag('html')
+        self._index = DocumentIndex() if index else None
+        if self._index is not None:
+            self._index.add(self._root)
+            self._root._index = self._index
         self._current_tag = self._root
         self._tag_stack = [self._root]
         self._parsing_errors = []
@@ -79,10 +93,25 @@ class HTMLParser:
         # Set parent-child relationships
         tag.parent = self._current_tag
         self._current_tag.contents.append(tag)
+        if self._index is not None:
+            self._index.add(tag)
         
         # Update current tag if it's an opening tag
         self._current_tag = tag
         self._tag_stack.append(tag)
+
+    def add_leaf(self, tag: Tag):
+        """
+        Add a tag that has no end tag (comment, declaration, processing
+        instruction) to the current parsing context, without entering it.
+
+        Args:
+            tag (Tag): Tag to add
+        """
+        tag.parent = self._current_tag
+        self._current_tag.contents.append(tag)
+        if self._index is not None:
+            self._index.add(tag)
     
     def add_text(self, text: str):
         """
@@ -135,8 +164,8 @@ class _ScoutHTMLParser(StdHTMLParser):
             tag (str): Tag name
             attrs (List[tuple]): Tag attributes
         """
-        # Convert attrs to dictionary
-        attrs_dict = dict(attrs)
+        # Convert attrs to dictionary, sharing one copy of each attribute name
+        attrs_dict = {intern(k): v for k, v in attrs}
         
         # Create Tag instance
         new_tag = Tag(tag, attrs_dict)
@@ -172,9 +201,8 @@ class _ScoutHTMLParser(StdHTMLParser):
             data (str): Comment content
         """
         # Optionally handle comments
-        comment_tag = Tag('comment')
-        comment_tag.attrs['content'] = data
-        self._scout_parser.add_tag(comment_tag)
+        if self._scout_parser.special_nodes:
+            self._scout_parser.add_leaf(Tag('comment', {'content': data}))
     
     def handle_decl(self, decl: str):
         """
@@ -184,9 +212,8 @@ class _ScoutHTMLParser(StdHTMLParser):
             decl (str): Declaration content
         """
         # Create a special tag for declarations
-        decl_tag = Tag('!DOCTYPE')
-        decl_tag.attrs['content'] = decl
-        self._scout_parser.add_tag(decl_tag)
+        if self._scout_parser.special_nodes:
+            self._scout_parser.add_leaf(Tag('!DOCTYPE', {'content': decl}))
     
     def handle_pi(self, data: str):
         """
@@ -196,9 +223,8 @@ class _ScoutHTMLParser(StdHTMLParser):
             data (str): Processing instruction content
         """
         # Create a special tag for processing instructions
-        pi_tag = Tag('?')
-        pi_tag.attrs['content'] = data
-        self._scout_parser.add_tag(pi_tag)
+        if self._scout_parser.special_nodes:
+            self._scout_parser.add_leaf(Tag('?', {'content': data}))
     
     def handle_entityref(self, name: str):
         """
@@ -0,0 +1,393 @@
+"""
+Scout Lazy LXML Parser - Scout Tags as Views over an lxml Tree
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from lxml import etree, html as lxml_html
+from ..element import Tag, NavigableString, _matches
+from ..selector import compile_selector
+from .lxml_parser import LXMLParser
+
+_NAME = re.compile(r'^[^\W\d][\w.-]*$')
+_NEWLINES = re.compile(r'\n\n+')
+
+
+class LXMLLazyParser(LXMLParser):
+    """
+    lxml parser that keeps the lxml tree instead of copying it into Scout tags.
+
+    The document is handed out as a :class:`LazyTag`, a view of an lxml
+    element; the tags reached from it through ``contents``, ``parent``,
+    ``find_all``, ``select`` and friends are views created on first access.
+    ``find_all`` and ``select`` run as lxml XPath queries and ``get_text``
+    reads the lxml tree directly, so most work happens in lxml's C code and
+    only the tags a query returns get a Python object.
+    """
+
+    def __init__(self, parser_type: str = 'html', special_nodes: bool = True, index: bool = False):
+        """
+        Initialize the lazy LXML parser.
+
+        Args:
+            parser_type (str): Type of parser ('html' or 'xml')
+            special_nodes (bool): Show comments and processing instructions
+                as tags. Pass False to hide them. Defaults to True.
+            index (bool): Accepted for compatibility and ignored: lxml answers
+                the lookups a DocumentIndex would.
+        """
+        super().__init__(parser_type, special_nodes=special_nodes, index=False)
+
+    def parse(self, markup: str) -> Tag:
+        """
+        Parse HTML/XML markup and return a view of the root element.
+
+        Args:
+            markup (str): HTML/XML content to parse
+
+        Returns:
+            Tag: Parsed document root (a LazyTag)
+        """
+        try:
+            markup = self._preprocess_markup(markup)
+            if self._parser_type == 'html':
+                tree = lxml_html.fromstring(markup, parser=self._parser)
+            else:
+                tree = etree.fromstring(markup, parser=self._parser)
+            return _LazyDocument(self._parser_type == 'html', self.special_nodes).proxy(tree)
+        except Exception as e:
+            self._parsing_errors.append(str(e))
+            return Tag('root')
+
+
+class _LazyDocument:
+    """Per-document state shared by its views: one LazyTag per lxml element."""
+
+    __slots__ = ('html', 'special_nodes', 'proxies')
+
+    def __init__(self, html: bool, special_nodes: bool):
+        self.html = html
+        self.special_nodes = special_nodes
+        self.proxies: Dict[Any, LazyTag] = {}
+
+    def proxy(self, element: Any) -> 'LazyTag':
+        """The view of ``element``, the same object every time."""
+        tag = self.proxies.get(element)
+        if tag is None:
+            tag = self.proxies[element] = LazyTag(element, self)
+        return tag
+
+
+class LazyTag(Tag):
+    """
+    A Scout :class:`~webscout.scout.element.Tag` backed by an lxml element.
+
+    ``name``, ``attrs``, ``contents`` and ``parent`` read through to the lxml
+    element; ``attrs`` is its live attribute mapping. ``contents`` is built
+    on access, so edit the tree with ``decompose``, ``extract``, ``clear``
+    and ``replace_with`` (which change the lxml tree) rather than by
+    mutating the list.
+    """
+
+    __slots__ = ('_element', '_document')
+
+    def __init__(self, element: Any, document: _LazyDocument):
+        """
+        Wrap an lxml element; use the document's ``proxy()`` so each element has one view.
+
+        Args:
+            element: lxml element
+            document (_LazyDocument): Document the element belongs to
+        """
+        self._element = element
+        self._document = document
+        self.string = None
+        self._index = None
+
+    @property
+    def name(self) -> Any:
+        """Tag name (lxml's ``Comment``/``ProcessingInstruction`` factory for those nodes)."""
+        return self._element.tag
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._element.tag = value
+
+    @property
+    def _attrs(self) -> Any:
+        return self._element.attrib
+
+    @property
+    def attrs(self) -> Any:
+        """Tag attributes, as lxml's live attribute mapping."""
+        return self._element.attrib
+
+    @attrs.setter
+    def attrs(self, value: Dict[str, str]) -> None:
+        attrib = self._element.attrib
+        attrib.clear()
+        attrib.update(value or {})
+
+    @property
+    def parent(self) -> Optional['LazyTag']:
+        """View of the parent element, or None at the root."""
+        parent = self._element.getparent()
+        return None if parent is None else self._document.proxy(parent)
+
+    @property
+    def contents(self) -> List[Any]:
+        """Child tags and text nodes, as a new list."""
+        element = self._element
+        contents: List[Any] = []
+        if element.text:
+            contents.append(self._text(element.text))
+        proxy = self._document.proxy
+        special_nodes = self._document.special_nodes
+        for child in element:
+            if special_nodes or isinstance(child.tag, str):
+                contents.append(proxy(child))
+            if child.tail:
+                contents.append(self._text(child.tail))
+        return contents
+
+    def _text(self, text: str) -> NavigableString:
+        node = NavigableString(text)
+        node.parent = self
+        return node
+
+    def find_all(self, name=None, attrs={}, recursive=True, text=None, limit=None, **kwargs) -> List[Tag]:
+        """
+        Find all matching elements, with an lxml XPath query.
+
+        The name, class, id and plain attribute filters become an XPath
+        expression; the few elements it returns are then checked against the
+        full criteria, as :meth:`Tag.find_all <webscout.scout.element.Tag.find_all>`
+        would.
+
+        Args:
+            name (str, list or re.Pattern, optional): Tag name(s) to search for
+            attrs (dict, optional): Attributes to match
+            recursive (bool, optional): Search recursively
+            text (str, optional): Text content to match
+            limit (int, optional): Maximum number of results
+            **kwargs: More attributes to match; ``class_`` stands for ``class``
+
+        Returns:
+            List[Tag]: List of matching elements
+        """
+        if kwargs:
+            attrs = {**attrs, **{('class' if k == 'class_' else k): v for k, v in kwargs.items()}}
+        if not recursive:
+            return [self] if _matches(self, name, attrs, text) else []
+
+        bare_name = self._document.html and isinstance(name, str) and _NAME.match(name)
+        if limit == 1 and bare_name and not attrs and not text:
+            # libxml2 stops at the first match of a bare name step
+            expression, variables = f'descendant-or-self::{name.lower()}[1]', {}
+        else:
+            expression, variables = _find_all_xpath(
+                name, attrs, self._document.html, self._document.special_nodes
+            )
+        proxy = self._document.proxy
+        results = []
+        for element in _compile_xpath(expression)(self._element, **variables):
+            tag = proxy(element)
+            if _matches(tag, name, attrs, text):
+                results.append(tag)
+                if limit and len(results) >= limit:
+                    break
+        return results
+
+    def select(self, selector: str) -> List[Tag]:
+        """
+        Select descendant elements using a CSS selector.
+
+        Selectors with an XPath form (see :attr:`Selector.xpath
+        <webscout.scout.selector.Selector.xpath>`) run as one lxml XPath
+        query; the others are matched tag by tag.
+
+        Args:
+            selector (str): CSS selector string
+
+        Returns:
+            List[Tag]: List of matching elements, in document order
+
+        Raises:
+            ValueError: If the selector is invalid or unsupported
+        """
+        compiled = compile_selector(selector)
+        if compiled.xpath is None:
+            return compiled.select(self)
+        proxy = self._document.proxy
+        return [proxy(element) for element in _compile_xpath(compiled.xpath)(self._element)]
+
+    def select_one(self, selector: str) -> Optional[Tag]:
+        """
+        Select the first element matching the CSS selector.
+
+        Args:
+            selector (str): CSS selector string
+
+        Returns:
+            Tag or None: First matching element
+        """
+        compiled = compile_selector(selector)
+        if compiled.xpath is None:
+            return compiled.select_one(self)
+        expression = compiled.xpath
+        if ' | ' not in expression:
+            expression += '[1]'
+        elements = _compile_xpath(expression)(self._element)
+        return self._document.proxy(elements[0]) if elements else None
+
+    def get_text(self, separator=' ', strip=False, types=None) -> str:
+        """
+        Extract text from the tag and its descendants, reading the lxml tree.
+
+        Gives the same text as :meth:`Tag.get_text
+        <webscout.scout.element.Tag.get_text>` on the converted tree, without
+        creating a view per tag.
+
+        Args:
+            separator (str, optional): Text separator
+            strip (bool, optional): Strip whitespace
+            types (list, optional): Types of content to extract
+
+        Returns:
+            str: Extracted text
+        """
+        if types is not None:
+            return super().get_text(separator, strip, types)
+        return _get_text(self._element, separator, strip, self._document.special_nodes)
+
+    def decode_contents(self, eventual_encoding='utf-8') -> str:
+        """
+        Decode the contents of the tag to a string.
+
+        Args:
+            eventual_encoding (str, optional): Encoding to use
+
+        Returns:
+            str: Decoded contents
+        """
+        return ''.join(self._element.itertext())
+
+    def decompose(self) -> None:
+        """Remove the tag and its contents from the document, keeping the text after it."""
+        element = self._element
+        parent = element.getparent()
+        if parent is None:
+            return
+        if element.tail:
+            previous = element.getprevious()
+            if previous is not None:
+                previous.tail = (previous.tail or '') + element.tail
+            else:
+                parent.text = (parent.text or '') + element.tail
+            element.tail = None
+        parent.remove(element)
+
+    def clear(self) -> None:
+        """Remove all contents of the tag."""
+        element = self._element
+        element.text = None
+        for child in list(element):
+            element.remove(child)
+
+    def replace_with(self, new_tag: Tag) -> None:
+        """
+        Replace this tag with another tag.
+
+        A plain :class:`Tag` is copied into the lxml tree; the tree then
+        shows a view of the copy, not ``new_tag`` itself.
+
+        Args:
+            new_tag (Tag): Tag to replace the current tag
+        """
+        element = self._element
+        parent = element.getparent()
+        if parent is None:
+            return
+        replacement = new_tag._element if isinstance(new_tag, LazyTag) else _to_element(new_tag, parent)
+        replacement.tail, element.tail = element.tail, None
+        parent.replace(element, replacement)
+
+
+def _get_text(element: Any, separator: str, strip: bool, special_nodes: bool) -> str:
+    """:meth:`Tag.get_text <webscout.scout.element.Tag.get_text>` over an lxml element and its ``contents``."""
+    texts = [element.text] if element.text else []
+    for child in element:
+        if special_nodes or isinstance(child.tag, str):
+            texts.append(_get_text(child, separator, strip, special_nodes))
+        if child.tail:
+            texts.append(child.tail)
+    text = _NEWLINES.sub('\n', separator.join(texts))
+    return text.strip() if strip else text
+
+
+def _to_element(tag: Tag, parent: Any) -> Any:
+    """Copy a Scout tag and its contents into a new lxml element made by ``parent``'s parser."""
+    element = parent.makeelement(tag.name, {k: '' if v is None else str(v) for k, v in tag.attrs.items()})
+    last = None
+    for child in tag.contents:
+        if isinstance(child, Tag):
+            last = _to_element(child, element)
+            element.append(last)
+        elif last is None:
+            element.text = (element.text or '') + child
+        else:
+            last.tail = (last.tail or '') + child
+    return element
+
+
+def _find_all_xpath(name: Any, attrs: Dict[str, Any], html: bool, special_nodes: bool) -> Tuple[str, Dict[str, str]]:
+    """
+    XPath expression (with its variables) narrowing ``find_all`` to the
+    elements that can match; every result still goes through ``_matches``.
+    """
+    variables: Dict[str, str] = {}
+
+    def variable(value: str) -> str:
+        key = f'v{len(variables)}'
+        variables[key] = value
+        return f'${key}'
+
+    step = '*'
+    predicates = []
+    if name and html:
+        if isinstance(name, str):
+            if _NAME.match(name):
+                step = name.lower()
+            else:
+                predicates.append(f'name()={variable(name.lower())}')
+        elif isinstance(name, (list, tuple, set, frozenset)) and name and all(isinstance(n, str) for n in name):
+            predicates.append(' or '.join(f'name()={variable(n)}' for n in sorted({n.lower() for n in name})))
+    elif not name and special_nodes:
+        # Comments and processing instructions are tags too, and match an empty query
+        step = 'node()[not(self::text())]'
+
+    for key, value in (attrs or {}).items():
+        if not _NAME.match(key):
+            continue
+        if value is True:
+            predicates.append(f'@{key}')
+        elif value is False:
+            predicates.append(f'not(@{key})')
+        elif key == 'class':
+            tokens = value.split() if isinstance(value, str) and len(value.split()) == 1 else value
+            if isinstance(tokens, (list, tuple)) and all(isinstance(t, str) and t for t in tokens):
+                predicates.extend(
+                    f"contains(concat(' ', normalize-space(@class), ' '), {variable(f' {token} ')})"
+                    for token in tokens
+                )
+        elif isinstance(value, str):
+            predicates.append(f'@{key}={variable(value)}')
+
+    return 'descendant-or-self::' + step + ''.join(f'[{predicate}]' for predicate in predicates), variables
+
+
+@lru_cache(maxsize=512)
+def _compile_xpath(expression: str) -> etree.XPath:
+    return etree.XPath(expression)
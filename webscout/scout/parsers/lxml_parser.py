@@ -3,10 +3,12 @@ Scout LXML Parser - Advanced HTML/XML Parsing with lxml
 """
 
 import re
+from sys import intern
 from typing import List, Optional, Dict, Any, Union
 
 from lxml import etree, html as lxml_html
 from ..element import Tag, NavigableString
+from ..index import DocumentIndex
 
 class LXMLParser:
     """
@@ -14,14 +16,21 @@ class LXMLParser:
     Provides robust parsing with enhanced error handling and flexibility.
     """
     
-    def __init__(self, parser_type: str = 'html'):
+    def __init__(self, parser_type: str = 'html', special_nodes: bool = True, index: bool = False):
         """
         Initialize the LXML parser with advanced parsing capabilities.
         
         Args:
             parser_type (str): Type of parser ('html' or 'xml')
+            special_nodes (bool): Keep comments and processing instructions
+                as tags. Pass False to drop them. Defaults to True.
+            index (bool): Build a DocumentIndex of the tags as they are converted,
+                for fast lookups on the root. Defaults to False.
         """
         self._parser_type = parser_type
+        self.special_nodes = special_nodes
+        self.index = index
+        self._index = None
         self._parsing_errors = []
         
         # Select appropriate parser based on type
@@ -53,7 +62,10 @@ class LXMLParser:
                 tree = etree.fromstring(markup, parser=self._parser)
             
             # Convert lxml element to Scout Tag
-            return self._convert_element(tree)
+            self._index = DocumentIndex() if self.index else None
+            root = self._convert_element(tree)
+            root._index = self._index
+            return root
         
         except Exception as e:
             self._parsing_errors.append(str(e))
@@ -88,15 +100,26 @@ class LXMLParser:
         Returns:
             Tag: Converted Scout Tag
         """
-        # Create Tag with name and attributes
-        tag = Tag(element.tag, dict(element.attrib))
+        # Create Tag with name and attributes, sharing one copy of each attribute name
+        tag = Tag(element.tag, {intern(k): v for k, v in element.attrib.items()})
+        if self._index is not None:
+            self._index.add(tag)
         
         # Add text content
         if element.text:
-            tag.contents.append(NavigableString(element.text))
+            text = NavigableString(element.text)
+            text.parent = tag
+            tag.contents.append(text)
         
         # Recursively add child elements
         for child in element:
+            if not self.special_nodes and not isinstance(child.tag, str):
+                # Comment or processing instruction: keep only its tail text
+                if child.tail:
+                    tail_text = NavigableString(child.tail)
+                    tail_text.parent = tag
+                    tag.contents.append(tail_text)
+                continue
             child_tag = self._convert_element(child)
             child_tag.parent = tag
             tag.contents.append(child_tag)
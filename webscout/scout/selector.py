@@ -0,0 +1,571 @@
+"""
+Scout Selector Module - Compiled CSS Selectors
+
+A selector string is parsed once into a :class:`Selector`, a tree of
+matchers kept in an LRU cache, so ``Tag.select`` with the same selector
+only pays for matching. Matching runs right to left: a candidate tag is
+checked against the last compound selector first and rejected there in the
+common case, before any ancestor or sibling is looked at. On a document
+root with a :class:`~webscout.scout.index.DocumentIndex`, the candidates
+come from the index entry of the last compound's tag name, class or id.
+
+Supported: type, ``*``, ``.class``, ``#id``, ``[attr]``,
+``[attr=|~=||=|^=|$=|*=value i]``, the descendant, ``>``, ``+`` and ``~``
+combinators, selector lists (``a, b``) and the pseudo-classes
+``:not()``, ``:is()``, ``:where()``, ``:first-child``, ``:last-child``,
+``:only-child``, ``:nth-child()``, ``:nth-last-child()``,
+``:first-of-type``, ``:last-of-type``, ``:only-of-type``,
+``:nth-of-type()``, ``:nth-last-of-type()`` and ``:empty``.
+
+Most selectors also compile to an equivalent XPath expression
+(:attr:`Selector.xpath`), which backends built on lxml evaluate natively.
+
+>>> from webscout.scout.selector import compile_selector
+>>> links = compile_selector("div.result > h2 a[href^='http']")
+>>> links.select(soup)
+"""
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_NO_ATTRS = MappingProxyType({})
+
+_IDENT = r'-?[^\W\d][\w-]*'
+_TOKENS = re.compile(
+    rf'''
+    (?P<ws>\s+)
+  | (?P<comb>[>+~])
+  | (?P<comma>,)
+  | (?P<type>{_IDENT}|\*)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>{_IDENT})
+  | \[\s*(?P<attr>{_IDENT})\s*
+      (?:(?P<op>[~|^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\s\]]+))\s*(?P<flag>[iIsS])?\s*)?\]
+  | :(?P<pseudo>{_IDENT})(?P<args>\()?
+    ''',
+    re.VERBOSE,
+)
+_NTH = re.compile(
+    r'^(?:(?P<odd>odd)|(?P<even>even)|(?P<a>[+-]?\d*)n\s*(?:(?P<sign>[+-])\s*(?P<b>\d+))?|(?P<int>[+-]?\d+))$'
+)
+
+_XPATH_NAME = re.compile(r'^[^\W\d][\w.-]*$')
+
+_Test = Callable[[Any, '_Context'], bool]
+# Tag name step ('*' or a name) -> XPath predicate equivalent to a _Test, or None if it has none
+_Condition = Callable[[str], Optional[str]]
+
+
+class _Context:
+    """Per-``select`` cache of element siblings, for the structural pseudo-classes."""
+
+    __slots__ = ('_siblings',)
+
+    def __init__(self):
+        self._siblings: Dict[Tuple[int, Optional[str]], Tuple[list, Dict[int, int]]] = {}
+
+    def siblings(self, tag: Any, of_type: bool = False) -> Tuple[list, int]:
+        """Element siblings of ``tag`` (itself included) and its position among them."""
+        parent = tag.parent
+        if parent is None:
+            return [tag], 0
+        name = tag.name if of_type else None
+        key = (id(parent), name)
+        cached = self._siblings.get(key)
+        if cached is None:
+            elements = [
+                child for child in parent.contents
+                if not isinstance(child, str) and (name is None or child.name == name)
+            ]
+            cached = self._siblings[key] = (elements, {id(e): i for i, e in enumerate(elements)})
+        elements, positions = cached
+        return elements, positions[id(tag)]
+
+
+class _Compound:
+    """One compound selector (``div.a#b[c]:first-child``): tag name, id, classes and other tests."""
+
+    __slots__ = ('name', 'ids', 'classes', 'tests', 'conditions')
+
+    def __init__(self):
+        self.name: Optional[str] = None
+        self.ids: List[str] = []
+        self.classes: List[str] = []
+        self.tests: List[_Test] = []
+        self.conditions: List[_Condition] = []
+
+    def xpath(self) -> Optional[str]:
+        """The compound as an XPath step (``div[@id='a']``), or None if it has no XPath form."""
+        if self.name is not None and not _XPATH_NAME.match(self.name):
+            return None
+        step = self.name or '*'
+        predicates = [f"@id={_literal(tag_id)}" for tag_id in self.ids]
+        predicates.extend(_token_xpath('class', cls) for cls in self.classes)
+        for condition in self.conditions:
+            predicate = condition(step)
+            if predicate is None:
+                return None
+            predicates.append(predicate)
+        return step + ''.join(f'[{predicate}]' for predicate in predicates)
+
+    def query(self) -> Dict[str, Any]:
+        """The class and id part, as ``find_all`` attribute filters."""
+        query: Dict[str, Any] = {}
+        if self.classes:
+            query['class'] = self.classes
+        if self.ids:
+            query['id'] = self.ids[0]
+        return query
+
+    def matches(self, tag: Any, context: _Context) -> bool:
+        if self.name is not None:
+            name = tag.name
+            if type(name) is not str or (name != self.name and name.lower() != self.name):
+                return False
+        if self.ids or self.classes:
+            attrs = tag._attrs or _NO_ATTRS
+            for tag_id in self.ids:
+                if attrs.get('id') != tag_id:
+                    return False
+            if self.classes:
+                value = attrs.get('class')
+                if not value:
+                    return False
+                tokens = value.split() if isinstance(value, str) else value
+                for cls in self.classes:
+                    if cls not in tokens:
+                        return False
+        for test in self.tests:
+            if not test(tag, context):
+                return False
+        return True
+
+
+class _Complex:
+    """Compound selectors joined by combinators, stored right to left."""
+
+    __slots__ = ('parts',)
+
+    def __init__(self, parts: List[Tuple[_Compound, Optional[str]]]):
+        # parts[0] is the rightmost compound; each combinator links a part to the next one (its left)
+        self.parts = parts
+
+    def xpath(self) -> Optional[str]:
+        """
+        The complex selector as an XPath step on the rightmost compound, the
+        compounds to its left turned into predicates on the matching axes.
+        """
+        expression = None
+        for compound, combinator in reversed(self.parts):
+            step = compound.xpath()
+            if step is None:
+                return None
+            expression = step if expression is None else f'{step}[{_AXES[combinator].format(expression)}]'
+        return expression
+
+    def matches(self, tag: Any, context: _Context, i: int = 0) -> bool:
+        compound, combinator = self.parts[i]
+        if not compound.matches(tag, context):
+            return False
+        if combinator is None:
+            return True
+        if combinator == ' ':
+            node = tag.parent
+            while node is not None:
+                if self.matches(node, context, i + 1):
+                    return True
+                node = node.parent
+            return False
+        if combinator == '>':
+            return tag.parent is not None and self.matches(tag.parent, context, i + 1)
+        siblings, position = context.siblings(tag)
+        if combinator == '+':
+            return position > 0 and self.matches(siblings[position - 1], context, i + 1)
+        return any(self.matches(sibling, context, i + 1) for sibling in siblings[:position])
+
+
+class Selector:
+    """
+    A compiled CSS selector list.
+
+    Get one with :func:`compile_selector`, which caches them; ``Tag.select``
+    and ``Tag.select_one`` use it under the hood.
+    """
+
+    __slots__ = ('text', '_selectors', 'xpath')
+
+    def __init__(self, text: str, selectors: List[_Complex]):
+        self.text = text
+        self._selectors = selectors
+        steps = [selector.xpath() for selector in selectors]
+        #: Equivalent XPath expression selecting the matching descendants of
+        #: the context element, or None when part of the selector has no XPath form
+        self.xpath: Optional[str] = None if None in steps else ' | '.join(f'descendant::{step}' for step in steps)
+
+    def __repr__(self) -> str:
+        return f"Selector({self.text!r})"
+
+    def match(self, tag: Any, _context: Optional[_Context] = None) -> bool:
+        """
+        Check whether a tag matches the selector.
+
+        Args:
+            tag (Tag): Tag to check
+
+        Returns:
+            bool: True if it matches any selector of the list
+        """
+        context = _context or _Context()
+        return any(selector.matches(tag, context) for selector in self._selectors)
+
+    def select(self, root: Any, limit: Optional[int] = None) -> list:
+        """
+        Descendants of ``root`` matching the selector, in document order.
+
+        Args:
+            root (Tag): Tag to search under
+            limit (int, optional): Maximum number of results
+
+        Returns:
+            List[Tag]: Matching tags
+        """
+        context = _Context()
+        selectors = self._selectors
+        single = selectors[0].matches if len(selectors) == 1 else None
+        results = []
+        for tag in self._candidates(root):
+            if tag is root:
+                continue
+            if single(tag, context) if single else any(selector.matches(tag, context) for selector in selectors):
+                results.append(tag)
+                if limit and len(results) >= limit:
+                    break
+        return results
+
+    def select_one(self, root: Any) -> Optional[Any]:
+        """
+        First descendant of ``root`` matching the selector.
+
+        Args:
+            root (Tag): Tag to search under
+
+        Returns:
+            Tag or None: First match
+        """
+        results = self.select(root, limit=1)
+        return results[0] if results else None
+
+    def _candidates(self, root: Any):
+        index = root._index
+        if index is None:
+            return _descendants(root)
+        index.refresh(root)
+        if len(self._selectors) != 1:
+            return index.tags
+        parts = self._selectors[0].parts
+        # A compound whose name, class or id is nowhere in the document rules out every match
+        for compound, _ in parts[1:]:
+            positions = index.positions(compound.name, compound.query())
+            if positions is not None and not positions:
+                return ()
+        last = parts[0][0]
+        return index.lookup(last.name, last.query())
+
+
+def _descendants(root: Any):
+    stack = [child for child in reversed(root.contents) if not isinstance(child, str)]
+    while stack:
+        tag = stack.pop()
+        yield tag
+        if tag.contents:
+            stack.extend([child for child in reversed(tag.contents) if not isinstance(child, str)])
+
+
+@lru_cache(maxsize=512)
+def compile_selector(selector: str) -> Selector:
+    """
+    Compile a CSS selector, or return it from the cache of the last 512.
+
+    Args:
+        selector (str): CSS selector (list)
+
+    Returns:
+        Selector: Compiled selector
+
+    Raises:
+        ValueError: If the selector is invalid or unsupported
+    """
+    selectors, end = _parse_list(selector, 0)
+    if end != len(selector):
+        raise ValueError(f"Invalid CSS selector {selector!r}: unexpected {selector[end]!r} at {end}")
+    return Selector(selector, selectors)
+
+
+def _error(text: str, pos: int, reason: str) -> ValueError:
+    return ValueError(f"Invalid CSS selector {text!r}: {reason} at {pos}")
+
+
+def _parse_list(text: str, pos: int, nested: bool = False) -> Tuple[List[_Complex], int]:
+    """Parse a comma-separated selector list from ``pos``, up to the end or (nested) a ``)``."""
+    selectors = []
+    parts: List[Tuple[_Compound, Optional[str]]] = []
+    compound: Optional[_Compound] = None
+    combinator: Optional[str] = None
+
+    def finish_compound() -> None:
+        nonlocal compound, combinator
+        parts.append((compound, combinator))
+        compound, combinator = None, None
+
+    def finish_selector() -> None:
+        if compound is not None:
+            finish_compound()
+        elif not parts or combinator != ' ':
+            raise _error(text, pos, "expected a selector")
+        # Right to left: each part keeps the combinator linking it to the part on its left
+        selectors.append(_Complex(parts[::-1]))
+        parts.clear()
+
+    while pos < len(text):
+        if nested and text[pos] == ')':
+            break
+        match = _TOKENS.match(text, pos)
+        if not match:
+            raise _error(text, pos, f"unexpected {text[pos]!r}")
+        kind = next(k for k in ('ws', 'comb', 'comma', 'type', 'id', 'cls', 'attr', 'pseudo') if match.group(k))
+        pos = match.end()
+
+        if kind == 'ws':
+            if compound is not None:
+                finish_compound()
+                combinator = ' '
+            continue
+        if kind == 'comb':
+            if compound is not None:
+                finish_compound()
+            elif not parts or combinator not in (None, ' '):
+                raise _error(text, match.start(), f"unexpected combinator {match.group('comb')!r}")
+            combinator = match.group('comb')
+            continue
+        if kind == 'comma':
+            finish_selector()
+            combinator = None
+            continue
+
+        if kind == 'type':
+            if compound is not None:
+                raise _error(text, match.start(), "type selector must come first")
+            compound = _Compound()
+            name = match.group('type')
+            compound.name = None if name == '*' else name.lower()
+            continue
+        if compound is None:
+            compound = _Compound()
+        if kind == 'id':
+            compound.ids.append(match.group('id'))
+        elif kind == 'cls':
+            compound.classes.append(match.group('cls'))
+        elif kind == 'attr':
+            compound.tests.append(_attribute_test(match))
+            compound.conditions.append(_attribute_condition(match))
+        elif kind == 'pseudo':
+            test, condition, pos = _pseudo_test(text, match, pos)
+            compound.tests.append(test)
+            compound.conditions.append(condition)
+
+    finish_selector()
+    return selectors, pos
+
+
+def _attribute_test(match: re.Match) -> _Test:
+    name = match.group('attr').lower()
+    op = match.group('op')
+    if op is None:
+        return lambda tag, context: name in (tag._attrs or _NO_ATTRS)
+    value = next(v for v in (match.group('dq'), match.group('sq'), match.group('bare'), '') if v is not None)
+    fold = (match.group('flag') or '').lower() == 'i'
+    if fold:
+        value = value.lower()
+
+    if op == '=':
+        check = value.__eq__
+    elif op == '~=':
+        check = lambda actual: value in actual.split()  # noqa: E731
+    elif op == '|=':
+        check = lambda actual: actual == value or actual.startswith(value + '-')  # noqa: E731
+    elif op == '^=':
+        check = lambda actual: bool(value) and actual.startswith(value)  # noqa: E731
+    elif op == '$=':
+        check = lambda actual: bool(value) and actual.endswith(value)  # noqa: E731
+    else:
+        check = lambda actual: bool(value) and value in actual  # noqa: E731
+
+    def test(tag: Any, context: _Context) -> bool:
+        attrs = tag._attrs or _NO_ATTRS
+        if name not in attrs:
+            return False
+        actual = attrs[name]
+        actual = '' if actual is None else actual if isinstance(actual, str) else ' '.join(actual)
+        return check(actual.lower() if fold else actual)
+
+    return test
+
+
+def _attribute_condition(match: re.Match) -> _Condition:
+    name = match.group('attr').lower()
+    op = match.group('op')
+    if not _XPATH_NAME.match(name) or (match.group('flag') or '').lower() == 'i':
+        return lambda step: None
+    attribute = f'@{name}'
+    if op is None:
+        return lambda step: attribute
+    value = next(v for v in (match.group('dq'), match.group('sq'), match.group('bare'), '') if v is not None)
+    literal = _literal(value)
+    if op == '=':
+        predicate = f'{attribute}={literal}'
+    elif op == '~=':
+        predicate = _token_xpath(name, value)
+    elif op == '|=':
+        predicate = f'{attribute}={literal} or starts-with({attribute}, {_literal(value + "-")})'
+    elif not value:
+        predicate = 'false()'
+    elif op == '^=':
+        predicate = f'starts-with({attribute}, {literal})'
+    elif op == '$=':
+        predicate = f'substring({attribute}, string-length({attribute}) - {len(value) - 1})={literal}'
+    else:
+        predicate = f'contains({attribute}, {literal})'
+    return lambda step: predicate
+
+
+def _nth(text: str, argument: str, pos: int) -> Tuple[int, int]:
+    match = _NTH.match(argument.strip().lower())
+    if not match:
+        raise _error(text, pos, f"invalid nth argument {argument!r}")
+    if match.group('odd'):
+        return 2, 1
+    if match.group('even'):
+        return 2, 0
+    if match.group('int') is not None:
+        return 0, int(match.group('int'))
+    a = match.group('a')
+    a = 1 if a in ('', '+') else -1 if a == '-' else int(a)
+    b = int(match.group('b') or 0) * (-1 if match.group('sign') == '-' else 1)
+    return a, b
+
+
+def _nth_test(a: int, b: int, of_type: bool, last: bool) -> _Test:
+    def test(tag: Any, context: _Context) -> bool:
+        siblings, position = context.siblings(tag, of_type)
+        n = len(siblings) - position if last else position + 1
+        if a == 0:
+            return n == b
+        return (n - b) % a == 0 and (n - b) // a >= 0
+
+    return test
+
+
+def _nth_condition(a: int, b: int, of_type: bool, last: bool) -> _Condition:
+    def condition(step: str) -> Optional[str]:
+        if of_type and step == '*':
+            return None
+        n = f"(count({'following' if last else 'preceding'}-sibling::{step if of_type else '*'}) + 1)"
+        if a == 0:
+            return f'{n} = {b}'
+        if a > 0:
+            return f'{n} >= {b} and ({n} - {b}) mod {a} = 0'
+        return f'{n} <= {b} and ({b} - {n}) mod {-a} = 0'
+
+    return condition
+
+
+def _only_condition(of_type: bool) -> _Condition:
+    def condition(step: str) -> Optional[str]:
+        if of_type and step == '*':
+            return None
+        siblings = step if of_type else '*'
+        return f'not(preceding-sibling::{siblings}) and not(following-sibling::{siblings})'
+
+    return condition
+
+
+_STRUCTURAL = {
+    'first-child': (0, 1, False, False),
+    'last-child': (0, 1, False, True),
+    'first-of-type': (0, 1, True, False),
+    'last-of-type': (0, 1, True, True),
+}
+_NTH_PSEUDOS = {
+    'nth-child': (False, False),
+    'nth-last-child': (False, True),
+    'nth-of-type': (True, False),
+    'nth-last-of-type': (True, True),
+}
+
+
+def _pseudo_test(text: str, match: re.Match, pos: int) -> Tuple[_Test, _Condition, int]:
+    """
+    _Test and XPath condition for the pseudo-class at ``match``; returns them
+    and the position after its arguments.
+    """
+    name = match.group('pseudo').lower()
+    if match.group('args') is None:
+        if name in _STRUCTURAL:
+            return _nth_test(*_STRUCTURAL[name]), _nth_condition(*_STRUCTURAL[name]), pos
+        if name in ('only-child', 'only-of-type'):
+            of_type = name == 'only-of-type'
+            return (lambda tag, context: len(context.siblings(tag, of_type)[0]) == 1), _only_condition(of_type), pos
+        if name == 'empty':
+            return (lambda tag, context: not any(
+                not isinstance(child, str) or child for child in tag.contents
+            )), (lambda step: 'not(node())'), pos
+        raise _error(text, match.start(), f"unsupported pseudo-class :{name}")
+
+    if name in _NTH_PSEUDOS:
+        end = text.find(')', pos)
+        if end < 0:
+            raise _error(text, pos, "missing ')'")
+        a, b = _nth(text, text[pos:end], pos)
+        return _nth_test(a, b, *_NTH_PSEUDOS[name]), _nth_condition(a, b, *_NTH_PSEUDOS[name]), end + 1
+    if name in ('not', 'is', 'where', 'matches'):
+        inner, end = _parse_list(text, pos, nested=True)
+        if end >= len(text) or text[end] != ')':
+            raise _error(text, end, "missing ')'")
+        selector = Selector(text[pos:end], inner)
+        steps = [complex_selector.xpath() for complex_selector in inner]
+        either = None if None in steps else ' or '.join(f'self::{step}' for step in steps)
+        if name == 'not':
+            return (
+                (lambda tag, context: not selector.match(tag, context)),
+                (lambda step: either and f'not({either})'),
+                end + 1,
+            )
+        return selector.match, (lambda step: either), end + 1
+    raise _error(text, match.start(), f"unsupported pseudo-class :{name}()")
+
+
+# Combinator linking a compound to the one on its left -> XPath predicate on that left part
+_AXES = {
+    ' ': 'ancestor::{}',
+    '>': 'parent::{}',
+    '+': 'preceding-sibling::*[1][self::{}]',
+    '~': 'preceding-sibling::{}',
+}
+
+
+def _literal(value: str) -> str:
+    """``value`` as an XPath 1.0 string literal, which has no escapes."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return 'concat(' + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ')'
+
+
+def _token_xpath(attribute: str, token: str) -> str:
+    """XPath predicate: the whitespace-separated ``attribute`` value contains ``token``."""
+    if not token or token != ''.join(token.split()):
+        return 'false()'
+    return f"contains(concat(' ', normalize-space(@{attribute}), ' '), {_literal(f' {token} ')})"
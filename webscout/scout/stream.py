@@ -0,0 +1,359 @@
+"""
+Scout Stream Module - Incremental, Event-Driven Parsing
+
+:class:`StreamParser` builds the same kind of tree as the ``html.parser``
+backend, one fed chunk at a time, and reports elements as they open and
+close. :func:`iterparse` drives it from a string, bytes, a file, an
+iterable of chunks or a streaming ``requests`` response, and stops reading
+as soon as the caller stops iterating:
+
+>>> from webscout.scout.stream import iterparse
+>>> response = requests.get(url, stream=True)
+>>> for event, tag in iterparse(response, select="head > title"):
+...     title = tag.get_text()
+...     break  # the rest of the page is never downloaded
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser as StdHTMLParser
+from sys import intern
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .element import Tag, NavigableString
+from .selector import compile_selector
+
+EVENTS = frozenset(('start', 'end', 'text'))
+
+_VOID = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'source', 'track', 'wbr',
+))
+
+_CLOSES_P = frozenset((
+    'address', 'article', 'aside', 'blockquote', 'details', 'div', 'dl', 'fieldset', 'figcaption', 'figure',
+    'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'main', 'menu', 'nav', 'ol', 'p',
+    'pre', 'section', 'table', 'ul',
+))
+
+# Start tag -> open elements it ends when one of them is the current element
+_IMPLIED_END: Dict[str, FrozenSet[str]] = {name: frozenset(('p',)) for name in _CLOSES_P}
+_IMPLIED_END.update({
+    'li': frozenset(('li', 'p')),
+    'dt': frozenset(('dt', 'dd', 'p')),
+    'dd': frozenset(('dt', 'dd', 'p')),
+    'tr': frozenset(('tr', 'td', 'th')),
+    'td': frozenset(('td', 'th')),
+    'th': frozenset(('td', 'th')),
+    'thead': frozenset(('thead', 'tbody', 'tfoot', 'tr', 'td', 'th')),
+    'tbody': frozenset(('thead', 'tbody', 'tfoot', 'tr', 'td', 'th')),
+    'tfoot': frozenset(('thead', 'tbody', 'tfoot', 'tr', 'td', 'th')),
+    'option': frozenset(('option',)),
+    'optgroup': frozenset(('option', 'optgroup')),
+})
+
+_SNIFF_BYTES = 1024
+_META_CHARSET = re.compile(rb'''<meta[^>]+charset\s*=\s*["']?\s*([\w.:-]+)''', re.IGNORECASE)
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+Source = Union[str, bytes, Iterable[Union[str, bytes]], Any]
+
+
+class StreamParser:
+    """
+    Incremental HTML tree builder with a pull interface.
+
+    Feed it text as it arrives and collect ``(event, node)`` pairs with
+    :meth:`read_events`:
+
+    - ``start``: a tag was opened; its attributes are set, its contents are not
+    - ``end``: a tag and everything inside it has been parsed
+    - ``text``: a non-blank text node was completed
+
+    Tags are linked into the tree under :attr:`root` as they are parsed, so an
+    ``end`` tag is a finished subtree that ``find_all``, ``select`` and
+    ``get_text`` work on. Calling ``clear()`` on subtrees once they have
+    been handled keeps memory flat on long pages.
+
+    With ``select``, only ``start``/``end`` events of tags matching that CSS
+    selector are reported. Tags are matched when the event fires, so
+    selectors that look at what comes later in the document
+    (``:last-child``, ``:nth-last-child()``, ``+``/``~`` on a later sibling)
+    only see what has been parsed so far.
+    """
+
+    def __init__(
+        self,
+        events: Iterable[str] = ('end',),
+        select: Optional[str] = None,
+        special_nodes: bool = True,
+    ):
+        """
+        Initialize the stream parser.
+
+        Args:
+            events (Iterable[str]): Events to report, any of 'start', 'end'
+                and 'text'. Defaults to ('end',).
+            select (str, optional): Only report start/end events of tags
+                matching this CSS selector
+            special_nodes (bool): Keep comments, declarations and processing
+                instructions as tags. Defaults to True.
+
+        Raises:
+            ValueError: If an event name is unknown or the selector is invalid
+        """
+        self.events = frozenset(events)
+        unknown = self.events - EVENTS
+        if unknown:
+            raise ValueError(f"Unknown event(s) {', '.join(sorted(unknown))}; choose from start, end, text")
+        self.selector = compile_selector(select) if select else None
+        self.special_nodes = special_nodes
+        self.root = Tag('html')
+        self._stack: List[Tag] = [self.root]
+        self._text: List[str] = []
+        self._events: List[Tuple[str, Any]] = []
+        self._parser = _StreamHTMLParser(self)
+        self._closed = False
+
+    def feed(self, data: str) -> None:
+        """
+        Parse the next chunk of markup.
+
+        Args:
+            data (str): Markup; chunks may split tags, entities or text anywhere
+        """
+        self._parser.feed(data)
+
+    def close(self) -> Tag:
+        """
+        Finish parsing: flush buffered markup and end every open tag.
+
+        Returns:
+            Tag: Document root
+        """
+        if not self._closed:
+            self._closed = True
+            self._parser.close()
+            self._flush_text()
+            while len(self._stack) > 1:
+                self._end(self._stack.pop())
+        return self.root
+
+    def read_events(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Hand over the events collected since the last call.
+
+        Yields:
+            Tuple[str, Any]: ``(event, node)`` pairs in document order
+        """
+        events, self._events = self._events, []
+        return iter(events)
+
+    def start(self, name: str, attrs: Optional[Dict[str, Optional[str]]], void: bool = False) -> None:
+        """
+        Open a tag, ending the tags its start tag implies the end of.
+
+        Args:
+            name (str): Tag name
+            attrs (dict, optional): Tag attributes
+            void (bool): The tag has no contents (``<br>``, ``<x/>``, comments)
+        """
+        self._flush_text()
+        implied = _IMPLIED_END.get(name)
+        if implied:
+            while len(self._stack) > 1 and self._stack[-1].name in implied:
+                self._end(self._stack.pop())
+        parent = self._stack[-1]
+        tag = Tag(name, attrs)
+        tag.parent = parent
+        parent.contents.append(tag)
+        if 'start' in self.events and (self.selector is None or self.selector.match(tag)):
+            self._events.append(('start', tag))
+        if void or name in _VOID:
+            self._end(tag)
+        else:
+            self._stack.append(tag)
+
+    def end(self, name: str) -> None:
+        """
+        Close the innermost open tag called ``name`` and every tag inside it.
+
+        End tags with no open tag of that name are ignored.
+
+        Args:
+            name (str): Tag name
+        """
+        self._flush_text()
+        stack = self._stack
+        for depth in range(len(stack) - 1, 0, -1):
+            if stack[depth].name == name:
+                while len(stack) > depth:
+                    self._end(stack.pop())
+                return
+
+    def text(self, data: str) -> None:
+        """
+        Buffer text; it becomes a node once the next tag starts or ends.
+
+        Args:
+            data (str): Text content
+        """
+        self._text.append(data)
+
+    def _flush_text(self) -> None:
+        if not self._text:
+            return
+        text = ''.join(self._text)
+        self._text.clear()
+        if text.strip():
+            node = NavigableString(text)
+            node.parent = self._stack[-1]
+            node.parent.contents.append(node)
+            if 'text' in self.events:
+                self._events.append(('text', node))
+
+    def _end(self, tag: Tag) -> None:
+        if 'end' in self.events and (self.selector is None or self.selector.match(tag)):
+            self._events.append(('end', tag))
+
+
+class _StreamHTMLParser(StdHTMLParser):
+    """
+    Internal tokenizer that forwards to a :class:`StreamParser`.
+    """
+
+    def __init__(self, builder: StreamParser):
+        """
+        Initialize the tokenizer with the tree builder it feeds.
+
+        Args:
+            builder (StreamParser): Tree builder
+        """
+        super().__init__(convert_charrefs=True)
+        self._builder = builder
+
+    def handle_starttag(self, tag: str, attrs: List[tuple]):
+        self._builder.start(tag, {intern(k): v for k, v in attrs})
+
+    def handle_startendtag(self, tag: str, attrs: List[tuple]):
+        self._builder.start(tag, {intern(k): v for k, v in attrs}, void=True)
+
+    def handle_endtag(self, tag: str):
+        self._builder.end(tag)
+
+    def handle_data(self, data: str):
+        self._builder.text(data)
+
+    def handle_comment(self, data: str):
+        if self._builder.special_nodes:
+            self._builder.start('comment', {'content': data}, void=True)
+
+    def handle_decl(self, decl: str):
+        if self._builder.special_nodes:
+            self._builder.start('!DOCTYPE', {'content': decl}, void=True)
+
+    def handle_pi(self, data: str):
+        if self._builder.special_nodes:
+            self._builder.start('?', {'content': data}, void=True)
+
+
+def iterparse(
+    source: Source,
+    events: Iterable[str] = ('end',),
+    select: Optional[str] = None,
+    encoding: Optional[str] = None,
+    chunk_size: int = 16384,
+    special_nodes: bool = True,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Parse markup incrementally, yielding ``(event, node)`` pairs as they happen.
+
+    Only as much of ``source`` is read as it takes to produce the events the
+    caller consumes: break out of the loop (or close the generator) and
+    nothing more is read or parsed. A ``requests`` response opened with
+    ``stream=True`` is closed at that point, so the rest of the body is not
+    downloaded.
+
+    Args:
+        source: Markup as a str or bytes, a binary or text file object, an
+            iterable of str or bytes chunks, or a ``requests`` response
+        events (Iterable[str]): Events to report: 'start', 'end', 'text'.
+            Defaults to ('end',).
+        select (str, optional): Only report start/end events of tags
+            matching this CSS selector
+        encoding (str, optional): Encoding of byte input. By default the
+            response charset, a byte order mark or a ``<meta charset>`` in
+            the first kilobyte, else UTF-8.
+        chunk_size (int): Bytes or characters read at a time. Defaults to 16384.
+        special_nodes (bool): Keep comments, declarations and processing
+            instructions as tags. Defaults to True.
+
+    Yields:
+        Tuple[str, Any]: ``(event, node)``; ``node.parent`` chains up to the
+        document root, which the tree is built under as it is parsed
+
+    Raises:
+        ValueError: If an event name is unknown or the selector is invalid
+    """
+    parser = StreamParser(events, select=select, special_nodes=special_nodes)
+    response = source if hasattr(source, 'iter_content') else None
+    if response is not None and encoding is None and 'charset=' in response.headers.get('content-type', ''):
+        encoding = response.encoding
+    try:
+        decoder = None
+        head = b''
+        for chunk in _chunks(source, chunk_size):
+            if isinstance(chunk, (bytes, bytearray)):
+                if decoder is None:
+                    head += chunk
+                    if len(head) < _SNIFF_BYTES:
+                        continue
+                    decoder = _decoder(encoding, head)
+                    chunk, head = head, b''
+                chunk = decoder.decode(chunk)
+            parser.feed(chunk)
+            yield from parser.read_events()
+        if decoder is None and head:
+            decoder = _decoder(encoding, head)
+            parser.feed(decoder.decode(head))
+        if decoder is not None:
+            parser.feed(decoder.decode(b'', final=True))
+        parser.close()
+        yield from parser.read_events()
+    finally:
+        if response is not None:
+            response.close()
+
+
+def _chunks(source: Source, chunk_size: int) -> Iterator[Union[str, bytes]]:
+    if isinstance(source, (str, bytes, bytearray)):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    elif hasattr(source, 'iter_content'):
+        yield from source.iter_content(chunk_size)
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from source
+
+
+def _decoder(encoding: Optional[str], head: bytes) -> codecs.IncrementalDecoder:
+    if encoding is None:
+        for bom, name in _BOMS:
+            if head.startswith(bom):
+                encoding = name
+                break
+        else:
+            match = _META_CHARSET.search(head, 0, _SNIFF_BYTES)
+            encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        return codecs.getincrementaldecoder(encoding)(errors='replace')
+    except LookupError:
+        return codecs.getincrementaldecoder('utf-8')(errors='replace')
@@ -0,0 +1,306 @@
+"""
+Shared, pooled HTTP transport for providers.
+
+Every provider used to open its own ``requests.Session`` or ``httpx`` client,
+so nothing shared connection pools, keep-alive connections or TLS sessions.
+This module hands out clients that all sit on one set of per-host pools:
+
+>>> from webscout import transport
+>>> session = transport.session(headers={"User-Agent": "..."})       # requests
+>>> client = transport.async_client(headers={"User-Agent": "..."})   # httpx
+
+Sessions and clients keep their own headers, cookies and proxies; only the
+connection pools underneath are shared. Closing a session or client leaves the
+shared pools open for everybody else.
+
+Pool limits, retries, the default timeout and a default proxy are set in one
+place with :func:`configure`.
+"""
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from typing import Any, Dict, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+Proxies = Optional[Union[str, Dict[str, str]]]
+
+
+class TransportConfig:
+    """Settings shared by every client this module hands out.
+
+    Attributes:
+        pool_connections: Number of per-host pools kept by the requests adapter
+        pool_maxsize: Max keep-alive connections per host
+        max_connections: Max concurrent connections for httpx clients
+        keepalive_expiry: Seconds an idle httpx connection is kept
+        max_retries: Retries on connection errors (and 502/503/504 for idempotent requests)
+        backoff_factor: Backoff between retries, see ``urllib3.Retry``
+        timeout: Default timeout in seconds when a request doesn't pass one
+        proxies: Default proxies (requests-style dict or a single URL)
+        http2: Use HTTP/2 for httpx clients when the ``h2`` package is installed
+    """
+
+    def __init__(self):
+        self.pool_connections = 32
+        self.pool_maxsize = 32
+        self.max_connections = 100
+        self.keepalive_expiry = 30.0
+        self.max_retries = 2
+        self.backoff_factor = 0.3
+        self.timeout = 30.0
+        self.proxies: Proxies = None
+        self.http2 = True
+
+
+config = TransportConfig()
+
+_lock = threading.Lock()
+_adapter: Optional["_SharedAdapter"] = None
+_sync_transports: Dict[Optional[str], "_SharedSyncTransport"] = {}
+_async_transports: Dict[Optional[str], "_LoopLocalAsyncTransport"] = {}
+
+
+def configure(**settings: Any) -> TransportConfig:
+    """
+    Updates the shared transport settings.
+
+    Clients created afterwards use the new settings; existing clients keep the
+    pools they already have.
+
+    Args:
+        **settings: Any attribute of :class:`TransportConfig`
+
+    Returns:
+        The updated configuration
+
+    Raises:
+        AttributeError: On an unknown setting
+    """
+    global _adapter
+    with _lock:
+        for key, value in settings.items():
+            if not hasattr(config, key):
+                raise AttributeError(f"Unknown transport setting: {key}")
+            setattr(config, key, value)
+        _adapter = None
+        _sync_transports.clear()
+        _async_transports.clear()
+    return config
+
+
+def _proxy_dict(proxies: Proxies) -> Dict[str, str]:
+    if not proxies:
+        return {}
+    if isinstance(proxies, str):
+        return {"http": proxies, "https": proxies}
+    return dict(proxies)
+
+
+def _proxy_url(proxies: Proxies) -> Optional[str]:
+    """Single proxy URL for httpx, which proxies all schemes through one transport."""
+    proxies = _proxy_dict(proxies)
+    return proxies.get("https") or proxies.get("http") or proxies.get("all")
+
+
+def _http2_enabled() -> bool:
+    return config.http2 and importlib.util.find_spec("h2") is not None
+
+
+# -- requests ---------------------------------------------------------------
+
+class _SharedAdapter(HTTPAdapter):
+    """HTTPAdapter mounted into many sessions: applies the default timeout and ignores close()."""
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=config.timeout if timeout is None else timeout, **kwargs)
+
+    def close(self):
+        # Session.close() closes its adapters; the pools belong to everybody.
+        pass
+
+
+def _shared_adapter() -> _SharedAdapter:
+    global _adapter
+    with _lock:
+        if _adapter is None:
+            retry = Retry(
+                total=config.max_retries,
+                read=False,
+                backoff_factor=config.backoff_factor,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            )
+            _adapter = _SharedAdapter(
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
+                max_retries=retry,
+            )
+        return _adapter
+
+
+def session(headers: Optional[Dict[str, str]] = None, proxies: Proxies = None) -> requests.Session:
+    """
+    Creates a ``requests.Session`` backed by the shared connection pools.
+
+    Args:
+        headers: Default headers for this session
+        proxies: Proxies for this session, defaults to ``config.proxies``
+
+    Returns:
+        A regular ``requests.Session``
+    """
+    sess = requests.Session()
+    adapter = _shared_adapter()
+    sess.mount("http://", adapter)
+    sess.mount("https://", adapter)
+    if headers:
+        sess.headers.update(headers)
+    sess.proxies.update(_proxy_dict(proxies or config.proxies))
+    return sess
+
+
+# -- httpx ------------------------------------------------------------------
+
+def _limits():
+    import httpx
+
+    return httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.pool_maxsize,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+
+
+class _SharedSyncTransport:
+    """Wraps one ``httpx.HTTPTransport`` so that closing a client leaves the pool open."""
+
+    def __init__(self, proxy: Optional[str]):
+        import httpx
+
+        self._pool = httpx.HTTPTransport(
+            http2=_http2_enabled(),
+            limits=_limits(),
+            retries=config.max_retries,
+            proxy=proxy,
+        )
+
+    def handle_request(self, request):
+        return self._pool.handle_request(request)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _shared_sync_transport(proxy: Optional[str]) -> _SharedSyncTransport:
+    with _lock:
+        transport = _sync_transports.get(proxy)
+        if transport is None:
+            transport = _sync_transports[proxy] = _SharedSyncTransport(proxy)
+        return transport
+
+
+def client(headers: Optional[Dict[str, str]] = None, proxies: Proxies = None, **kwargs: Any):
+    """
+    Creates an ``httpx.Client`` backed by the shared connection pools.
+
+    Args:
+        headers: Default headers for this client
+        proxies: Proxies (requests-style dict or URL), defaults to ``config.proxies``
+        **kwargs: Passed to ``httpx.Client``
+
+    Returns:
+        httpx.Client
+    """
+    import httpx
+
+    kwargs.setdefault("timeout", config.timeout)
+    return httpx.Client(
+        headers=headers,
+        transport=_shared_sync_transport(_proxy_url(proxies or config.proxies)),
+        **kwargs,
+    )
+
+
+class _LoopLocalAsyncTransport:
+    """Async transport that keeps one connection pool per event loop.
+
+    httpx/httpcore connections belong to the loop that opened them, so a single
+    pool can't be shared across loops. Requests are routed to the pool of the
+    loop they run on; pools go away with their loop.
+    """
+
+    def __init__(self, proxy: Optional[str]):
+        self._proxy = proxy
+        self._pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._pools_lock = threading.Lock()
+
+    def _pool(self):
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        with self._pools_lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = httpx.AsyncHTTPTransport(
+                    http2=_http2_enabled(),
+                    limits=_limits(),
+                    retries=config.max_retries,
+                    proxy=self._proxy,
+                )
+            return pool
+
+    async def handle_async_request(self, request):
+        return await self._pool().handle_async_request(request)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _shared_async_transport(proxy: Optional[str]) -> _LoopLocalAsyncTransport:
+    with _lock:
+        transport = _async_transports.get(proxy)
+        if transport is None:
+            transport = _async_transports[proxy] = _LoopLocalAsyncTransport(proxy)
+        return transport
+
+
+def async_client(headers: Optional[Dict[str, str]] = None, proxies: Proxies = None, **kwargs: Any):
+    """
+    Creates an ``httpx.AsyncClient`` backed by the shared connection pools.
+
+    Safe to call outside a running event loop (e.g. in a provider's
+    ``__init__``); pools are created per loop on first request.
+
+    Args:
+        headers: Default headers for this client
+        proxies: Proxies (requests-style dict or URL), defaults to ``config.proxies``
+        **kwargs: Passed to ``httpx.AsyncClient``
+
+    Returns:
+        httpx.AsyncClient
+    """
+    import httpx
+
+    kwargs.setdefault("timeout", config.timeout)
+    return httpx.AsyncClient(
+        headers=headers,
+        transport=_shared_async_transport(_proxy_url(proxies or config.proxies)),
+        **kwargs,
+    )
@@ -6,10 +6,11 @@ Webscout Update Checker
 'New Webscout version available: 2.0.0 - Update with: pip install --upgrade webscout'
 """
 
+import os
+import sys
+import threading
 from typing import Optional, Dict, Any, Literal
 
-import requests
-from packaging import version
 from importlib.metadata import version as get_package_version
 from importlib.metadata import PackageNotFoundError
 
@@ -45,6 +46,8 @@ def get_pypi_version() -> Optional[str]:
         >>> print(latest)
         '2.0.0'
     """
+    import requests
+
     try:
         response = requests.get(
             "https://pypi.org/pypi/webscout/json",
@@ -70,6 +73,8 @@ def version_compare(v1: str, v2: str) -> VersionCompareResult:
         >>> version_compare('1.0.0', '2.0.0')
         -1
     """
+    from packaging import version
+
     try:
         version1 = version.parse(v1)
         version2 = version.parse(v2)
@@ -123,6 +128,31 @@ def check_for_updates() -> Optional[str]:
     
     return get_update_message(installed_version, latest_version)
 
+def check_for_updates_in_background() -> Optional[threading.Thread]:
+    """Run :func:`check_for_updates` in a daemon thread if the user opted in.
+
+    The check is opt-in through the ``WEBSCOUT_CHECK_UPDATES`` environment
+    variable (``1``/``true``/``yes``) so that importing webscout never waits
+    on the network. A resulting message is printed to stderr.
+
+    Returns:
+        Optional[threading.Thread]: The started thread, or None if disabled
+    """
+    if os.environ.get("WEBSCOUT_CHECK_UPDATES", "").lower() not in ("1", "true", "yes"):
+        return None
+
+    def run() -> None:
+        try:
+            message = check_for_updates()
+        except Exception:
+            return
+        if message:
+            print(message, file=sys.stderr)
+
+    thread = threading.Thread(target=run, name="webscout-update-check", daemon=True)
+    thread.start()
+    return thread
+
 if __name__ == "__main__":
     try:
         update_message = check_for_updates()
@@ -69,7 +69,11 @@ def _text_extract_json(html_bytes: bytes, keywords: str) -> List[Dict[str, str]]
 
 def _normalize(raw_html: str) -> str:
     """Strip HTML tags from the raw_html string."""
-    return unescape(REGEX_STRIP_TAGS.sub("", raw_html)) if raw_html else ""
+    if not raw_html:
+        return ""
+    if "<" not in raw_html and "&" not in raw_html:
+        return raw_html  # Nothing to strip or unescape, the common case for parsed text
+    return unescape(REGEX_STRIP_TAGS.sub("", raw_html))
 
 
 def _normalize_url(url: str) -> str: